@@ -2,16 +2,20 @@ from __future__ import annotations
 
 import functools
 import re
+import threading
+import time
 from collections.abc import Callable, Generator, Mapping, Sequence
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeIs, overload
 
+from cachetools import LRUCache
 from django.utils.functional import cached_property
 from parsimonious.exceptions import IncompleteParseError
 from parsimonious.grammar import Grammar
 from parsimonious.nodes import Node, NodeVisitor
 
+from sentry import options
 from sentry.exceptions import IncompatibleMetricsQuery, InvalidSearchQuery
 from sentry.search.events.constants import (
     DURATION_UNITS,
@@ -38,6 +42,7 @@ from sentry.search.utils import (
     parse_size,
 )
 from sentry.snuba.dataset import Dataset
+from sentry.utils import metrics
 from sentry.utils.snuba import is_duration_measurement, is_measurement, is_span_op_breakdown
 from sentry.utils.validators import is_event_id, is_span_id
 
@@ -1814,6 +1819,142 @@ default_config = SearchConfig(
 )
 
 
+# Maximum number of parsed queries kept in the per-process parse cache.
+PARSE_CACHE_SIZE = 2048
+
+
+class _CachedParse(NamedTuple):
+    # The config is kept alive alongside the entry so that its `id()`, which is
+    # part of the cache key, can never be reused by another config object.
+    config: SearchConfig[Any]
+    tokens: tuple[QueryToken, ...]
+    parse_duration: float
+
+
+_parse_cache: LRUCache[tuple[Any, ...], _CachedParse] = LRUCache(maxsize=PARSE_CACHE_SIZE)
+_parse_cache_lock = threading.Lock()
+
+
+def clear_parse_cache() -> None:
+    with _parse_cache_lock:
+        _parse_cache.clear()
+
+
+def _get_parse_cache_key(
+    query: str, config: SearchConfig[Any], params: ParamsType | None
+) -> tuple[Any, ...]:
+    """
+    Only the project scope of `params` is able to influence the visitor output
+    (through the fallback field type resolution), so the time range is
+    deliberately left out of the key.
+    """
+    if not params:
+        return (query, id(config), None, (), None)
+
+    environment = params.get("environment")
+    if isinstance(environment, list):
+        environment = tuple(sorted(environment))
+
+    return (
+        query,
+        id(config),
+        params.get("organization_id"),
+        tuple(sorted(params.get("project_id") or ())),
+        environment,
+    )
+
+
+def _freeze_tokens(tokens: Sequence[QueryToken]) -> tuple[QueryToken, ...] | None:
+    """
+    Converts a token list into an immutable tree suitable for caching. Returns
+    None when the tokens can't be cached because they hold values computed
+    relative to the current time (ie. `timestamp:-24h`).
+    """
+    frozen: list[QueryToken] = []
+    for token in tokens:
+        if isinstance(token, ParenExpression):
+            children = _freeze_tokens(token.children)
+            if children is None:
+                return None
+            token = ParenExpression(children)
+        elif isinstance(token, (SearchFilter, AggregateFilter)):
+            if isinstance(token.value.raw_value, datetime):
+                return None
+        frozen.append(token)
+    return tuple(frozen)
+
+
+def _thaw_tokens(tokens: Sequence[QueryToken]) -> list[QueryToken]:
+    return [
+        (
+            ParenExpression(_thaw_tokens(token.children))
+            if isinstance(token, ParenExpression)
+            else token
+        )
+        for token in tokens
+    ]
+
+
+def _parse_search_query(
+    query: str,
+    config: SearchConfig[Any],
+    params: ParamsType | None,
+    get_field_type: Callable[[str], str | None] | None,
+    get_function_result_type: Callable[[str], str | None] | None,
+) -> list[QueryToken]:
+    try:
+        tree = event_search_grammar.parse(query)
+    except IncompleteParseError as e:
+        idx = e.column()
+        prefix = query[max(0, idx - 5) : idx]
+        suffix = query[idx : (idx + 5)]
+        raise InvalidSearchQuery(
+            "{} {}".format(
+                f"Parse error at '{prefix}{suffix}' (column {e.column():d}).",
+                "This is commonly caused by unmatched parentheses. Enclose any text in double quotes.",
+            )
+        )
+
+    return SearchVisitor(
+        config,
+        params=params,
+        get_field_type=get_field_type,
+        get_function_result_type=get_function_result_type,
+    ).visit(tree)
+
+
+def _parse_search_query_cached(
+    query: str, config: SearchConfig[Any], params: ParamsType | None
+) -> list[QueryToken]:
+    key = _get_parse_cache_key(query, config, params)
+
+    with _parse_cache_lock:
+        entry = _parse_cache.get(key)
+
+    if entry is not None and entry.config is config:
+        metrics.incr("event_search.parse_cache.hit", sample_rate=0.1)
+        metrics.distribution(
+            "event_search.parse_cache.time_saved",
+            entry.parse_duration,
+            unit="millisecond",
+            sample_rate=0.1,
+        )
+        return _thaw_tokens(entry.tokens)
+
+    metrics.incr("event_search.parse_cache.miss", sample_rate=0.1)
+
+    start = time.perf_counter()
+    tokens = _parse_search_query(query, config, params, None, None)
+    parse_duration = (time.perf_counter() - start) * 1000
+
+    frozen = _freeze_tokens(tokens)
+    if frozen is not None:
+        with _parse_cache_lock:
+            _parse_cache[key] = _CachedParse(config, frozen, parse_duration)
+
+    return tokens
+
+
 @overload
 def parse_search_query(
     query: str,
@@ -1847,22 +1988,13 @@ def parse_search_query(
     if config is None:
         config = default_config
 
-    try:
-        tree = event_search_grammar.parse(query)
-    except IncompleteParseError as e:
-        idx = e.column()
-        prefix = query[max(0, idx - 5) : idx]
-        suffix = query[idx : (idx + 5)]
-        raise InvalidSearchQuery(
-            "{} {}".format(
-                f"Parse error at '{prefix}{suffix}' (column {e.column():d}).",
-                "This is commonly caused by unmatched parentheses. Enclose any text in double quotes.",
-            )
-        )
+    # Custom field type resolvers are usually bound to a query builder and may
+    # resolve differently per request, so those parses are never cached.
+    if (
+        get_field_type is None
+        and get_function_result_type is None
+        and options.get("api.event-search.parse-cache.enabled")
+    ):
+        return _parse_search_query_cached(query, config, params)
 
-    return SearchVisitor(
-        config,
-        params=params,
-        get_field_type=get_field_type,
-        get_function_result_type=get_function_result_type,
-    ).visit(tree)
+    return _parse_search_query(query, config, params, get_field_type, get_function_result_type)
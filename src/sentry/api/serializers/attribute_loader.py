@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+import sentry_sdk
+
+from sentry.utils import metrics
+
+# Shared by all serializers, only providers that do not touch Postgres are run here.
+_attribute_loader_pool = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="serializer-attribute-loader"
+)
+
+
+class AttributeLoaderDeadlineExceeded(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class AttributeProvider:
+    """
+    A single lookup of serializer attributes.
+
+    ``load`` is called with the results of the providers named in ``depends_on`` as
+    keyword arguments.  Providers are ``concurrent`` if they are safe to run outside of
+    the request thread, which in practice means they must not query Postgres: Django
+    connections are bound to the thread that opened them.  Snuba and cache lookups
+    are fine.
+    """
+
+    name: str
+    load: Callable[..., Any]
+    depends_on: tuple[str, ...] = ()
+    concurrent: bool = False
+
+
+def _run_provider(
+    provider: AttributeProvider,
+    dependencies: Mapping[str, Any],
+    metric_prefix: str,
+) -> Any:
+    with (
+        sentry_sdk.start_span(op="serializer.load_attrs", name=provider.name),
+        metrics.timer(f"{metric_prefix}.provider", tags={"provider": provider.name}),
+    ):
+        return provider.load(**{name: dependencies[name] for name in provider.depends_on})
+
+
+def _run_provider_in_thread(
+    isolation_scope: sentry_sdk.Scope,
+    current_scope: sentry_sdk.Scope,
+    provider: AttributeProvider,
+    dependencies: Mapping[str, Any],
+    metric_prefix: str,
+) -> Any:
+    with sentry_sdk.scope.use_isolation_scope(isolation_scope):
+        with sentry_sdk.scope.use_scope(current_scope):
+            return _run_provider(provider, dependencies, metric_prefix)
+
+
+def load_attributes(
+    providers: Sequence[AttributeProvider],
+    timeout: float | None = None,
+    allow_concurrency: bool = True,
+    metric_prefix: str = "api.serializers.attribute_loader",
+) -> dict[str, Any]:
+    """
+    Runs the given providers and returns their results keyed by provider name.
+
+    Providers run as soon as all of their dependencies are resolved.  Concurrent
+    providers are submitted to a thread pool, while all others run on the calling
+    thread in the order they were given, so that Postgres lookups overlap with the
+    Snuba queries in flight.  With ``allow_concurrency=False`` every provider runs on
+    the calling thread.
+
+    :param timeout: The total time in seconds all providers may take.  Checked between
+        providers, raises :class:`AttributeLoaderDeadlineExceeded` when exceeded.
+        Providers waiting on the network should be bounded by the same deadline
+        themselves, a running provider is not interrupted.
+    """
+    by_name = {provider.name: provider for provider in providers}
+    for provider in providers:
+        for dependency in provider.depends_on:
+            if dependency not in by_name:
+                raise ValueError(f"{provider.name} depends on unknown provider {dependency}")
+
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    results: dict[str, Any] = {}
+    pending = list(providers)
+    running: dict[Future[Any], AttributeProvider] = {}
+
+    def check_deadline() -> float | None:
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            metrics.incr(f"{metric_prefix}.deadline_exceeded")
+            raise AttributeLoaderDeadlineExceeded(
+                f"Loading attributes took longer than {timeout} seconds, "
+                f"waiting for {sorted(p.name for p in [*running.values(), *pending])}"
+            )
+        return remaining
+
+    def collect(futures: set[Future[Any]]) -> None:
+        for future in futures:
+            provider = running.pop(future)
+            results[provider.name] = future.result()
+
+    try:
+        with metrics.timer(f"{metric_prefix}.total"):
+            while pending or running:
+                ready = [p for p in pending if all(d in results for d in p.depends_on)]
+
+                for provider in ready:
+                    if provider.concurrent and allow_concurrency:
+                        pending.remove(provider)
+                        future = _attribute_loader_pool.submit(
+                            _run_provider_in_thread,
+                            sentry_sdk.get_isolation_scope(),
+                            sentry_sdk.get_current_scope(),
+                            provider,
+                            {name: results[name] for name in provider.depends_on},
+                            metric_prefix,
+                        )
+                        running[future] = provider
+
+                inline = next((p for p in ready if p in pending), None)
+                if inline is not None:
+                    check_deadline()
+                    pending.remove(inline)
+                    results[inline.name] = _run_provider(inline, results, metric_prefix)
+                    collect({future for future in running if future.done()})
+                    continue
+
+                if not running:
+                    # Nothing is in flight and nothing can be started, the
+                    # dependencies must be cyclic.
+                    raise ValueError(
+                        f"Cyclic dependencies between {sorted(p.name for p in pending)}"
+                    )
+
+                done, _ = wait(running, timeout=check_deadline(), return_when=FIRST_COMPLETED)
+                if not done:
+                    check_deadline()
+                collect(done)
+    finally:
+        for future in running:
+            future.cancel()
+
+    return results
@@ -7,6 +7,7 @@ from typing import Any, TypeVar
 import sentry_sdk
 from django.contrib.auth.models import AnonymousUser
 
+from sentry.api.serializers.dataloader import loader_scope
 from sentry.users.models.user import User
 from sentry.users.services.user.model import RpcUser
 
@@ -64,7 +65,10 @@ def serialize(
                 pass
         else:
             return objects
-    with sentry_sdk.start_span(op="serialize", name=type(serializer).__name__) as span:
+    with (
+        loader_scope(),
+        sentry_sdk.start_span(op="serialize", name=type(serializer).__name__) as span,
+    ):
         span.set_data("Object Count", len(objects))
 
         with sentry_sdk.start_span(op="serialize.get_attrs", name=type(serializer).__name__):
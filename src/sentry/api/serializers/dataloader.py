@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Generator, Hashable, Iterable, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from django.db.models import Model
+
+from sentry.utils import metrics
+
+_loaders: ContextVar[dict[Hashable, DataLoader[Any, Any]] | None] = ContextVar(
+    "serializer_loaders", default=None
+)
+
+
+class DataLoader[K: Hashable, V]:
+    """
+    Batches lookups of individual keys into one bulk lookup.
+
+    Keys are queued with `prime` (usually from `get_attrs`) and resolved all
+    at once the first time any of them is loaded.  Results are memoized for the
+    lifetime of the loader, which is one `loader_scope` when obtained through
+    `get_loader`.
+    """
+
+    def __init__(self, name: str, batch_load: Callable[[list[K]], Mapping[K, V]]) -> None:
+        self.name = name
+        self._batch_load = batch_load
+        self._pending: dict[K, None] = {}
+        self._results: dict[K, V | None] = {}
+
+    def prime(self, keys: Iterable[K]) -> None:
+        for key in keys:
+            if key not in self._results:
+                self._pending[key] = None
+
+    def dispatch(self) -> None:
+        if not self._pending:
+            return
+
+        keys = list(self._pending)
+        self._pending.clear()
+        metrics.distribution(
+            "api.serializers.dataloader.batch_size", len(keys), tags={"loader": self.name}
+        )
+        results = self._batch_load(keys)
+        for key in keys:
+            self._results[key] = results.get(key)
+
+    def load(self, key: K) -> V | None:
+        if key not in self._results:
+            self._pending[key] = None
+            self.dispatch()
+        return self._results[key]
+
+    def load_many(self, keys: Iterable[K]) -> dict[K, V | None]:
+        keys = list(keys)
+        self.prime(keys)
+        self.dispatch()
+        return {key: self._results[key] for key in keys}
+
+
+@contextmanager
+def loader_scope() -> Generator[None]:
+    """
+    Shares loaders, and with them their memoized results, between all serializers
+    run within the scope.  Nested scopes reuse the outermost one.
+    """
+    if _loaders.get() is not None:
+        yield
+        return
+
+    token = _loaders.set({})
+    try:
+        yield
+    finally:
+        _loaders.reset(token)
+
+
+def get_loader[K: Hashable, V](
+    key: Hashable, name: str, batch_load: Callable[[list[K]], Mapping[K, V]]
+) -> DataLoader[K, V]:
+    """
+    Returns the loader registered under `key` in the current `loader_scope`.
+    Outside of a scope every call returns a new loader.
+    """
+    loaders = _loaders.get()
+    if loaders is None:
+        return DataLoader(name, batch_load)
+
+    loader = loaders.get(key)
+    if loader is None:
+        loader = loaders[key] = DataLoader(name, batch_load)
+    return loader
+
+
+def model_loader[M: Model](model: type[M]) -> DataLoader[int, M]:
+    """Returns a loader for instances of `model` by primary key."""
+    return get_loader(model, model.__name__, model.objects.in_bulk)
+
+
+def load_related[M: Model](instances: Iterable[Model], field: str, model: type[M]) -> None:
+    """
+    Fills the `field` foreign key of every instance whose related object is not
+    cached yet, with one lookup through the `model_loader` of `model`.
+    """
+    pending = []
+    for instance in instances:
+        descriptor = getattr(type(instance), field)
+        if not descriptor.is_cached(instance):
+            pending.append(instance)
+    if not pending:
+        return
+
+    attname = pending[0]._meta.get_field(field).attname
+    related = model_loader(model).load_many({getattr(instance, attname) for instance in pending})
+    for instance in pending:
+        related_instance = related[getattr(instance, attname)]
+        if related_instance is not None:
+            setattr(instance, field, related_instance)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import itertools
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
@@ -11,10 +12,12 @@ from typing import Any, Protocol, TypedDict, TypeGuard
 import sentry_sdk
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
-from django.db.models import Min, prefetch_related_objects
+from django.db.models import Min
 
-from sentry import tagstore
+from sentry import options, tagstore
 from sentry.api.serializers import Serializer, register, serialize
+from sentry.api.serializers.attribute_loader import AttributeProvider, load_attributes
+from sentry.api.serializers.dataloader import load_related
 from sentry.api.serializers.models.actor import ActorSerializer, ActorSerializerResponse
 from sentry.api.serializers.models.plugin import is_plugin_deprecated
 from sentry.constants import LOG_LEVELS
@@ -34,6 +37,7 @@ from sentry.models.groupseen import GroupSeen
 from sentry.models.groupshare import GroupShare
 from sentry.models.groupsnooze import GroupSnooze
 from sentry.models.groupsubscription import GroupSubscription
+from sentry.models.organization import Organization
 from sentry.models.project import Project
 from sentry.models.team import Team
 from sentry.notifications.helpers import (
@@ -58,7 +62,14 @@ from sentry.users.services.user.serial import serialize_generic_user
 from sentry.users.services.user.service import user_service
 from sentry.utils.cache import cache
 from sentry.utils.safe import safe_execute
-from sentry.utils.snuba import aliased_query, raw_query
+from sentry.utils.snuba import (
+    SnubaQueryParams,
+    SnubaRequest,
+    aliased_query,
+    prepare_aliased_query,
+    prepare_raw_queries,
+    send_prepared_queries,
+)
 
 # TODO(jess): remove when snuba is primary backend
 snuba_tsdb = SnubaTSDB(**settings.SENTRY_TSDB_OPTIONS)
@@ -229,16 +240,27 @@ class GroupSerializerBase(Serializer, ABC):
 
         return result
 
-    def get_attrs(
-        self, item_list: Sequence[Group], user: User | RpcUser | AnonymousUser, **kwargs: Any
-    ) -> dict[Group, dict[str, Any]]:
-        GroupMeta.objects.populate_cache(item_list)
+    def _get_attribute_providers(
+        self,
+        item_list: Sequence[Group],
+        user: User | RpcUser | AnonymousUser,
+        deadline: float | None = None,
+    ) -> list[AttributeProvider]:
+        """
+        Returns the lookups `get_attrs` is built from. Lookups that only send
+        prepared queries to Snuba are marked as concurrent and run alongside the
+        Postgres lookups. Preparing a query resolves projects, environments and
+        retention from Postgres, so that stays on the request thread, and so does
+        parsing results that are completed from Postgres. The Snuba requests are
+        bounded by `deadline`.
+        """
+        # should only have 1 org at this point
+        organization_id = item_list[0].project.organization_id
 
-        # Note that organization is necessary here for use in `_get_permalink` to avoid
-        # making unnecessary queries.
-        prefetch_related_objects(item_list, "project__organization")
+        def get_user_state():
+            if not user.is_authenticated:
+                return set(), {}, defaultdict(lambda: (False, False, None))
 
-        if user.is_authenticated and item_list:
             bookmarks = set(
                 GroupBookmark.objects.filter(user_id=user.id, group__in=item_list).values_list(
                     "group_id", flat=True
@@ -249,45 +271,100 @@ class GroupSerializerBase(Serializer, ABC):
                     "group_id", "last_seen"
                 )
             )
-            subscriptions = self._get_subscriptions(item_list, user)
-        else:
-            bookmarks = set()
-            seen_groups = {}
-            subscriptions = defaultdict(lambda: (False, False, None))
-
-        resolved_assignees = self._serialize_assignees(item_list)
-
-        ignore_items = {g.group_id: g for g in GroupSnooze.objects.filter(group__in=item_list)}
-
-        release_resolutions, commit_resolutions = self._resolve_resolutions(item_list, user)
+            return bookmarks, seen_groups, self._get_subscriptions(item_list, user)
+
+        def get_actors(ignore_items, resolutions):
+            release_resolutions, _ = resolutions
+            user_ids = {
+                user_id
+                for user_id in itertools.chain(
+                    (r[-1] for r in release_resolutions.values()),
+                    (r.actor_id for r in ignore_items.values()),
+                )
+                if user_id is not None
+            }
+            if not user_ids:
+                return {}
 
-        user_ids = {
-            user_id
-            for user_id in itertools.chain(
-                (r[-1] for r in release_resolutions.values()),
-                (r.actor_id for r in ignore_items.values()),
-            )
-            if user_id is not None
-        }
-        if user_ids:
             serialized_users = user_service.serialize_many(
                 filter={"user_ids": user_ids, "is_active": True},
                 as_user=serialize_generic_user(user),
             )
-            actors = {id: u for id, u in zip(user_ids, serialized_users)}
-        else:
-            actors = {}
-
-        share_ids = dict(
-            GroupShare.objects.filter(group__in=item_list).values_list("group_id", "uuid")
-        )
+            return {id: u for id, u in zip(user_ids, serialized_users)}
+
+        def get_annotations():
+            annotations_by_group_id: MutableMapping[int, list[Any]] = defaultdict(list)
+            for annotations_by_group in itertools.chain.from_iterable(
+                [
+                    self._resolve_integration_annotations(organization_id, item_list),
+                    [self._resolve_external_issue_annotations(item_list)],
+                ]
+            ):
+                merge_list_dictionaries(annotations_by_group_id, annotations_by_group)
+            return annotations_by_group_id
 
-        seen_stats = self._get_seen_stats(item_list, user)
+        return [
+            AttributeProvider(
+                "seen_stats_request", lambda: self._prepare_seen_stats(item_list, user)
+            ),
+            AttributeProvider(
+                "seen_stats_results",
+                lambda seen_stats_request: self._send_seen_stats(seen_stats_request, deadline),
+                depends_on=("seen_stats_request",),
+                concurrent=True,
+            ),
+            AttributeProvider(
+                "seen_stats",
+                lambda seen_stats_request, seen_stats_results: self._finish_seen_stats(
+                    item_list, user, seen_stats_request, seen_stats_results
+                ),
+                depends_on=("seen_stats_request", "seen_stats_results"),
+            ),
+            AttributeProvider(
+                "snuba_stats_request",
+                lambda seen_stats: self._prepare_group_snuba_stats(item_list, seen_stats),
+                depends_on=("seen_stats",),
+            ),
+            AttributeProvider("user_state", get_user_state),
+            AttributeProvider("assignees", lambda: self._serialize_assignees(item_list)),
+            AttributeProvider(
+                "ignore_items",
+                lambda: {g.group_id: g for g in GroupSnooze.objects.filter(group__in=item_list)},
+            ),
+            AttributeProvider("resolutions", lambda: self._resolve_resolutions(item_list, user)),
+            AttributeProvider("actors", get_actors, depends_on=("ignore_items", "resolutions")),
+            AttributeProvider(
+                "share_ids",
+                lambda: dict(
+                    GroupShare.objects.filter(group__in=item_list).values_list("group_id", "uuid")
+                ),
+            ),
+            AttributeProvider("annotations", get_annotations),
+            AttributeProvider(
+                "snuba_stats",
+                lambda snuba_stats_request: self._load_group_snuba_stats(
+                    snuba_stats_request, deadline
+                ),
+                depends_on=("snuba_stats_request",),
+                concurrent=True,
+            ),
+        ]
 
-        organization_id_list = list({item.project.organization_id for item in item_list})
+    def get_attrs(
+        self, item_list: Sequence[Group], user: User | RpcUser | AnonymousUser, **kwargs: Any
+    ) -> dict[Group, dict[str, Any]]:
         # if no groups, then we can't proceed but this seems to be a valid use case
         if not item_list:
             return {}
+
+        GroupMeta.objects.populate_cache(item_list)
+
+        # Note that organization is necessary here for use in `_get_permalink` to avoid
+        # making unnecessary queries. The loaders share them with nested serializers.
+        load_related(item_list, "project", Project)
+        load_related([item.project for item in item_list], "organization", Organization)
+
+        organization_id_list = list({item.project.organization_id for item in item_list})
         if len(organization_id_list) > 1:
             # this should never happen but if it does we should know about it
             logger.warning(
@@ -296,19 +373,26 @@ class GroupSerializerBase(Serializer, ABC):
                 organization_id_list,
             )
 
-        # should only have 1 org at this point
-        organization_id = organization_id_list[0]
-
-        annotations_by_group_id: MutableMapping[int, list[Any]] = defaultdict(list)
-        for annotations_by_group in itertools.chain.from_iterable(
-            [
-                self._resolve_integration_annotations(organization_id, item_list),
-                [self._resolve_external_issue_annotations(item_list)],
-            ]
-        ):
-            merge_list_dictionaries(annotations_by_group_id, annotations_by_group)
-
-        snuba_stats = self._get_group_snuba_stats(item_list, seen_stats)
+        timeout = options.get("api.serializers.group.attrs-timeout") or None
+        loaded = load_attributes(
+            self._get_attribute_providers(
+                item_list,
+                user,
+                deadline=time.monotonic() + timeout if timeout is not None else None,
+            ),
+            timeout=timeout,
+            allow_concurrency=options.get("api.serializers.group.concurrent-attrs.enabled"),
+            metric_prefix="api.serializers.group.get_attrs",
+        )
+        bookmarks, seen_groups, subscriptions = loaded["user_state"]
+        release_resolutions, commit_resolutions = loaded["resolutions"]
+        resolved_assignees = loaded["assignees"]
+        ignore_items = loaded["ignore_items"]
+        actors = loaded["actors"]
+        share_ids = loaded["share_ids"]
+        annotations_by_group_id = loaded["annotations"]
+        seen_stats = loaded["seen_stats"]
+        snuba_stats = loaded["snuba_stats"]
 
         result = {}
         for item in item_list:
@@ -518,9 +602,37 @@ class GroupSerializerBase(Serializer, ABC):
         # combine results back
         return {group: agg_stats[group] for group in item_list if group in agg_stats}
 
+    def _prepare_seen_stats(self, item_list: Sequence[Group], user) -> Any:
+        """
+        Prepares the Snuba requests the seen stats are loaded with, so that they can
+        be sent alongside other lookups. Serializers that can't split loading the
+        seen stats return None and load them in `_finish_seen_stats`.
+        """
+        return None
+
+    def _send_seen_stats(self, prepared: Any, deadline: float | None = None) -> Any:
+        """
+        Sends the requests returned by `_prepare_seen_stats`. Must not touch Postgres.
+        """
+        return None
+
+    def _finish_seen_stats(
+        self, item_list: Sequence[Group], user, prepared: Any, results: Any
+    ) -> Mapping[Group, SeenStats] | None:
+        return self._get_seen_stats(item_list, user)
+
     def _get_group_snuba_stats(
         self, item_list: Sequence[Group], seen_stats: Mapping[Group, SeenStats] | None
     ):
+        return self._load_group_snuba_stats(self._prepare_group_snuba_stats(item_list, seen_stats))
+
+    def _prepare_group_snuba_stats(
+        self, item_list: Sequence[Group], seen_stats: Mapping[Group, SeenStats] | None
+    ) -> tuple[dict[int, Any], SnubaRequest | None] | None:
+        """
+        Reads the cached unhandled flags and prepares the query for the missing
+        ones. Preparing the query may hit Postgres, sending it doesn't.
+        """
         if self._collapse("unhandled") and len(item_list) > 0:
             return None
         start = self._get_start_from_seen_stats(seen_stats)
@@ -541,26 +653,47 @@ class GroupSerializerBase(Serializer, ABC):
             filter_keys.setdefault("project_id", []).append(item.project_id)
             filter_keys.setdefault("group_id", []).append(item.id)
 
-        if filter_keys:
-            rv = raw_query(
-                dataset=Dataset.Events,
-                selected_columns=[
-                    "group_id",
-                    [
-                        "argMax",
-                        [["has", ["exception_stacks.mechanism_handled", 0]], "timestamp"],
-                        "unhandled",
+        if not filter_keys:
+            return unhandled, None
+
+        [snuba_request] = prepare_raw_queries(
+            [
+                SnubaQueryParams(
+                    dataset=Dataset.Events,
+                    selected_columns=[
+                        "group_id",
+                        [
+                            "argMax",
+                            [["has", ["exception_stacks.mechanism_handled", 0]], "timestamp"],
+                            "unhandled",
+                        ],
                     ],
-                ],
-                groupby=["group_id"],
-                filter_keys=filter_keys,
-                start=start,
-                orderby="group_id",
-                referrer="group.unhandled-flag",
-                tenant_ids=(
-                    {"organization_id": item_list[0].project.organization_id} if item_list else None
-                ),
-            )
+                    groupby=["group_id"],
+                    filter_keys=filter_keys,
+                    start=start,
+                    orderby="group_id",
+                    tenant_ids=(
+                        {"organization_id": item_list[0].project.organization_id}
+                        if item_list
+                        else None
+                    ),
+                )
+            ],
+            referrer="group.unhandled-flag",
+        )
+        return unhandled, snuba_request
+
+    @staticmethod
+    def _load_group_snuba_stats(
+        prepared: tuple[dict[int, Any], SnubaRequest | None] | None,
+        deadline: float | None = None,
+    ):
+        if prepared is None:
+            return None
+        unhandled, snuba_request = prepared
+
+        if snuba_request is not None:
+            [rv] = send_prepared_queries([snuba_request], deadline=deadline)
             for x in rv["data"]:
                 unhandled[x["group_id"]] = x["unhandled"]
 
@@ -1019,39 +1152,119 @@ class GroupSerializerSnuba(GroupSerializerBase):
     def _seen_stats_error(
         self, error_issue_list: Sequence[Group], user
     ) -> Mapping[Group, SeenStats]:
-        return self._parse_seen_stats_results(
-            self._execute_error_seen_stats_query(
-                item_list=error_issue_list,
-                start=self.start,
-                end=self.end,
-                conditions=self.conditions,
-                environment_ids=self.environment_ids,
-            ),
-            error_issue_list,
-            bool(self.start or self.end or self.conditions),
-            self.environment_ids,
-        )
+        return self._run_seen_stats_queries(error_issue_list, self._error_seen_stats_query_params)
 
     def _seen_stats_generic(
         self, generic_issue_list: Sequence[Group], user
     ) -> Mapping[Group, SeenStats]:
-        return self._parse_seen_stats_results(
-            self._execute_generic_seen_stats_query(
-                item_list=generic_issue_list,
+        return self._run_seen_stats_queries(
+            generic_issue_list, self._generic_seen_stats_query_params
+        )
+
+    def _run_seen_stats_queries(
+        self, issue_list: Sequence[Group], query_params_func: Callable[..., dict[str, Any]]
+    ) -> Mapping[Group, SeenStats]:
+        queries = self._get_seen_stats_queries(issue_list, query_params_func)
+        return self._combine_seen_stats(
+            issue_list, {name: aliased_query(**params) for name, params in queries.items()}
+        )
+
+    def _get_seen_stats_queries(
+        self, issue_list: Sequence[Group], query_params_func: Callable[..., dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Returns the `aliased_query` parameters of the queries the seen stats of
+        `issue_list` are built from, by name.
+        """
+        return {
+            "time_range": query_params_func(
+                item_list=issue_list,
                 start=self.start,
                 end=self.end,
                 conditions=self.conditions,
                 environment_ids=self.environment_ids,
-            ),
-            generic_issue_list,
+            )
+        }
+
+    def _combine_seen_stats(
+        self, issue_list: Sequence[Group], results: Mapping[str, Any]
+    ) -> Mapping[Group, SeenStats]:
+        """
+        Builds the seen stats from the results of `_get_seen_stats_queries`.
+        """
+        return self._parse_seen_stats_results(
+            results["time_range"],
+            issue_list,
             bool(self.start or self.end or self.conditions),
             self.environment_ids,
         )
 
+    def _partition_seen_stats_queries(
+        self, item_list: Sequence[Group]
+    ) -> list[tuple[Sequence[Group], Callable[..., dict[str, Any]]]]:
+        error_issues = [group for group in item_list if GroupCategory.ERROR == group.issue_category]
+        generic_issues = [
+            group for group in item_list if group.issue_category != GroupCategory.ERROR
+        ]
+        return [
+            (issues, query_params_func)
+            for issues, query_params_func in (
+                (error_issues, self._error_seen_stats_query_params),
+                (generic_issues, self._generic_seen_stats_query_params),
+            )
+            if issues
+        ]
+
+    def _get_seen_stats(self, item_list: Sequence[Group], user) -> Mapping[Group, SeenStats] | None:
+        prepared = self._prepare_seen_stats(item_list, user)
+        return self._finish_seen_stats(item_list, user, prepared, self._send_seen_stats(prepared))
+
+    def _prepare_seen_stats(
+        self, item_list: Sequence[Group], user
+    ) -> list[dict[str, SnubaRequest]] | None:
+        if self._collapse("stats") or not item_list:
+            return None
+
+        return [
+            {
+                name: prepare_aliased_query(**params)
+                for name, params in self._get_seen_stats_queries(issues, query_params_func).items()
+            }
+            for issues, query_params_func in self._partition_seen_stats_queries(item_list)
+        ]
+
+    def _send_seen_stats(
+        self, prepared: list[dict[str, SnubaRequest]] | None, deadline: float | None = None
+    ) -> list[dict[str, Any]] | None:
+        if prepared is None:
+            return None
+
+        # All queries are sent at once, so that Snuba runs them in parallel
+        snuba_requests = [request for requests in prepared for request in requests.values()]
+        results = iter(send_prepared_queries(snuba_requests, deadline=deadline))
+        return [{name: next(results) for name in requests} for requests in prepared]
+
+    def _finish_seen_stats(
+        self,
+        item_list: Sequence[Group],
+        user,
+        prepared: list[dict[str, SnubaRequest]] | None,
+        results: list[dict[str, Any]] | None,
+    ) -> Mapping[Group, SeenStats] | None:
+        if results is None:
+            return None
+
+        agg_stats: dict[Group, SeenStats] = {}
+        for (issues, _), issue_results in zip(
+            self._partition_seen_stats_queries(item_list), results
+        ):
+            agg_stats.update(self._combine_seen_stats(issues, issue_results))
+        return {group: agg_stats[group] for group in item_list if group in agg_stats}
+
     @staticmethod
-    def _execute_error_seen_stats_query(
+    def _error_seen_stats_query_params(
         item_list, start=None, end=None, conditions=None, environment_ids=None
-    ):
+    ) -> dict[str, Any]:
         project_ids = list({item.project_id for item in item_list})
         group_ids = [item.id for item in item_list]
         aggregations = [
@@ -1065,7 +1278,7 @@ class GroupSerializerSnuba(GroupSerializerBase):
         if environment_ids:
             filters["environment"] = environment_ids
 
-        return aliased_query(
+        return dict(
             dataset=Dataset.Events,
             start=start,
             end=end,
@@ -1079,10 +1292,18 @@ class GroupSerializerSnuba(GroupSerializerBase):
             ),
         )
 
+    @classmethod
+    def _execute_error_seen_stats_query(
+        cls, item_list, start=None, end=None, conditions=None, environment_ids=None
+    ):
+        return aliased_query(
+            **cls._error_seen_stats_query_params(item_list, start, end, conditions, environment_ids)
+        )
+
     @staticmethod
-    def _execute_generic_seen_stats_query(
+    def _generic_seen_stats_query_params(
         item_list, start=None, end=None, conditions=None, environment_ids=None
-    ):
+    ) -> dict[str, Any]:
         project_ids = list({item.project_id for item in item_list})
         group_ids = [item.id for item in item_list]
         aggregations = [
@@ -1094,7 +1315,7 @@ class GroupSerializerSnuba(GroupSerializerBase):
         filters = {"project_id": project_ids, "group_id": group_ids}
         if environment_ids:
             filters["environment"] = environment_ids
-        return aliased_query(
+        return dict(
             dataset=Dataset.IssuePlatform,
             start=start,
             end=end,
@@ -1108,6 +1329,16 @@ class GroupSerializerSnuba(GroupSerializerBase):
             ),
         )
 
+    @classmethod
+    def _execute_generic_seen_stats_query(
+        cls, item_list, start=None, end=None, conditions=None, environment_ids=None
+    ):
+        return aliased_query(
+            **cls._generic_seen_stats_query_params(
+                item_list, start, end, conditions, environment_ids
+            )
+        )
+
     @staticmethod
     def _parse_seen_stats_results(
         result, item_list, use_result_first_seen_times_seen, environment_ids=None
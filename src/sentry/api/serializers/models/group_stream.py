@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import functools
 from abc import abstractmethod
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from datetime import datetime, timedelta
-from typing import Any, NamedTuple, NotRequired, Protocol, TypedDict
+from typing import Any, NamedTuple, NotRequired, TypedDict
 
 from django.contrib.auth.models import AnonymousUser
 from django.utils import timezone
@@ -259,17 +259,6 @@ class StreamGroupSerializer(GroupSerializer, GroupStatsMixin):
         return stats
 
 
-class _SeenStatsFunc(Protocol):
-    def __call__(
-        self,
-        item_list,
-        start=None,
-        end=None,
-        conditions=None,
-        environment_ids=None,
-    ) -> Mapping[str, Any]: ...
-
-
 class _Filtered(TypedDict):
     count: str
     userCount: int
@@ -622,60 +611,55 @@ class StreamGroupSerializerSnuba(GroupSerializerSnuba, GroupStatsMixin):
             )
         return results
 
-    def _seen_stats_error(
-        self, error_issue_list: Sequence[Group], user
-    ) -> Mapping[Group, SeenStats]:
-        return self.__seen_stats_impl(error_issue_list, self._execute_error_seen_stats_query)
-
-    def _seen_stats_generic(
-        self, generic_issue_list: Sequence[Group], user
-    ) -> Mapping[Group, SeenStats]:
-        return self.__seen_stats_impl(generic_issue_list, self._execute_generic_seen_stats_query)
-
-    def __seen_stats_impl(
-        self,
-        error_issue_list: Sequence[Group],
-        seen_stats_func: _SeenStatsFunc,
-    ) -> Mapping[Any, SeenStats]:
-        partial_execute_seen_stats_query = functools.partial(
-            seen_stats_func,
-            item_list=error_issue_list,
+    def _get_seen_stats_queries(
+        self, issue_list: Sequence[Group], query_params_func: Callable[..., dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        partial_query_params = functools.partial(
+            query_params_func,
+            item_list=issue_list,
             environment_ids=self.environment_ids,
             start=self.start,
             end=self.end,
         )
+        queries = {"time_range": partial_query_params()}
+        if self.conditions and not self._collapse("filtered"):
+            queries["filtered"] = partial_query_params(conditions=self.conditions)
+        if not self._collapse("lifetime") and (self.start or self.end):
+            queries["lifetime"] = partial_query_params(start=None, end=None)
+        return queries
+
+    def _combine_seen_stats(
+        self, issue_list: Sequence[Group], results: Mapping[str, Any]
+    ) -> Mapping[Any, SeenStats]:
         time_range_result = self._parse_seen_stats_results(
-            partial_execute_seen_stats_query(),
-            error_issue_list,
+            results["time_range"],
+            issue_list,
             self.start or self.end or self.conditions,
             self.environment_ids,
         )
         filtered_result = (
             self._parse_seen_stats_results(
-                partial_execute_seen_stats_query(conditions=self.conditions),
-                error_issue_list,
+                results["filtered"],
+                issue_list,
                 self.start or self.end or self.conditions,
                 self.environment_ids,
             )
-            if self.conditions and not self._collapse("filtered")
+            if "filtered" in results
             else None
         )
         lifetime_result = (
             (
                 self._parse_seen_stats_results(
-                    partial_execute_seen_stats_query(start=None, end=None),
-                    error_issue_list,
-                    False,
-                    self.environment_ids,
+                    results["lifetime"], issue_list, False, self.environment_ids
                 )
-                if self.start or self.end
+                if "lifetime" in results
                 else time_range_result
             )
             if not self._collapse("lifetime")
             else None
         )
 
-        for item in error_issue_list:
+        for item in issue_list:
             time_range_result[item].update(
                 {
                     "filtered": filtered_result.get(item) if filtered_result else None,
@@ -1,7 +1,9 @@
 from base64 import urlsafe_b64decode, urlsafe_b64encode
 
 from sentry.api.serializers import Serializer, register
+from sentry.api.serializers.dataloader import model_loader
 from sentry.models.distribution import Distribution
+from sentry.models.files.file import File
 from sentry.models.releasefile import ReleaseFile
 
 
@@ -19,10 +21,17 @@ def encode_release_file_id(obj):
     if obj.name:
         dist_name = ""
         if obj.dist_id:
-            dist_name = Distribution.objects.get(pk=obj.dist_id).name
+            dist_name = _get_dist_name(obj.dist_id)
         return urlsafe_b64encode(f"{dist_name}_{obj.name}".encode())
 
 
+def _get_dist_name(dist_id: int) -> str:
+    dist = model_loader(Distribution).load(dist_id)
+    if dist is None:
+        raise Distribution.DoesNotExist
+    return dist.name
+
+
 def decode_release_file_id(id: str):
     """May raise ValueError"""
     try:
@@ -35,16 +44,28 @@ def decode_release_file_id(id: str):
 
 @register(ReleaseFile)
 class ReleaseFileSerializer(Serializer):
+    def get_attrs(self, item_list, user, **kwargs):
+        model_loader(Distribution).prime(item.dist_id for item in item_list if item.dist_id)
+
+        # Pseudo release files from artifact indexes carry an unsaved file.
+        files = model_loader(File).load_many(
+            item.file_id
+            for item in item_list
+            if item.file_id and not ReleaseFile.file.is_cached(item)
+        )
+        return {item: {"file": files.get(item.file_id)} for item in item_list}
+
     def serialize(self, obj, attrs, user, **kwargs):
         dist_name = None
         if obj.dist_id:
-            dist_name = Distribution.objects.get(pk=obj.dist_id).name
+            dist_name = _get_dist_name(obj.dist_id)
+        file = attrs.get("file") or obj.file
         return {
             "id": encode_release_file_id(obj),
             "name": obj.name,
             "dist": dist_name,
-            "headers": obj.file.headers,
-            "size": obj.file.size,
-            "sha1": obj.file.checksum,
-            "dateCreated": obj.file.timestamp,
+            "headers": file.headers,
+            "size": file.size,
+            "sha1": file.checksum,
+            "dateCreated": file.timestamp,
         }
@@ -145,6 +145,20 @@ def issue_occurrence_options() -> list[click.Option]:
     ]
 
 
+def query_subscription_options() -> list[click.Option]:
+    """Return a list of query subscription result consumer options."""
+    options = multiprocessing_options(default_max_batch_size=100)
+    options.append(
+        click.Option(
+            ["--mode", "mode"],
+            type=click.Choice(["parallel", "batched"]),
+            default="parallel",
+            help="The mode to process updates in. Parallel uses multi-processing, batched hands all updates of a batch to the subscribers at once.",
+        )
+    )
+    return options
+
+
 def ingest_replay_recordings_options() -> list[click.Option]:
     """Return a list of ingest-replay-recordings options."""
     options = multiprocessing_options(default_max_batch_size=10)
@@ -350,32 +364,32 @@ KAFKA_CONSUMERS: Mapping[str, ConsumerDefinition] = {
     "events-subscription-results": {
         "topic": Topic.EVENTS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "events"},
     },
     "transactions-subscription-results": {
         "topic": Topic.TRANSACTIONS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "transactions"},
     },
     "generic-metrics-subscription-results": {
         "topic": Topic.GENERIC_METRICS_SUBSCRIPTIONS_RESULTS,
         "validate_schema": True,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "generic_metrics"},
     },
     "metrics-subscription-results": {
         "topic": Topic.METRICS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "metrics"},
     },
     "subscription-results-eap-items": {
         "topic": Topic.EAP_ITEMS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {
             "dataset": "events_analytics_platform",
             "topic_override": "subscription-results-eap-items",
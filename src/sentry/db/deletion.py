@@ -33,7 +33,7 @@ class BulkDeleteQuery:
         self.order_by = order_by
         self.using = router.db_for_write(model)
 
-    def execute(self, chunk_size: int = 10000) -> None:
+    def _get_where(self) -> list[str]:
         quote_name = connections[self.using].ops.quote_name
 
         where = []
@@ -48,7 +48,12 @@ class BulkDeleteQuery:
             where.append(f"project_id = {self.project_id}")
         if self.organization_id:
             where.append(f"organization_id = {self.organization_id}")
+        return where
+
+    def execute(self, chunk_size: int = 10000) -> None:
+        quote_name = connections[self.using].ops.quote_name
 
+        where = self._get_where()
         if where:
             where_clause = "where {}".format(" and ".join(where))
         else:
@@ -83,6 +88,51 @@ class BulkDeleteQuery:
 
         return self._continuous_query(query)
 
+    def get_id_ranges(self, range_size: int) -> Generator[tuple[int, int]]:
+        """
+        Splits the id space of the table into disjoint ranges of `range_size`
+        ids, half open, without reading the ids themselves. Ranges start at
+        multiples of `range_size`, so they stay the same as rows are deleted.
+        """
+        cursor = connections[self.using].cursor()
+        cursor.execute(f"select min(id), max(id) from {self.model._meta.db_table}")
+        min_id, max_id = cursor.fetchone()
+        if min_id is None:
+            return
+
+        for lo in range(min_id // range_size * range_size, max_id + 1, range_size):
+            yield lo, min(lo + range_size, max_id + 1)
+
+    def execute_range(self, lo: int, hi: int, chunk_size: int = 10000) -> int:
+        """
+        Deletes the matching rows with ids in [lo, hi), a chunk at a time. Each
+        chunk continues from the last id deleted, so rows which are kept aren't
+        scanned again. Returns the number of rows deleted.
+        """
+        where = " and ".join(["id >= %s", "id < %s", *self._get_where()])
+        query = f"""
+            delete from {self.model._meta.db_table}
+            where id = any(array(
+                select id
+                from {self.model._meta.db_table}
+                where {where}
+                order by id
+                limit {chunk_size}
+            ))
+            returning id;
+        """
+
+        deleted = 0
+        cursor = connections[self.using].cursor()
+        while lo < hi:
+            cursor.execute(query, [lo, hi])
+            ids = [row[0] for row in cursor.fetchall()]
+            if not ids:
+                break
+            deleted += len(ids)
+            lo = max(ids) + 1
+        return deleted
+
     def _continuous_query(self, query: str) -> None:
         results = True
         cursor = connections[self.using].cursor()
@@ -8,8 +8,10 @@ from typing import TYPE_CHECKING, Any, Generic, TypeVar
 from django.db import router
 from django.db.models import Q
 
+from sentry import options
 from sentry.constants import ObjectStatus
 from sentry.db.models.base import Model
+from sentry.deletions.planner import delete_relations
 from sentry.silo.safety import unguarded_write
 from sentry.users.services.user.model import RpcUser
 from sentry.users.services.user.service import user_service
@@ -31,6 +33,11 @@ def _delete_children(
     transaction_id: str | None = None,
     actor_id: int | None = None,
 ) -> bool:
+    concurrency = options.get("deletions.planner.concurrency")
+    if concurrency > 1:
+        delete_relations(manager, relations, concurrency, transaction_id, actor_id)
+        return False
+
     # Ideally this runs through the deletion manager
     for relation in relations:
         task = manager.get(
@@ -0,0 +1,267 @@
+"""
+Plans the deletion of the child relations of a deletion task.
+
+Deletion tasks return their child relations as an ordered list, and the order
+matters: a relation is often listed before another because deleting it first
+keeps foreign keys intact. The planner turns that list into stages, where the
+relations in a stage are independent of each other and can be deleted
+concurrently, while the stages run in order.
+
+Two relations are only considered independent if both are deleted in bulk
+(which doesn't cascade into further relations), they are for different models
+and neither model has a foreign key to the other. Any other relation is a
+barrier that runs after everything listed before it, and before everything
+listed after it, exactly as before.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django import db
+
+from sentry import options
+from sentry.db.models.base import Model
+from sentry.utils import metrics
+
+if TYPE_CHECKING:
+    from sentry.deletions.base import BaseDeletionTask, BaseRelation
+    from sentry.deletions.manager import DeletionTaskManager
+
+# Row counts are estimated up to this many rows, so that estimating a large
+# relation stays cheap.
+ESTIMATE_LIMIT = 100_000
+
+# Bounds for the chunk size of bulk deletions as it adapts to delete latency.
+MIN_CHUNK_SIZE = 100
+MAX_CHUNK_SIZE = 50_000
+
+
+@dataclass
+class PlannedRelation:
+    relation: BaseRelation
+    stage: int
+    # The number of rows left to delete, capped to ESTIMATE_LIMIT, or None if
+    # the relation isn't for a model.
+    estimated_rows: int | None
+
+
+def _get_model(relation: BaseRelation) -> type[Model] | None:
+    model = relation.params.get("model")
+    if isinstance(model, type) and issubclass(model, Model):
+        return model
+    return None
+
+
+def _get_task(
+    manager: DeletionTaskManager, relation: BaseRelation
+) -> type[BaseDeletionTask[Any]] | None:
+    if relation.task is not None:
+        return relation.task
+    model = _get_model(relation)
+    if model is None:
+        return None
+    return manager.tasks.get(model, manager.default_task)
+
+
+def _has_foreign_key(model: type[Model], other: type[Model]) -> bool:
+    return any(
+        field.related_model is other
+        for field in model._meta.get_fields()
+        if field.concrete and (field.many_to_one or field.one_to_one)
+    )
+
+
+def _is_independent(
+    manager: DeletionTaskManager, relation: BaseRelation, other: BaseRelation
+) -> bool:
+    from sentry.deletions.base import BulkModelDeletionTask
+
+    model, other_model = _get_model(relation), _get_model(other)
+    if model is None or other_model is None or model is other_model:
+        return False
+
+    for r in (relation, other):
+        task = _get_task(manager, r)
+        if task is None or not issubclass(task, BulkModelDeletionTask):
+            return False
+
+    return not _has_foreign_key(model, other_model) and not _has_foreign_key(other_model, model)
+
+
+def estimate_rows(relation: BaseRelation, limit: int = ESTIMATE_LIMIT) -> int | None:
+    model = _get_model(relation)
+    if model is None:
+        return None
+    return model.objects.filter(**relation.params["query"])[:limit].count()
+
+
+def plan_relations(
+    manager: DeletionTaskManager,
+    relations: Sequence[BaseRelation],
+    estimate: bool = True,
+) -> list[list[PlannedRelation]]:
+    """
+    Splits relations into stages of relations which can be deleted
+    concurrently. Each relation is placed in the stage after the last relation
+    listed before it that it depends on, and the relations of a stage are
+    ordered by their estimated size, largest first.
+    """
+    planned: list[PlannedRelation] = []
+    for relation in relations:
+        stage = 0
+        for previous in planned:
+            if previous.stage >= stage and not _is_independent(
+                manager, previous.relation, relation
+            ):
+                stage = previous.stage + 1
+        planned.append(
+            PlannedRelation(
+                relation=relation,
+                stage=stage,
+                estimated_rows=estimate_rows(relation) if estimate else None,
+            )
+        )
+
+    stages: list[list[PlannedRelation]] = [[] for _ in range(max(p.stage for p in planned) + 1)]
+    for p in planned:
+        stages[p.stage].append(p)
+    for stage_relations in stages:
+        stage_relations.sort(key=lambda p: -(p.estimated_rows or 0))
+    return stages
+
+
+def get_progress(
+    task: BaseDeletionTask[Any], instance_list: Sequence[Model]
+) -> list[dict[str, Any]]:
+    """
+    Reports the estimated number of rows left to delete for each child
+    relation of the given instances, in the stages they would be deleted in.
+    """
+    relations = list(task.get_child_relations_bulk(instance_list))
+    for instance in instance_list:
+        relations.extend(task.get_child_relations(instance))
+    relations = task.filter_relations(relations)
+    if not relations:
+        return []
+
+    progress = []
+    for stage in plan_relations(task.manager, relations):
+        for p in stage:
+            model = _get_model(p.relation)
+            progress.append(
+                {
+                    "model": model.__name__ if model else None,
+                    "stage": p.stage,
+                    "estimated_rows": p.estimated_rows,
+                    "estimate_limit": ESTIMATE_LIMIT,
+                }
+            )
+    return progress
+
+
+class AdaptiveChunkSize:
+    """
+    Adjusts the chunk size of a bulk deletion so that each chunk takes about
+    the target duration: chunks that are much faster than the target grow the
+    next chunk, and chunks slower than the target shrink it.
+    """
+
+    def __init__(self, chunk_size: int, target_duration: float) -> None:
+        self.chunk_size = min(max(chunk_size, MIN_CHUNK_SIZE), MAX_CHUNK_SIZE)
+        self.target_duration = target_duration
+
+    def observe(self, duration: float) -> int:
+        if duration > self.target_duration:
+            self.chunk_size = max(MIN_CHUNK_SIZE, self.chunk_size // 2)
+        elif duration < self.target_duration / 2:
+            self.chunk_size = min(MAX_CHUNK_SIZE, int(self.chunk_size * 1.5))
+        return self.chunk_size
+
+
+def _run_relation(
+    manager: DeletionTaskManager,
+    relation: BaseRelation,
+    transaction_id: str | None,
+    actor_id: int | None,
+) -> None:
+    from sentry.deletions.base import BulkModelDeletionTask
+
+    task = manager.get(
+        transaction_id=transaction_id,
+        actor_id=actor_id,
+        task=relation.task,
+        **relation.params,
+    )
+
+    chunk_size = None
+    if isinstance(task, BulkModelDeletionTask):
+        chunk_size = AdaptiveChunkSize(
+            task.chunk_size, options.get("deletions.planner.target-chunk-duration")
+        )
+
+    task_name = type(task).__name__
+    has_more = True
+    while has_more:
+        start = time.monotonic()
+        has_more = task.chunk()
+        if chunk_size is not None:
+            task.chunk_size = chunk_size.observe(time.monotonic() - start)
+            metrics.distribution(
+                "deletions.planner.chunk_size", task.chunk_size, tags={"task": task_name}
+            )
+        if has_more:
+            metrics.incr("deletions.should_spawn", tags={"task": task_name})
+
+
+def _run_relation_in_thread(
+    manager: DeletionTaskManager,
+    relation: BaseRelation,
+    transaction_id: str | None,
+    actor_id: int | None,
+) -> None:
+    try:
+        _run_relation(manager, relation, transaction_id, actor_id)
+    finally:
+        # Connections are per thread, so close the ones this thread opened.
+        db.connections.close_all()
+
+
+def delete_relations(
+    manager: DeletionTaskManager,
+    relations: Sequence[BaseRelation],
+    concurrency: int,
+    transaction_id: str | None = None,
+    actor_id: int | None = None,
+) -> None:
+    """
+    Deletes relations stage by stage, running the relations of each stage on
+    up to `concurrency` threads.
+    """
+    stages = plan_relations(manager, relations, estimate=False)
+    metrics.distribution("deletions.planner.stages", len(stages))
+
+    for stage in stages:
+        metrics.distribution("deletions.planner.stage_size", len(stage))
+        if len(stage) > concurrency:
+            # Start the largest relations first, so that they don't hold up the
+            # end of the stage.
+            stage.sort(key=lambda p: -(estimate_rows(p.relation) or 0))
+
+        if len(stage) == 1 or concurrency <= 1:
+            for p in stage:
+                _run_relation(manager, p.relation, transaction_id, actor_id)
+            continue
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(stage))) as pool:
+            futures = [
+                pool.submit(_run_relation_in_thread, manager, p.relation, transaction_id, actor_id)
+                for p in stage
+            ]
+            # Wait for the whole stage, raising the first error.
+            for future in futures:
+                future.result()
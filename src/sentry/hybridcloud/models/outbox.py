@@ -3,15 +3,17 @@ from __future__ import annotations
 import abc
 import contextlib
 import datetime
+import operator
 import threading
-from collections.abc import Generator, Iterable, Mapping
+from collections.abc import Generator, Iterable, Mapping, Sequence
+from functools import reduce
 from typing import Any, Self
 
 import psycopg2.errors
 import sentry_sdk
 from django import db
 from django.db import DatabaseError, OperationalError, connections, models, router, transaction
-from django.db.models import Count, Max, Min
+from django.db.models import Case, Count, Max, Min, Q, Value, When
 from django.db.models.functions import Now
 from django.db.transaction import Atomic
 from django.utils import timezone
@@ -146,6 +148,54 @@ class OutboxBase(Model):
             else:
                 raise
 
+    @classmethod
+    def prepare_next_from_shards(cls, rows: Sequence[Mapping[str, Any]]) -> list[Self]:
+        """
+        Claims many shards at once, like `prepare_next_from_shard` does for one:
+        the first message of every shard is locked in a single query, skipping
+        shards which are being processed elsewhere, and the claimed shards are
+        rescheduled in a single update.
+
+        :return: The first message of each claimed shard, in the order of `rows`.
+        """
+        if not rows:
+            return []
+
+        using = router.db_for_write(cls)
+        with transaction.atomic(using=using, savepoint=False):
+            first_ids = (
+                cls.objects.filter(reduce(operator.or_, (Q(**row) for row in rows)))
+                .values(*cls.sharding_columns)
+                .annotate(first_id=Min("id"))
+                .values("first_id")
+            )
+            next_outboxes = list(
+                cls.objects.filter(id__in=first_ids).select_for_update(skip_locked=True)
+            )
+            if not next_outboxes:
+                return []
+
+            shards = {
+                outbox: Q(**outbox.key_from(cls.sharding_columns)) for outbox in next_outboxes
+            }
+            now = timezone.now()
+            cls.objects.filter(reduce(operator.or_, shards.values())).update(
+                scheduled_for=Case(
+                    *(
+                        When(shard, then=Value(outbox.next_schedule(now)))
+                        for outbox, shard in shards.items()
+                    ),
+                    output_field=models.DateTimeField(),
+                ),
+                scheduled_from=now,
+            )
+
+        order = {tuple(row[k] for k in cls.sharding_columns): i for i, row in enumerate(rows)}
+        return sorted(
+            next_outboxes,
+            key=lambda outbox: order[tuple(getattr(outbox, k) for k in cls.sharding_columns)],
+        )
+
     def key_from(self, attrs: Iterable[str]) -> Mapping[str, Any]:
         return {k: _ensure_not_null(k, getattr(self, k)) for k in attrs}
 
@@ -298,41 +348,43 @@ class OutboxBase(Model):
     def process(self, is_synchronous_flush: bool) -> bool:
         with self.process_coalesced(is_synchronous_flush=is_synchronous_flush) as coalesced:
             if coalesced is not None and not self.should_skip_shard():
-                with (
-                    metrics.timer(
-                        "outbox.send_signal.duration",
-                        tags={
-                            "category": OutboxCategory(coalesced.category).name,
-                            "synchronous": int(is_synchronous_flush),
-                        },
-                    ),
-                    sentry_sdk.start_span(op="outbox.process") as span,
-                ):
-                    self._set_span_data_for_coalesced_message(span=span, message=coalesced)
-                    try:
-                        coalesced.send_signal()
-                    except Exception as e:
-                        category_number = coalesced.category
-                        category_name = OutboxCategory(category_number).name
-                        error_message = (
-                            f"Could not flush shard category={category_number} ({category_name})"
-                        )
-
-                        if in_test_environment():
-                            orig_error = f"{type(e).__name__}: {e}"
-                            error_message += (
-                                "\n\nNOTE: This error is the last in a chain. If you are seeing "
-                                + "this while running tests, your real problem is likely the error "
-                                + "causing this flush error:"
-                                + f"\n\n\t{orig_error}\n\n"
-                                + "Scroll up to that error for details."
-                            )
-
-                        raise OutboxFlushError(error_message, coalesced) from e
-
+                self._send_coalesced_signal(coalesced, is_synchronous_flush)
                 return True
         return False
 
+    def _send_coalesced_signal(self, coalesced: OutboxBase, is_synchronous_flush: bool) -> None:
+        with (
+            metrics.timer(
+                "outbox.send_signal.duration",
+                tags={
+                    "category": OutboxCategory(coalesced.category).name,
+                    "synchronous": int(is_synchronous_flush),
+                },
+            ),
+            sentry_sdk.start_span(op="outbox.process") as span,
+        ):
+            self._set_span_data_for_coalesced_message(span=span, message=coalesced)
+            try:
+                coalesced.send_signal()
+            except Exception as e:
+                category_number = coalesced.category
+                category_name = OutboxCategory(category_number).name
+                error_message = (
+                    f"Could not flush shard category={category_number} ({category_name})"
+                )
+
+                if in_test_environment():
+                    orig_error = f"{type(e).__name__}: {e}"
+                    error_message += (
+                        "\n\nNOTE: This error is the last in a chain. If you are seeing "
+                        + "this while running tests, your real problem is likely the error "
+                        + "causing this flush error:"
+                        + f"\n\n\t{orig_error}\n\n"
+                        + "Scroll up to that error for details."
+                    )
+
+                raise OutboxFlushError(error_message, coalesced) from e
+
     @abc.abstractmethod
     def send_signal(self) -> None:
         pass
@@ -376,6 +428,154 @@ class OutboxBase(Model):
                 f"Failed to process Outbox, {OutboxCategory(self.category).name} due to database error",
             ) from e
 
+    def bulk_drain_shard(self, batch_size: int = 100) -> int:
+        """
+        Drains the whole shard like `drain_shard(flush_all=True)`, but works
+        through the coalesced groups at the head of the shard a batch at a time
+        instead of one group per transaction: the latest message of each group
+        is sent in shard order, then every message of the sent groups is deleted
+        together.
+
+        :return: The number of messages processed.
+        """
+        in_test_assert_no_transaction(
+            "bulk_drain_shard should only be called outside of any active transaction!"
+        )
+
+        # Disabled shards keep the latest message of every group, which only
+        # the one group at a time drain handles.
+        if self.should_skip_shard():
+            self.drain_shard(flush_all=True)
+            return 0
+
+        processed_count = 0
+        try:
+            while True:
+                with self.process_shard(None) as shard_row:
+                    if shard_row is None:
+                        break
+                    # A failed send doesn't roll back the groups sent before
+                    # it, so that they aren't sent again.
+                    batch_count, error = self._process_batch(batch_size)
+                    processed_count += batch_count
+                if error is not None:
+                    raise error
+        except DatabaseError as e:
+            raise OutboxDatabaseError(
+                f"Failed to process Outbox, {OutboxCategory(self.category).name} due to database error",
+            ) from e
+        return processed_count
+
+    def _process_batch(self, batch_size: int) -> tuple[int, OutboxFlushError | None]:
+        head = (
+            self.selected_messages_in_shard()
+            .order_by("id")
+            .values_list("category", "object_identifier")[:batch_size]
+        )
+        groups = list(dict.fromkeys(head))
+        if not groups:
+            return 0, None
+
+        # The first and latest message of each group, including messages past
+        # the head of the shard, as they are coalesced into the latest one.
+        bounds = (
+            self.selected_messages_in_shard()
+            .filter(
+                reduce(
+                    operator.or_,
+                    (
+                        Q(category=category, object_identifier=object_identifier)
+                        for category, object_identifier in groups
+                    ),
+                )
+            )
+            .values("category", "object_identifier")
+            .annotate(first_id=Min("id"), last_id=Max("id"))
+        )
+        group_ids = {
+            (row["category"], row["object_identifier"]): (row["first_id"], row["last_id"])
+            for row in bounds
+        }
+        messages = self.objects.in_bulk(
+            [message_id for ids in group_ids.values() for message_id in ids]
+        )
+
+        now = datetime.datetime.now(tz=datetime.UTC).timestamp()
+        sent: list[tuple[OutboxBase, OutboxBase]] = []
+        error: OutboxFlushError | None = None
+        for group in sorted(group_ids, key=lambda group: group_ids[group][0]):
+            first_id, last_id = group_ids[group]
+            first_coalesced, coalesced = messages[first_id], messages[last_id]
+            metrics.timing(
+                "outbox.coalesced_net_queue_time",
+                now - first_coalesced.date_added.timestamp(),
+                tags={"category": OutboxCategory(coalesced.category).name, "synchronous": 0},
+            )
+            try:
+                self._send_coalesced_signal(coalesced, is_synchronous_flush=False)
+            except OutboxFlushError as e:
+                error = e
+                break
+            sent.append((first_coalesced, coalesced))
+
+        return self._delete_coalesced(sent, batch_size), error
+
+    def _delete_coalesced(
+        self, sent: Sequence[tuple[OutboxBase, OutboxBase]], batch_size: int
+    ) -> int:
+        if not sent:
+            return 0
+
+        last_ids = {
+            (coalesced.category, coalesced.object_identifier): coalesced.id for _, coalesced in sent
+        }
+        messages = self.selected_messages_in_shard().filter(
+            reduce(
+                operator.or_,
+                (
+                    Q(category=category, object_identifier=object_identifier)
+                    for category, object_identifier in last_ids
+                ),
+            )
+        )
+
+        # As in `process_coalesced`, delete in batches and apply the id
+        # condition in python, as filtering rows in postgres leads to timeouts.
+        processed: dict[int, int] = {}
+        while True:
+            batch = messages.order_by("id").values_list("id", "category", "object_identifier")[
+                :batch_size
+            ]
+            delete_ids = []
+            for message_id, category, object_identifier in batch:
+                if message_id <= last_ids[(category, object_identifier)]:
+                    delete_ids.append(message_id)
+                    processed[category] = processed.get(category, 0) + 1
+            if not delete_ids:
+                break
+            self.objects.filter(id__in=delete_ids).delete()
+
+        now = datetime.datetime.now(tz=datetime.UTC).timestamp()
+        for category, count in processed.items():
+            metrics.incr(
+                "outbox.processed",
+                count,
+                tags={"category": OutboxCategory(category).name, "synchronous": 0},
+            )
+        for first_coalesced, coalesced in sent:
+            tags = {"category": OutboxCategory(coalesced.category).name, "synchronous": 0}
+            metrics.timing(
+                "outbox.processing_lag",
+                now - first_coalesced.scheduled_from.timestamp(),
+                tags=tags,
+            )
+            metrics.timing(
+                "outbox.coalesced_net_processing_time",
+                now - first_coalesced.date_added.timestamp(),
+                tags=tags,
+            )
+        return sum(processed.values())
+
     @classmethod
     def get_shard_depths_descending(cls, limit: int | None = 10) -> list[dict[str, int | str]]:
         """
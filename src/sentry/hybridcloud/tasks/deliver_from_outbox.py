@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import math
+import time
 from typing import Any
 
 import sentry_sdk
 from django.conf import settings
 from django.db.models import Max, Min
 
+from sentry import options
 from sentry.hybridcloud.models.outbox import (
     ControlOutboxBase,
     OutboxBase,
@@ -20,6 +22,7 @@ from sentry.taskworker.namespaces import hybridcloud_control_tasks, hybridcloud_
 from sentry.taskworker.task import Task
 from sentry.utils import metrics
 from sentry.utils.env import in_test_environment
+from sentry.utils.iterators import chunked
 
 
 @instrumented_task(
@@ -62,6 +65,9 @@ def enqueue_outbox_jobs(
 # non coalesced work.
 CONCURRENCY = 5
 
+# The number of the deepest shards whose depth is recorded each turn of the scheduler.
+SHARD_DEPTH_SAMPLE_SIZE = 10
+
 
 def schedule_batch(
     silo_mode: SiloMode,
@@ -104,7 +110,16 @@ def schedule_batch(
                     outbox_identifier_hi=lo + (i + 1) * batch_size,
                 )
 
-            deepest_shard_information = outbox_model.get_shard_depths_descending(limit=1)
+            deepest_shard_information = outbox_model.get_shard_depths_descending(
+                limit=SHARD_DEPTH_SAMPLE_SIZE
+            )
+            for shard_information in deepest_shard_information:
+                metrics.distribution(
+                    "deliver_from_outbox.shard_depth",
+                    value=float(shard_information["depth"]),
+                    tags=metrics_tags,
+                    sample_rate=1.0,
+                )
             max_shard_depth = (
                 float(deepest_shard_information[0]["depth"]) if deepest_shard_information else 0.0
             )
@@ -181,6 +196,9 @@ def drain_outbox_shards_control(
 def process_outbox_batch(
     outbox_identifier_hi: int, outbox_identifier_low: int, outbox_model: type[OutboxBase]
 ) -> int:
+    if options.get("hybrid_cloud.outbox.bulk_drain.enabled"):
+        return bulk_process_outbox_batch(outbox_identifier_hi, outbox_identifier_low, outbox_model)
+
     processed_count: int = 0
     for shard_attributes in outbox_model.find_scheduled_shards(
         outbox_identifier_low, outbox_identifier_hi
@@ -193,21 +211,60 @@ def process_outbox_batch(
             processed_count += 1
             shard_outbox.drain_shard(flush_all=True)
         except Exception as e:
-            with sentry_sdk.isolation_scope() as scope:
-                if isinstance(e, OutboxFlushError):
-                    scope.set_tag("outbox.category", e.outbox.category)
-                    scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
-                    scope.set_context(
-                        "outbox",
-                        {
-                            "shard_identifier": e.outbox.shard_identifier,
-                            "object_identifier": e.outbox.object_identifier,
-                            "payload": e.outbox.payload,
-                        },
-                    )
-                sentry_sdk.capture_exception(e)
-                # In production, it's ok to just continue processing forward, but in tests we aim to surface
-                # problems aggressively.
-                if in_test_environment():
-                    raise
+            _capture_drain_error(e)
     return processed_count
+
+
+def bulk_process_outbox_batch(
+    outbox_identifier_hi: int, outbox_identifier_low: int, outbox_model: type[OutboxBase]
+) -> int:
+    """
+    Like `process_outbox_batch`, but claims many shards with each query and
+    drains each shard a batch of coalesced messages at a time.
+    """
+    shards_per_claim = options.get("hybrid_cloud.outbox.bulk_drain.shards")
+    batch_size = options.get("hybrid_cloud.outbox.bulk_drain.batch_size")
+
+    processed_count: int = 0
+    message_count: int = 0
+    start = time.monotonic()
+    scheduled_shards = outbox_model.find_scheduled_shards(
+        outbox_identifier_low, outbox_identifier_hi
+    )
+    for shards in chunked(scheduled_shards, shards_per_claim):
+        for shard_outbox in outbox_model.prepare_next_from_shards(shards):
+            try:
+                processed_count += 1
+                message_count += shard_outbox.bulk_drain_shard(batch_size=batch_size)
+            except Exception as e:
+                _capture_drain_error(e)
+
+    duration = time.monotonic() - start
+    metrics_tags = dict(outbox_name=outbox_model._meta.label)
+    metrics.incr("deliver_from_outbox.drained_shards", processed_count, tags=metrics_tags)
+    metrics.incr("deliver_from_outbox.drained_messages", message_count, tags=metrics_tags)
+    if duration > 0:
+        metrics.distribution(
+            "deliver_from_outbox.drain_rate", message_count / duration, tags=metrics_tags
+        )
+    return processed_count
+
+
+def _capture_drain_error(e: Exception) -> None:
+    with sentry_sdk.isolation_scope() as scope:
+        if isinstance(e, OutboxFlushError):
+            scope.set_tag("outbox.category", e.outbox.category)
+            scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
+            scope.set_context(
+                "outbox",
+                {
+                    "shard_identifier": e.outbox.shard_identifier,
+                    "object_identifier": e.outbox.object_identifier,
+                    "payload": e.outbox.payload,
+                },
+            )
+        sentry_sdk.capture_exception(e)
+        # In production, it's ok to just continue processing forward, but in tests we aim to surface
+        # problems aggressively.
+        if in_test_environment():
+            raise e
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime, timedelta
 from typing import Literal, TypedDict, TypeVar
 
@@ -23,11 +25,11 @@ from sentry.incidents.utils.types import (
 from sentry.models.organization import Organization
 from sentry.models.project import Project
 from sentry.snuba.dataset import Dataset
-from sentry.snuba.models import QuerySubscription
+from sentry.snuba.models import QuerySubscription, SnubaQuery
 from sentry.utils import metrics, redis
 from sentry.utils.dates import to_datetime
 from sentry.utils.memory import track_memory_usage
-from sentry.workflow_engine.models import DataPacket, Detector
+from sentry.workflow_engine.models import DataPacket, DataSourceDetector, Detector
 from sentry.workflow_engine.processors.data_packet import process_data_packet
 from sentry.workflow_engine.types import DetectorEvaluationResult, DetectorGroupKey
 
@@ -58,10 +60,27 @@ class SubscriptionProcessor:
     and then can process one or more updates via `process_update`.
     """
 
-    def __init__(self, subscription: QuerySubscription) -> None:
+    def __init__(
+        self,
+        subscription: QuerySubscription,
+        preloaded: tuple[Detector | None, datetime] | None = None,
+    ) -> None:
+        """
+        :param preloaded: The detector of the subscription and its last update, when
+            already loaded in bulk by `process_updates`.
+        """
         self.subscription = subscription
         self.detector: Detector | None = None
         self.last_update = to_datetime(0)
+        # Whether `process_update` stores the last update itself, or leaves it to
+        # `process_updates` to store all of them at once.
+        self.store_last_update = preloaded is None
+
+        if preloaded is not None:
+            self.detector, self.last_update = preloaded
+            if self.detector is None:
+                logger.info("Detector not found", extra={"subscription_id": self.subscription.id})
+            return
 
         # We're doing workflow engine processing, we need the Detector.
         try:
@@ -73,6 +92,85 @@ class SubscriptionProcessor:
         except Detector.DoesNotExist:
             logger.info("Detector not found", extra={"subscription_id": self.subscription.id})
 
+    @classmethod
+    def process_updates(
+        cls, updates: Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]]
+    ) -> None:
+        """
+        Process a batch of updates, such as all updates of a consumer batch.
+
+        Projects, queries and detectors of all subscriptions are loaded in bulk, and
+        the last updates of the detectors are read and written in one Redis round
+        trip each. Updates of the same subscription are processed in order by a
+        single processor. A failure to process an update is logged and does not
+        affect the updates of other subscriptions.
+        """
+        if not updates:
+            return
+
+        updates_by_subscription: dict[int, list[QuerySubscriptionUpdate]] = defaultdict(list)
+        subscriptions: dict[int, QuerySubscription] = {}
+        for subscription_update, subscription in updates:
+            updates_by_subscription[subscription.id].append(subscription_update)
+            subscriptions[subscription.id] = subscription
+
+        metrics.distribution(
+            "incidents.alert_rules.process_updates.batch_size",
+            len(updates),
+            tags={"subscriptions": "false"},
+        )
+        metrics.distribution(
+            "incidents.alert_rules.process_updates.batch_size",
+            len(subscriptions),
+            tags={"subscriptions": "true"},
+        )
+
+        _preload_subscription_relations(subscriptions.values())
+        detectors = _bulk_get_detectors(subscriptions.values())
+        last_updates = bulk_get_detector_last_updates(
+            [
+                (detector, subscriptions[subscription_id].project_id)
+                for subscription_id, detector in detectors.items()
+            ]
+        )
+
+        processors: list[SubscriptionProcessor] = []
+        try:
+            for subscription_id, subscription_updates in updates_by_subscription.items():
+                subscription = subscriptions[subscription_id]
+                detector = detectors.get(subscription_id)
+                last_update = (
+                    last_updates[(detector.id, subscription.project_id)]
+                    if detector
+                    else to_datetime(0)
+                )
+                processor = cls(subscription, preloaded=(detector, last_update))
+                processors.append(processor)
+                for subscription_update in sorted(
+                    subscription_updates, key=lambda update: update["timestamp"]
+                ):
+                    try:
+                        with metrics.timer("incidents.subscription_procesor.process_update"):
+                            processor.process_update(subscription_update)
+                    except Exception:
+                        logger.exception(
+                            "Failed to process subscription update",
+                            extra={
+                                "subscription_id": subscription_id,
+                                "subscription_update": subscription_update,
+                            },
+                        )
+        finally:
+            bulk_store_detector_last_updates(
+                [
+                    (processor.detector, processor.subscription.project_id, processor.last_update)
+                    for processor in processors
+                    if processor.detector is not None
+                    and processor.last_update
+                    > last_updates[(processor.detector.id, processor.subscription.project_id)]
+                ]
+            )
+
     def get_crash_rate_alert_metrics_aggregation_value(
         self, subscription_update: QuerySubscriptionUpdate
     ) -> float | None:
@@ -259,20 +357,20 @@ class SubscriptionProcessor:
                 metrics.incr("incidents.alert_rules.skipping_update_invalid_aggregation_value")
                 # We have an invalid aggregate, but we _did_ process the update, so we store
                 # last_update to reflect that and avoid reprocessing.
-                store_detector_last_update(
-                    self.detector, self.subscription.project.id, self.last_update
-                )
+                self._store_last_update(self.detector)
                 return False
 
             self.process_results_workflow_engine(
                 self.detector, subscription_update, aggregation_value
             )
             # Ensure that we have last_update stored for all Detector evaluations.
-            store_detector_last_update(
-                self.detector, self.subscription.project.id, self.last_update
-            )
+            self._store_last_update(self.detector)
             return True
 
+    def _store_last_update(self, detector: Detector) -> None:
+        if self.store_last_update:
+            store_detector_last_update(detector, self.subscription.project.id, self.last_update)
+
 
 def build_detector_last_update_key(detector: Detector, project_id: int) -> str:
     return f"detector:{detector.id}:project:{project_id}:last_update"
@@ -292,6 +390,79 @@ def store_detector_last_update(detector: Detector, project_id: int, last_update:
     )
 
 
+def bulk_get_detector_last_updates(
+    detectors: Iterable[tuple[Detector, int]],
+) -> dict[tuple[int, int], datetime]:
+    """
+    Like `get_detector_last_update`, for many detector and project pairs at once.
+    Returns the last updates keyed by detector id and project id.
+    """
+    detectors = list(detectors)
+    if not detectors:
+        return {}
+
+    with get_redis_client().pipeline(transaction=False) as pipeline:
+        for detector, project_id in detectors:
+            pipeline.get(build_detector_last_update_key(detector, project_id))
+        values = pipeline.execute()
+
+    return {
+        (detector.id, project_id): to_datetime(int(value or "0"))
+        for (detector, project_id), value in zip(detectors, values)
+    }
+
+
+def bulk_store_detector_last_updates(
+    last_updates: Iterable[tuple[Detector, int, datetime]],
+) -> None:
+    last_updates = list(last_updates)
+    if not last_updates:
+        return
+
+    with get_redis_client().pipeline(transaction=False) as pipeline:
+        for detector, project_id, last_update in last_updates:
+            pipeline.set(
+                build_detector_last_update_key(detector, project_id),
+                int(last_update.timestamp()),
+                ex=REDIS_TTL,
+            )
+        pipeline.execute()
+
+
+def _preload_subscription_relations(subscriptions: Iterable[QuerySubscription]) -> None:
+    """
+    Load the projects, organizations and queries of the subscriptions in bulk,
+    rather than one by one when first accessed.
+    """
+    subscriptions = list(subscriptions)
+    projects = Project.objects.select_related("organization").in_bulk(
+        {subscription.project_id for subscription in subscriptions}
+    )
+    snuba_queries = SnubaQuery.objects.in_bulk(
+        {subscription.snuba_query_id for subscription in subscriptions}
+    )
+    for subscription in subscriptions:
+        # Missing projects are left unset, so that accessing them raises as before.
+        if project := projects.get(subscription.project_id):
+            subscription.project = project
+        if snuba_query := snuba_queries.get(subscription.snuba_query_id):
+            subscription.snuba_query = snuba_query
+
+
+def _bulk_get_detectors(subscriptions: Iterable[QuerySubscription]) -> Mapping[int, Detector]:
+    """
+    Returns the detectors of the subscriptions, keyed by subscription id.
+    """
+    subscription_ids = {str(subscription.id) for subscription in subscriptions}
+    return {
+        int(data_source_detector.data_source.source_id): data_source_detector.detector
+        for data_source_detector in DataSourceDetector.objects.filter(
+            data_source__type=DATA_SOURCE_SNUBA_QUERY_SUBSCRIPTION,
+            data_source__source_id__in=subscription_ids,
+        ).select_related("data_source", "detector")
+    }
+
+
 def get_redis_client() -> RetryingRedisCluster:
     cluster_key = settings.SENTRY_INCIDENT_RULES_REDIS_CLUSTER
     return redis.redis_clusters.get(cluster_key)  # type: ignore[return-value]
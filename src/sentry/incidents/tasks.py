@@ -17,7 +17,10 @@ from sentry.incidents.utils.types import QuerySubscriptionUpdate
 from sentry.models.project import Project
 from sentry.silo.base import SiloMode
 from sentry.snuba.models import QuerySubscription
-from sentry.snuba.query_subscriptions.consumer import register_subscriber
+from sentry.snuba.query_subscriptions.consumer import (
+    register_batch_subscriber,
+    register_subscriber,
+)
 from sentry.tasks.base import instrumented_task
 from sentry.taskworker.namespaces import alerts_tasks
 from sentry.taskworker.retry import Retry
@@ -40,6 +43,19 @@ def handle_snuba_query_update(
         SubscriptionProcessor(subscription).process_update(subscription_update)
 
 
+@register_batch_subscriber(INCIDENTS_SNUBA_SUBSCRIPTION_TYPE)
+def handle_snuba_query_updates(
+    updates: list[tuple[QuerySubscriptionUpdate, QuerySubscription]],
+) -> None:
+    """
+    Handles all subscription updates of a consumer batch.
+    """
+    from sentry.incidents.subscription_processor import SubscriptionProcessor
+
+    with metrics.timer("incidents.subscription_procesor.process_updates"):
+        SubscriptionProcessor.process_updates(updates)
+
+
 @instrumented_task(
     name="sentry.incidents.tasks.handle_trigger_action",
     namespace=alerts_tasks,
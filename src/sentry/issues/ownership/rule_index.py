@@ -0,0 +1,188 @@
+"""
+An index of ownership rules, used to only test the rules that can match an event.
+
+Testing every rule of an ownership schema against every frame of an event gets
+slow for large CODEOWNERS files, as almost none of the rules match. The index
+keys each rule by the least common word of its pattern that any value it
+matches must contain, so an event only needs to look up the words of its own
+paths, URL and modules. Rules whose other words don't appear in the event
+either are skipped as well. The candidate rules are then tested with their
+matcher as before, so the result is exactly the same as testing every rule.
+
+A word here is a run of ASCII letters, digits and underscores. A word of a
+pattern is only used as a key if it is delimited on both sides by literal
+characters (or the ends of the pattern), since a wildcard next to it could
+extend it into a longer word of the value. Rules without such a word, rules
+with patterns using character classes, escapes or non-ASCII characters, and
+tag rules are always tested.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from typing import Any
+
+import orjson
+from cachetools import LRUCache
+
+from sentry.issues.ownership.grammar import CODEOWNERS, MODULE, PATH, URL, Rule, load_schema
+from sentry.utils.event_frames import find_stack_frames
+from sentry.utils.safe import get_path
+
+# Number of indexes kept per process. Indexes of large CODEOWNERS files hold
+# tens of thousands of rules, so this is kept small.
+CACHE_SIZE = 32
+
+_WORD_RE = re.compile(r"[a-z0-9_]+")
+_WILDCARDS = frozenset("*?")
+# Patterns using any of these may match characters other than themselves.
+_UNINDEXABLE = frozenset("[]{}\\!")
+
+_cache: LRUCache[Hashable, RuleIndex] = LRUCache(maxsize=CACHE_SIZE)
+_cache_lock = threading.Lock()
+
+
+def get_pattern_words(pattern: str) -> set[str]:
+    """
+    Returns the words any value matching the pattern must contain as whole
+    words.
+    """
+    if not pattern.isascii() or _UNINDEXABLE & set(pattern):
+        return set()
+
+    pattern = pattern.lower()
+    words = set()
+    for match in _WORD_RE.finditer(pattern):
+        start, end = match.span()
+        if start > 0 and pattern[start - 1] in _WILDCARDS:
+            continue
+        if end < len(pattern) and pattern[end] in _WILDCARDS:
+            continue
+        words.add(match.group())
+    return words
+
+
+def _get_words(values: Iterable[Any]) -> set[str] | None:
+    """
+    Returns the words of the values, or None if any value can't be split into
+    words safely, in which case every rule has to be tested.
+    """
+    words: set[str] = set()
+    for value in values:
+        if not value:
+            continue
+        # Non-ASCII characters may match ASCII ones case insensitively.
+        if not isinstance(value, str) or not value.isascii():
+            return None
+        words.update(_WORD_RE.findall(value.lower()))
+    return words
+
+
+class RuleIndex:
+    def __init__(self, rules: Sequence[Rule]) -> None:
+        self.rules = list(rules)
+        # Positions of the indexed rules and the words they require, by
+        # matcher type and key.
+        self.keyed: dict[str, dict[str, list[tuple[int, frozenset[str]]]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        # Positions of the rules of each matcher type without a key.
+        self.unkeyed: dict[str, list[int]] = defaultdict(list)
+        # Positions of the rules which are always tested.
+        self.always: list[int] = []
+
+        pattern_words: dict[int, tuple[str, set[str]]] = {}
+        for i, rule in enumerate(self.rules):
+            type = rule.matcher.type
+            # Path and CODEOWNERS rules are tested against the same values.
+            if type == CODEOWNERS:
+                type = PATH
+
+            if type in (PATH, URL, MODULE):
+                pattern_words[i] = (type, get_pattern_words(rule.matcher.pattern))
+            else:
+                self.always.append(i)
+
+        # Key each rule by its least common word, so that common words such as
+        # file extensions or the directories of code mappings don't make most
+        # rules candidates for every event.
+        frequencies: Counter[str] = Counter()
+        for _, words in pattern_words.values():
+            frequencies.update(words)
+
+        for i, (type, words) in pattern_words.items():
+            if words:
+                key = min(words, key=lambda word: (frequencies[word], -len(word), word))
+                self.keyed[type][key].append((i, frozenset(words)))
+            else:
+                self.unkeyed[type].append(i)
+
+    def _get_values(
+        self,
+        type: str,
+        data: Mapping[str, Any],
+        munged_data: tuple[Sequence[Mapping[str, Any]], Sequence[str]],
+    ) -> list[Any]:
+        if type == URL:
+            return [get_path(data, "request", "url")]
+
+        if type == PATH:
+            frames, keys = munged_data
+        else:
+            frames, keys = find_stack_frames(data), ["module"]
+        return [frame.get(key) for frame in frames for key in keys]
+
+    def get_candidates(
+        self,
+        data: Mapping[str, Any],
+        munged_data: tuple[Sequence[Mapping[str, Any]], Sequence[str]],
+    ) -> list[Rule]:
+        """
+        Returns the rules which may match the event, in the order of the schema.
+        """
+        positions = set(self.always)
+        for type in set(self.keyed) | set(self.unkeyed):
+            positions.update(self.unkeyed.get(type, ()))
+
+            keyed = self.keyed.get(type)
+            if not keyed:
+                continue
+
+            words = _get_words(self._get_values(type, data, munged_data))
+            if words is None:
+                for rules in keyed.values():
+                    positions.update(i for i, _ in rules)
+            else:
+                for word in words & keyed.keys():
+                    positions.update(i for i, required in keyed[word] if required <= words)
+
+        return [self.rules[i] for i in sorted(positions)]
+
+
+def get_rule_index(schema: Mapping[str, Any], revision: Hashable | None = None) -> RuleIndex:
+    """
+    Returns the index for an ownership schema, building it if it isn't cached
+    yet. Indexes are cached by `revision`, which has to change whenever the
+    schema does, so that looking up the index doesn't have to read the whole
+    schema. Without a revision they are cached by the contents of the schema.
+    """
+    if revision is not None:
+        key: Hashable = ("revision", revision)
+    else:
+        key = ("schema", hashlib.md5(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)).hexdigest())
+    with _cache_lock:
+        index = _cache.get(key)
+    if index is None:
+        index = RuleIndex(load_schema(schema))
+        with _cache_lock:
+            _cache[key] = index
+    return index
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Mapping, Sequence
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 import sentry_sdk
 from django.db import models
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.utils import timezone
 
+from sentry import options
 from sentry.analytics.events.codeowners_assignment import CodeOwnersAssignment
 from sentry.analytics.events.issueowners_assignment import IssueOwnersAssignment
 from sentry.analytics.events.suspectcommit_assignment import SuspectCommitAssignment
@@ -16,6 +18,7 @@ from sentry.backup.scopes import RelocationScope
 from sentry.db.models import Model, region_silo_model, sane_repr
 from sentry.db.models.fields import FlexibleForeignKey
 from sentry.issues.ownership.grammar import Matcher, Rule, load_schema, resolve_actors
+from sentry.issues.ownership.rule_index import get_rule_index
 from sentry.models.activity import Activity
 from sentry.models.group import Group
 from sentry.models.groupowner import OwnerRuleType
@@ -125,7 +128,9 @@ class ProjectOwnership(Model):
         codeowners = ProjectCodeOwners.get_codeowners_cached(project_id)
         ownership.schema = cls.get_combined_schema(ownership, codeowners)
 
-        rules = cls._matching_ownership_rules(ownership, data)
+        rules = cls._matching_ownership_rules(
+            ownership, data, revision=cls._get_schema_revision(ownership, codeowners)
+        )
 
         if not rules:
             return [], None
@@ -384,12 +389,38 @@ class ProjectOwnership(Model):
                 except Exception as e:
                     sentry_sdk.capture_exception(e)
 
+    @classmethod
+    def _get_schema_revision(
+        cls, *owners: ProjectOwnership | ProjectCodeOwners | None
+    ) -> tuple[tuple[str, int, datetime], ...] | None:
+        """
+        Identifies the revision of the schemas of the given ownership rules and
+        code owners. Their timestamps are bumped on every save, so the revision
+        changes whenever any of the schemas does.
+        """
+        revision = tuple(
+            (
+                type(owner).__name__,
+                owner.id,
+                owner.last_updated if isinstance(owner, ProjectOwnership) else owner.date_updated,
+            )
+            for owner in owners
+            if owner is not None and owner.id is not None
+        )
+        return revision or None
+
     @classmethod
     def _matching_ownership_rules(
         cls,
         ownership: ProjectOwnership | ProjectCodeOwners,
         data: Mapping[str, Any],
+        revision: tuple[tuple[str, int, datetime], ...] | None = None,
     ) -> list[Rule]:
+        """
+        Returns the rules of the schema of `ownership` matching the event.
+        `revision` identifies the schema if it was combined from several
+        sources, see `_get_schema_revision`.
+        """
         if ownership.schema is None:
             return []
 
@@ -403,6 +434,24 @@ class ProjectOwnership(Model):
             tags={"ownership_type": ownership_type},
         )
 
+        if options.get("ownership.rule-index.enabled"):
+            index = get_rule_index(
+                ownership.schema,
+                revision=revision or cls._get_schema_revision(ownership),
+            )
+            metrics.distribution(
+                key="projectownership.matching_ownership_rules.rules",
+                value=len(index.rules),
+                tags={"ownership_type": ownership_type},
+            )
+            candidates = index.get_candidates(data, munged_data)
+            metrics.distribution(
+                key="projectownership.matching_ownership_rules.candidates",
+                value=len(candidates),
+                tags={"ownership_type": ownership_type},
+            )
+            return [rule for rule in candidates if rule.test(data, munged_data)]
+
         rules = load_schema(ownership.schema)
         metrics.distribution(
             key="projectownership.matching_ownership_rules.rules",
@@ -413,6 +462,13 @@ class ProjectOwnership(Model):
         return [rule for rule in rules if rule.test(data, munged_data)]
 
 
+def modify_last_updated(instance, **kwargs):
+    if instance.id is None:
+        return
+    # The rule index is cached by this timestamp, see `_get_schema_revision`.
+    instance.last_updated = timezone.now()
+
+
 def process_resource_change(instance, change, **kwargs):
     from sentry.models.groupowner import GroupOwner
     from sentry.models.projectownership import ProjectOwnership
@@ -426,6 +482,12 @@ def process_resource_change(instance, change, **kwargs):
     GroupOwner.invalidate_debounce_issue_owners_evaluation_cache(instance.project_id)
 
 
+pre_save.connect(
+    modify_last_updated,
+    sender=ProjectOwnership,
+    dispatch_uid="projectownership_modify_last_updated",
+    weak=False,
+)
 # Signals update the cached reads used in post_processing
 post_save.connect(
     lambda instance, **kwargs: process_resource_change(instance, "updated", **kwargs),
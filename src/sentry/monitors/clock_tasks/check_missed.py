@@ -7,7 +7,13 @@ from arroyo.backends.kafka import KafkaPayload
 from django.db.models import Q
 from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import MarkMissing
 
+from sentry import options
 from sentry.constants import ObjectStatus
+from sentry.monitors.due_queue import (
+    IGNORED_RECHECK_INTERVAL,
+    pop_due_monitor_environments,
+    schedule_monitor_environments,
+)
 from sentry.monitors.logic.mark_failed import mark_failed
 from sentry.monitors.logic.monitor_environment import update_monitor_environment
 from sentry.monitors.models import CheckInStatus, MonitorCheckIn, MonitorEnvironment, MonitorStatus
@@ -25,6 +31,9 @@ logger = logging.getLogger(__name__)
 # monitors the larger the number of checkins to check will exist.
 MONITOR_LIMIT = 10_000
 
+# How many due monitor environments are popped from the due queue at once.
+DUE_PAGE_SIZE = 1_000
+
 # re-use the monitor exclusion query node across dispatch_check_missing and
 # mark_environment_missing.
 IGNORE_MONITORS = ~Q(
@@ -50,6 +59,21 @@ def dispatch_check_missing(ts: datetime) -> None:
 
     This will dispatch MarkMissing messages into monitors-clock-tasks.
     """
+    if options.get("crons.due_queue.read"):
+        missed_count = 0
+        for monitor_environment_ids in pop_due_monitor_environments(ts, DUE_PAGE_SIZE):
+            missed_count += len(monitor_environment_ids)
+            for monitor_environment_id in monitor_environment_ids:
+                produce_mark_missing(monitor_environment_id, ts)
+
+        metrics.gauge(
+            "sentry.monitors.tasks.check_missing.count",
+            missed_count,
+            sample_rate=1.0,
+            tags={"source": "due_queue"},
+        )
+        return
+
     missed_envs = list(
         MonitorEnvironment.objects.filter(
             IGNORE_MONITORS,
@@ -66,21 +90,44 @@ def dispatch_check_missing(ts: datetime) -> None:
     )
 
     for monitor_environment in missed_envs:
-        message: MarkMissing = {
-            "type": "mark_missing",
-            "ts": ts.timestamp(),
-            "monitor_environment_id": monitor_environment["id"],
-        }
-        # XXX(epurkhiser): Partitioning by monitor_environment.id is important
-        # here as these task messages will be consumed in a multi-consumer
-        # setup. If we backlogged clock-ticks we may produce multiple missed
-        # tasks for the same monitor_environment. These MUST happen in-order.
-        payload = KafkaPayload(
-            str(monitor_environment["id"]).encode(),
-            MONITORS_CLOCK_TASKS_CODEC.encode(message),
-            [],
-        )
-        produce_task(payload)
+        produce_mark_missing(monitor_environment["id"], ts)
+
+
+def produce_mark_missing(monitor_environment_id: int, ts: datetime) -> None:
+    message: MarkMissing = {
+        "type": "mark_missing",
+        "ts": ts.timestamp(),
+        "monitor_environment_id": monitor_environment_id,
+    }
+    # XXX(epurkhiser): Partitioning by monitor_environment.id is important
+    # here as these task messages will be consumed in a multi-consumer
+    # setup. If we backlogged clock-ticks we may produce multiple missed
+    # tasks for the same monitor_environment. These MUST happen in-order.
+    payload = KafkaPayload(
+        str(monitor_environment_id).encode(),
+        MONITORS_CLOCK_TASKS_CODEC.encode(message),
+        [],
+    )
+    produce_task(payload)
+
+
+def reschedule_monitor_environment(monitor_environment_id: int, ts: datetime) -> None:
+    """
+    Moves a monitor environment that turned out not to be missing at the clock
+    tick `ts` back to its place in the due queue, since it was leased when it
+    was popped.
+    """
+    next_checkin_latest = (
+        MonitorEnvironment.objects.filter(id=monitor_environment_id)
+        .values_list("next_checkin_latest", flat=True)
+        .first()
+    )
+    if next_checkin_latest is None:
+        schedule_monitor_environments([(monitor_environment_id, None)])
+    elif not MonitorEnvironment.objects.filter(IGNORE_MONITORS, id=monitor_environment_id).exists():
+        schedule_monitor_environments([(monitor_environment_id, ts + IGNORED_RECHECK_INTERVAL)])
+    else:
+        schedule_monitor_environments([(monitor_environment_id, next_checkin_latest)])
 
 
 def mark_environment_missing(monitor_environment_id: int, ts: datetime) -> None:
@@ -100,6 +147,8 @@ def mark_environment_missing(monitor_environment_id: int, ts: datetime) -> None:
     except MonitorEnvironment.DoesNotExist:
         # Nothing to do. We already handled this miss in an earlier tasks
         # (or the environment was deleted)
+        if options.get("crons.due_queue.write"):
+            reschedule_monitor_environment(monitor_environment_id, ts)
         return None
 
     monitor = monitor_environment.monitor
@@ -453,7 +453,116 @@ def update_existing_check_in(
     existing_check_in.update(**updated_checkin)
 
 
-def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
+class CheckinGroupContext:
+    """
+    State shared between the check-ins of a group processed in bulk. All
+    check-ins of a group belong to the same project, monitor slug and
+    environment name (see `CheckinItem.processing_key`), so the monitor and
+    monitor environment only need to be resolved once for the group, and
+    again only when a check-in carries a monitor config that has not been
+    applied yet.
+
+    Marking an in-progress check-in as OK only moves the `last_checkin` and
+    `next_checkin` of the monitor environment forward, which the next check-in
+    marked as OK overwrites. That update is therefore deferred, and dropped when
+    it is superseded. It is flushed before anything else reads or writes the
+    monitor environment.
+
+    Clock tasks, other check-ins and users may change the monitor environment
+    while the group is processed, so the fields they write are reloaded before
+    the shared monitor environment is used again.
+    """
+
+    def __init__(self) -> None:
+        self.monitor: Monitor | None = None
+        self.monitor_environment: MonitorEnvironment | None = None
+        self.applied_configs: dict[str, ProcessingErrorsException | None] = {}
+        self.pending_mark_ok: tuple[MonitorCheckIn, datetime] | None = None
+
+    def ensure_monitor_with_config(
+        self,
+        project: Project,
+        monitor_slug: str,
+        config: dict[str, Any] | None,
+    ) -> tuple[Monitor | None, ProcessingErrorsException | None]:
+        config_key = json.dumps(config, sort_keys=True) if config else ""
+        # Re-upserting a monitor that is no longer upserting marks it as
+        # upserting again, so the config has to be applied once more.
+        if (
+            self.monitor is not None
+            and config_key in self.applied_configs
+            and (not config or self.monitor.is_upserting)
+        ):
+            return (self.monitor, self.applied_configs[config_key])
+
+        monitor, non_fatal_processing_error = _ensure_monitor_with_config(
+            project, monitor_slug, config
+        )
+        if monitor is not None:
+            if monitor is not self.monitor:
+                self.flush()
+                self.monitor = monitor
+                self.monitor_environment = None
+                self.applied_configs = {"": None}
+            self.applied_configs[config_key] = non_fatal_processing_error
+        return (monitor, non_fatal_processing_error)
+
+    def ensure_environment(
+        self, project: Project, monitor: Monitor, environment: str | None
+    ) -> MonitorEnvironment:
+        if self.monitor_environment is None or monitor is not self.monitor:
+            self.monitor_environment = MonitorEnvironment.objects.ensure_environment(
+                project, monitor, environment
+            )
+        else:
+            self._refresh_environment(self.monitor_environment)
+        return self.monitor_environment
+
+    @staticmethod
+    def _refresh_environment(monitor_environment: MonitorEnvironment) -> None:
+        # Only reload the plain fields, reloading all of them would drop the
+        # cached monitor.
+        monitor_environment.refresh_from_db(
+            fields=["status", "is_muted", "last_checkin", "next_checkin", "next_checkin_latest"]
+        )
+
+    def _supersede_pending(self, check_in: MonitorCheckIn, succeeded_at: datetime) -> None:
+        if self.pending_mark_ok is None:
+            return
+
+        pending_check_in, pending_succeeded_at = self.pending_mark_ok
+        last_checkin = check_in.monitor_environment.last_checkin
+        if last_checkin is None or last_checkin <= pending_succeeded_at:
+            last_checkin = pending_check_in.date_added
+
+        # The pending update is overwritten entirely by the next one, as long as
+        # the next one would still be applied after it.
+        if last_checkin <= succeeded_at:
+            self.pending_mark_ok = None
+            metrics.incr("monitors.checkin.bulk.collapsed_in_progress")
+        else:
+            self.flush()
+
+    def mark_ok(self, check_in: MonitorCheckIn, succeeded_at: datetime) -> None:
+        self._supersede_pending(check_in, succeeded_at)
+        if check_in.status == CheckInStatus.IN_PROGRESS:
+            self.pending_mark_ok = (check_in, succeeded_at)
+        else:
+            mark_ok(check_in, succeeded_at)
+
+    def flush(self) -> None:
+        if self.pending_mark_ok is not None:
+            check_in, succeeded_at = self.pending_mark_ok
+            self.pending_mark_ok = None
+            self._refresh_environment(check_in.monitor_environment)
+            mark_ok(check_in, succeeded_at)
+
+
+def _process_checkin(
+    item: CheckinItem,
+    txn: Transaction | Span,
+    group_context: CheckinGroupContext | None = None,
+) -> None:
     params = item.payload
 
     # XXX: The start_time is when relay received the original envelope store
@@ -627,8 +736,11 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
     monitor = None
     # 01
     # Retrieve or upsert monitor for this check-in
+    ensure_monitor_with_config = (
+        group_context.ensure_monitor_with_config if group_context else _ensure_monitor_with_config
+    )
     try:
-        (monitor, non_fatal_processing_errors) = _ensure_monitor_with_config(
+        (monitor, non_fatal_processing_errors) = ensure_monitor_with_config(
             project,
             monitor_slug,
             monitor_config,
@@ -744,10 +856,13 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
 
     # 02
     # Retrieve or upsert monitor environment for this check-in
+    ensure_environment = (
+        group_context.ensure_environment
+        if group_context
+        else MonitorEnvironment.objects.ensure_environment
+    )
     try:
-        monitor_environment = MonitorEnvironment.objects.ensure_environment(
-            project, monitor, environment
-        )
+        monitor_environment = ensure_environment(project, monitor, environment)
     except MonitorEnvironmentLimitsExceeded as e:
         metrics.incr(
             "monitors.checkin.result",
@@ -810,6 +925,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
     # 03
     # Create or update check-in
 
+    pending_mark_ok = group_context.pending_mark_ok if group_context else None
     try:
         with transaction.atomic(router.db_for_write(Monitor)):
             status: int = getattr(CheckInStatus, validated_params["status"].upper())
@@ -871,6 +987,10 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
                         }
                         raise ProcessingErrorsException([env_mismatch_error], monitor)
 
+                # Share the monitor environment with the rest of the check-in
+                # processing, avoiding a query and keeping its state consistent
+                check_in.monitor_environment = monitor_environment
+
                 txn.set_tag("outcome", "process_existing_checkin")
                 update_existing_check_in(
                     txn,
@@ -886,6 +1006,9 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
             # 03-B
             # Create a brand new check-in object
             except MonitorCheckIn.DoesNotExist:
+                if group_context:
+                    group_context.flush()
+
                 # When was this check-in expected to have happened?
                 expected_time = monitor_environment.next_checkin
 
@@ -972,6 +1095,8 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
             # 04
             # Update monitor status
             if check_in.status == CheckInStatus.ERROR:
+                if group_context:
+                    group_context.flush()
                 # Note: We use `start_time` for received here since it's the time that this
                 # checkin was received by relay. Potentially, `ts` should be the client
                 # timestamp. If we change that, leave `received` the same.
@@ -980,6 +1105,8 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
                 ):
                     update_monitor_environment(monitor_environment, check_in.date_added, start_time)
                     mark_failed(check_in, failed_at=start_time, received=start_time)
+            elif group_context:
+                group_context.mark_ok(check_in, start_time)
             else:
                 mark_ok(check_in, start_time)
 
@@ -1004,6 +1131,10 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
                 tags={**metric_kwargs, "status": "complete"},
             )
     except Exception as e:
+        # Any deferred update flushed while processing this check-in has been
+        # rolled back with it
+        if group_context:
+            group_context.pending_mark_ok = pending_mark_ok
         if isinstance(e, ProcessingErrorsException):
             raise
         # Skip this message and continue processing in the consumer.
@@ -1018,7 +1149,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
         raise non_fatal_processing_errors
 
 
-def process_checkin(item: CheckinItem) -> None:
+def process_checkin(item: CheckinItem, group_context: CheckinGroupContext | None = None) -> None:
     """
     Process an individual check-in
     """
@@ -1029,7 +1160,7 @@ def process_checkin(item: CheckinItem) -> None:
         ) as txn:
             # Deepcopy the checkin here so that it's not modified. We need the original when we get a
             # `ProcessingErrorsException`
-            _process_checkin(deepcopy(item), txn)
+            _process_checkin(deepcopy(item), txn, group_context)
     except ProcessingErrorsException as e:
         handle_processing_errors(item, e)
     except Exception:
@@ -1040,9 +1171,25 @@ def process_checkin_group(items: list[CheckinItem]) -> None:
     """
     Process a group of related check-ins (all part of the same monitor)
     completely serially.
+
+    Large groups are processed with a shared `CheckinGroupContext`.
     """
-    for item in items:
-        process_checkin(item)
+    min_bulk_size = options.get("crons.bulk_checkin_group_min_size")
+    if not min_bulk_size or len(items) < min_bulk_size:
+        for item in items:
+            process_checkin(item)
+        return
+
+    metrics.incr("monitors.checkin.bulk.group")
+    group_context = CheckinGroupContext()
+    try:
+        for item in items:
+            process_checkin(item, group_context)
+    finally:
+        try:
+            group_context.flush()
+        except Exception:
+            logger.exception("Failed to update monitor environment")
 
 
 def process_batch(
@@ -0,0 +1,147 @@
+"""
+The due queue tracks when each monitor environment is next expected to have
+checked in by (its `next_checkin_latest`), so that clock ticks can find the
+monitor environments that missed a check-in without scanning the
+MonitorEnvironment table.
+
+The queue is a redis sorted set of monitor environment ids scored by their
+`next_checkin_latest` timestamp. It is kept up to date whenever the
+`next_checkin_latest` of a monitor environment changes. Monitor environments
+popped by a clock tick are leased for `DUE_LEASE` rather than removed, and are
+rescheduled once their missed check-in has been handled, so a lost clock task
+only delays detection until the lease expires.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Generator, Iterable
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import router, transaction
+
+from sentry import options
+from sentry.monitors.models import MonitorEnvironment
+from sentry.utils import redis
+from sentry.utils.query import RangeQuerySetWrapper
+
+logger = logging.getLogger(__name__)
+
+DUE_QUEUE_KEY = "sentry.monitors.due-queue"
+
+# How long a popped monitor environment is held back before it is considered
+# due again, unless it is rescheduled before that.
+DUE_LEASE = timedelta(minutes=5)
+
+# How far ahead monitor environments which are not processed by the clock (such
+# as those of disabled monitors) are rescheduled to be checked again.
+IGNORED_RECHECK_INTERVAL = timedelta(hours=1)
+
+pop_due_script = redis.load_redis_script("monitors/pop_due.lua")
+
+
+def _get_cluster():
+    return redis.redis_clusters.get(settings.SENTRY_MONITORS_REDIS_CLUSTER)
+
+
+def schedule_monitor_environments(entries: Iterable[tuple[int, datetime | None]]) -> None:
+    """
+    Sets when each of the `(monitor_environment_id, next_checkin_latest)` is
+    next due. Monitor environments without a `next_checkin_latest` are removed
+    from the queue.
+    """
+    if not options.get("crons.due_queue.write"):
+        return
+
+    scheduled: dict[str, float] = {}
+    removed: list[int] = []
+    for monitor_environment_id, next_checkin_latest in entries:
+        if next_checkin_latest is None:
+            removed.append(monitor_environment_id)
+        else:
+            scheduled[str(monitor_environment_id)] = next_checkin_latest.timestamp()
+
+    if not scheduled and not removed:
+        return
+
+    with _get_cluster().pipeline(transaction=False) as pipeline:
+        if scheduled:
+            pipeline.zadd(DUE_QUEUE_KEY, scheduled)
+        if removed:
+            pipeline.zrem(DUE_QUEUE_KEY, *removed)
+        pipeline.execute()
+
+
+def schedule_monitor_environment_on_commit(monitor_environment: MonitorEnvironment) -> None:
+    """
+    Schedules the monitor environment once the current transaction commits, so
+    that the queue never runs ahead of the database.
+    """
+    monitor_environment_id = monitor_environment.id
+    next_checkin_latest = monitor_environment.next_checkin_latest
+    transaction.on_commit(
+        lambda: schedule_monitor_environments([(monitor_environment_id, next_checkin_latest)]),
+        using=router.db_for_write(MonitorEnvironment),
+    )
+
+
+def schedule_monitor_on_commit(monitor_id: int) -> None:
+    """
+    Schedules every monitor environment of the monitor once the current
+    transaction commits. Use this when a monitor is enabled again, since the
+    clock only rechecks the monitor environments of a disabled monitor every
+    `IGNORED_RECHECK_INTERVAL`.
+    """
+
+    def schedule() -> None:
+        schedule_monitor_environments(
+            MonitorEnvironment.objects.filter(monitor_id=monitor_id).values_list(
+                "id", "next_checkin_latest"
+            )
+        )
+
+    transaction.on_commit(schedule, using=router.db_for_write(MonitorEnvironment))
+
+
+def pop_due_monitor_environments(ts: datetime, page_size: int) -> Generator[list[int]]:
+    """
+    Pops the ids of all monitor environments due at the clock tick `ts` in
+    pages of at most `page_size`.
+    """
+    cluster = _get_cluster()
+    lease_ts = (ts + DUE_LEASE).timestamp()
+
+    while True:
+        page = pop_due_script(
+            keys=[DUE_QUEUE_KEY],
+            args=[ts.timestamp(), page_size, lease_ts],
+            client=cluster,
+        )
+        if not page:
+            return
+
+        yield [int(member) for member in page]
+
+        if len(page) < page_size:
+            return
+
+
+def backfill_due_queue() -> None:
+    """
+    Schedules every monitor environment. Run this once writes are enabled and
+    before reading from the queue, to pick up monitor environments whose
+    `next_checkin_latest` was set before writes were enabled.
+    """
+    queryset = MonitorEnvironment.objects.filter(next_checkin_latest__isnull=False).values_list(
+        "id", "next_checkin_latest"
+    )
+    count = 0
+    for _ in RangeQuerySetWrapper(
+        queryset,
+        callbacks=[schedule_monitor_environments],
+        result_value_getter=lambda item: item[0],
+    ):
+        count += 1
+
+    logger.info("monitors.due_queue.backfilled", extra={"count": count})
@@ -34,6 +34,7 @@ from sentry.constants import DataCategory, ObjectStatus
 from sentry.db.models.query import in_iexact
 from sentry.models.environment import Environment
 from sentry.models.organization import Organization
+from sentry.monitors.due_queue import schedule_monitor_on_commit
 from sentry.monitors.models import (
     DEFAULT_STATUS_ORDER,
     MONITOR_ENVIRONMENT_ORDERING,
@@ -356,6 +357,8 @@ class OrganizationMonitorIndexEndpoint(OrganizationEndpoint):
 
                 if result:
                     monitor.update(**result)
+                if status == ObjectStatus.ACTIVE:
+                    schedule_monitor_on_commit(monitor.id)
                 updated.append(monitor)
             self.create_audit_entry(
                 request=request,
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from sentry.monitors.due_queue import schedule_monitor_environment_on_commit
 from sentry.monitors.models import CheckInStatus, MonitorCheckIn, MonitorEnvironment
 
 
@@ -32,3 +33,4 @@ def update_monitor_environment(
     monitor_env.save(
         update_fields=["last_checkin", "next_checkin", "next_checkin_latest", "status"]
     )
+    schedule_monitor_environment_on_commit(monitor_env)
@@ -24,6 +24,7 @@ from sentry.db.models.fields.slug import DEFAULT_SLUG_MAX_LENGTH
 from sentry.db.postgres.transactions import in_test_hide_transaction_boundary
 from sentry.models.project import Project
 from sentry.monitors.constants import MAX_MARGIN, MAX_THRESHOLD, MAX_TIMEOUT
+from sentry.monitors.due_queue import schedule_monitor_environments, schedule_monitor_on_commit
 from sentry.monitors.logic.monitor_environment import update_monitor_environment
 from sentry.monitors.models import (
     MONITOR_CONFIG,
@@ -447,9 +448,13 @@ class MonitorValidator(CamelSnakeSerializer):
 
             params["config"] = merged_config
 
+        enabled = False
         if "status" in params:
+            enabled = (
+                params["status"] == ObjectStatus.ACTIVE and instance.status != ObjectStatus.ACTIVE
+            )
             # Attempt to assign a monitor seat
-            if params["status"] == ObjectStatus.ACTIVE and instance.status != ObjectStatus.ACTIVE:
+            if enabled:
                 outcome = quotas.backend.assign_seat(DataCategory.MONITOR_SEAT, instance)
                 # The MonitorValidator checks if a seat assignment is available.
                 # This protects against a race condition
@@ -480,6 +485,11 @@ class MonitorValidator(CamelSnakeSerializer):
                 data=instance.get_audit_log_data(),
             )
 
+        # The environments of the disabled monitor were only rechecked
+        # occasionally, put them back at their next expected check-in
+        if enabled:
+            schedule_monitor_on_commit(instance.id)
+
         # Update monitor slug in billing
         if "slug" in params:
             quotas.backend.update_monitor_slug(existing_slug, params["slug"], instance.project_id)
@@ -493,6 +503,11 @@ class MonitorValidator(CamelSnakeSerializer):
                 MonitorEnvironment.objects.filter(monitor_id=instance.id).update(
                     next_checkin_latest=F("next_checkin") + get_checkin_margin(checkin_margin)
                 )
+                schedule_monitor_environments(
+                    MonitorEnvironment.objects.filter(monitor_id=instance.id).values_list(
+                        "id", "next_checkin_latest"
+                    )
+                )
 
             max_runtime = updated_config.get("max_runtime")
             if max_runtime != existing_max_runtime:
@@ -765,6 +780,7 @@ class MonitorIncidentDetectorValidator(BaseDetectorTypeValidator):
                 if seat_outcome != Outcome.ACCEPTED:
                     raise serializers.ValidationError("Failed to update monitor")
                 monitor.update(status=ObjectStatus.ACTIVE)
+                schedule_monitor_on_commit(monitor.id)
             else:
                 quotas.backend.disable_seat(DataCategory.MONITOR_SEAT, monitor)
                 monitor.update(status=ObjectStatus.DISABLED)
@@ -348,6 +348,21 @@ register(
     type=Int,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# The number of independent child relations deleted concurrently. At 1, child
+# relations are deleted one at a time, in the order they are listed.
+register(
+    "deletions.planner.concurrency",
+    default=1,
+    type=Int,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# The intended duration in seconds of each chunk of a concurrent bulk deletion.
+register(
+    "deletions.planner.target-chunk-duration",
+    default=1.0,
+    type=Float,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 
 register(
@@ -356,6 +371,14 @@ register(
     type=Bool,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Delete the models of bulk query deletes in disjoint id ranges claimed by the
+# cleanup workers, checkpointing the completed ranges.
+register(
+    "cleanup.bulk-query-deletes.streaming",
+    default=False,
+    type=Bool,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # Filestore (default)
 register("filestore.backend", default="filesystem", flags=FLAG_NOSTORE)
@@ -492,6 +515,13 @@ register(
     default=None,
     flags=FLAG_ALLOW_EMPTY | FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
+# The maximum number of recording segments downloaded at once when reading a replay.
+register(
+    "replay.storage.download-concurrency",
+    type=Int,
+    default=10,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 # Globally disables replay-video.
 register(
     "replay.replay-video.disabled",
@@ -541,6 +571,14 @@ register(
     default=False,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Enable the streaming recording parser, which skips snapshot events without decoding them and
+# yields the remaining events one at a time. Takes precedence over the msgspec parser.
+register(
+    "replay.consumer.streaming_recording_parser",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 # Enable new database query caching.
 register(
     "replay.consumer.enable_new_query_caching_system",
@@ -845,6 +883,62 @@ register(
 register("snuba.search.hits-sample-size", default=100, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("snuba.track-outcomes-sample-rate", default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Serve expired Snuba query cache entries while they are refreshed in the background
+register(
+    "snuba.query-cache.stale-while-revalidate.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Seconds an expired Snuba query cache entry may still be served while it is refreshed
+register(
+    "snuba.query-cache.stale-ttl-seconds",
+    type=Int,
+    default=300,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Per-referrer overrides of the Snuba query cache TTLs: {referrer: {"ttl": int, "stale_ttl": int}}
+register(
+    "snuba.query-cache.referrer-ttls",
+    type=Dict,
+    default={},
+    flags=FLAG_ALLOW_EMPTY | FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Dedicated Snuba connection pools for referrer prefixes: {referrer_prefix: pool_size}
+register(
+    "snuba.client.pool-partitions",
+    type=Dict,
+    default={},
+    flags=FLAG_ALLOW_EMPTY | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Enables the per-process cache of parsed search queries in `parse_search_query`
+register(
+    "api.event-search.parse-cache.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Runs the Snuba lookups of the group serializers concurrently with their Postgres
+# lookups, and the total time in seconds all lookups of one `get_attrs` call may take.
+# The Snuba requests get the time remaining until that deadline as their timeout.
+# The default matches SENTRY_SNUBA_TIMEOUT, so it only cuts off serializations that
+# already spent longer than a single Snuba query may take. A timeout of 0 disables
+# the deadline.
+register(
+    "api.serializers.group.concurrent-attrs.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "api.serializers.group.attrs-timeout",
+    type=Float,
+    default=30.0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # The percentage of tagkeys that we want to cache. Set to 1.0 in order to cache everything, <=0.0 to stop caching
 register(
     "snuba.tagstore.cache-tagkeys-rate",
@@ -922,6 +1016,33 @@ register(
 # Killswitch to stop storing any reprocessing payloads.
 register("store.reprocessing-force-disable", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Pull the nodestore payloads and attachments of each page of events being
+# reprocessed in bulk, rather than one event at a time.
+register(
+    "reprocessing2.batch-pull-event-data.enabled",
+    default=False,
+    type=Bool,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Move the related rows of merged groups with one update per model, rather
+# than one row at a time.
+register(
+    "merge.bulk-merge-objects.enabled",
+    default=False,
+    type=Bool,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Only test the ownership and CODEOWNERS rules whose patterns share a word
+# with the paths, URL and modules of an event, using a cached index of the rules.
+register(
+    "ownership.rule-index.enabled",
+    default=False,
+    type=Bool,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Enable calling the severity modeling API on group creation
 register(
     "processing.calculate-severity-on-group-creation",
@@ -1328,6 +1449,23 @@ register("processing.release-archive-min-files", default=10, flags=FLAG_AUTOMATO
 # All Relay options (statically authenticated Relays can be registered here)
 register("relay.static_auth", default={}, flags=FLAG_NOSTORE)
 
+# Recompute only the affected sections of cached project configs on invalidation,
+# and skip writing configs whose revision did not change.
+register(
+    "relay.project-config.incremental-recompute.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Compute the project configs of all projects in an organization in one batch on
+# organization wide invalidations.
+register(
+    "relay.project-config.org-batch.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Tell Relay to stop extracting metrics from transaction payloads (see killswitches)
 # Example value: [{"project_id": 42}, {"project_id": 123}]
 register("relay.drop-transaction-metrics", default=[], flags=FLAG_AUTOMATOR_MODIFIABLE)
@@ -2226,6 +2364,23 @@ register(
     default=False,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Drain outbox shards in bulk: claim many shards per query and process their
+# coalesced messages in batches.
+register(
+    "hybrid_cloud.outbox.bulk_drain.enabled",
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "hybrid_cloud.outbox.bulk_drain.shards",
+    default=100,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "hybrid_cloud.outbox.bulk_drain.batch_size",
+    default=100,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # List of event IDs to pass through
 register(
@@ -2401,6 +2556,36 @@ register(
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Keep the due queue of monitor environments (see sentry.monitors.due_queue) up
+# to date. Once enabled, backfill the queue with `backfill_due_queue` before
+# enabling reads.
+register(
+    "crons.due_queue.write",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Find missed check-ins by popping due monitor environments from the due queue
+# instead of scanning the MonitorEnvironment table on every clock tick.
+register(
+    "crons.due_queue.read",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Check-in groups (check-ins for the same monitor environment within a batch)
+# of at least this size share their monitor and monitor environment lookups
+# and collapse consecutive in-progress updates of the monitor environment.
+# Disabled when 0.
+register(
+    "crons.bulk_checkin_group_min_size",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 
 # Sets the timeout for webhooks
 register(
@@ -2777,6 +2962,14 @@ register(
     flags=FLAG_ALLOW_EMPTY | FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Only send native profile frames missing from the symbolication cache to symbolicator.
+register(
+    "profiling.symbolication_cache.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # max number of profiles to use for computing
 # the aggregated flamegraph.
 register(
@@ -2812,6 +3005,25 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# the number of time ranges (and chunk queries) queried at once when looking
+# for flamegraph profile candidates. Once enough candidates are found, no
+# further queries are made.
+register(
+    "profiling.flamegraph.query.concurrency",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# how long the profile candidates of a flamegraph query are cached for,
+# expressed in seconds. 0 disables the cache.
+register(
+    "profiling.flamegraph.candidates-cache.ttl",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # list of platform names for which we allow using unsampled profiles for the purpose
 # of improving profile (function) metrics
 register(
@@ -3257,6 +3469,22 @@ register(
     default=False,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Count events and users of groups in Redis at ingest, and read event frequency
+# condition values from those counters when they cover the queried window. Reads
+# should only be enabled once writes have been enabled for longer than the counter
+# retention.
+register(
+    "rules.frequency-counters.write.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "rules.frequency-counters.read.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "delayed_processing.batch_size",
     default=10000,
@@ -3274,6 +3502,27 @@ register(
     default=False,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Process the delayed workflows of small projects in tasks covering several projects
+# of an organization, sharing the Snuba queries of their slow conditions.
+register(
+    "delayed_workflow.cross-project-batching.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "delayed_workflow.cross-project-batching.max-projects",
+    type=Int,
+    default=50,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# How far apart the window ends of two queries may be to still be merged.
+register(
+    "delayed_workflow.cross-project-batching.max-window-skew-seconds",
+    type=Int,
+    default=30,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "workflow_engine.scheduler.use_conditional_delete",
     type=Bool,
@@ -3342,6 +3591,14 @@ register(
     default=0.1,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Evaluate workflows from a cached per-detector index with cost-sorted conditions,
+# and evaluate identical conditions only once per event.
+register(
+    "workflow_engine.compiled-workflow-index.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_MODIFIABLE_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
 # Whether to directly log workflow evaluation logs to Sentry instead of using the stdlib
 # logger (which also logs to Sentry).
 register(
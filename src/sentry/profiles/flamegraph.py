@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Literal, NotRequired, TypedDict
 
+from django.core.cache import cache
 from rest_framework.request import Request as HttpRequest
 from snuba_sdk import (
     And,
@@ -25,10 +26,12 @@ from sentry.search.eap.types import EAPResponse, SearchResolverConfig
 from sentry.search.events.builder.discover import DiscoverQueryBuilder
 from sentry.search.events.builder.profile_functions import ProfileFunctionsQueryBuilder
 from sentry.search.events.fields import resolve_datetime64
-from sentry.search.events.types import QueryBuilderConfig, SnubaParams
+from sentry.search.events.types import EventsResponse, QueryBuilderConfig, SnubaParams
 from sentry.snuba.dataset import Dataset, StorageKey
 from sentry.snuba.referrer import Referrer
 from sentry.snuba.spans_rpc import Spans
+from sentry.utils import json, metrics
+from sentry.utils.hashlib import md5_text
 from sentry.utils.iterators import chunked
 from sentry.utils.snuba import bulk_snuba_queries
 
@@ -99,6 +102,39 @@ class FlamegraphExecutor:
         self.fingerprint = fingerprint
 
     def get_profile_candidates(self) -> ProfileCandidates:
+        cache_ttl = options.get("profiling.flamegraph.candidates-cache.ttl")
+        if cache_ttl <= 0:
+            return self._get_profile_candidates()
+
+        cache_key = self._get_candidates_cache_key()
+        candidates = cache.get(cache_key)
+        if candidates is not None:
+            metrics.incr("profiling.flamegraph.candidates_cache", tags={"result": "hit"})
+            return candidates
+
+        metrics.incr("profiling.flamegraph.candidates_cache", tags={"result": "miss"})
+        candidates = self._get_profile_candidates()
+        cache.set(cache_key, candidates, cache_ttl)
+        return candidates
+
+    def _get_candidates_cache_key(self) -> str:
+        assert self.snuba_params.start is not None and self.snuba_params.end is not None
+        organization = self.snuba_params.organization
+        key = {
+            "organization_id": organization.id if organization is not None else None,
+            "project_ids": sorted(self.snuba_params.project_ids),
+            "environments": sorted(self.snuba_params.environment_names),
+            "start": self.snuba_params.start.isoformat(),
+            "end": self.snuba_params.end.isoformat(),
+            "data_source": self.data_source,
+            # only leading and trailing whitespace is insignificant, whitespace
+            # within quoted values is part of the value
+            "query": self.query.strip(),
+            "fingerprint": self.fingerprint,
+        }
+        return f"profiling:flamegraph:candidates:{md5_text(json.dumps(key)).hexdigest()}"
+
+    def _get_profile_candidates(self) -> ProfileCandidates:
         if self.data_source == "functions":
             return self.get_profile_candidates_from_functions()
         elif self.data_source == "transactions":
@@ -180,40 +216,17 @@ class FlamegraphExecutor:
 
     def get_profile_candidates_from_transactions(self) -> ProfileCandidates:
         max_profiles = options.get("profiling.flamegraph.profile-set.size")
-        initial_chunk_delta_hours = options.get(
-            "profiling.flamegraph.query.initial_chunk_delta.hours"
-        )
-        max_chunk_delta_hours = options.get("profiling.flamegraph.query.max_delta.hours")
-        multiplier = options.get("profiling.flamegraph.query.multiplier")
-
-        initial_chunk_delta = timedelta(hours=initial_chunk_delta_hours)
-        max_chunk_delta = timedelta(hours=max_chunk_delta_hours)
 
         transaction_profile_candidates: list[TransactionProfileCandidate] = []
         profiler_metas: list[ProfilerMeta] = []
 
-        assert self.snuba_params.start is not None and self.snuba_params.end is not None
         snuba_params = self.snuba_params.copy()
 
-        for chunk_start, chunk_end in split_datetime_range_exponential(
-            self.snuba_params.start,
-            self.snuba_params.end,
-            initial_chunk_delta,
-            max_chunk_delta,
-            multiplier,
-            reverse=True,
+        for chunk_start, results in self._iter_transactions_based_candidates(
+            max_profiles,
+            Referrer.API_PROFILING_PROFILE_FLAMEGRAPH_TRANSACTION_CANDIDATES.value,
         ):
             snuba_params.start = chunk_start
-            snuba_params.end = chunk_end
-
-            builder = self.get_transactions_based_candidate_query(
-                query=self.query, limit=max_profiles, snuba_params=snuba_params
-            )
-
-            results = builder.run_query(
-                Referrer.API_PROFILING_PROFILE_FLAMEGRAPH_TRANSACTION_CANDIDATES.value,
-            )
-            results = builder.process_results(results)
 
             for row in results["data"]:
                 if row["profile.id"] is not None:
@@ -244,7 +257,6 @@ class FlamegraphExecutor:
         continuous_profile_candidates: list[ContinuousProfileCandidate] = []
 
         if max_continuous_profile_candidates > 0:
-            snuba_params.end = self.snuba_params.end
             continuous_profile_candidates, _ = self.get_chunks_for_profilers(
                 profiler_metas, max_continuous_profile_candidates, snuba_params
             )
@@ -254,6 +266,58 @@ class FlamegraphExecutor:
             "continuous": continuous_profile_candidates,
         }
 
+    def _iter_transactions_based_candidates(
+        self, limit: int, referrer: str
+    ) -> Iterator[tuple[datetime, EventsResponse]]:
+        """
+        Yields the start of each time range the query is split into, newest
+        first, along with the candidates found in it. Ranges are queried
+        `profiling.flamegraph.query.concurrency` at a time, so stop iterating
+        once enough candidates are found to skip querying the older ones.
+        """
+        initial_chunk_delta_hours = options.get(
+            "profiling.flamegraph.query.initial_chunk_delta.hours"
+        )
+        max_chunk_delta_hours = options.get("profiling.flamegraph.query.max_delta.hours")
+        multiplier = options.get("profiling.flamegraph.query.multiplier")
+        concurrency = max(options.get("profiling.flamegraph.query.concurrency"), 1)
+
+        initial_chunk_delta = timedelta(hours=initial_chunk_delta_hours)
+        max_chunk_delta = timedelta(hours=max_chunk_delta_hours)
+
+        assert self.snuba_params.start is not None and self.snuba_params.end is not None
+
+        time_ranges = split_datetime_range_exponential(
+            self.snuba_params.start,
+            self.snuba_params.end,
+            initial_chunk_delta,
+            max_chunk_delta,
+            multiplier,
+            reverse=True,
+        )
+
+        for batch in chunked(time_ranges, concurrency):
+            builders = []
+            for chunk_start, chunk_end in batch:
+                snuba_params = self.snuba_params.copy()
+                snuba_params.start = chunk_start
+                snuba_params.end = chunk_end
+                builders.append(
+                    self.get_transactions_based_candidate_query(
+                        query=self.query, limit=limit, snuba_params=snuba_params
+                    )
+                )
+
+            if len(builders) == 1:
+                results = [builders[0].run_query(referrer)]
+            else:
+                results = bulk_snuba_queries(
+                    [builder.get_snql_query() for builder in builders], referrer
+                )
+
+            for (chunk_start, _), builder, result in zip(batch, builders, results):
+                yield chunk_start, builder.process_results(result)
+
     def get_transactions_based_candidate_query(
         self,
         query: str | None,
@@ -321,7 +385,7 @@ class FlamegraphExecutor:
             for chunk in chunked(profiler_metas, chunk_size)
         ]
 
-        results = self._query_chunks_for_profilers(queries)
+        results = self._iter_chunks_for_profilers(queries)
 
         profiler_metas_by_profiler = defaultdict(list)
         for profiler_meta in profiler_metas:
@@ -421,6 +485,17 @@ class FlamegraphExecutor:
             limit=Limit(options.get("profiling.continuous-profiling.chunks-set.size")),
         )
 
+    def _iter_chunks_for_profilers(self, queries: list[Query]) -> Iterator[Mapping[str, Any]]:
+        concurrency = options.get("profiling.flamegraph.query.concurrency")
+        if concurrency <= 1:
+            yield from self._query_chunks_for_profilers(queries)
+            return
+
+        # Query in batches, so that no more batches are queried once the
+        # consumer has found enough chunks.
+        for batch in chunked(queries, concurrency):
+            yield from self._query_chunks_for_profilers(batch)
+
     def _query_chunks_for_profilers(self, queries: list[Query]) -> list[Mapping[str, Any]]:
         """This function is split out for mocking as we cannot write to the
         profile chunks dataset in tests today"""
@@ -450,38 +525,17 @@ class FlamegraphExecutor:
             raise ValueError("`organization` is required and cannot be `None`")
 
         max_profiles = options.get("profiling.flamegraph.profile-set.size")
-        initial_chunk_delta_hours = options.get(
-            "profiling.flamegraph.query.initial_chunk_delta.hours"
-        )
-        max_chunk_delta_hours = options.get("profiling.flamegraph.query.max_delta.hours")
-        multiplier = options.get("profiling.flamegraph.query.multiplier")
-
-        initial_chunk_delta = timedelta(hours=initial_chunk_delta_hours)
-        max_chunk_delta = timedelta(hours=max_chunk_delta_hours)
 
         referrer = Referrer.API_PROFILING_PROFILE_FLAMEGRAPH_PROFILE_CANDIDATES.value
         transaction_profile_candidates: list[TransactionProfileCandidate] = []
         profiler_metas: list[ProfilerMeta] = []
 
-        assert self.snuba_params.start is not None and self.snuba_params.end is not None
         snuba_params = self.snuba_params.copy()
 
-        for chunk_start, chunk_end in split_datetime_range_exponential(
-            self.snuba_params.start,
-            self.snuba_params.end,
-            initial_chunk_delta,
-            max_chunk_delta,
-            multiplier,
-            reverse=True,
+        for chunk_start, results in self._iter_transactions_based_candidates(
+            max_profiles, referrer
         ):
             snuba_params.start = chunk_start
-            snuba_params.end = chunk_end
-
-            builder = self.get_transactions_based_candidate_query(
-                query=self.query, limit=max_profiles, snuba_params=snuba_params
-            )
-            results = builder.run_query(referrer)
-            results = builder.process_results(results)
 
             for row in results["data"]:
                 if row["profile.id"] is not None:
@@ -516,7 +570,6 @@ class FlamegraphExecutor:
         # If there are continuous profiles attached to transactions, we prefer those as
         # the active thread id gives us more user friendly flamegraphs than without.
         if profiler_metas and max_continuous_profile_candidates > 0:
-            snuba_params.end = self.snuba_params.end
             continuous_profile_candidates, continuous_duration = self.get_chunks_for_profilers(
                 profiler_metas, max_continuous_profile_candidates, snuba_params
             )
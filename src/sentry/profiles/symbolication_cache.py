@@ -0,0 +1,245 @@
+"""
+A cache of symbolicated native profile frames.
+
+A native frame is addressed by the debug id of the image it belongs to and its
+instruction address relative to that image. Symbolicating it gives the same
+result wherever the image was loaded, and the same frames recur across the
+profiles of an app release, so the results are cached and only frames missing
+from the cache are sent to symbolicator.
+
+Cached frames keep their addresses as offsets into their image, and are rebased
+onto the image they are found in again. Only frames that were fully symbolicated
+are cached, so frames whose debug files are uploaded later are not held back.
+
+Lookups go through a bounded in-process LRU cache before reaching the shared
+cache. Keys are scoped to a project, so symbols are never shared with projects
+which don't have access to the debug files.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from cachetools import LRUCache
+from django.core.cache import cache
+
+CACHE_TTL = 24 * 60 * 60
+
+# Number of frames kept in the in-process cache. Entries are typically a few
+# hundred bytes, so this stays in the tens of megabytes.
+LOCAL_CACHE_SIZE = 50_000
+
+_ADDRESS_FIELDS = ("instruction_addr", "sym_addr", "image_addr")
+
+_local_cache: LRUCache[str, list[dict[str, Any]]] = LRUCache(maxsize=LOCAL_CACHE_SIZE)
+_local_cache_lock = threading.Lock()
+
+
+def clear_local_cache() -> None:
+    with _local_cache_lock:
+        _local_cache.clear()
+
+
+def _parse_addr(addr: Any) -> int | None:
+    if isinstance(addr, int):
+        return addr
+    if isinstance(addr, str):
+        try:
+            return int(addr, 16)
+        except ValueError:
+            return None
+    return None
+
+
+class _ImageIndex:
+    """Finds the image containing an instruction address."""
+
+    def __init__(self, modules: Iterable[Mapping[str, Any]]) -> None:
+        images = []
+        for module in modules:
+            debug_id = module.get("debug_id") or module.get("id") or module.get("uuid")
+            start = _parse_addr(module.get("image_addr"))
+            size = module.get("image_size")
+            if debug_id and start is not None and size:
+                images.append((start, start + size, str(debug_id).lower()))
+        images.sort()
+        self._starts = [image[0] for image in images]
+        self._images = images
+
+    def find(self, addr: int) -> tuple[int, str] | None:
+        idx = bisect.bisect_right(self._starts, addr) - 1
+        if idx < 0:
+            return None
+        start, end, debug_id = self._images[idx]
+        if addr >= end:
+            return None
+        return start, debug_id
+
+
+def _rebase(frames: Sequence[Mapping[str, Any]], image_addr: int) -> list[dict[str, Any]]:
+    result = []
+    for frame in frames:
+        frame = dict(frame)
+        frame.pop("original_index", None)
+        for field in _ADDRESS_FIELDS:
+            addr = _parse_addr(frame.get(field))
+            if addr is not None:
+                frame[field] = addr - image_addr
+        result.append(frame)
+    return result
+
+
+def _restore(frames: Sequence[Mapping[str, Any]], image_addr: int) -> list[dict[str, Any]]:
+    result = []
+    for frame in frames:
+        frame = dict(frame)
+        for field in _ADDRESS_FIELDS:
+            offset = frame.get(field)
+            if isinstance(offset, int):
+                frame[field] = hex(image_addr + offset)
+        result.append(frame)
+    return result
+
+
+def get_many(keys: Iterable[str]) -> dict[str, list[dict[str, Any]]]:
+    found: dict[str, list[dict[str, Any]]] = {}
+    remaining = []
+    with _local_cache_lock:
+        for key in keys:
+            value = _local_cache.get(key)
+            if value is None:
+                remaining.append(key)
+            else:
+                found[key] = value
+
+    if remaining:
+        shared = cache.get_many(remaining)
+        with _local_cache_lock:
+            for key, value in shared.items():
+                _local_cache[key] = value
+        found.update(shared)
+    return found
+
+
+def set_many(values: Mapping[str, list[dict[str, Any]]]) -> None:
+    if not values:
+        return
+    with _local_cache_lock:
+        for key, value in values.items():
+            _local_cache[key] = value
+    cache.set_many(dict(values), timeout=CACHE_TTL)
+
+
+class SymbolicationCacheLookup:
+    """
+    Splits the stacktraces of a symbolication request into the frames found in
+    the cache and the frames which still need to be symbolicated, and merges the
+    results of both back into stacktraces shaped like a symbolicator response.
+    """
+
+    def __init__(
+        self,
+        project_id: int,
+        modules: Iterable[Mapping[str, Any]],
+        stacktraces: Sequence[Mapping[str, Any]],
+    ) -> None:
+        images = _ImageIndex(modules)
+        self.stacktraces = stacktraces
+        # The cache key and image address of every frame, or None if the frame
+        # can't be cached.
+        self.frame_keys: list[list[tuple[str, int] | None]] = []
+
+        for stacktrace in stacktraces:
+            frame_keys: list[tuple[str, int] | None] = []
+            for idx, frame in enumerate(stacktrace["frames"]):
+                addr = _parse_addr(frame.get("instruction_addr"))
+                image = images.find(addr) if addr is not None else None
+                if image is None or frame.get("addr_mode", "abs") != "abs":
+                    frame_keys.append(None)
+                    continue
+                image_addr, debug_id = image
+                adjust = self._adjust_instruction_addr(frame, idx)
+                key = f"profiling:symcache:{project_id}:{debug_id}:{addr - image_addr:x}:{adjust:d}"
+                frame_keys.append((key, image_addr))
+            self.frame_keys.append(frame_keys)
+
+        self.keys = {
+            frame_key[0] for frame_keys in self.frame_keys for frame_key in frame_keys if frame_key
+        }
+        self._sent: list[str | tuple[int, int]] = []
+
+    @staticmethod
+    def _adjust_instruction_addr(frame: Mapping[str, Any], idx: int) -> bool:
+        # Symbolicator doesn't adjust the first frame of a stacktrace unless told
+        # otherwise. Frames are moved into a different stacktrace when only the
+        # misses are sent, so the adjustment is made explicit.
+        return bool(frame.get("adjust_instruction_addr", idx > 0))
+
+    def get_missing_frames(self, cached: Mapping[str, Any]) -> list[dict[str, Any]]:
+        """
+        Returns the frames to send to symbolicator, each frame missing from the
+        cache only once.
+        """
+        frames = []
+        sent_keys = set()
+        for stacktrace_idx, stacktrace in enumerate(self.stacktraces):
+            for idx, frame in enumerate(stacktrace["frames"]):
+                frame_key = self.frame_keys[stacktrace_idx][idx]
+                if frame_key is None:
+                    self._sent.append((stacktrace_idx, idx))
+                else:
+                    key = frame_key[0]
+                    if key in cached or key in sent_keys:
+                        continue
+                    sent_keys.add(key)
+                    self._sent.append(key)
+
+                frame = dict(frame)
+                frame["adjust_instruction_addr"] = self._adjust_instruction_addr(frame, idx)
+                frames.append(frame)
+        return frames
+
+    def merge(
+        self,
+        cached: Mapping[str, list[dict[str, Any]]],
+        symbolicated_frames: Sequence[dict[str, Any]],
+    ) -> tuple[list[dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+        """
+        Returns the symbolicated stacktraces, along with the newly symbolicated
+        frames to add to the cache.
+        """
+        results: dict[str | tuple[int, int], list[dict[str, Any]]] = {}
+        for i, frame in enumerate(symbolicated_frames):
+            sent_idx = frame.get("original_index", i)
+            results.setdefault(self._sent[sent_idx], []).append(frame)
+
+        stacktraces = []
+        for stacktrace_idx, stacktrace in enumerate(self.stacktraces):
+            frames: list[dict[str, Any]] = []
+            for idx, raw_frame in enumerate(stacktrace["frames"]):
+                frame_key = self.frame_keys[stacktrace_idx][idx]
+                if frame_key is None:
+                    new_frames = results.get((stacktrace_idx, idx), [raw_frame])
+                elif frame_key[0] in cached:
+                    new_frames = _restore(cached[frame_key[0]], frame_key[1])
+                else:
+                    new_frames = [dict(f) for f in results.get(frame_key[0], [raw_frame])]
+
+                for frame in new_frames:
+                    frame["original_index"] = idx
+                    frames.append(frame)
+            stacktraces.append({**stacktrace, "frames": frames})
+
+        to_cache = {}
+        for frame_keys in self.frame_keys:
+            for frame_key in frame_keys:
+                if frame_key is None or frame_key[0] in cached or frame_key[0] in to_cache:
+                    continue
+                new_frames = results.get(frame_key[0])
+                if new_frames and all(f.get("status") == "symbolicated" for f in new_frames):
+                    to_cache[frame_key[0]] = _rebase(new_frames, frame_key[1])
+
+        return stacktraces, to_cache
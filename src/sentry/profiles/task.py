@@ -47,6 +47,7 @@ from sentry.models.projectsdk import (
     get_rejected_sdk_version,
 )
 from sentry.objectstore.metrics import measure_storage_operation
+from sentry.profiles import symbolication_cache
 from sentry.profiles.java import (
     convert_android_methods_to_jvm_frames,
     deobfuscate_signature,
@@ -424,7 +425,14 @@ def _symbolicate_profile(profile: Profile, project: Project) -> bool:
                     len(frames_sent),
                 )
 
-                modules, stacktraces, success = run_symbolicate(
+                if platform in SHOULD_SYMBOLICATE_JS or not options.get(
+                    "profiling.symbolication_cache.enabled"
+                ):
+                    symbolicate_fn = run_symbolicate
+                else:
+                    symbolicate_fn = run_symbolicate_with_cache
+
+                modules, stacktraces, success = symbolicate_fn(
                     project=project,
                     profile=profile,
                     modules=raw_modules,
@@ -713,6 +721,53 @@ def run_symbolicate(
     return modules, stacktraces, False
 
 
+def run_symbolicate_with_cache(
+    project: Project,
+    profile: Profile,
+    modules: list[Any],
+    stacktraces: list[Any],
+    frame_order: FrameOrder,
+    platform: str,
+) -> tuple[list[Any], list[Any], bool]:
+    """
+    Symbolicates native frames like `run_symbolicate`, but only sends the frames
+    missing from the symbolication cache to symbolicator.
+    """
+    lookup = symbolication_cache.SymbolicationCacheLookup(project.id, modules, stacktraces)
+    cached = symbolication_cache.get_many(lookup.keys)
+    missing_frames = lookup.get_missing_frames(cached)
+
+    metrics.incr(
+        "process_profile.symbolicate.cache",
+        amount=len(cached),
+        tags={"platform": platform, "result": "hit"},
+    )
+    metrics.incr(
+        "process_profile.symbolicate.cache",
+        amount=len(lookup.keys) - len(cached),
+        tags={"platform": platform, "result": "miss"},
+    )
+
+    if not missing_frames:
+        symbolicated_frames: list[Any] = []
+    else:
+        modules, missing_stacktraces, success = run_symbolicate(
+            project=project,
+            profile=profile,
+            modules=modules,
+            stacktraces=[{"frames": missing_frames}],
+            frame_order=frame_order,
+            platform=platform,
+        )
+        if not success:
+            return modules, stacktraces, False
+        symbolicated_frames = missing_stacktraces[0]["frames"]
+
+    stacktraces, to_cache = lookup.merge(cached, symbolicated_frames)
+    symbolication_cache.set_many(to_cache)
+    return modules, stacktraces, True
+
+
 @metrics.wraps("process_profile.symbolicate.process")
 def _process_symbolicator_results(
     profile: Profile,
@@ -820,9 +875,28 @@ def _process_symbolicator_results_for_sample(
     elif symbolicated_frames:
         profile["profile"]["frames"] = symbolicated_frames
 
-    if platform in SHOULD_SYMBOLICATE:
+    # frames symbolicated into a single frame are remapped with a table lookup,
+    # only stacks containing inlined frames need to be rebuilt
+    inlined_frames = {
+        index: indices for index, indices in symbolicated_frames_dict.items() if len(indices) > 1
+    }
+    remap_table = list(range(max(symbolicated_frames_dict, default=-1) + 1))
+    for index, indices in symbolicated_frames_dict.items():
+        if len(indices) == 1:
+            remap_table[index] = indices[0]
+    needs_remap = bool(inlined_frames) or any(
+        index != new_index for index, new_index in enumerate(remap_table)
+    )
+
+    if platform in SHOULD_SYMBOLICATE and needs_remap:
 
         def get_stack(stack: list[int]) -> list[int]:
+            if inlined_frames.keys().isdisjoint(stack):
+                try:
+                    return list(map(remap_table.__getitem__, stack))
+                except IndexError:
+                    # frames beyond the symbolicated ones are kept as they are
+                    pass
             new_stack: list[int] = []
             for index in stack:
                 if index in symbolicated_frames_dict:
@@ -1206,16 +1280,12 @@ def _calculate_duration_for_sample_format_v1(profile: Profile) -> int:
     duration_ns = end_ns - start_ns
     # try another method to determine the duration in case it's negative or 0.
     if duration_ns <= 0:
-        samples = sorted(
-            profile["profile"]["samples"],
-            key=itemgetter("elapsed_since_start_ns"),
-        )
+        samples = profile["profile"]["samples"]
         if len(samples) < 2:
             return 0
-        first, last = samples[0], samples[-1]
-        first_ns = int(first["elapsed_since_start_ns"])
-        last_ns = int(last["elapsed_since_start_ns"])
-        duration_ns = last_ns - first_ns
+        # timestamps are sent as strings, compare them as numbers
+        elapsed_ns = [int(sample["elapsed_since_start_ns"]) for sample in samples]
+        duration_ns = max(elapsed_ns) - min(elapsed_ns)
     duration_ms = int(duration_ns * 1e-6)
     return min(duration_ms, 30000)
 
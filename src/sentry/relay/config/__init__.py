@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import logging
-import uuid
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Generator, Iterable, Mapping, MutableMapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Literal, NotRequired, TypedDict
 
@@ -1054,6 +1057,212 @@ def _get_mobile_performance_profiles(
     ]
 
 
+# Organization level results shared between the project configs computed
+# within `shared_organization_state`, keyed by (name, organization id).
+_organization_state: ContextVar[dict[tuple[str, int], Any] | None] = ContextVar(
+    "relay_config_organization_state", default=None
+)
+
+
+@contextmanager
+def shared_organization_state() -> Generator[None]:
+    """
+    Computes organization level parts of the project config (retentions,
+    performance score profiles, trusted relays) only once for all the configs
+    built within this context. Use this when computing the configs of many
+    projects of the same organization in one go.
+    """
+    token = _organization_state.set({})
+    try:
+        yield
+    finally:
+        _organization_state.reset(token)
+
+
+def _get_organization_scoped[T](name: str, organization: Organization, fn: Callable[[], T]) -> T:
+    state = _organization_state.get()
+    if state is None:
+        return fn()
+
+    key = (name, organization.id)
+    if key not in state:
+        state[key] = fn()
+    return state[key]
+
+
+def _build_dynamic_sampling_section(
+    project: Project, project_keys: Iterable[ProjectKey] | None
+) -> Mapping[str, Any]:
+    section: dict[str, Any] = {}
+    # NOTE: Omitting dynamicSampling because of a failure increases the number
+    # of events forwarded by Relay, because dynamic sampling will stop filtering
+    # anything.
+    add_experimental_config(section, "sampling", get_dynamic_sampling_config, project)
+    return section
+
+
+def _build_metric_extraction_section(
+    project: Project, project_keys: Iterable[ProjectKey] | None
+) -> Mapping[str, Any]:
+    if _should_extract_transaction_metrics(project):
+        if metric_extraction := get_metric_extraction_config(project):
+            return {"metricExtraction": metric_extraction}
+    return {}
+
+
+def _build_performance_score_section(
+    project: Project, project_keys: Iterable[ProjectKey] | None
+) -> Mapping[str, Any]:
+    organization = project.organization
+    performance_score_profiles = _get_organization_scoped(
+        "performance_score_profiles",
+        organization,
+        lambda: [
+            *_get_desktop_browser_performance_profiles(organization),
+            *_get_mobile_browser_performance_profiles(organization),
+            *_get_mobile_performance_profiles(organization),
+            *_get_default_browser_performance_profiles(organization),
+        ],
+    )
+    if performance_score_profiles:
+        return {"performanceScore": {"profiles": performance_score_profiles}}
+    return {}
+
+
+def _build_filter_settings_section(
+    project: Project, project_keys: Iterable[ProjectKey] | None
+) -> Mapping[str, Any]:
+    with sentry_sdk.start_span(op="get_filter_settings"):
+        if filter_settings := get_filter_settings(project):
+            return {"filterSettings": filter_settings}
+    return {}
+
+
+def _build_quotas_section(
+    project: Project, project_keys: Iterable[ProjectKey] | None
+) -> Mapping[str, Any]:
+    with sentry_sdk.start_span(op="get_all_quotas"):
+        if quotas_config := get_quotas(project, keys=project_keys):
+            return {"quotas": quotas_config}
+    return {}
+
+
+@dataclass(frozen=True)
+class ProjectConfigSection:
+    """
+    A part of the project config that can be recomputed independently of the
+    rest of it. A section owns the `keys` of the `config` object it builds.
+    """
+
+    name: str
+    keys: tuple[str, ...]
+    build: Callable[[Project, Iterable[ProjectKey] | None], Mapping[str, Any]]
+
+
+PROJECT_CONFIG_SECTIONS: dict[str, ProjectConfigSection] = {
+    section.name: section
+    for section in (
+        ProjectConfigSection("dynamic_sampling", ("sampling",), _build_dynamic_sampling_section),
+        ProjectConfigSection(
+            "metric_extraction", ("metricExtraction",), _build_metric_extraction_section
+        ),
+        ProjectConfigSection(
+            "performance_score", ("performanceScore",), _build_performance_score_section
+        ),
+        ProjectConfigSection("filters", ("filterSettings",), _build_filter_settings_section),
+        ProjectConfigSection("quotas", ("quotas",), _build_quotas_section),
+    )
+}
+
+# Invalidation triggers (see `schedule_invalidate_project_config`) which are
+# known to only change some sections of the project config. Invalidations with
+# any other trigger recompute the whole config.
+INVALIDATION_TRIGGER_SECTIONS: dict[str, tuple[str, ...]] = {
+    "dynamic_sampling:boost_release": ("dynamic_sampling",),
+    "dynamic_sampling:custom_rule_upsert": ("dynamic_sampling",),
+    "dynamic_sampling_boost_low_volume_projects": ("dynamic_sampling",),
+    "dynamic_sampling_boost_low_volume_transactions": ("dynamic_sampling",),
+    "releaseproject.post_save": ("dynamic_sampling",),
+    "alerts:create-on-demand-metric": ("metric_extraction",),
+    "dashboards:create-on-demand-metric": ("metric_extraction",),
+}
+
+
+def get_invalidated_sections(trigger: str | None) -> tuple[str, ...] | None:
+    """
+    Returns the names of the sections affected by an invalidation trigger, or
+    None if the whole project config has to be recomputed.
+    """
+    if trigger is None:
+        return None
+    return INVALIDATION_TRIGGER_SECTIONS.get(trigger)
+
+
+def get_project_config_revision(cfg: Mapping[str, Any]) -> str:
+    """
+    Returns a revision derived from the contents of a project config, so that
+    recomputing an unchanged config yields the same revision.
+    """
+    content = {k: v for k, v in cfg.items() if k not in ("rev", "lastFetch", "lastChange")}
+    return hashlib.sha1(utils.json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+
+def update_project_config_sections(
+    project: Project,
+    cached_config: Mapping[str, Any],
+    sections: Iterable[str],
+    project_keys: Iterable[ProjectKey] | None = None,
+) -> MutableMapping[str, Any] | None:
+    """Recomputes only the given sections of a previously computed project config.
+
+    :param cached_config: The serialized project config as found in the project
+        config cache.
+    :return: The updated project config, or None if the config can't be updated
+        incrementally and needs a full recompute.
+    """
+    if project.status != ObjectStatus.ACTIVE or cached_config.get("disabled"):
+        return None
+    if "config" not in cached_config:
+        return None
+
+    cfg = dict(cached_config)
+    config = dict(cfg["config"])
+    cfg["config"] = config
+
+    for name in sections:
+        section = PROJECT_CONFIG_SECTIONS[name]
+        for key in section.keys:
+            config.pop(key, None)
+        with sentry_sdk.start_span(op=f"project_config.section.{name}"):
+            config.update(section.build(project, project_keys))
+
+    now = datetime.now(timezone.utc)
+    cfg["lastFetch"] = now
+    cfg["lastChange"] = now
+    cfg["rev"] = get_project_config_revision(cfg)
+    return cfg
+
+
+# Sections which differ between the configs of different keys of the same project.
+KEY_DEPENDENT_SECTIONS = ("quotas",)
+
+
+def derive_project_key_config(
+    project: Project,
+    project_config: Mapping[str, Any],
+    project_keys: Iterable[ProjectKey],
+) -> MutableMapping[str, Any] | None:
+    """Derives the config for other keys of a project from a config computed for
+    one of its keys, recomputing only the parts that depend on the keys.
+
+    :return: The derived project config, or None if it needs a full recompute.
+    """
+    project_keys = list(project_keys)
+    cfg = dict(project_config)
+    cfg["publicKeys"] = get_public_key_configs(project_keys=project_keys)
+    return update_project_config_sections(project, cfg, KEY_DEPENDENT_SECTIONS, project_keys)
+
+
 def _get_project_config(
     project: Project, project_keys: Iterable[ProjectKey] | None = None
 ) -> ProjectConfig:
@@ -1069,15 +1278,18 @@ def _get_project_config(
             "slug": project.slug,
             "lastFetch": now,
             "lastChange": now,
-            "rev": uuid.uuid4().hex,
             "publicKeys": public_keys,
             "config": {
                 "allowedDomains": list(get_origins(project)),
-                "trustedRelays": [
-                    r["public_key"]
-                    for r in project.organization.get_option("sentry:trusted-relays", [])
-                    if r
-                ],
+                "trustedRelays": _get_organization_scoped(
+                    "trusted_relays",
+                    project.organization,
+                    lambda: [
+                        r["public_key"]
+                        for r in project.organization.get_option("sentry:trusted-relays", [])
+                        if r
+                    ],
+                ),
                 "piiConfig": get_pii_config(project),
                 "datascrubbingSettings": get_datascrubbing_settings(project),
             },
@@ -1099,10 +1311,7 @@ def _get_project_config(
         if exposed_features := get_exposed_features(project):
             config["features"] = exposed_features
 
-    # NOTE: Omitting dynamicSampling because of a failure increases the number
-    # of events forwarded by Relay, because dynamic sampling will stop filtering
-    # anything.
-    add_experimental_config(config, "sampling", get_dynamic_sampling_config, project)
+    config.update(PROJECT_CONFIG_SECTIONS["dynamic_sampling"].build(project, project_keys))
 
     # Rules to replace high cardinality transaction names
     if not features.has("projects:transaction-name-clustering-disabled", project):
@@ -1136,8 +1345,7 @@ def _get_project_config(
             project,
         )
 
-        if metric_extraction := get_metric_extraction_config(project):
-            config["metricExtraction"] = metric_extraction
+    config.update(PROJECT_CONFIG_SECTIONS["metric_extraction"].build(project, project_keys))
 
     config["sessionMetrics"] = {
         "version": (
@@ -1147,45 +1355,42 @@ def _get_project_config(
         ),
     }
 
-    performance_score_profiles = [
-        *_get_desktop_browser_performance_profiles(project.organization),
-        *_get_mobile_browser_performance_profiles(project.organization),
-        *_get_mobile_performance_profiles(project.organization),
-        *_get_default_browser_performance_profiles(project.organization),
-    ]
-    if performance_score_profiles:
-        config["performanceScore"] = {"profiles": performance_score_profiles}
-
-    with sentry_sdk.start_span(op="get_filter_settings"):
-        if filter_settings := get_filter_settings(project):
-            config["filterSettings"] = filter_settings
+    config.update(PROJECT_CONFIG_SECTIONS["performance_score"].build(project, project_keys))
+    config.update(PROJECT_CONFIG_SECTIONS["filters"].build(project, project_keys))
     with sentry_sdk.start_span(op="get_grouping_config_dict_for_project"):
         grouping_config = get_grouping_config_dict_for_project(project)
         if grouping_config is not None:
             config["groupingConfig"] = grouping_config
     with sentry_sdk.start_span(op="get_event_retention"):
-        event_retention = quotas.backend.get_event_retention(project.organization)
+        event_retention = _get_organization_scoped(
+            "event_retention",
+            project.organization,
+            lambda: quotas.backend.get_event_retention(project.organization),
+        )
         if event_retention is not None:
             config["eventRetention"] = event_retention
     with sentry_sdk.start_span(op="get_downsampled_event_retention"):
-        downsampled_event_retention = quotas.backend.get_downsampled_event_retention(
-            project.organization
+        downsampled_event_retention = _get_organization_scoped(
+            "downsampled_event_retention",
+            project.organization,
+            lambda: quotas.backend.get_downsampled_event_retention(project.organization),
         )
         if downsampled_event_retention is not None:
             config["downsampledEventRetention"] = downsampled_event_retention
     with sentry_sdk.start_span(op="get_retentions"):
-        retentions = quotas.backend.get_retentions(project.organization)
-        retentions_config = {
-            RETENTIONS_CONFIG_MAPPING[c]: v.to_object()
-            for c, v in retentions.items()
-            if c in RETENTIONS_CONFIG_MAPPING
-        }
+        retentions_config = _get_organization_scoped(
+            "retentions",
+            project.organization,
+            lambda: {
+                RETENTIONS_CONFIG_MAPPING[c]: v.to_object()
+                for c, v in quotas.backend.get_retentions(project.organization).items()
+                if c in RETENTIONS_CONFIG_MAPPING
+            },
+        )
         if retentions_config:
             config["retentions"] = retentions_config
 
-    with sentry_sdk.start_span(op="get_all_quotas"):
-        if quotas_config := get_quotas(project, keys=project_keys):
-            config["quotas"] = quotas_config
+    config.update(PROJECT_CONFIG_SECTIONS["quotas"].build(project, project_keys))
 
     if features.has("organizations:log-project-config", project.organization):
         try:
@@ -1246,6 +1451,7 @@ def _get_project_config(
         except Exception:
             capture_exception()
 
+    cfg["rev"] = get_project_config_revision(cfg)
     return ProjectConfig(project, **cfg)
 
 
@@ -73,8 +73,7 @@ class RedisProjectConfigCache(ProjectConfigCache):
         amount = sum(1 for rv in return_values if rv >= 1)
         metrics.incr("relay.projectconfig_cache.write", amount=amount, tags={"action": "delete"})
 
-    def get(self, public_key):
-        rv_b = self.cluster_read.get(self.__get_redis_key(public_key))
+    def __decode(self, rv_b: bytes | None) -> Mapping[str, Any] | None:
         if rv_b is not None:
             try:
                 rv = zstandard.decompress(rv_b).decode()
@@ -84,6 +83,19 @@ class RedisProjectConfigCache(ProjectConfigCache):
             return json.loads(rv)
         return None
 
+    def get(self, public_key):
+        return self.__decode(self.cluster_read.get(self.__get_redis_key(public_key)))
+
+    def get_many(self, public_keys) -> dict[str, Mapping[str, Any] | None]:
+        public_keys = list(public_keys)
+        # Note: Those are multiple pipelines, one per cluster node.
+        with self.cluster_read.pipeline(transaction=False) as p:
+            for public_key in public_keys:
+                p.get(self.__get_redis_key(public_key))
+            values = p.execute()
+
+        return {public_key: self.__decode(rv_b) for public_key, rv_b in zip(public_keys, values)}
+
     def get_rev(self, public_key) -> str | None:
         if value := self.cluster_read.get(self.__get_redis_rev_key(public_key)):
             return value.decode()
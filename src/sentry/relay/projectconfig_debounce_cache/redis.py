@@ -23,16 +23,20 @@ class RedisProjectConfigDebounceCache(ProjectConfigDebounceCache):
 
         super().__init__(**options)
 
-    def _get_redis_key(self, public_key, project_id, organization_id):
+    def _get_redis_key(self, public_key, project_id, organization_id, sections=None):
         if organization_id:
-            return f"{self._key_prefix}:o:{organization_id}"
+            key = f"{self._key_prefix}:o:{organization_id}"
         elif project_id:
-            return f"{self._key_prefix}:p:{project_id}"
+            key = f"{self._key_prefix}:p:{project_id}"
         elif public_key:
-            return f"{self._key_prefix}:k:{public_key}"
+            key = f"{self._key_prefix}:k:{public_key}"
         else:
             raise ValueError()
 
+        if sections is not None:
+            key = f"{key}:s:{','.join(sorted(sections))}"
+        return key
+
     def validate(self):
         validate_dynamic_cluster(self.is_redis_cluster, self.cluster)
 
@@ -44,34 +48,33 @@ class RedisProjectConfigDebounceCache(ProjectConfigDebounceCache):
         else:
             raise AssertionError("unreachable")
 
-    def is_debounced(self, *, public_key, project_id, organization_id):
-        if organization_id:
-            key = self._get_redis_key(
-                public_key=None, project_id=None, organization_id=organization_id
-            )
-            client = self._get_redis_client(key)
-            if client.get(key):
-                return True
-        if project_id:
-            key = self._get_redis_key(public_key=None, project_id=project_id, organization_id=None)
-            client = self._get_redis_client(key)
-            if client.get(key):
-                return True
-        if public_key:
-            key = self._get_redis_key(public_key=public_key, project_id=None, organization_id=None)
-            client = self._get_redis_client(key)
-            if client.get(key):
-                return True
+    def is_debounced(self, *, public_key, project_id, organization_id, sections=None):
+        scopes = (
+            {"public_key": None, "project_id": None, "organization_id": organization_id},
+            {"public_key": None, "project_id": project_id, "organization_id": None},
+            {"public_key": public_key, "project_id": None, "organization_id": None},
+        )
+        for scope in scopes:
+            if not any(scope.values()):
+                continue
+            # A pending task for the whole config also covers any sections.
+            keys = [self._get_redis_key(**scope)]
+            if sections is not None:
+                keys.append(self._get_redis_key(**scope, sections=sections))
+            for key in keys:
+                client = self._get_redis_client(key)
+                if client.get(key):
+                    return True
         return False
 
-    def debounce(self, *, public_key, project_id, organization_id):
-        key = self._get_redis_key(public_key, project_id, organization_id)
+    def debounce(self, *, public_key, project_id, organization_id, sections=None):
+        key = self._get_redis_key(public_key, project_id, organization_id, sections)
         client = self._get_redis_client(key)
         client.setex(key, self._debounce_ttl, 1)
         metrics.incr("relay.projectconfig_debounce_cache.debounce")
 
-    def mark_task_done(self, *, public_key, project_id, organization_id):
-        key = self._get_redis_key(public_key, project_id, organization_id)
+    def mark_task_done(self, *, public_key, project_id, organization_id, sections=None):
+        key = self._get_redis_key(public_key, project_id, organization_id, sections)
         client = self._get_redis_client(key)
         ret = client.delete(key)
         metrics.incr("relay.projectconfig_debounce_cache.task_done")
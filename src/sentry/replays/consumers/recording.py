@@ -116,6 +116,9 @@ def process_message(message: bytes) -> ProcessedEvent | None:
         return process_recording_event(
             recording_event,
             use_new_recording_parser=options.get("replay.consumer.msgspec_recording_parser"),
+            use_streaming_recording_parser=options.get(
+                "replay.consumer.streaming_recording_parser"
+            ),
         )
     except DropSilently:
         return None
@@ -1,7 +1,9 @@
 import dataclasses
 import logging
+import re
 import time
 import zlib
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from typing import Any, TypedDict
 
@@ -111,6 +113,36 @@ def parse_recording_data(payload: bytes) -> list[dict]:
         return json.loads(payload)
 
 
+# Snapshot events make up the bulk of a recording and are never inspected. rrweb writes the type
+# first, which lets us recognize them and skip their bodies without decoding them.
+SNAPSHOT_EVENT_PREFIX = re.compile(rb'\s*\{\s*"type"\s*:\s*[23]\s*[,}]')
+
+raw_events_decoder = msgspec.json.Decoder(list[msgspec.Raw])
+event_decoder = msgspec.json.Decoder(RRWebEvent)
+
+
+def iter_recording_data(payload: bytes) -> Iterator[dict[str, Any]]:
+    """Yield the custom events of a recording one at a time.
+
+    The recording is only split into its events up front. Each event is a view into the payload,
+    so no copy of it is made. Snapshot events are skipped without being decoded, and every
+    other event is decoded when it's reached. Only the event being processed is held in memory.
+    """
+    for raw_event in raw_events_decoder.decode(payload):
+        if SNAPSHOT_EVENT_PREFIX.match(memoryview(raw_event)):
+            continue
+
+        try:
+            event = event_decoder.decode(raw_event)
+        except msgspec.DecodeError:
+            metrics.incr("replays.recording_consumer.msgspec_decode_error")
+            yield json.loads(bytes(raw_event))
+            continue
+
+        if isinstance(event, CustomEvent) and event.data is not None:
+            yield {"type": 5, "data": {"tag": event.data.tag, "payload": event.data.payload}}
+
+
 class DropEvent(Exception):
     pass
 
@@ -149,9 +181,13 @@ class ProcessedEvent:
 
 @sentry_sdk.trace
 def process_recording_event(
-    message: Event, use_new_recording_parser: bool = False
+    message: Event,
+    use_new_recording_parser: bool = False,
+    use_streaming_recording_parser: bool = False,
 ) -> ProcessedEvent:
-    parsed_output = parse_replay_events(message, use_new_recording_parser)
+    parsed_output = parse_replay_events(
+        message, use_new_recording_parser, use_streaming_recording_parser
+    )
     if parsed_output:
         replay_events, trace_items = parsed_output
     else:
@@ -185,9 +221,14 @@ def process_recording_event(
     )
 
 
-def parse_replay_events(message: Event, use_new_recording_parser: bool):
+def parse_replay_events(
+    message: Event, use_new_recording_parser: bool, use_streaming_recording_parser: bool = False
+):
     try:
-        if use_new_recording_parser:
+        events: Iterable[dict[str, Any]]
+        if use_streaming_recording_parser:
+            events = iter_recording_data(message["payload"])
+        elif use_new_recording_parser:
             events = parse_recording_data(message["payload"])
         else:
             events = json.loads(message["payload"])
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import random
 import uuid
-from collections.abc import Callable, Iterator, MutableMapping
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -90,7 +90,7 @@ class EventContext(TypedDict):
 
 @sentry_sdk.trace
 def parse_events(
-    context: EventContext, events: list[dict[str, Any]]
+    context: EventContext, events: Iterable[dict[str, Any]]
 ) -> tuple[ParsedEventMeta, list[TraceItem]]:
     sampled = random.randint(0, 499) < 1
 
@@ -255,7 +255,7 @@ def which(event: dict[str, Any]) -> EventType:
         return EventType.UNKNOWN
 
 
-def which_iter(events: list[dict[str, Any]]) -> Iterator[tuple[EventType, dict[str, Any]]]:
+def which_iter(events: Iterable[dict[str, Any]]) -> Iterator[tuple[EventType, dict[str, Any]]]:
     for event in events:
         yield (which(event), event)
 
@@ -37,8 +37,12 @@ def pack(rrweb: bytes, video: bytes | None) -> bytes:
         return b"\x01" + _to_uint_bytes(len(video)) + video + rrweb
 
 
-def unpack(obj: bytes):
-    mv = memoryview(obj)
+def unpack(obj: bytes | memoryview) -> tuple[memoryview | None, memoryview]:
+    """Split a packed payload into its video and rrweb parts.
+
+    Both parts are views into `obj`. No bytes are copied, however large the payload.
+    """
+    mv = obj if isinstance(obj, memoryview) else memoryview(obj)
     if mv[0] == 91:  # Not packed.
         return (None, mv)
     elif mv[0] == Encoding.RRWEB.value:
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import uuid
 import zlib
+from collections import deque
 from collections.abc import Generator, Iterator
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -24,6 +25,7 @@ from snuba_sdk import (
     Request,
 )
 
+from sentry import options
 from sentry.models.files.file import File
 from sentry.models.files.fileblobindex import FileBlobIndex
 from sentry.replays.lib.storage import RecordingSegmentStorageMeta, filestore, storage
@@ -265,14 +267,42 @@ def download_segments(segments: list[RecordingSegmentStorageMeta]) -> Iterator[b
 def iter_segment_data(
     segments: list[RecordingSegmentStorageMeta],
 ) -> Generator[tuple[int, memoryview]]:
-    with ThreadPoolExecutor(max_workers=10) as pool:
-        segment_data = pool.map(_download_segment, segments)
-
-    for i, result in enumerate(segment_data):
-        if result is None:
-            yield i, memoryview(b"[]")
-        else:
-            yield i, result[1]
+    """Download segments concurrently and yield them in order.
+
+    At most `replay.storage.download-concurrency` segments are in flight at a time. A segment is
+    yielded as soon as it and every segment before it have arrived, so the first segments can be
+    streamed to the client while the later ones are still downloading.
+    """
+    concurrency = max(options.get("replay.storage.download-concurrency"), 1)
+    remaining = iter(segments)
+    pending: deque[Future[tuple[memoryview | None, memoryview] | None]] = deque()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+
+        def download_next() -> None:
+            segment = next(remaining, None)
+            if segment is not None:
+                pending.append(pool.submit(_download_segment, segment))
+
+        try:
+            for _ in range(concurrency):
+                download_next()
+
+            i = 0
+            while pending:
+                result = pending.popleft().result()
+                download_next()
+
+                if result is None:
+                    yield i, memoryview(b"[]")
+                else:
+                    yield i, result[1]
+                i += 1
+        finally:
+            # The consumer may stop early (e.g. the client disconnected). Don't download the
+            # segments it will never read.
+            for future in pending:
+                future.cancel()
 
 
 def download_segment(segment: RecordingSegmentStorageMeta, span: Any) -> bytes:
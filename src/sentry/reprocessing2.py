@@ -87,7 +87,7 @@ instead of group deletion is:
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Literal, overload
@@ -104,6 +104,9 @@ from sentry.models.files.utils import get_storage
 from sentry.models.project import Project
 from sentry.objectstore import get_attachments_session
 from sentry.options.rollout import in_random_rollout
+from sentry.rules.conditions.frequency_counters import (
+    invalidate_groups as invalidate_frequency_counters,
+)
 from sentry.services import eventstore
 from sentry.services.eventstore.models import Event, GroupEvent
 from sentry.services.eventstore.processing import event_processing_store
@@ -208,11 +211,78 @@ def pull_event_data(project_id: int, event_id: str) -> ReprocessableEvent:
     return ReprocessableEvent(event=event, data=data, attachments=attachments)
 
 
-def reprocess_event(project_id: int, event_id: str, start_time: float) -> None:
+def pull_event_data_multi(
+    project_id: int, events: Sequence[Event | GroupEvent]
+) -> dict[str, ReprocessableEvent | CannotReprocess]:
+    """
+    Like `pull_event_data`, but for a batch of events that were already
+    fetched from the eventstore, such as a page of `reprocess_group`. The
+    unprocessed payloads are read with a single nodestore call and the
+    attachments with a single query.
+
+    Returns either the reprocessable event or the reason it can't be
+    reprocessed for each event ID.
+    """
+    from sentry.lang.native.processing import get_required_attachment_types
+
+    with sentry_sdk.start_span(op="reprocess_events.nodestore.get_multi"):
+        node_ids = {
+            event.event_id: Event.generate_node_id(project_id, event.event_id) for event in events
+        }
+        unprocessed = nodestore.backend.get_multi(list(node_ids.values()), subkey="unprocessed")
+
+    results: dict[str, ReprocessableEvent | CannotReprocess] = {}
+    required_attachment_types: dict[str, set[str]] = {}
+    for event in events:
+        data = unprocessed.get(node_ids[event.event_id])
+        # Same order of checks as `pull_event_data`: an event without any
+        # payload is reported as missing.
+        if not event.data:
+            results[event.event_id] = CannotReprocess("event.not_found")
+        elif data is None:
+            results[event.event_id] = CannotReprocess("unprocessed_event.not_found")
+        else:
+            results[event.event_id] = ReprocessableEvent(event=event, data=data, attachments=[])
+            required_attachment_types[event.event_id] = get_required_attachment_types(data)
+
+    all_required_types = set().union(*required_attachment_types.values())
+    if all_required_types:
+        for attachment in EventAttachment.objects.filter(
+            project_id=project_id,
+            event_id__in=list(required_attachment_types),
+            type__in=list(all_required_types),
+        ):
+            result = results[attachment.event_id]
+            if (
+                isinstance(result, ReprocessableEvent)
+                and attachment.type in required_attachment_types[attachment.event_id]
+            ):
+                result.attachments.append(attachment)
+
+    for event_id, required_types in required_attachment_types.items():
+        result = results[event_id]
+        assert isinstance(result, ReprocessableEvent)
+        if required_types - {ea.type for ea in result.attachments}:
+            results[event_id] = CannotReprocess("attachment.not_found")
+
+    return results
+
+
+def reprocess_event(
+    project_id: int,
+    event_id: str,
+    start_time: float,
+    reprocessable_event: ReprocessableEvent | None = None,
+) -> None:
+    """
+    Submits an event to preprocessing again. The event data is pulled from
+    nodestore unless it was already pulled with `pull_event_data_multi`.
+    """
     from sentry.ingest.consumer.processors import CACHE_TIMEOUT
     from sentry.tasks.store import preprocess_event_from_reprocessing
 
-    reprocessable_event = pull_event_data(project_id, event_id)
+    if reprocessable_event is None:
+        reprocessable_event = pull_event_data(project_id, event_id)
 
     data = reprocessable_event.data
     event = reprocessable_event.event
@@ -646,6 +716,7 @@ def start_group_reprocessing(
     date_created = reprocessing_activity.datetime
 
     reprocessing_store.start_reprocessing(group_id, date_created, sync_count, event_count)
+    invalidate_frequency_counters([group_id, new_group.id])
 
     return new_group.id
 
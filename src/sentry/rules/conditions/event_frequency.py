@@ -6,7 +6,7 @@ import logging
 from collections import defaultdict
 from collections.abc import Callable, Mapping
 from datetime import datetime, timedelta
-from typing import Any, Literal, NotRequired, TypedDict
+from typing import Any, ClassVar, Literal, NotRequired, TypedDict
 
 from django import forms
 from django.core.cache import cache
@@ -15,13 +15,15 @@ from django.db.models.enums import TextChoices
 from django.utils import timezone
 from snuba_sdk import Op
 
-from sentry import features, release_health, tsdb
+from sentry import features, options, release_health, tsdb
+from sentry.api.helpers.error_upsampling import are_any_projects_error_upsampled
 from sentry.issues.constants import get_issue_tsdb_group_model, get_issue_tsdb_user_group_model
 from sentry.issues.grouptype import GroupCategory
 from sentry.models.group import DEFAULT_TYPE_ID, Group
 from sentry.models.project import Project
 from sentry.rules import EventState
 from sentry.rules.conditions.base import EventCondition, GenericCondition
+from sentry.rules.conditions.frequency_counters import CounterType, get_counts
 from sentry.rules.match import MatchType
 from sentry.services.eventstore.models import GroupEvent
 from sentry.tsdb.base import TSDBModel
@@ -131,6 +133,8 @@ class _QSTypedDict(TypedDict):
 
 class BaseEventFrequencyCondition(EventCondition, abc.ABC):
     intervals = STANDARD_INTERVALS
+    # The frequency counters that can answer the Snuba queries of the condition, if any.
+    counter_type: ClassVar[CounterType | None] = None
 
     def __init__(
         self,
@@ -351,6 +355,17 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
         group_on_time: bool = False,
         project_ids: list[int] | None = None,
     ) -> Mapping[int, int]:
+        counts: dict[int, int] = {}
+        if (
+            self.counter_type is not None
+            and options.get("rules.frequency-counters.read.enabled")
+            and not self._is_error_upsampled(model, project_ids)
+        ):
+            counts = get_counts(self.counter_type, keys, environment_id, start, end)
+            keys = [key for key in keys if key not in counts]
+            if not keys:
+                return counts
+
         result: Mapping[int, int] = tsdb_function(
             model=model,
             keys=keys,
@@ -364,8 +379,21 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
             group_on_time=group_on_time,
             project_ids=project_ids,
         )
+        if counts:
+            return {**result, **counts}
         return result
 
+    def _is_error_upsampled(self, model: TSDBModel, project_ids: list[int] | None) -> bool:
+        """
+        Whether Snuba counts the events by their sample weight, which the
+        counters don't know about.
+        """
+        return (
+            self.counter_type == CounterType.EVENTS
+            and model == get_issue_tsdb_group_model(GroupCategory.ERROR)
+            and are_any_projects_error_upsampled(project_ids or [])
+        )
+
     def get_chunked_result(
         self,
         tsdb_function: Callable[..., Any],
@@ -433,6 +461,7 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
 class EventFrequencyCondition(BaseEventFrequencyCondition):
     id = "sentry.rules.conditions.event_frequency.EventFrequencyCondition"
     label = "The issue is seen more than {value} times in {interval}"
+    counter_type = CounterType.EVENTS
 
     def query_hook(
         self,
@@ -512,6 +541,7 @@ class EventFrequencyCondition(BaseEventFrequencyCondition):
 class EventUniqueUserFrequencyCondition(BaseEventFrequencyCondition):
     id = "sentry.rules.conditions.event_frequency.EventUniqueUserFrequencyCondition"
     label = "The issue is seen by more than {value} users in {interval}"
+    counter_type = CounterType.USERS
 
     def query_hook(
         self,
@@ -587,6 +617,8 @@ class EventUniqueUserFrequencyCondition(BaseEventFrequencyCondition):
 class EventUniqueUserFrequencyConditionWithConditions(EventUniqueUserFrequencyCondition):
     id = "sentry.rules.conditions.event_frequency.EventUniqueUserFrequencyConditionWithConditions"
     label = "The issue is seen by more than {value} users in {interval} with conditions"
+    # The counters know nothing about the attributes of the counted events.
+    counter_type = None
 
     def query_hook(
         self,
@@ -884,6 +916,7 @@ class EventFrequencyPercentCondition(BaseEventFrequencyCondition):
     id = "sentry.rules.conditions.event_frequency.EventFrequencyPercentCondition"
     label = "The issue affects more than {value} percent of sessions in {interval}"
     logger = logging.getLogger("sentry.rules.event_frequency")
+    counter_type = CounterType.EVENTS
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.intervals = PERCENT_INTERVALS
@@ -0,0 +1,181 @@
+"""
+Incrementally maintained per-group event and user counts for the event
+frequency conditions.
+
+Every processed event increments a counter for the time bucket it falls into,
+and adds its user to a HyperLogLog of the same bucket.  Counting the events of a
+group in a window then only needs to read the buckets that make up the window,
+instead of querying Snuba.
+
+Counters are only kept for `RETENTION`, and a group's counters are only complete
+from the moment the first event was recorded for it within that time.  Lookups
+for windows reaching further back return no value for the group, and callers
+fall back to Snuba.  Since windows are rounded out to whole buckets, counts may
+include events up to one bucket before the start of the window.
+
+Events moving between groups, through merges, unmerges and reprocessing, aren't
+reflected in the counters.  Those operations call `invalidate_groups`, after
+which the counters of the groups only cover the time since.
+
+Unique users are counted with a HyperLogLog, which estimates the count with a
+standard error of 0.81%.  Snuba's `uniq` is exact up to 65536 users, so the
+unique user conditions may see counts a few users off from Snuba for groups
+with thousands of users, and decide differently for values right at the
+threshold.  Small counts are near exact.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import datetime, timedelta
+from enum import StrEnum
+
+from django.conf import settings
+from django.utils import timezone
+from sentry_redis_tools.clients import RedisCluster, StrictRedis
+
+from sentry import options
+from sentry.utils import metrics
+from sentry.utils.redis import redis_clusters
+
+BUCKET_SIZE = timedelta(seconds=10)
+# Long enough for an hour long window compared to the hour before it.
+RETENTION = timedelta(hours=2, minutes=5)
+
+
+class CounterType(StrEnum):
+    EVENTS = "e"
+    USERS = "u"
+
+
+def get_redis_client() -> RedisCluster | StrictRedis:
+    return redis_clusters.get(settings.SENTRY_RULE_FREQUENCY_COUNTERS_REDIS_CLUSTER)
+
+
+def _get_bucket(timestamp: datetime) -> int:
+    return int(timestamp.timestamp() // BUCKET_SIZE.total_seconds())
+
+
+# All keys of a group share a hash tag, so that they live in the same cluster slot
+# and can be read by a single MGET or PFCOUNT.
+def _make_counter_key(
+    counter_type: CounterType, group_id: int, environment_id: int | None, bucket: int
+) -> str:
+    return f"rfc:{counter_type}:{{{group_id}}}:{environment_id or ''}:{bucket}"
+
+
+def _make_since_key(group_id: int) -> str:
+    return f"rfc:s:{{{group_id}}}"
+
+
+def record_event(
+    group_id: int, environment_id: int | None, timestamp: datetime, user: str | None
+) -> None:
+    """
+    Count an event of the group, both for its environment and across all
+    environments.
+    """
+    now = timezone.now()
+    if timestamp < now - RETENTION:
+        return
+
+    bucket = _get_bucket(timestamp)
+    ttl = int((RETENTION + BUCKET_SIZE).total_seconds())
+    environment_ids = {None, environment_id}
+
+    with get_redis_client().pipeline(transaction=False) as pipeline:
+        since_key = _make_since_key(group_id)
+        pipeline.set(since_key, int(now.timestamp()), nx=True, ex=ttl)
+        pipeline.expire(since_key, ttl)
+        for env_id in environment_ids:
+            events_key = _make_counter_key(CounterType.EVENTS, group_id, env_id, bucket)
+            pipeline.incr(events_key)
+            pipeline.expire(events_key, ttl)
+            if user:
+                users_key = _make_counter_key(CounterType.USERS, group_id, env_id, bucket)
+                pipeline.pfadd(users_key, user)
+                pipeline.expire(users_key, ttl)
+        pipeline.execute()
+
+
+def invalidate_groups(group_ids: Collection[int]) -> None:
+    """
+    Stops serving the current counters of the groups, for when events were
+    moved between groups.  The counters of a group are complete again for
+    windows starting after the next bucket, and until then lookups for the
+    group fall back to Snuba.
+    """
+    if not group_ids:
+        return
+    if not (
+        options.get("rules.frequency-counters.write.enabled")
+        or options.get("rules.frequency-counters.read.enabled")
+    ):
+        return
+
+    # Any bucket the moved events were counted in ends before this.
+    since = int((timezone.now() + BUCKET_SIZE).timestamp())
+    ttl = int((RETENTION + BUCKET_SIZE).total_seconds())
+    with get_redis_client().pipeline(transaction=False) as pipeline:
+        for group_id in group_ids:
+            pipeline.set(_make_since_key(group_id), since, ex=ttl)
+        pipeline.execute()
+    metrics.incr("rules.frequency_counters.invalidated", amount=len(group_ids))
+
+
+def get_counts(
+    counter_type: CounterType,
+    group_ids: Collection[int],
+    environment_id: int | None,
+    start: datetime,
+    end: datetime,
+) -> dict[int, int]:
+    """
+    Returns the number of events or unique users of the groups between `start`
+    and `end`.  Groups whose counters do not cover the whole window are left out.
+    """
+    if not group_ids:
+        return {}
+    if start < timezone.now() - RETENTION:
+        metrics.incr(
+            "rules.frequency_counters.lookup",
+            amount=len(group_ids),
+            tags={"result": "out_of_range", "type": counter_type.name.lower()},
+        )
+        return {}
+
+    buckets = range(_get_bucket(start), _get_bucket(end) + 1)
+    group_ids = list(group_ids)
+    with get_redis_client().pipeline(transaction=False) as pipeline:
+        for group_id in group_ids:
+            pipeline.get(_make_since_key(group_id))
+            keys = [
+                _make_counter_key(counter_type, group_id, environment_id, bucket)
+                for bucket in buckets
+            ]
+            if counter_type == CounterType.USERS:
+                pipeline.pfcount(*keys)
+            else:
+                pipeline.mget(keys)
+        results = pipeline.execute()
+
+    counts: dict[int, int] = {}
+    for group_id, since, value in zip(group_ids, results[::2], results[1::2]):
+        if since is None or int(since) > start.timestamp():
+            continue
+        if counter_type == CounterType.USERS:
+            counts[group_id] = int(value)
+        else:
+            counts[group_id] = sum(int(count) for count in value if count is not None)
+
+    metrics.incr(
+        "rules.frequency_counters.lookup",
+        amount=len(counts),
+        tags={"result": "hit", "type": counter_type.name.lower()},
+    )
+    metrics.incr(
+        "rules.frequency_counters.lookup",
+        amount=len(group_ids) - len(counts),
+        tags={"result": "cold", "type": counter_type.name.lower()},
+    )
+    return counts
@@ -3,8 +3,10 @@ from __future__ import annotations
 import functools
 import logging
 import os
+import threading
 import time
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from multiprocessing import JoinableQueue as Queue
 from multiprocessing import Process
@@ -26,6 +28,8 @@ logger = logging.getLogger(__name__)
 
 TRANSACTION_PREFIX = "cleanup"
 DELETES_BY_PROJECT_CHUNK_SIZE = 100
+# The number of ids in each range claimed by a worker when streaming bulk query deletes.
+BULK_QUERY_DELETES_RANGE_SIZE = 100_000
 
 if TYPE_CHECKING:
     from sentry.db.deletion import BulkDeleteQuery
@@ -338,6 +342,7 @@ def _cleanup(
                 project,
                 project_id,
                 models_attempted,
+                concurrency=concurrency,
             )
 
             run_bulk_deletes_in_deletes(
@@ -695,6 +700,7 @@ def run_bulk_query_deletes(
     project: str | None,
     project_id: int | None,
     models_attempted: set[str],
+    concurrency: int = 1,
 ) -> None:
     from sentry import options
     from sentry.db.deletion import BulkDeleteQuery
@@ -703,6 +709,7 @@ def run_bulk_query_deletes(
     if options.get("cleanup.abort_execution"):
         raise CleanupExecutionAborted()
 
+    streaming = options.get("cleanup.bulk-query-deletes.streaming")
     debug_output("Running bulk query deletes in bulk_query_deletes")
     bulk_query_deletes = generate_bulk_query_deletes()
     for model_tp, dtfield, order_by in bulk_query_deletes:
@@ -714,13 +721,17 @@ def run_bulk_query_deletes(
             debug_output(f"Removing {model_tp.__name__} for days={days} project={project or '*'}")
             models_attempted.add(model_tp.__name__.lower())
             try:
-                BulkDeleteQuery(
+                q = BulkDeleteQuery(
                     model=model_tp,
                     dtfield=dtfield,
                     days=days,
                     project_id=project_id,
                     order_by=order_by,
-                ).execute(chunk_size=chunk_size)
+                )
+                if streaming:
+                    stream_bulk_query_deletes(q, concurrency, chunk_size=chunk_size)
+                else:
+                    q.execute(chunk_size=chunk_size)
             except Exception:
                 capture_exception(tags={"model": model_tp.__name__})
                 metrics.incr(
@@ -731,6 +742,104 @@ def run_bulk_query_deletes(
                 )
 
 
+class BulkDeleteCheckpoint:
+    """
+    Records the id ranges of a bulk query delete which were completed today,
+    so that an interrupted cleanup resumes where it left off instead of
+    scanning those ranges again.
+    """
+
+    ttl = 24 * 60 * 60
+
+    def __init__(self, q: BulkDeleteQuery) -> None:
+        self.prefix = ":".join(
+            str(part)
+            for part in (
+                "cleanup:bulk-query-delete",
+                q.model._meta.db_table,
+                q.days,
+                q.project_id,
+                q.organization_id,
+                timezone.now().date().isoformat(),
+            )
+        )
+
+    def is_completed(self, lo: int) -> bool:
+        from django.core.cache import cache
+
+        return bool(cache.get(f"{self.prefix}:{lo}"))
+
+    def mark_completed(self, lo: int) -> None:
+        from django.core.cache import cache
+
+        cache.set(f"{self.prefix}:{lo}", 1, self.ttl)
+
+
+def stream_bulk_query_deletes(
+    q: BulkDeleteQuery,  # Imported locally in functions that use it
+    concurrency: int,
+    chunk_size: int = 10000,
+) -> int:
+    """
+    Deletes the rows matching a BulkDeleteQuery with `concurrency` workers,
+    each claiming the next disjoint range of ids and deleting the matching
+    rows in it with keyset pagination. Ids are never collected centrally, and
+    completed ranges are checkpointed.
+
+    Returns the number of rows deleted.
+    """
+    from django.db import connections
+
+    from sentry import options
+    from sentry.utils import metrics
+
+    model_name = q.model.__name__
+    checkpoint = BulkDeleteCheckpoint(q)
+    id_ranges = q.get_id_ranges(BULK_QUERY_DELETES_RANGE_SIZE)
+    lock = threading.Lock()
+
+    def claim_range() -> tuple[int, int] | None:
+        with lock:
+            return next(id_ranges, None)
+
+    def work() -> int:
+        deleted = 0
+        while (id_range := claim_range()) is not None:
+            if options.get("cleanup.abort_execution"):
+                raise CleanupExecutionAborted()
+
+            lo, hi = id_range
+            if checkpoint.is_completed(lo):
+                continue
+            deleted += q.execute_range(lo, hi, chunk_size=chunk_size)
+            checkpoint.mark_completed(lo)
+        return deleted
+
+    def work_in_thread() -> int:
+        try:
+            return work()
+        finally:
+            # Connections are per thread, so close the ones this thread opened.
+            connections.close_all()
+
+    start = time.monotonic()
+    if concurrency <= 1:
+        deleted = work()
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = [pool.submit(work_in_thread) for _ in range(concurrency)]
+            deleted = sum(future.result() for future in futures)
+
+    duration = time.monotonic() - start
+    rate = deleted / duration if duration > 0 else 0.0
+    metrics.incr("cleanup.bulk_query_delete.rows", deleted, tags={"model": model_name})
+    metrics.distribution(
+        "cleanup.bulk_query_delete.rows_per_second", rate, tags={"model": model_name}
+    )
+    debug_output(f"[DELETED] {deleted} {model_name} rows in {duration:.1f}s ({rate:.0f} rows/s)")
+    return deleted
+
+
 def _schedule_bulk_delete_chunks(
     task_queue: _WorkQueue,
     q: BulkDeleteQuery,  # Imported locally in functions that use it
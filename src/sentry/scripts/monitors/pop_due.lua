@@ -0,0 +1,20 @@
+-- Pops a page of due members from a sorted set scored by due timestamp
+--
+-- Rather than being removed, popped members are rescheduled at the lease
+-- timestamp, so that they are popped again should they not be rescheduled by
+-- whatever processes them.
+--
+-- KEYS[1]: The sorted set key
+-- ARGV[1]: The timestamp up to which (inclusive) members are due
+-- ARGV[2]: The maximum number of members to pop
+-- ARGV[3]: The lease timestamp popped members are rescheduled at
+--
+-- Returns: The popped members
+
+local members = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+
+for _, member in ipairs(members) do
+    redis.call('ZADD', KEYS[1], ARGV[3], member)
+end
+
+return members
@@ -40,11 +40,10 @@ class RedisReprocessingStore(ReprocessingStore):
         # Events for a group are split and bucketed by their primary hashes. If flushing is to be
         # performed on a per-group basis, the event count needs to be summed up across all buckets
         # belonging to a single group.
-        event_count = 0
+        pipe = self.redis.pipeline()
         for primary_hash in old_primary_hashes:
-            key = _get_old_primary_hash_subset_key(project_id, group_id, primary_hash)
-            event_count += self.redis.llen(key)
-        return event_count
+            pipe.llen(_get_old_primary_hash_subset_key(project_id, group_id, primary_hash))
+        return sum(pipe.execute())
 
     def pop_batched_events(
         self, project_id: int, group_id: int, primary_hash: str
@@ -98,14 +97,18 @@ class RedisReprocessingStore(ReprocessingStore):
         old_primary_hash: str,
     ) -> None:
         event_key = _get_old_primary_hash_subset_key(project_id, group_id, old_primary_hash)
-        self.redis.lpush(event_key, f"{date_val.timestamp()};{event_id}")
-        self.redis.expire(event_key, settings.SENTRY_REPROCESSING_TOMBSTONES_TTL)
+        pipe = self.redis.pipeline()
+        pipe.lpush(event_key, f"{date_val.timestamp()};{event_id}")
+        pipe.expire(event_key, settings.SENTRY_REPROCESSING_TOMBSTONES_TTL)
+        pipe.execute()
 
     def add_hash(self, project_id: int, group_id: int, hash: str) -> None:
         primary_hash_set_key = f"re2:tombstone-primary-hashes:{project_id}:{group_id}"
 
-        self.redis.sadd(primary_hash_set_key, hash)
-        self.redis.expire(primary_hash_set_key, settings.SENTRY_REPROCESSING_TOMBSTONES_TTL)
+        pipe = self.redis.pipeline()
+        pipe.sadd(primary_hash_set_key, hash)
+        pipe.expire(primary_hash_set_key, settings.SENTRY_REPROCESSING_TOMBSTONES_TTL)
+        pipe.execute()
 
     def get_remaining_event_count(
         self, project_id: int, old_group_id: int, datetime_to_event: list[tuple[datetime, str]]
@@ -115,11 +118,13 @@ class RedisReprocessingStore(ReprocessingStore):
         key = _get_remaining_key(project_id, old_group_id)
 
         if datetime_to_event:
-            llen = self.redis.lpush(
+            pipe = self.redis.pipeline()
+            pipe.lpush(
                 key,
                 *(f"{datetime.timestamp()};{event_id}" for datetime, event_id in datetime_to_event),
             )
-            self.redis.expire(key, settings.SENTRY_REPROCESSING_SYNC_TTL)
+            pipe.expire(key, settings.SENTRY_REPROCESSING_SYNC_TTL)
+            llen = pipe.execute()[0]
         else:
             llen = self.redis.llen(key)
         return llen
@@ -167,8 +172,10 @@ class RedisReprocessingStore(ReprocessingStore):
 
     def get_pending(self, group_id: int) -> tuple[str | None, int]:
         pending_key = _get_sync_counter_key(group_id)
-        pending = self.redis.get(pending_key)
-        ttl = self.redis.ttl(pending_key)
+        pipe = self.redis.pipeline()
+        pipe.get(pending_key)
+        pipe.ttl(pending_key)
+        pending, ttl = pipe.execute()
         return pending, ttl
 
     def get_progress(self, group_id: int) -> dict[str, Any] | None:
@@ -1,5 +1,6 @@
 import logging
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Sequence
 from datetime import timezone
 
 import sentry_sdk
@@ -16,8 +17,12 @@ from sentry.utils import metrics
 
 logger = logging.getLogger(__name__)
 TQuerySubscriptionCallable = Callable[[QuerySubscriptionUpdate, QuerySubscription], None]
+TQuerySubscriptionBatchCallable = Callable[
+    [list[tuple[QuerySubscriptionUpdate, QuerySubscription]]], None
+]
 
 subscriber_registry: dict[str, TQuerySubscriptionCallable] = {}
+batch_subscriber_registry: dict[str, TQuerySubscriptionBatchCallable] = {}
 
 
 def register_subscriber(
@@ -32,6 +37,24 @@ def register_subscriber(
     return inner
 
 
+def register_batch_subscriber(
+    subscriber_key: str,
+) -> Callable[[TQuerySubscriptionBatchCallable], TQuerySubscriptionBatchCallable]:
+    """
+    Registers a callback that handles all updates of a subscription type within a
+    consumer batch at once.  Subscription types also need a regular subscriber,
+    which is used when messages are not consumed in batches.
+    """
+
+    def inner(func: TQuerySubscriptionBatchCallable) -> TQuerySubscriptionBatchCallable:
+        if subscriber_key in batch_subscriber_registry:
+            raise Exception("Batch handler already registered for %s" % subscriber_key)
+        batch_subscriber_registry[subscriber_key] = func
+        return func
+
+    return inner
+
+
 def parse_message_value(
     value: bytes, jsoncodec: Codec[SubscriptionResult]
 ) -> QuerySubscriptionUpdate:
@@ -61,6 +84,89 @@ def parse_message_value(
     }
 
 
+def _parse_and_fetch_subscription(
+    message_value: bytes,
+    message_offset: int,
+    message_partition: int,
+    topic: str,
+    dataset: str,
+    jsoncodec: Codec[SubscriptionResult],
+) -> tuple[QuerySubscriptionUpdate, QuerySubscription] | None:
+    """
+    Parses the value from Kafka and fetches the subscription it belongs to. Returns
+    None if the message is invalid or there is no handler for the subscription.
+    """
+    try:
+        with metrics.timer("snuba_query_subscriber.parse_message_value", tags={"dataset": dataset}):
+            contents = parse_message_value(message_value, jsoncodec)
+    except InvalidMessageError:
+        # If the message is in an invalid format, just log the error
+        # and continue
+        logger.exception(
+            "Subscription update could not be parsed",
+            extra={
+                "offset": message_offset,
+                "partition": message_partition,
+                "value": message_value,
+            },
+        )
+        return None
+    sentry_sdk.get_isolation_scope().set_tag("query_subscription_id", contents["subscription_id"])
+
+    try:
+        with metrics.timer("snuba_query_subscriber.fetch_subscription", tags={"dataset": dataset}):
+            subscription = QuerySubscription.objects.get_from_cache(
+                subscription_id=contents["subscription_id"]
+            )
+            if subscription.status != QuerySubscription.Status.ACTIVE.value:
+                metrics.incr("snuba_query_subscriber.subscription_inactive")
+                return None
+    except QuerySubscription.DoesNotExist:
+        metrics.incr("snuba_query_subscriber.subscription_doesnt_exist", tags={"dataset": dataset})
+        logger.warning(
+            "Received subscription update, but subscription does not exist",
+            extra={
+                "offset": message_offset,
+                "partition": message_partition,
+                "value": message_value,
+            },
+        )
+        try:
+            if topic in topic_to_dataset:
+                _delete_from_snuba(
+                    topic_to_dataset[topic],
+                    contents["subscription_id"],
+                    EntityKey(contents["entity"]),
+                )
+            else:
+                logger.exception(
+                    "Topic not registered with QuerySubscriptionConsumer, can't remove "
+                    "non-existent subscription from Snuba",
+                    extra={"topic": topic, "subscription_id": contents["subscription_id"]},
+                )
+        except InvalidMessageError as e:
+            logger.exception(str(e))
+        except Exception:
+            logger.exception("Failed to delete unused subscription from snuba.")
+        return None
+
+    if subscription.type not in subscriber_registry:
+        metrics.incr(
+            "snuba_query_subscriber.subscription_type_not_registered", tags={"dataset": dataset}
+        )
+        logger.error(
+            "Received subscription update, but no subscription handler registered",
+            extra={
+                "offset": message_offset,
+                "partition": message_partition,
+                "value": message_value,
+            },
+        )
+        return None
+
+    return contents, subscription
+
+
 def handle_message(
     message_value: bytes,
     message_offset: int,
@@ -76,104 +182,108 @@ def handle_message(
     :param message:
     :return:
     """
-    with sentry_sdk.isolation_scope() as scope:
-        try:
-            with metrics.timer(
-                "snuba_query_subscriber.parse_message_value", tags={"dataset": dataset}
-            ):
-                contents = parse_message_value(message_value, jsoncodec)
-        except InvalidMessageError:
-            # If the message is in an invalid format, just log the error
-            # and continue
-            logger.exception(
-                "Subscription update could not be parsed",
-                extra={
-                    "offset": message_offset,
-                    "partition": message_partition,
-                    "value": message_value,
-                },
-            )
+    with sentry_sdk.isolation_scope():
+        parsed = _parse_and_fetch_subscription(
+            message_value, message_offset, message_partition, topic, dataset, jsoncodec
+        )
+        if parsed is None:
             return
-        scope.set_tag("query_subscription_id", contents["subscription_id"])
+        contents, subscription = parsed
+
+        _call_subscriber(
+            contents, subscription, message_value, message_offset, message_partition, dataset
+        )
+
+
+def _call_subscriber(
+    contents: QuerySubscriptionUpdate,
+    subscription: QuerySubscription,
+    message_value: bytes,
+    message_offset: int,
+    message_partition: int,
+    dataset: str,
+) -> None:
+    sentry_sdk.set_tag("project_id", subscription.project_id)
+    sentry_sdk.set_tag("query_subscription_id", contents["subscription_id"])
+
+    callback = subscriber_registry[subscription.type]
+    with (
+        sentry_sdk.start_span(op="process_message") as span,
+        metrics.timer(
+            "snuba_query_subscriber.callback.duration",
+            instance=subscription.type,
+            tags={"dataset": dataset},
+        ),
+    ):
+        span.set_data("payload", contents)
+        span.set_data("subscription_dataset", subscription.snuba_query.dataset)
+        span.set_data("subscription_query", subscription.snuba_query.query)
+        span.set_data("subscription_aggregation", subscription.snuba_query.aggregate)
+        span.set_data("subscription_time_window", subscription.snuba_query.time_window)
+        span.set_data("subscription_resolution", subscription.snuba_query.resolution)
+        span.set_data("message_offset", message_offset)
+        span.set_data("message_partition", message_partition)
+        span.set_data("message_value", message_value)
+
+        callback(contents, subscription)
+
 
+def handle_messages(
+    messages: Sequence[tuple[bytes, int, int]],
+    topic: str,
+    dataset: str,
+    jsoncodec: Codec[SubscriptionResult],
+) -> None:
+    """
+    Handles a batch of `(value, offset, partition)` messages. Updates of subscription
+    types with a batch subscriber are passed to it all at once, all other updates are
+    handled one by one as in `handle_message`.
+    """
+    batched_updates: dict[str, list[tuple[QuerySubscriptionUpdate, QuerySubscription]]] = (
+        defaultdict(list)
+    )
+    for message_value, message_offset, message_partition in messages:
         try:
-            with metrics.timer(
-                "snuba_query_subscriber.fetch_subscription", tags={"dataset": dataset}
-            ):
-                subscription = QuerySubscription.objects.get_from_cache(
-                    subscription_id=contents["subscription_id"]
+            with sentry_sdk.isolation_scope():
+                parsed = _parse_and_fetch_subscription(
+                    message_value, message_offset, message_partition, topic, dataset, jsoncodec
                 )
-                if subscription.status != QuerySubscription.Status.ACTIVE.value:
-                    metrics.incr("snuba_query_subscriber.subscription_inactive")
-                    return
-        except QuerySubscription.DoesNotExist:
-            metrics.incr(
-                "snuba_query_subscriber.subscription_doesnt_exist", tags={"dataset": dataset}
-            )
-            logger.warning(
-                "Received subscription update, but subscription does not exist",
-                extra={
-                    "offset": message_offset,
-                    "partition": message_partition,
-                    "value": message_value,
-                },
-            )
-            try:
-                if topic in topic_to_dataset:
-                    _delete_from_snuba(
-                        topic_to_dataset[topic],
-                        contents["subscription_id"],
-                        EntityKey(contents["entity"]),
-                    )
+                if parsed is None:
+                    continue
+                contents, subscription = parsed
+                if subscription.type in batch_subscriber_registry:
+                    batched_updates[subscription.type].append(parsed)
                 else:
-                    logger.exception(
-                        "Topic not registered with QuerySubscriptionConsumer, can't remove "
-                        "non-existent subscription from Snuba",
-                        extra={"topic": topic, "subscription_id": contents["subscription_id"]},
+                    _call_subscriber(
+                        contents,
+                        subscription,
+                        message_value,
+                        message_offset,
+                        message_partition,
+                        dataset,
                     )
-            except InvalidMessageError as e:
-                logger.exception(str(e))
-            except Exception:
-                logger.exception("Failed to delete unused subscription from snuba.")
-            return
-
-        if subscription.type not in subscriber_registry:
-            metrics.incr(
-                "snuba_query_subscriber.subscription_type_not_registered", tags={"dataset": dataset}
-            )
-            logger.error(
-                "Received subscription update, but no subscription handler registered",
+        except Exception:
+            logger.exception(
+                "Unexpected error while handling subscription update. Skipping message.",
                 extra={
                     "offset": message_offset,
                     "partition": message_partition,
                     "value": message_value,
                 },
             )
-            return
-
-        sentry_sdk.set_tag("project_id", subscription.project_id)
-        sentry_sdk.set_tag("query_subscription_id", contents["subscription_id"])
 
-        callback = subscriber_registry[subscription.type]
+    for subscription_type, updates in batched_updates.items():
         with (
-            sentry_sdk.start_span(op="process_message") as span,
+            sentry_sdk.isolation_scope(),
+            sentry_sdk.start_span(op="process_batch") as span,
             metrics.timer(
-                "snuba_query_subscriber.callback.duration",
-                instance=subscription.type,
+                "snuba_query_subscriber.batch_callback.duration",
+                instance=subscription_type,
                 tags={"dataset": dataset},
             ),
         ):
-            span.set_data("payload", contents)
-            span.set_data("subscription_dataset", subscription.snuba_query.dataset)
-            span.set_data("subscription_query", subscription.snuba_query.query)
-            span.set_data("subscription_aggregation", subscription.snuba_query.aggregate)
-            span.set_data("subscription_time_window", subscription.snuba_query.time_window)
-            span.set_data("subscription_resolution", subscription.snuba_query.resolution)
-            span.set_data("message_offset", message_offset)
-            span.set_data("message_partition", message_partition)
-            span.set_data("message_value", message_value)
-
-            callback(contents, subscription)
+            span.set_data("batch_size", len(updates))
+            batch_subscriber_registry[subscription_type](updates)
 
 
 class InvalidMessageError(Exception):
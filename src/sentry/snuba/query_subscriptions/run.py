@@ -1,6 +1,7 @@
 import logging
 from collections.abc import Mapping
 from functools import partial
+from typing import Literal
 
 import sentry_sdk
 from arroyo.backends.kafka.consumer import KafkaPayload
@@ -10,6 +11,7 @@ from arroyo.processing.strategies import (
     ProcessingStrategyFactory,
     RunTask,
 )
+from arroyo.processing.strategies.batching import BatchStep, ValuesBatch
 from arroyo.types import BrokerValue, Commit, Message, Partition
 from sentry_kafka_schemas import get_codec
 
@@ -34,6 +36,7 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         output_block_size: int | None,
         multi_proc: bool = True,
         topic_override: str | None = None,
+        mode: Literal["parallel", "batched"] = "parallel",
     ):
         self.dataset = Dataset(dataset)
         self.logical_topic = dataset_to_logical_topic[self.dataset]
@@ -46,6 +49,8 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         self.input_block_size = input_block_size
         self.output_block_size = output_block_size
         self.multi_proc = multi_proc
+        # In batched mode all updates of a batch are handled together in this process.
+        self.batched = mode == "batched"
         self.pool = MultiprocessingPool(num_processes)
 
     def create_with_partitions(
@@ -53,6 +58,16 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         commit: Commit,
         partitions: Mapping[Partition, int],
     ) -> ProcessingStrategy[KafkaPayload]:
+        if self.batched:
+            return BatchStep(
+                max_batch_size=self.max_batch_size,
+                max_batch_time=self.max_batch_time,
+                next_step=RunTask(
+                    partial(process_batch, self.dataset, self.topic, self.logical_topic),
+                    CommitOffsets(commit),
+                ),
+            )
+
         callable = partial(process_message, self.dataset, self.topic, self.logical_topic)
         if self.multi_proc:
             return run_task_with_multiprocessing(
@@ -111,3 +126,35 @@ def process_message(
                     "value": message_value,
                 },
             )
+
+
+def process_batch(
+    dataset: Dataset,
+    topic: str,
+    logical_topic: str,
+    message: Message[ValuesBatch[KafkaPayload]],
+) -> None:
+    from sentry.snuba.query_subscriptions.consumer import handle_messages
+    from sentry.utils import metrics
+
+    messages = []
+    for value in message.payload:
+        assert isinstance(value, BrokerValue)
+        messages.append((value.payload.value, value.offset, value.partition.index))
+
+    with (
+        sentry_sdk.start_transaction(
+            op="handle_messages",
+            name="query_subscription_consumer_process_batch",
+            custom_sampling_context={"sample_rate": options.get("subscriptions-query.sample-rate")},
+        ),
+        metrics.timer("snuba_query_subscriber.handle_messages", tags={"dataset": dataset.value}),
+    ):
+        try:
+            handle_messages(messages, topic, dataset.value, get_codec(logical_topic))
+        except Exception:
+            # Like in process_message, make sure that no batch can block the consumer.
+            logger.exception(
+                "Unexpected error while handling batch in QuerySubscriptionStrategy. Skipping batch.",
+                extra={"offsets": [offset for _, offset, _ in messages]},
+            )
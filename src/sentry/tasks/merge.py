@@ -4,15 +4,19 @@ from typing import Any
 
 import sentry_sdk
 from django.db import DataError, IntegrityError, router, transaction
-from django.db.models import F
+from django.db.models import Exists, F, OuterRef, Q
 
-from sentry import eventstream, similarity, tsdb
+from sentry import eventstream, options, similarity, tsdb
+from sentry.rules.conditions.frequency_counters import (
+    invalidate_groups as invalidate_frequency_counters,
+)
 from sentry.silo.base import SiloMode
 from sentry.tasks.base import instrumented_task, track_group_async_operation
 from sentry.tasks.post_process import fetch_buffered_group_stats
 from sentry.taskworker.namespaces import issues_tasks
 from sentry.taskworker.retry import Retry
 from sentry.tsdb.base import TSDBModel
+from sentry.utils import metrics
 
 logger = logging.getLogger("sentry.merge")
 delete_logger = logging.getLogger("sentry.deletions.async")
@@ -102,9 +106,14 @@ def merge_groups(
             GroupMeta,
         )
 
-        has_more = merge_objects(
-            model_list, group, new_group, logger=logger, transaction_id=transaction_id
-        )
+        if options.get("merge.bulk-merge-objects.enabled"):
+            has_more = bulk_merge_objects(
+                model_list, group, new_group, logger=logger, transaction_id=transaction_id
+            )
+        else:
+            has_more = merge_objects(
+                model_list, group, new_group, logger=logger, transaction_id=transaction_id
+            )
 
         if not has_more:
             # There are no more objects to merge for *this* "from" group, remove it
@@ -113,6 +122,7 @@ def merge_groups(
             from_object_ids.remove(from_object_id)
 
             similarity.merge(group.project, new_group, [group], allow_unsafe=True)
+            invalidate_frequency_counters([new_group.id, group.id])
 
             environment_ids = list(
                 Environment.objects.filter(projects=group.project).values_list("id", flat=True)
@@ -205,28 +215,53 @@ def merge_groups(
         eventstream.backend.end_merge(eventstream_state)
 
 
-def merge_objects(models, group, new_group, limit=1000, logger=None, transaction_id=None):
-    has_more = False
-    for model in models:
-        all_fields = [f.name for f in model._meta.get_fields()]
+def _get_merge_querysets(model, group):
+    all_fields = [f.name for f in model._meta.get_fields()]
 
-        # Not all models have a 'project' or 'project_id' field, but we make a best effort
-        # to filter on one if it is available.
-        # Also note that all_fields doesn't contain f.attname
-        # (django ForeignKeys have only attribute "attname" where "_id" is implicitly appended)
-        # but we still want to check for "project_id" because some models define a project_id bigint.
-        has_project = "project_id" in all_fields or "project" in all_fields
+    # Not all models have a 'project' or 'project_id' field, but we make a best effort
+    # to filter on one if it is available.
+    # Also note that all_fields doesn't contain f.attname
+    # (django ForeignKeys have only attribute "attname" where "_id" is implicitly appended)
+    # but we still want to check for "project_id" because some models define a project_id bigint.
+    has_project = "project_id" in all_fields or "project" in all_fields
 
-        if has_project:
-            project_qs = model.objects.filter(project_id=group.project_id)
-        else:
-            project_qs = model.objects.all()
+    if has_project:
+        project_qs = model.objects.filter(project_id=group.project_id)
+    else:
+        project_qs = model.objects.all()
 
-        has_group = "group" in all_fields
-        if has_group:
-            queryset = project_qs.filter(group=group)
-        else:
-            queryset = project_qs.filter(group_id=group.id)
+    has_group = "group" in all_fields
+    if has_group:
+        queryset = project_qs.filter(group=group)
+    else:
+        queryset = project_qs.filter(group_id=group.id)
+
+    return project_qs, queryset, has_group
+
+
+def _delete_merged_object(obj, new_group, logger=None, transaction_id=None):
+    # Before deleting, we want to merge in counts
+    if hasattr(obj, "merge_counts"):
+        obj.merge_counts(new_group)
+
+    obj_id = obj.id
+    obj.delete()
+
+    if logger is not None:
+        delete_logger.debug(
+            "object.delete.executed",
+            extra={
+                "object_id": obj_id,
+                "transaction_id": transaction_id,
+                "model": type(obj).__name__,
+            },
+        )
+
+
+def merge_objects(models, group, new_group, limit=1000, logger=None, transaction_id=None):
+    has_more = False
+    for model in models:
+        project_qs, queryset, has_group = _get_merge_querysets(model, group)
 
         for obj in queryset[:limit]:
             try:
@@ -236,29 +271,75 @@ def merge_objects(models, group, new_group, limit=1000, logger=None, transaction
                     else:
                         project_qs.filter(id=obj.id).update(group_id=new_group.id)
             except IntegrityError:
-                delete = True
-            else:
-                delete = False
-
-            if delete:
-                # Before deleting, we want to merge in counts
-                if hasattr(model, "merge_counts"):
-                    obj.merge_counts(new_group)
-
-                obj_id = obj.id
-                obj.delete()
-
-                if logger is not None:
-                    delete_logger.debug(
-                        "object.delete.executed",
-                        extra={
-                            "object_id": obj_id,
-                            "transaction_id": transaction_id,
-                            "model": model.__name__,
-                        },
-                    )
+                _delete_merged_object(obj, new_group, logger=logger, transaction_id=transaction_id)
             has_more = True
 
         if has_more:
             return True
     return has_more
+
+
+def _get_group_unique_fields(model):
+    """
+    Returns the other fields of every unique constraint of the model that
+    includes its group, i.e. the fields that may only appear once per group.
+    """
+    group_names = {"group", "group_id"}
+    unique_fields = [list(fields) for fields in model._meta.unique_together]
+    unique_fields.extend(
+        list(constraint.fields) for constraint in model._meta.total_unique_constraints
+    )
+    unique_fields.extend([field.name] for field in model._meta.concrete_fields if field.unique)
+    return [
+        [name for name in fields if name not in group_names]
+        for fields in unique_fields
+        if group_names & set(fields)
+    ]
+
+
+def _bulk_merge_model(model, group, new_group, logger=None, transaction_id=None):
+    _, queryset, has_group = _get_merge_querysets(model, group)
+
+    # Rows that would violate a unique constraint once moved lose against the
+    # row that is already in the new group, just like in `merge_objects`.
+    conflicts = Q()
+    for fields in _get_group_unique_fields(model):
+        conflicts |= Exists(
+            model.objects.filter(group_id=new_group.id, **{name: OuterRef(name) for name in fields})
+        )
+
+    with transaction.atomic(using=router.db_for_write(model)):
+        if conflicts:
+            for obj in queryset.filter(conflicts):
+                _delete_merged_object(obj, new_group, logger=logger, transaction_id=transaction_id)
+
+        if has_group:
+            return queryset.update(group=new_group)
+        else:
+            return queryset.update(group_id=new_group.id)
+
+
+def bulk_merge_objects(models, group, new_group, logger=None, transaction_id=None):
+    """
+    Set based version of `merge_objects`, which moves the rows of each model
+    with a single update after deleting the rows that would conflict with the
+    rows of the new group. Models whose conflicts can't be determined up
+    front, e.g. because of conditional unique constraints, fall back to
+    `merge_objects`.
+    """
+    for model in models:
+        try:
+            moved = _bulk_merge_model(
+                model, group, new_group, logger=logger, transaction_id=transaction_id
+            )
+        except IntegrityError:
+            metrics.incr("merge.bulk_merge_objects.fallback", tags={"model": model.__name__})
+            if merge_objects(
+                [model], group, new_group, logger=logger, transaction_id=transaction_id
+            ):
+                return True
+        else:
+            metrics.incr(
+                "merge.bulk_merge_objects.rows", amount=moved, tags={"model": model.__name__}
+            )
+    return False
@@ -1023,6 +1023,21 @@ def process_workflow_engine_metric_issues(job: PostProcessJob) -> None:
     process_workflow_engine(job)
 
 
+def record_frequency_counters(job: PostProcessJob) -> None:
+    if job["is_reprocessed"] or not options.get("rules.frequency-counters.write.enabled"):
+        return
+
+    from sentry.rules.conditions.frequency_counters import record_event
+
+    event = job["event"]
+    record_event(
+        group_id=event.group_id,
+        environment_id=event.get_environment().id,
+        timestamp=event.datetime,
+        user=event.get_tag("sentry:user"),
+    )
+
+
 def process_rules(job: PostProcessJob) -> None:
     if job["is_reprocessed"]:
         return
@@ -1715,6 +1730,7 @@ GROUP_CATEGORY_POST_PROCESS_PIPELINE = {
         handle_owner_assignment,
         handle_auto_assignment,
         kick_off_seer_automation,
+        record_frequency_counters,
         process_rules,
         process_workflow_engine_issue_alerts,
         process_service_hooks,
@@ -1734,6 +1750,7 @@ GROUP_CATEGORY_POST_PROCESS_PIPELINE = {
     GroupCategory.FEEDBACK: [
         feedback_filter_decorator(process_snoozes),
         feedback_filter_decorator(process_inbox_adds),
+        feedback_filter_decorator(record_frequency_counters),
         feedback_filter_decorator(process_rules),
         feedback_filter_decorator(process_workflow_engine_issue_alerts),
         feedback_filter_decorator(process_resource_change_bounds),
@@ -1747,6 +1764,7 @@ GENERIC_POST_PROCESS_PIPELINE = [
     process_snoozes,
     process_inbox_adds,
     kick_off_seer_automation,
+    record_frequency_counters,
     process_rules,
     process_workflow_engine_issue_alerts,
     process_resource_change_bounds,
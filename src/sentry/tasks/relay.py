@@ -1,9 +1,11 @@
 import logging
 import time
+from collections import defaultdict
 
 import sentry_sdk
 from django.db import router, transaction
 
+from sentry import options
 from sentry.models.organization import Organization
 from sentry.relay import projectconfig_cache, projectconfig_debounce_cache
 from sentry.silo.base import SiloMode
@@ -103,11 +105,49 @@ def validate_args(organization_id=None, project_id=None, public_key=None):
         raise TypeError("Must provide exactly one of organzation_id, project_id or public_key")
 
 
-def compute_configs(organization_id=None, project_id=None, public_key=None):
+def _recompute_cached_config(key, scope, sections=None, cached_config=None, base_config=None):
+    """Recomputes the config of a key if it is in the cache.
+
+    If we find the config in the cache it means it was active.  As such we want to
+    recalculate it.  If the config was not there at all, we leave it and avoid the
+    cost of re-computation.
+
+    :param cached_config: The cached config of the key, if it was already fetched.
+    :param base_config: A freshly computed config of another key of the same project,
+       the config of this key is derived from it when given.
+    :returns: The new config, or ``None`` if the cached config should be retained.
+    """
+    if cached_config is None:
+        cached_config = projectconfig_cache.backend.get(key.public_key)
+    config = None
+    if cached_config is None:
+        action = "not-cached"
+    else:
+        config = compute_projectkey_config(
+            key, cached_config=cached_config, sections=sections, base_config=base_config
+        )
+        skip_unchanged = options.get("relay.project-config.incremental-recompute.enabled")
+        if skip_unchanged and config.get("rev") == cached_config.get("rev"):
+            config = None
+            action = "unchanged"
+        else:
+            action = "recompute"
+
+    metrics.incr(
+        "relay.projectconfig_cache.invalidation.recompute",
+        tags={"action": action, "scope": scope},
+    )
+    return config
+
+
+def compute_configs(organization_id=None, project_id=None, public_key=None, sections=None):
     """Computes all configs for the org, project or single public key.
 
     You must only provide one single argument, not all.
 
+    :param sections: Names of the :data:`sentry.relay.config.PROJECT_CONFIG_SECTIONS`
+       to recompute in the cached configs.  When omitted the configs are rebuilt in
+       full.
     :returns: A dict mapping all affected public keys to their config.  The dict will not
        contain keys which should be retained in the cache unchanged.
     """
@@ -117,6 +157,9 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
     validate_args(organization_id, project_id, public_key)
     configs = {}
 
+    if organization_id and options.get("relay.project-config.org-batch.enabled"):
+        return compute_organization_configs(organization_id, sections=sections)
+
     if organization_id:
         # We want to re-compute all projects in an organization, instead of simply
         # removing the configs and rely on relay requests to lazily re-compute them.  This
@@ -129,34 +172,16 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
                 project.set_cached_field_value("organization", organization)
                 for key in ProjectKey.objects.filter(project_id=project.id):
                     key.set_cached_field_value("project", project)
-                    # If we find the config in the cache it means it was active.  As such we want to
-                    # recalculate it.  If the config was not there at all, we leave it and avoid the
-                    # cost of re-computation.
-                    if projectconfig_cache.backend.get(key.public_key) is not None:
-                        configs[key.public_key] = compute_projectkey_config(key)
-                        action = "recompute"
-                    else:
-                        action = "not-cached"
-                    metrics.incr(
-                        "relay.projectconfig_cache.invalidation.recompute",
-                        tags={"action": action, "scope": "organization"},
-                    )
+                    config = _recompute_cached_config(key, "organization", sections)
+                    if config is not None:
+                        configs[key.public_key] = config
     elif project_id:
         for project in Project.objects.filter(id=project_id):
             for key in ProjectKey.objects.filter(project_id=project_id):
                 key.set_cached_field_value("project", project)
-                # If we find the config in the cache it means it was active.  As such we want to
-                # recalculate it.  If the config was not there at all, we leave it and avoid the
-                # cost of re-computation.
-                if projectconfig_cache.backend.get(key.public_key) is not None:
-                    configs[key.public_key] = compute_projectkey_config(key)
-                    action = "recompute"
-                else:
-                    action = "not-cached"
-                    metrics.incr(
-                        "relay.projectconfig_cache.invalidation.recompute",
-                        tags={"action": action, "scope": "project"},
-                    )
+                config = _recompute_cached_config(key, "project", sections)
+                if config is not None:
+                    configs[key.public_key] = config
     elif public_key:
         try:
             key = ProjectKey.objects.get(public_key=public_key)
@@ -179,18 +204,101 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
     return configs
 
 
-def compute_projectkey_config(key):
+def compute_organization_configs(organization_id, sections=None):
+    """Computes the configs of all cached keys in an organization in one batch.
+
+    Unlike the per-key path of :func:`compute_configs`, all keys and cached configs
+    of the organization are loaded upfront, organization level state is computed
+    only once, and only the first key of every project gets a full project config.
+    The configs of the other keys of the project are derived from it.
+
+    :returns: A dict mapping all affected public keys to their config.
+    """
+    from sentry.models.project import Project
+    from sentry.models.projectkey import ProjectKey, ProjectKeyStatus
+    from sentry.relay.config import shared_organization_state
+
+    configs = {}
+    organization = Organization.objects.filter(id=organization_id).first()
+    if organization is None:
+        return configs
+
+    keys_by_project = defaultdict(list)
+    for key in ProjectKey.objects.filter(project__organization_id=organization_id):
+        keys_by_project[key.project_id].append(key)
+
+    with metrics.timer("relay.projectconfig_cache.org_batch.fetch"):
+        cached_configs = projectconfig_cache.backend.get_many(
+            [key.public_key for keys in keys_by_project.values() for key in keys]
+        )
+
+    with shared_organization_state():
+        for project in Project.objects.filter(organization_id=organization_id):
+            project.set_cached_field_value("organization", organization)
+            base_config = None
+            for key in keys_by_project.get(project.id, ()):
+                key.set_cached_field_value("project", project)
+                cached_config = cached_configs.get(key.public_key)
+                if cached_config is None:
+                    metrics.incr(
+                        "relay.projectconfig_cache.invalidation.recompute",
+                        tags={"action": "not-cached", "scope": "organization"},
+                    )
+                    continue
+
+                config = _recompute_cached_config(
+                    key,
+                    "organization",
+                    sections,
+                    cached_config=cached_config,
+                    base_config=base_config,
+                )
+                if config is not None:
+                    configs[key.public_key] = config
+                    if base_config is None and key.status == ProjectKeyStatus.ACTIVE:
+                        base_config = config
+
+    metrics.distribution("relay.projectconfig_cache.org_batch.size", len(configs))
+    return configs
+
+
+def compute_projectkey_config(key, cached_config=None, sections=None, base_config=None):
     """Computes a single config for the given :class:`ProjectKey`.
 
+    :param cached_config: The config of the key currently in the cache.
+    :param sections: When given together with ``cached_config``, only these sections
+       of the cached config are recomputed.  See
+       :func:`sentry.relay.config.update_project_config_sections`.
+    :param base_config: A freshly computed config of another key of the same project.
+       The config is derived from it instead of being computed from scratch.  See
+       :func:`sentry.relay.config.derive_project_key_config`.
     :returns: A dict with the project config.
     """
     from sentry.models.projectkey import ProjectKeyStatus
-    from sentry.relay.config import get_project_config
+    from sentry.relay.config import (
+        derive_project_key_config,
+        get_project_config,
+        update_project_config_sections,
+    )
 
     if key.status != ProjectKeyStatus.ACTIVE:
         return {"disabled": True}
-    else:
-        return get_project_config(key.project, project_keys=[key]).to_dict()
+
+    if base_config is not None:
+        config = derive_project_key_config(key.project, base_config, [key])
+        if config is not None:
+            return config
+
+    if cached_config is not None and sections:
+        config = update_project_config_sections(
+            key.project, cached_config, sections, project_keys=[key]
+        )
+        if config is not None:
+            metrics.incr("relay.projectconfig_cache.section_recompute", tags={"outcome": "ok"})
+            return config
+        metrics.incr("relay.projectconfig_cache.section_recompute", tags={"outcome": "full"})
+
+    return get_project_config(key.project, project_keys=[key]).to_dict()
 
 
 @instrumented_task(
@@ -226,10 +334,17 @@ def invalidate_project_config(
     Both these mean that an outdated version of the project config could still end up in the
     cache.  These will be addressed in the future using config revisions tracked in Redis.
     """
+    from sentry.relay.config import get_invalidated_sections
+
+    invalidated_sections = get_invalidated_sections(trigger)
+
     # Make sure we start by deleting the deduplication key so that new invalidation triggers
     # can schedule a new message while we already started computing the project config.
     projectconfig_debounce_cache.invalidation.mark_task_done(
-        organization_id=organization_id, project_id=project_id, public_key=public_key
+        organization_id=organization_id,
+        project_id=project_id,
+        public_key=public_key,
+        sections=invalidated_sections,
     )
 
     if project_id:
@@ -244,8 +359,15 @@ def invalidate_project_config(
     sentry_sdk.set_tag("trigger_details", trigger_details)
     sentry_sdk.set_context("kwargs", kwargs)
 
+    sections = None
+    if options.get("relay.project-config.incremental-recompute.enabled"):
+        sections = invalidated_sections
+
     updated_configs = compute_configs(
-        organization_id=organization_id, project_id=project_id, public_key=public_key
+        organization_id=organization_id,
+        project_id=project_id,
+        public_key=public_key,
+        sections=sections,
     )
     projectconfig_cache.backend.set_many(updated_configs)
 
@@ -337,6 +459,7 @@ def _schedule_invalidate_project_config(
     """For param docs, see :func:`schedule_invalidate_project_config`."""
     from sentry.models.project import Project
     from sentry.models.projectkey import ProjectKey
+    from sentry.relay.config import get_invalidated_sections
 
     validate_args(organization_id, project_id, public_key)
 
@@ -368,7 +491,12 @@ def _schedule_invalidate_project_config(
             check_debounce_keys["organization_id"] = org_id
 
     with quiet_redis_noise():
-        if projectconfig_debounce_cache.invalidation.is_debounced(**check_debounce_keys):
+        # Tasks only recomputing some sections must not swallow invalidations of other
+        # sections or the whole config, so they are debounced separately.
+        sections = get_invalidated_sections(trigger)
+        if projectconfig_debounce_cache.invalidation.is_debounced(
+            **check_debounce_keys, sections=sections
+        ):
             # If this task is already in the queue, do not schedule another task.
             metrics.incr(
                 "relay.projectconfig_cache.skipped",
@@ -398,5 +526,8 @@ def _schedule_invalidate_project_config(
 
         # Use the original arguments to this function to set the debounce key.
         projectconfig_debounce_cache.invalidation.debounce(
-            organization_id=organization_id, project_id=project_id, public_key=public_key
+            organization_id=organization_id,
+            project_id=project_id,
+            public_key=public_key,
+            sections=sections,
         )
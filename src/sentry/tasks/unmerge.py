@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
+import math
 from collections import defaultdict
 from collections.abc import Callable, Mapping, Sequence
-from datetime import datetime
+from datetime import UTC, datetime
 from functools import reduce
 from typing import Any
 
@@ -24,12 +25,15 @@ from sentry.models.grouprelease import GroupRelease
 from sentry.models.project import Project
 from sentry.models.release import Release
 from sentry.models.userreport import UserReport
+from sentry.rules.conditions.frequency_counters import (
+    invalidate_groups as invalidate_frequency_counters,
+)
 from sentry.services import eventstore
 from sentry.services.eventstore.models import GroupEvent
 from sentry.silo.base import SiloMode
 from sentry.tasks.base import instrumented_task
 from sentry.taskworker.namespaces import issues_tasks
-from sentry.tsdb.base import TSDBModel
+from sentry.tsdb.base import IncrMultiOptions, TSDBModel
 from sentry.types.activity import ActivityType
 from sentry.unmerge import InitialUnmergeArgs, SuccessiveUnmergeArgs, UnmergeArgs, UnmergeArgsBase
 from sentry.utils.eventuser import EventUser
@@ -272,6 +276,8 @@ def truncate_denormalizations(project: Project, group: Group) -> None:
         [str(group.id)],
     )
 
+    invalidate_frequency_counters([group.id])
+
     similarity.delete(project, group)
 
 
@@ -367,6 +373,22 @@ def get_event_user_from_interface(value: dict[str, Any], project: Project) -> Ev
     )
 
 
+def get_tsdb_bucket_size() -> int | None:
+    """\
+    The largest interval every TSDB rollup is a multiple of. Events within the
+    same bucket fall into the same interval of every rollup, so their data can
+    be written to TSDB together rather than once per event.
+    """
+    rollups = list(tsdb.backend.get_rollups())
+    return math.gcd(*rollups) if rollups else None
+
+
+def get_tsdb_bucket(timestamp: datetime, bucket_size: int | None) -> datetime:
+    if bucket_size is None:
+        return timestamp
+    return datetime.fromtimestamp(tsdb.backend.normalize_to_epoch(timestamp, bucket_size), UTC)
+
+
 def collect_tsdb_data(
     caches: Mapping[str, Any], project: Project, events: Sequence[GroupEvent]
 ) -> tuple[
@@ -386,20 +408,23 @@ def collect_tsdb_data(
         lambda: defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
     )
 
+    bucket_size = get_tsdb_bucket_size()
+
     for event in events:
         environment = caches["Environment"](project.organization_id, get_environment_name(event))
+        timestamp = get_tsdb_bucket(event.datetime, bucket_size)
 
-        counters[event.datetime][TSDBModel.group][(event.group_id, environment.id)] += 1
+        counters[timestamp][TSDBModel.group][(event.group_id, environment.id)] += 1
 
         user = event.data.get("user")
         if user:
             tag_value = get_event_user_from_interface(user, project).tag_value
             if tag_value is not None:
-                sets[event.datetime][TSDBModel.users_affected_by_group][
+                sets[timestamp][TSDBModel.users_affected_by_group][
                     (event.group_id, environment.id)
                 ].add(tag_value)
 
-        frequencies[event.datetime][TSDBModel.frequent_environments_by_group][str(event.group_id)][
+        frequencies[timestamp][TSDBModel.frequent_environments_by_group][str(event.group_id)][
             str(environment.id)
         ] += 1
 
@@ -413,7 +438,7 @@ def collect_tsdb_data(
                 caches["Release"](project.organization_id, release).id,
             )
 
-            frequencies[event.datetime][TSDBModel.frequent_releases_by_group][str(event.group_id)][
+            frequencies[timestamp][TSDBModel.frequent_releases_by_group][str(event.group_id)][
                 str(grouprelease.id)
             ] += 1
 
@@ -425,18 +450,27 @@ def repair_tsdb_data(
 ) -> None:
     counters, sets, frequencies = collect_tsdb_data(caches, project, events)
 
+    # Counters carry their own timestamps, so they're written with one call per
+    # environment.
+    counter_items: dict[int, list[tuple[TSDBModel, int, IncrMultiOptions]]] = defaultdict(list)
     for timestamp, data in counters.items():
         for model, keys in data.items():
             for (key, environment_id), value in keys.items():
-                tsdb.backend.incr(model, key, timestamp, value, environment_id=environment_id)
+                counter_items[environment_id].append(
+                    (model, key, {"timestamp": timestamp, "count": value})
+                )
+
+    for environment_id, items in counter_items.items():
+        tsdb.backend.incr_multi(items, environment_id=environment_id)
 
     for timestamp, sets_data in sets.items():
+        set_items: dict[int, list[tuple[TSDBModel, int, list[str]]]] = defaultdict(list)
         for model, sets_keys in sets_data.items():
             for (key, environment_id), sets_values in sets_keys.items():
-                # TODO: This should use `record_multi` rather than `record`.
-                tsdb.backend.record(
-                    model, key, list(sets_values), timestamp, environment_id=environment_id
-                )
+                set_items[environment_id].append((model, key, list(sets_values)))
+
+        for environment_id, record_items in set_items.items():
+            tsdb.backend.record_multi(record_items, timestamp, environment_id=environment_id)
 
     for timestamp, frequencies_data in frequencies.items():
         # Convert the frequency data to the format expected by record_frequency_multi
@@ -454,12 +488,20 @@ def repair_tsdb_data(
 def repair_denormalizations(
     caches: Mapping[str, Any], project: Project, events: Sequence[GroupEvent]
 ) -> None:
+    """\
+    Repairs the denormalized data of one batch of events. The writes of a batch
+    are grouped together, but batches are still repaired one after another.
+    """
     repair_group_environment_data(caches, project, events)
     repair_group_release_data(caches, project, events)
     repair_tsdb_data(caches, project, events)
 
+    # The similarity index records the events of one group at a time.
+    events_by_group: dict[int, list[GroupEvent]] = defaultdict(list)
     for event in events:
-        similarity.record(project, [event])
+        events_by_group[event.group_id].append(event)
+    for group_events in events_by_group.values():
+        similarity.record(project, group_events)
 
 
 def lock_hashes(project_id: int, source_id: int, fingerprints: Sequence[str]) -> list[str]:
@@ -538,6 +580,9 @@ def unmerge(*posargs: Any, **kwargs: Any) -> None:
             )
             if eventstream_state:
                 args.replacement.stop_snuba_replacement(eventstream_state)
+        invalidate_frequency_counters(
+            [args.source_id, *(destination_id for destination_id, _ in args.destinations.values())]
+        )
         return
 
     source_events = []
@@ -605,4 +650,7 @@ def unmerge(*posargs: Any, **kwargs: Any) -> None:
         source_fields_reset=source_fields_reset,
     )
 
+    # Batches run one after another: destination groups are created by the
+    # first batch that sees their fingerprint, and the eventstream state of
+    # each destination is carried from batch to batch.
     unmerge.delay(**new_args.dump_arguments())
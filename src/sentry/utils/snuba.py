@@ -6,10 +6,12 @@ import logging
 import math
 import os
 import re
+import threading
 import time
 from collections import namedtuple
 from collections.abc import Callable, Collection, Mapping, MutableMapping, Sequence
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
@@ -23,10 +25,12 @@ import urllib3
 from dateutil.parser import parse as parse_datetime
 from django.conf import settings
 from django.core.cache import cache
+from sentry_sdk.tracing import Span
 from snuba_sdk import Column, DeleteQuery, Function, MetricsQuery, Request
 from snuba_sdk.legacy import json_to_snql
 from snuba_sdk.query import SelectableExpression
 
+from sentry import options
 from sentry.api.helpers.error_upsampling import (
     UPSAMPLED_ERROR_AGGREGATION,
     are_any_projects_error_upsampled,
@@ -440,6 +444,12 @@ class DatasetSelectionError(QueryExecutionError):
     """
 
 
+class QueryDeadlineExceeded(QueryExecutionError):
+    """
+    The deadline of a request, see `SnubaRequest.deadline`, ran out before it was sent.
+    """
+
+
 class QueryConnectionFailed(QueryExecutionError):
     """
     The connection to clickhouse has failed, and so the query cannot be run
@@ -562,19 +572,92 @@ class RetrySkipTimeout(urllib3.Retry):
             )
 
 
-_snuba_pool = connection_from_url(
-    settings.SENTRY_SNUBA,
-    retries=RetrySkipTimeout(
-        total=5,
-        # Our calls to snuba frequently fail due to network issues. We want to
-        # automatically retry most requests. Some of our POSTs and all of our DELETEs
-        # do cause mutations, but we have other things in place to handle duplicate
-        # mutations.
-        allowed_methods={"GET", "POST", "DELETE"},
-    ),
-    timeout=settings.SENTRY_SNUBA_TIMEOUT,
-    maxsize=10,
-)
+def _create_snuba_pool(maxsize: int = 10) -> urllib3.connectionpool.HTTPConnectionPool:
+    return connection_from_url(
+        settings.SENTRY_SNUBA,
+        retries=RetrySkipTimeout(
+            total=5,
+            # Our calls to snuba frequently fail due to network issues. We want to
+            # automatically retry most requests. Some of our POSTs and all of our DELETEs
+            # do cause mutations, but we have other things in place to handle duplicate
+            # mutations.
+            allowed_methods={"GET", "POST", "DELETE"},
+        ),
+        timeout=settings.SENTRY_SNUBA_TIMEOUT,
+        maxsize=maxsize,
+    )
+
+
+_snuba_pool = _create_snuba_pool()
+
+# Connection pools dedicated to groups of referrers, see `get_snuba_pool`.
+_partitioned_snuba_pools: dict[str, urllib3.connectionpool.HTTPConnectionPool] = {}
+_partitioned_snuba_pools_lock = threading.Lock()
+
+
+def get_snuba_pool(referrer: str | None) -> urllib3.connectionpool.HTTPConnectionPool:
+    """
+    Returns the connection pool to use for the given referrer. Referrers matching
+    a prefix in `snuba.client.pool-partitions` (ie. `{"api.dashboards.": 5}`) get
+    their own pool of the configured size, so that a slow referrer can only
+    exhaust its own connections. All other referrers share `_snuba_pool`.
+    """
+    if not referrer:
+        return _snuba_pool
+
+    partitions: Mapping[str, int] = options.get("snuba.client.pool-partitions")
+    prefix = max((p for p in partitions if referrer.startswith(p)), key=len, default=None)
+    if prefix is None:
+        return _snuba_pool
+
+    pool = _partitioned_snuba_pools.get(prefix)
+    if pool is None:
+        with _partitioned_snuba_pools_lock:
+            pool = _partitioned_snuba_pools.get(prefix)
+            if pool is None:
+                pool = _create_snuba_pool(maxsize=partitions[prefix])
+                _partitioned_snuba_pools[prefix] = pool
+    return pool
+
+
+def _urlopen(
+    method: str,
+    url: str,
+    body: str,
+    headers: Mapping[str, str],
+    deadline: float | None = None,
+) -> urllib3.response.HTTPResponse:
+    """
+    Sends a request through the referrer's connection pool, bounded by the
+    remaining time until `deadline` (a `time.monotonic()` value) if one is set,
+    and by `SENTRY_SNUBA_TIMEOUT` either way.
+    """
+    referrer = headers.get("referer", "unknown")
+    pool = get_snuba_pool(referrer)
+
+    kwargs: dict[str, Any] = {}
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            metrics.incr("snuba.client.deadline_exceeded", tags={"referrer": referrer})
+            raise QueryDeadlineExceeded(f"Deadline exceeded before sending query for {referrer}")
+        # This replaces the timeout of the pool, which still bounds every request.
+        kwargs["timeout"] = urllib3.Timeout(total=min(remaining, settings.SENTRY_SNUBA_TIMEOUT))
+
+    start = time.monotonic()
+    response = pool.urlopen(
+        method, url, body=body, headers=headers, preload_content=False, **kwargs
+    )
+    metrics.timing(
+        "snuba.client.time_to_first_byte", time.monotonic() - start, tags={"referrer": referrer}
+    )
+
+    try:
+        # Read the body now so the connection goes back to the pool right away.
+        response.data
+    finally:
+        response.release_conn()
+    return response
 
 
 epoch_naive = datetime(1970, 1, 1, tzinfo=None)
@@ -1032,6 +1115,8 @@ class SnubaRequest:
     referrer: str | None  # TODO: this should use the referrer Enum
     forward: Translator
     reverse: Translator
+    # `time.monotonic()` value after which the request is no longer sent to Snuba
+    deadline: float | None = None
 
     def __post_init__(self) -> None:
         self.validate()
@@ -1108,7 +1193,6 @@ def bulk_snuba_queries_with_referrers(
 
     Every request is paired with a referrer to be used for that request.
     """
-
     if "consistent" in OVERRIDE_OPTIONS:
         for request, _ in requests_with_referrers:
             request.flags.consistent = OVERRIDE_OPTIONS["consistent"]
@@ -1144,8 +1228,22 @@ def bulk_raw_query(
     Used to make queries using the (very) old JSON format for Snuba queries. Queries submitted here
     will be converted to SnQL queries before being sent to Snuba.
     """
+    snuba_requests = prepare_raw_queries(snuba_param_list, referrer=referrer)
+    return send_prepared_queries(snuba_requests, use_cache=use_cache)
+
+
+def prepare_raw_queries(
+    snuba_param_list: Sequence[SnubaQueryParams],
+    referrer: str | None = None,
+) -> list[SnubaRequest]:
+    """
+    Converts queries in the old JSON format to SnQL requests. This resolves the
+    organization, the environments and releases filtered on and the time window of
+    the queries, which may query Postgres, so it has to run on the request thread.
+    The requests can then be sent with `send_prepared_queries` from any thread.
+    """
     params = [_prepare_query_params(param, referrer) for param in snuba_param_list]
-    snuba_requests = [
+    return [
         SnubaRequest(
             request=json_to_snql(query, query["dataset"]),
             referrer=referrer,
@@ -1154,6 +1252,25 @@ def bulk_raw_query(
         )
         for query, forward, reverse in params
     ]
+
+
+def send_prepared_queries(
+    snuba_requests: Sequence[SnubaRequest],
+    use_cache: bool | None = False,
+    deadline: float | None = None,
+) -> ResultSet:
+    """
+    Sends requests built by `prepare_raw_queries` to Snuba. This doesn't touch
+    Postgres.
+
+    `deadline` is a `time.monotonic()` value requests have to complete by, see
+    `SnubaRequest.deadline`.
+    """
+    if deadline is not None:
+        snuba_requests = [
+            dataclasses.replace(snuba_request, deadline=deadline)
+            for snuba_request in snuba_requests
+        ]
     return _apply_cache_and_build_results(snuba_requests, use_cache=use_cache)
 
 
@@ -1186,6 +1303,11 @@ def _apply_cache_and_build_results(
 
     to_query: list[tuple[int, SnubaRequest, str | None]] = []
 
+    if use_cache and options.get("snuba.query-cache.stale-while-revalidate.enabled"):
+        results = _apply_revalidating_cache(snuba_requests_list)
+        results.sort()
+        return [result[1] for result in results]
+
     if use_cache:
         cache_keys = [
             get_cache_key(snuba_request.request) for _, snuba_request in snuba_requests_list
@@ -1221,6 +1343,212 @@ def _apply_cache_and_build_results(
     return [result[1] for result in results]
 
 
+@dataclasses.dataclass(frozen=True)
+class CacheTTLPolicy:
+    # Seconds a cached result is served without being revalidated.
+    ttl: int
+    # Additional seconds an expired result may still be served while it is
+    # being refreshed in the background.
+    stale_ttl: int
+
+
+def get_cache_ttl_policy(referrer: str | None) -> CacheTTLPolicy:
+    """
+    Returns the TTLs for cached results of the given referrer. Overrides are
+    configured through `snuba.query-cache.referrer-ttls`, ie.
+    `{"api.dashboards.widget": {"ttl": 120, "stale_ttl": 600}}`.
+    """
+    policy = CacheTTLPolicy(
+        ttl=settings.SENTRY_SNUBA_CACHE_TTL_SECONDS,
+        stale_ttl=options.get("snuba.query-cache.stale-ttl-seconds"),
+    )
+    if referrer is None:
+        return policy
+
+    override = options.get("snuba.query-cache.referrer-ttls").get(referrer)
+    if not override:
+        return policy
+
+    return CacheTTLPolicy(
+        ttl=override.get("ttl", policy.ttl),
+        stale_ttl=override.get("stale_ttl", policy.stale_ttl),
+    )
+
+
+def get_revalidating_cache_key(query: Request) -> str:
+    # sqcr - Snuba Query Cache (Revalidating). Entries are stored with their
+    # freshness deadline so they can't be shared with the plain cache.
+    return f"sqcr:{get_cache_key(query)[4:]}"
+
+
+class InflightQueries:
+    """
+    Tracks the queries this process is currently running against Snuba, so
+    that concurrent identical queries wait for the same result instead of
+    each issuing their own request.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future[Mapping[str, Any]]] = {}
+
+    def claim(self, key: str) -> tuple[Future[Mapping[str, Any]], bool]:
+        """
+        Returns the future for the given key, and whether the caller is the
+        owner responsible for running the query and resolving the future.
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._futures[key] = future
+            return future, True
+
+    def resolve(
+        self,
+        key: str,
+        result: Mapping[str, Any] | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._lock:
+            future = self._futures.pop(key, None)
+        if future is None:
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+_inflight_queries = InflightQueries()
+
+_revalidation_pool = ThreadPoolExecutor(
+    thread_name_prefix=f"{__name__}.revalidate",
+    max_workers=4,
+)
+
+
+def _store_revalidating_result(
+    cache_key: str, result: Mapping[str, Any], policy: CacheTTLPolicy
+) -> None:
+    cache.set(
+        cache_key,
+        json.dumps({"fresh_until": time.time() + policy.ttl, "result": result}),
+        policy.ttl + policy.stale_ttl,
+    )
+
+
+def _revalidate(snuba_request: SnubaRequest, cache_key: str, lock_key: str) -> None:
+    metric_tags = {"referrer": snuba_request.referrer or "unknown"}
+    try:
+        with sentry_sdk.isolation_scope():
+            [result] = _bulk_snuba_query([snuba_request])
+        _store_revalidating_result(cache_key, result, get_cache_ttl_policy(snuba_request.referrer))
+        metrics.incr("snuba.query_cache.revalidate.success", tags=metric_tags)
+    except Exception:
+        # The stale result has already been served, the next read will retry.
+        logger.warning("snuba.query_cache.revalidate.failed", exc_info=True)
+        metrics.incr("snuba.query_cache.revalidate.failure", tags=metric_tags)
+    finally:
+        cache.delete(lock_key)
+
+
+def _schedule_revalidation(snuba_request: SnubaRequest, cache_key: str) -> None:
+    """
+    Refreshes a stale entry in the background. The lock makes sure only one
+    refresh per entry runs at a time across all processes.
+    """
+    lock_key = f"{cache_key}:revalidate"
+    if not cache.add(lock_key, 1, settings.SENTRY_SNUBA_TIMEOUT):
+        return
+
+    try:
+        _revalidation_pool.submit(_revalidate, snuba_request, cache_key, lock_key)
+    except RuntimeError:
+        # The pool has been shut down, the next read will try again.
+        cache.delete(lock_key)
+
+
+def _apply_revalidating_cache(
+    snuba_requests_list: Sequence[tuple[int, SnubaRequest]],
+) -> list[tuple[int, Mapping[str, Any]]]:
+    """
+    Stale-while-revalidate variant of the query cache: expired entries that are
+    still within their stale window are served immediately while a single
+    background refresh updates them. Cache misses for identical queries that
+    are already in flight in this process wait for that query instead of
+    hitting Snuba again.
+    """
+    results: list[tuple[int, Mapping[str, Any]]] = []
+    owned: list[tuple[int, SnubaRequest, str]] = []
+    waiting: list[tuple[int, SnubaRequest, Future[Mapping[str, Any]]]] = []
+    unresolved: set[str] = set()
+
+    cache_keys = [
+        get_revalidating_cache_key(snuba_request.request)
+        for _, snuba_request in snuba_requests_list
+    ]
+    cache_data = cache.get_many(cache_keys)
+    now = time.time()
+
+    try:
+        for (query_pos, snuba_request), cache_key in zip(snuba_requests_list, cache_keys):
+            metric_tags = {"referrer": snuba_request.referrer} if snuba_request.referrer else None
+            cached = cache_data.get(cache_key)
+            if cached is not None:
+                entry = json.loads(cached)
+                results.append((query_pos, entry["result"]))
+                if entry["fresh_until"] > now:
+                    metrics.incr("snuba.query_cache.hit", tags=metric_tags)
+                else:
+                    metrics.incr("snuba.query_cache.stale_hit", tags=metric_tags)
+                    _schedule_revalidation(snuba_request, cache_key)
+                continue
+
+            metrics.incr("snuba.query_cache.miss", tags=metric_tags)
+            future, is_owner = _inflight_queries.claim(cache_key)
+            if is_owner:
+                owned.append((query_pos, snuba_request, cache_key))
+                unresolved.add(cache_key)
+            else:
+                metrics.incr("snuba.query_cache.coalesced", tags=metric_tags)
+                waiting.append((query_pos, snuba_request, future))
+
+        if owned:
+            query_results = _bulk_snuba_query([snuba_request for _, snuba_request, _ in owned])
+
+            for result, (query_pos, snuba_request, cache_key) in zip(query_results, owned):
+                try:
+                    _store_revalidating_result(
+                        cache_key, result, get_cache_ttl_policy(snuba_request.referrer)
+                    )
+                except Exception:
+                    # The result is still good, only the next read has to query again.
+                    logger.warning("snuba.query_cache.store.failed", exc_info=True)
+                # Waiters copy the result they are resolved with, so this caller
+                # gets its own copy too.
+                unresolved.remove(cache_key)
+                _inflight_queries.resolve(cache_key, result=result)
+                results.append((query_pos, deepcopy(result)))
+    except BaseException as e:
+        # Once resolved, a key may already be claimed again by another caller, so
+        # only the keys still claimed by this call are failed.
+        for cache_key in unresolved:
+            _inflight_queries.resolve(cache_key, error=e)
+        raise
+
+    for query_pos, snuba_request, future in waiting:
+        try:
+            # The result is shared with the other callers waiting for it.
+            result = deepcopy(future.result(timeout=settings.SENTRY_SNUBA_TIMEOUT))
+        except FutureTimeoutError:
+            [result] = _bulk_snuba_query([snuba_request])
+        results.append((query_pos, result))
+
+    return results
+
+
 def _is_rejected_query(body: Any) -> bool:
     return (
         "quota_allowance" in body
@@ -1237,141 +1565,163 @@ def _bulk_snuba_query(snuba_requests: Sequence[SnubaRequest]) -> ResultSet:
         span.set_tag("snuba.num_queries", len(snuba_requests_list))
 
         if len(snuba_requests_list) > 1:
-            with ThreadPoolExecutor(
+            query_thread_pool = ThreadPoolExecutor(
                 thread_name_prefix=__name__,
                 max_workers=10,
-            ) as query_thread_pool:
-                query_results = list(
-                    query_thread_pool.map(
-                        _snuba_query,
-                        [
-                            (
-                                sentry_sdk.get_isolation_scope(),
-                                sentry_sdk.get_current_scope(),
-                                snuba_request,
-                            )
-                            for snuba_request in snuba_requests_list
-                        ],
+            )
+            try:
+                futures = [
+                    query_thread_pool.submit(
+                        _queued_snuba_query,
+                        time.monotonic(),
+                        (
+                            sentry_sdk.get_isolation_scope(),
+                            sentry_sdk.get_current_scope(),
+                            snuba_request,
+                        ),
+                        span,
                     )
-                )
+                    for snuba_request in snuba_requests_list
+                ]
+                # Responses are parsed by the workers, so error responses count as
+                # failures here too, not only transport errors.
+                _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+                if not_done:
+                    # One of the requests failed, the whole bulk query is going to
+                    # fail so don't send the requests still waiting for a thread.
+                    cancelled = sum(future.cancel() for future in not_done)
+                    metrics.incr("snuba.client.cancelled", amount=cancelled)
+                    for future in futures:
+                        if future.done() and not future.cancelled():
+                            if (error := future.exception()) is not None:
+                                raise error
+                results = [future.result() for future in futures]
+            finally:
+                # Requests already sent can't be interrupted. Wait for them, they're
+                # bounded by their timeout, so that none are still in flight once
+                # this returns.
+                query_thread_pool.shutdown(wait=True, cancel_futures=True)
         else:
             # No need to submit to the thread pool if we're just performing a single query
-            query_results = [
-                _snuba_query(
+            results = [
+                _run_snuba_query(
                     (
                         sentry_sdk.get_isolation_scope(),
                         sentry_sdk.get_current_scope(),
                         snuba_requests_list[0],
-                    )
+                    ),
+                    span,
                 )
             ]
 
-        results = []
-        for index, item in enumerate(query_results):
-            referrer, response, _, reverse = item
-            try:
-                body = json.loads(response.data)
-                if SNUBA_INFO:
-                    if "sql" in body:
-                        log_snuba_info(
-                            "{}.sql:\n {}".format(
-                                referrer,
-                                sqlparse.format(body["sql"], reindent_aligned=True),
-                            )
-                        )
-                    if "error" in body:
-                        log_snuba_info("{}.err: {}".format(referrer, body["error"]))
-            except ValueError:
-                if response.status != 200:
-                    logger.warning(
-                        "snuba.query.invalid-json",
-                        extra={"response.data": response.data},
+        return results
+
+
+def _parse_snuba_response(
+    snuba_request: SnubaRequest, raw_result: RawResult, span: Span
+) -> dict[str, Any]:
+    """
+    Decodes the response to a query and raises the error it reports, if any.
+    Bulk queries call this from the thread that sent the query, so that a
+    failing query fails the whole bulk query right away.
+    """
+    referrer, response, _, reverse = raw_result
+    try:
+        body = json.loads(response.data)
+        if SNUBA_INFO:
+            if "sql" in body:
+                log_snuba_info(
+                    "{}.sql:\n {}".format(
+                        referrer,
+                        sqlparse.format(body["sql"], reindent_aligned=True),
                     )
-                    raise SnubaError("Failed to parse snuba error response")
-                raise UnexpectedResponseError(f"Could not decode JSON response: {response.data!r}")
-
-            allocation_policy_prefix = "allocation_policy."
-            bytes_scanned = body.get("profile", {}).get("progress_bytes", None)
-            if bytes_scanned is not None:
-                span.set_data(f"{allocation_policy_prefix}.bytes_scanned", bytes_scanned)
-            if _is_rejected_query(body):
-                quota_allowance_summary = body["quota_allowance"]["summary"]
-                for k, v in quota_allowance_summary.items():
-                    if isinstance(v, dict):
-                        for nested_k, nested_v in v.items():
-                            span.set_tag(allocation_policy_prefix + k + "." + nested_k, nested_v)
-                            sentry_sdk.set_tag(
-                                allocation_policy_prefix + k + "." + nested_k, nested_v
-                            )
-                    else:
-                        span.set_tag(allocation_policy_prefix + k, v)
-                        sentry_sdk.set_tag(allocation_policy_prefix + k, v)
-
-            if response.status != 200:
-                _log_request_query(snuba_requests_list[index].request)
-                metrics.incr(
-                    "snuba.client.api.error",
-                    tags={"status_code": response.status, "referrer": referrer},
                 )
-                if body.get("error"):
-                    error = body["error"]
-                    if response.status == 429:
-                        try:
-                            if (
-                                "quota_allowance" not in body
-                                or "summary" not in body["quota_allowance"]
-                            ):
-                                # Should not hit this - snuba gives us quota_allowance with a 429
-                                raise RateLimitExceeded(error["message"])
-                            quota_allowance_summary = body["quota_allowance"]["summary"]
-                            rejected_by = quota_allowance_summary["rejected_by"]
-                            throttled_by = quota_allowance_summary["throttled_by"]
-
-                            policy_info = rejected_by or throttled_by
-
-                            if policy_info:
-                                raise RateLimitExceeded(
-                                    error["message"],
-                                    policy=policy_info["policy"],
-                                    quota_unit=policy_info["quota_unit"],
-                                    storage_key=policy_info["storage_key"],
-                                    quota_used=policy_info["quota_used"],
-                                    rejection_threshold=policy_info["rejection_threshold"],
-                                )
-                        except KeyError:
-                            logger.warning(
-                                "Failed to parse rate limit error details from Snuba response",
-                                extra={"error": error["message"]},
-                            )
-
+            if "error" in body:
+                log_snuba_info("{}.err: {}".format(referrer, body["error"]))
+    except ValueError:
+        if response.status != 200:
+            logger.warning(
+                "snuba.query.invalid-json",
+                extra={"response.data": response.data},
+            )
+            raise SnubaError("Failed to parse snuba error response")
+        raise UnexpectedResponseError(f"Could not decode JSON response: {response.data!r}")
+
+    allocation_policy_prefix = "allocation_policy."
+    bytes_scanned = body.get("profile", {}).get("progress_bytes", None)
+    if bytes_scanned is not None:
+        span.set_data(f"{allocation_policy_prefix}.bytes_scanned", bytes_scanned)
+    if _is_rejected_query(body):
+        quota_allowance_summary = body["quota_allowance"]["summary"]
+        for k, v in quota_allowance_summary.items():
+            if isinstance(v, dict):
+                for nested_k, nested_v in v.items():
+                    span.set_tag(allocation_policy_prefix + k + "." + nested_k, nested_v)
+                    sentry_sdk.set_tag(allocation_policy_prefix + k + "." + nested_k, nested_v)
+            else:
+                span.set_tag(allocation_policy_prefix + k, v)
+                sentry_sdk.set_tag(allocation_policy_prefix + k, v)
+
+    if response.status != 200:
+        _log_request_query(snuba_request.request)
+        metrics.incr(
+            "snuba.client.api.error",
+            tags={"status_code": response.status, "referrer": referrer},
+        )
+        if body.get("error"):
+            error = body["error"]
+            if response.status == 429:
+                try:
+                    if "quota_allowance" not in body or "summary" not in body["quota_allowance"]:
+                        # Should not hit this - snuba gives us quota_allowance with a 429
                         raise RateLimitExceeded(error["message"])
-
-                    elif error["type"] == "schema":
-                        raise SchemaValidationError(error["message"])
-                    elif error["type"] == "invalid_query":
-                        logger.warning(
-                            "UnqualifiedQueryError",
-                            extra={
-                                "error": error["message"],
-                                "has_data": "data" in body and body["data"] is not None,
-                                "query": snuba_requests_list[index].request.serialize(),
-                            },
-                        )
-                        raise UnqualifiedQueryError(error["message"])
-                    elif error["type"] == "clickhouse":
-                        raise clickhouse_error_codes_map.get(error["code"], QueryExecutionError)(
-                            error["message"]
+                    quota_allowance_summary = body["quota_allowance"]["summary"]
+                    rejected_by = quota_allowance_summary["rejected_by"]
+                    throttled_by = quota_allowance_summary["throttled_by"]
+
+                    policy_info = rejected_by or throttled_by
+
+                    if policy_info:
+                        raise RateLimitExceeded(
+                            error["message"],
+                            policy=policy_info["policy"],
+                            quota_unit=policy_info["quota_unit"],
+                            storage_key=policy_info["storage_key"],
+                            quota_used=policy_info["quota_used"],
+                            rejection_threshold=policy_info["rejection_threshold"],
                         )
-                    else:
-                        raise SnubaError(error["message"])
-                else:
-                    raise SnubaError(f"HTTP {response.status}")
+                except KeyError:
+                    logger.warning(
+                        "Failed to parse rate limit error details from Snuba response",
+                        extra={"error": error["message"]},
+                    )
 
-            # Forward and reverse translation maps from model ids to snuba keys, per column
-            body["data"] = [reverse(d) for d in body["data"]]
-            results.append(body)
+                raise RateLimitExceeded(error["message"])
+
+            elif error["type"] == "schema":
+                raise SchemaValidationError(error["message"])
+            elif error["type"] == "invalid_query":
+                logger.warning(
+                    "UnqualifiedQueryError",
+                    extra={
+                        "error": error["message"],
+                        "has_data": "data" in body and body["data"] is not None,
+                        "query": snuba_request.request.serialize(),
+                    },
+                )
+                raise UnqualifiedQueryError(error["message"])
+            elif error["type"] == "clickhouse":
+                raise clickhouse_error_codes_map.get(error["code"], QueryExecutionError)(
+                    error["message"]
+                )
+            else:
+                raise SnubaError(error["message"])
+        else:
+            raise SnubaError(f"HTTP {response.status}")
 
-        return results
+    # Forward and reverse translation maps from model ids to snuba keys, per column
+    body["data"] = [reverse(d) for d in body["data"]]
+    return body
 
 
 def _log_request_query(req: Request) -> None:
@@ -1389,6 +1739,38 @@ def _log_request_query(req: Request) -> None:
 RawResult = tuple[str, urllib3.response.HTTPResponse, Translator, Translator]
 
 
+def _queued_snuba_query(
+    submitted_at: float,
+    params: tuple[
+        sentry_sdk.Scope,
+        sentry_sdk.Scope,
+        SnubaRequest,
+    ],
+    span: Span,
+) -> dict[str, Any]:
+    metrics.timing(
+        "snuba.client.queue_time",
+        time.monotonic() - submitted_at,
+        tags={"referrer": params[2].referrer or "unknown"},
+    )
+    return _run_snuba_query(params, span)
+
+
+def _run_snuba_query(
+    params: tuple[
+        sentry_sdk.Scope,
+        sentry_sdk.Scope,
+        SnubaRequest,
+    ],
+    span: Span,
+) -> dict[str, Any]:
+    thread_isolation_scope, thread_current_scope, snuba_request = params
+    raw_result = _snuba_query(params)
+    with sentry_sdk.scope.use_isolation_scope(thread_isolation_scope):
+        with sentry_sdk.scope.use_scope(thread_current_scope):
+            return _parse_snuba_response(snuba_request, raw_result, span)
+
+
 def _snuba_query(
     params: tuple[
         sentry_sdk.Scope,
@@ -1419,21 +1801,21 @@ def _snuba_query(
                 if isinstance(request.query, MetricsQuery):
                     return (
                         referrer,
-                        _raw_mql_query(request, headers),
+                        _raw_mql_query(request, headers, snuba_request.deadline),
                         snuba_request.forward,
                         snuba_request.reverse,
                     )
                 elif isinstance(request.query, DeleteQuery):
                     return (
                         referrer,
-                        _raw_delete_query(request, headers),
+                        _raw_delete_query(request, headers, snuba_request.deadline),
                         snuba_request.forward,
                         snuba_request.reverse,
                     )
 
                 return (
                     referrer,
-                    _raw_snql_query(request, headers),
+                    _raw_snql_query(request, headers, snuba_request.deadline),
                     snuba_request.forward,
                     snuba_request.reverse,
                 )
@@ -1442,7 +1824,7 @@ def _snuba_query(
 
 
 def _raw_delete_query(
-    request: Request, headers: Mapping[str, str]
+    request: Request, headers: Mapping[str, str], deadline: float | None = None
 ) -> urllib3.response.HTTPResponse:
     query = request.query
     if not isinstance(query, DeleteQuery):
@@ -1459,12 +1841,12 @@ def _raw_delete_query(
 
         with sentry_sdk.start_span(op="snuba_delete.run", name=body) as span:
             span.set_tag("snuba.referrer", referrer)
-            return _snuba_pool.urlopen(
-                "DELETE", f"/{query.storage_name}", body=body, headers=headers
-            )
+            return _urlopen("DELETE", f"/{query.storage_name}", body, headers, deadline)
 
 
-def _raw_mql_query(request: Request, headers: Mapping[str, str]) -> urllib3.response.HTTPResponse:
+def _raw_mql_query(
+    request: Request, headers: Mapping[str, str], deadline: float | None = None
+) -> urllib3.response.HTTPResponse:
     # Enter hub such that http spans are properly nested
     with timer("mql_query"):
         referrer = headers.get("referer", "unknown")
@@ -1477,12 +1859,12 @@ def _raw_mql_query(request: Request, headers: Mapping[str, str]) -> urllib3.resp
 
         with sentry_sdk.start_span(op="snuba_mql.run", name=serialized_req) as span:
             span.set_tag("snuba.referrer", referrer)
-            return _snuba_pool.urlopen(
-                "POST", f"/{request.dataset}/mql", body=body, headers=headers
-            )
+            return _urlopen("POST", f"/{request.dataset}/mql", body, headers, deadline)
 
 
-def _raw_snql_query(request: Request, headers: Mapping[str, str]) -> urllib3.response.HTTPResponse:
+def _raw_snql_query(
+    request: Request, headers: Mapping[str, str], deadline: float | None = None
+) -> urllib3.response.HTTPResponse:
     # Enter hub such that http spans are properly nested
     with timer("snql_query"):
         referrer = headers.get("referer", "<unknown>")
@@ -1494,9 +1876,7 @@ def _raw_snql_query(request: Request, headers: Mapping[str, str]) -> urllib3.res
 
         with sentry_sdk.start_span(op="snuba_snql.run", name=serialized_req) as span:
             span.set_tag("snuba.referrer", referrer)
-            return _snuba_pool.urlopen(
-                "POST", f"/{request.dataset}/snql", body=body, headers=headers
-            )
+            return _urlopen("POST", f"/{request.dataset}/snql", body, headers, deadline)
 
 
 def query(
@@ -1742,6 +2122,21 @@ def _aliased_query_impl(**kwargs):
     return raw_query(**aliased_query_params(**kwargs))
 
 
+def prepare_aliased_query(**kwargs) -> SnubaRequest:
+    """
+    Prepares the request `aliased_query` would send, so that it can be sent with
+    `send_prepared_queries` later, see `prepare_raw_queries`.
+    """
+    params = aliased_query_params(**kwargs)
+    referrer = params.pop("referrer", None)
+    if referrer:
+        params["tenant_ids"] = params.get("tenant_ids") or dict()
+        params["tenant_ids"]["referrer"] = referrer
+
+    [snuba_request] = prepare_raw_queries([SnubaQueryParams(**params)], referrer=referrer)
+    return snuba_request
+
+
 def resolve_conditions(
     conditions: Sequence | None, column_resolver: Callable[[Any], Any]
 ) -> list | None:
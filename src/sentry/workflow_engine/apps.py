@@ -8,3 +8,6 @@ class Config(AppConfig):
         # Import our base DataConditionHandlers for the workflow engine platform
         import sentry.workflow_engine.handlers  # NOQA
         from sentry.workflow_engine.endpoints import serializers  # NOQA
+
+        # Invalidates the cached workflow indexes on changes to workflows
+        from sentry.workflow_engine.processors import workflow_index  # NOQA
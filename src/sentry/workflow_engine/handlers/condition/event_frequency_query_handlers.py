@@ -69,6 +69,9 @@ class InvalidFilter(Exception):
 
 class BaseEventFrequencyQueryHandler(ABC):
     intervals: ClassVar[dict[str, tuple[str, timedelta]]] = STANDARD_INTERVALS
+    # Whether groups of different projects of the same organization can be
+    # queried together in a single batch_query call.
+    cross_project: ClassVar[bool] = True
 
     def get_query_window(self, end: datetime, duration: timedelta) -> tuple[datetime, datetime]:
         """
@@ -415,6 +418,8 @@ class EventUniqueUserFrequencyQueryHandler(BaseEventFrequencyQueryHandler):
 @slow_condition_query_handler_registry.register(Condition.PERCENT_SESSIONS_PERCENT)
 class PercentSessionsQueryHandler(BaseEventFrequencyQueryHandler):
     intervals: ClassVar[dict[str, tuple[str, timedelta]]] = PERCENT_INTERVALS
+    # Results are relative to the session count of a single project.
+    cross_project = False
 
     def get_session_count(
         self, project_id: int, environment_id: int | None, start: datetime, end: datetime
@@ -1,15 +1,20 @@
 import dataclasses
 import logging
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Generator, Hashable, Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import ClassVar, NoReturn, TypeVar
 
+import orjson
 import sentry_sdk
 
+from sentry import options
+from sentry.utils import metrics
 from sentry.utils.function_cache import cache_func_for_models
 from sentry.workflow_engine.models import DataCondition, DataConditionGroup
 from sentry.workflow_engine.models.data_condition import is_slow_condition
 from sentry.workflow_engine.processors.data_condition import split_conditions_by_speed
-from sentry.workflow_engine.types import ConditionError, DataConditionResult
+from sentry.workflow_engine.types import ConditionError, DataConditionResult, WorkflowEventData
 from sentry.workflow_engine.utils import scopedstats
 
 logger = logging.getLogger(__name__)
@@ -266,6 +271,55 @@ def evaluate_condition_group_results(
     )
 
 
+_shared_condition_results: ContextVar[
+    dict[Hashable, DataConditionResult | ConditionError] | None
+] = ContextVar("shared_condition_results", default=None)
+
+
+@contextmanager
+def shared_condition_results() -> Generator[None]:
+    """
+    Evaluates identical workflow conditions only once within the block, even if they
+    belong to different workflows. Meant to wrap the processing of a single event.
+    """
+    token = _shared_condition_results.set({})
+    try:
+        yield
+    finally:
+        _shared_condition_results.reset(token)
+
+
+def _get_shared_condition_key(condition: DataCondition, value: object) -> Hashable | None:
+    if not isinstance(value, WorkflowEventData):
+        return None
+    try:
+        comparison = orjson.dumps(condition.comparison, option=orjson.OPT_SORT_KEYS)
+        condition_result = orjson.dumps(condition.condition_result)
+    except TypeError:
+        return None
+    environment_id = value.workflow_env.id if value.workflow_env else None
+    return (condition.type, comparison, condition_result, environment_id)
+
+
+def _evaluate_condition(condition: DataCondition, value: T) -> DataConditionResult | ConditionError:
+    shared_results = _shared_condition_results.get()
+    if shared_results is None:
+        return condition.evaluate_value(value)
+
+    key = _get_shared_condition_key(condition, value)
+    if key is None:
+        return condition.evaluate_value(value)
+
+    if key in shared_results:
+        metrics.incr(
+            "workflow_engine.data_condition.shared_evaluation", tags={"type": condition.type}
+        )
+        return shared_results[key]
+
+    result = shared_results[key] = condition.evaluate_value(value)
+    return result
+
+
 @scopedstats.timer()
 def evaluate_data_conditions(
     conditions_to_evaluate: list[tuple[DataCondition, T]],
@@ -282,7 +336,7 @@ def evaluate_data_conditions(
         return ProcessedDataConditionGroup(logic_result=TriggerResult.TRUE, condition_results=[])
 
     for condition, value in conditions_to_evaluate:
-        evaluation_result = condition.evaluate_value(value)
+        evaluation_result = _evaluate_condition(condition, value)
         cleaned_result: DataConditionResult
         if isinstance(evaluation_result, ConditionError):
             cleaned_result = None
@@ -312,6 +366,17 @@ def evaluate_data_conditions(
                     logic_result=TriggerResult(triggered=False, error=trigger_result.error),
                     condition_results=[],
                 )
+        elif (
+            logic_type == DataConditionGroup.Type.ALL
+            and not trigger_result.is_tainted()
+            and options.get("workflow_engine.compiled-workflow-index.enabled")
+        ):
+            # A clean False decides an ALL group, the remaining conditions can't
+            # change the result.
+            return ProcessedDataConditionGroup(
+                logic_result=TriggerResult.FALSE,
+                condition_results=[],
+            )
 
         result = ProcessedDataCondition(
             logic_result=trigger_result,
@@ -408,21 +408,35 @@ def get_condition_query_groups(
     return condition_groups
 
 
-@metrics.wraps(
-    "workflow_engine.delayed_workflow.get_condition_group_results",
-    # We want this to be accurate enough for alerting, so sample 100%
-    sample_rate=1.0,
-)
-@sentry_sdk.trace
-def get_condition_group_results(
-    queries_to_groups: dict[UniqueConditionQuery, GroupQueryParams],
-) -> dict[UniqueConditionQuery, QueryResult]:
-    condition_group_results = {}
+@dataclass(frozen=True)
+class DelayedWorkflowBatch:
+    """
+    The buffered data of a project batch, prepared up to the point where the
+    slow conditions need to be queried.
+    """
+
+    project: Project
+    batch_key: str | None
+    event_data: EventRedisData
+    workflows_to_envs: Mapping[WorkflowId, int | None]
+    data_condition_groups: list[DataConditionGroup]
+    dcg_to_slow_conditions: dict[DataConditionGroupId, list[DataCondition]]
+    condition_groups: dict[UniqueConditionQuery, GroupQueryParams]
+
+
+def _query_condition_groups(
+    queries: Sequence[tuple[UniqueConditionQuery, GroupQueryParams]],
+) -> list[QueryResult | None]:
+    """
+    Runs the given queries in order. The result of a query is None if it was rate
+    limited on the last attempt of the task.
+    """
+    results: list[QueryResult | None] = []
     current_time = timezone.now()
 
     all_group_ids: set[GroupId] = set()
     # bulk gather groups and fetch them
-    for time_and_groups in queries_to_groups.values():
+    for _, time_and_groups in queries:
         all_group_ids.update(time_and_groups.group_ids)
 
     all_groups: list[GroupValues] = list(
@@ -435,7 +449,7 @@ def get_condition_group_results(
     if task := current_task():
         last_try = not task.retries_remaining
 
-    for unique_condition, time_and_groups in queries_to_groups.items():
+    for unique_condition, time_and_groups in queries:
         handler = unique_condition.handler()
         group_ids = time_and_groups.group_ids
         groups_to_query = [group for group in all_groups if group["id"] in group_ids]
@@ -464,17 +478,125 @@ def get_condition_group_results(
                     "workflow_engine.delayed_workflow.absent_group_ids",
                     extra={"group_ids": absent_group_ids, "unique_condition": unique_condition},
                 )
-            condition_group_results[unique_condition] = result
+            results.append(result)
         except RateLimitExceeded as e:
             # If we're on our final attempt and encounter a rate limit error, we log it and continue.
             # The condition will evaluate as false, which may be wrong, but this is better for users
             # than allowing the whole task to fail.
             if last_try:
                 logger.info("delayed_workflow.snuba_rate_limit_exceeded", extra={"error": e})
+                results.append(None)
             else:
                 raise
 
-    return condition_group_results
+    return results
+
+
+@metrics.wraps(
+    "workflow_engine.delayed_workflow.get_condition_group_results",
+    # We want this to be accurate enough for alerting, so sample 100%
+    sample_rate=1.0,
+)
+@sentry_sdk.trace
+def get_condition_group_results(
+    queries_to_groups: dict[UniqueConditionQuery, GroupQueryParams],
+) -> dict[UniqueConditionQuery, QueryResult]:
+    queries = list(queries_to_groups.items())
+    return {
+        unique_condition: result
+        for (unique_condition, _), result in zip(queries, _query_condition_groups(queries))
+        if result is not None
+    }
+
+
+@dataclass
+class MergedConditionQuery:
+    """
+    A UniqueConditionQuery shared by several project batches, along with the
+    index of each batch it was merged from.
+    """
+
+    query: UniqueConditionQuery
+    params: GroupQueryParams = field(default_factory=GroupQueryParams)
+    batch_indexes: list[int] = field(default_factory=list)
+
+
+def merge_condition_query_groups(
+    batches: Sequence[DelayedWorkflowBatch], max_window_skew: timedelta
+) -> list[MergedConditionQuery]:
+    """
+    Merge identical queries of different projects into one query over the
+    groups of all of them.
+
+    Queries are only merged within an organization, and queries of handlers
+    that are not `cross_project` only within a project. All merged queries end
+    at the latest timestamp of their members, so the window ends of the merged
+    members may differ by at most `max_window_skew`; members further apart are
+    split into separate queries.
+    """
+    now = timezone.now()
+    candidates: dict[tuple[int, int | None, UniqueConditionQuery], list[tuple[int, datetime]]]
+    candidates = defaultdict(list)
+    for index, batch in enumerate(batches):
+        for query, params in batch.condition_groups.items():
+            scope = None if query.handler.cross_project else batch.project.id
+            candidates[(batch.project.organization_id, scope, query)].append(
+                (index, params.timestamp or now)
+            )
+
+    merged_queries: list[MergedConditionQuery] = []
+    for (_, _, query), members in candidates.items():
+        members.sort(key=lambda member: member[1])
+        merged: MergedConditionQuery | None = None
+        window_start = now
+        for index, timestamp in members:
+            if merged is None or timestamp - window_start > max_window_skew:
+                merged = MergedConditionQuery(query)
+                merged_queries.append(merged)
+                window_start = timestamp
+            merged.params.update(batches[index].condition_groups[query].group_ids, timestamp)
+            merged.batch_indexes.append(index)
+    return merged_queries
+
+
+@metrics.wraps(
+    "workflow_engine.delayed_workflow.get_batched_condition_group_results",
+    sample_rate=1.0,
+)
+@sentry_sdk.trace
+def get_batched_condition_group_results(
+    batches: Sequence[DelayedWorkflowBatch], max_window_skew: timedelta
+) -> list[dict[UniqueConditionQuery, QueryResult]]:
+    """
+    Like get_condition_group_results, but for the queries of several projects at
+    once. Returns the results of every batch, in the order the batches were given.
+    """
+    merged_queries = merge_condition_query_groups(batches, max_window_skew)
+    metrics.distribution(
+        "workflow_engine.delayed_workflow.cross_project_batch.queries",
+        sum(len(batch.condition_groups) for batch in batches),
+        tags={"merged": False},
+        sample_rate=1.0,
+    )
+    metrics.distribution(
+        "workflow_engine.delayed_workflow.cross_project_batch.queries",
+        len(merged_queries),
+        tags={"merged": True},
+        sample_rate=1.0,
+    )
+
+    results = _query_condition_groups([(merged.query, merged.params) for merged in merged_queries])
+
+    batch_results: list[dict[UniqueConditionQuery, QueryResult]] = [{} for _ in batches]
+    for merged, result in zip(merged_queries, results):
+        if result is None:
+            continue
+        for index in merged.batch_indexes:
+            group_ids = batches[index].condition_groups[merged.query].group_ids
+            batch_results[index][merged.query] = {
+                group_id: value for group_id, value in result.items() if group_id in group_ids
+            }
+    return batch_results
 
 
 class MissingQueryResult(Exception):
@@ -793,22 +915,26 @@ def _summarize_by_first[T1, T2: int | str](it: Iterable[tuple[T1, T2]]) -> dict[
     return {key: sorted(values) for key, values in result.items()}
 
 
+def _set_verbose_logging(project: Project) -> None:
+    if features.has("organizations:workflow-engine-process-workflows-logs", project.organization):
+        log_context.set_verbose(True)
+
+
 @sentry_sdk.trace
-def process_delayed_workflows(
+def prepare_delayed_workflows(
     batch_client: DelayedWorkflowClient, project_id: int, batch_key: str | None = None
-) -> None:
+) -> DelayedWorkflowBatch | None:
     """
-    Grab workflows, groups, and data condition groups from the Redis buffer, evaluate the "slow" conditions in a bulk snuba query, and fire them if they pass
+    Grab workflows, groups, and data condition groups from the Redis buffer and
+    determine the Snuba queries needed to evaluate their "slow" conditions.
+    Returns None if there is nothing to query.
     """
     with sentry_sdk.start_span(op="delayed_workflow.prepare_data"):
         project = fetch_project(project_id)
         if not project:
-            return
+            return None
 
-        if features.has(
-            "organizations:workflow-engine-process-workflows-logs", project.organization
-        ):
-            log_context.set_verbose(True)
+        _set_verbose_logging(project)
 
         redis_data = batch_client.for_project(project_id).get_hash_data(batch_key)
         event_data = EventRedisData.from_redis_data(redis_data, continue_on_error=True)
@@ -847,7 +973,7 @@ def process_delayed_workflows(
         data_condition_groups, event_data, workflows_to_envs, dcg_to_slow_conditions
     )
     if not condition_groups:
-        return
+        return None
     logger.debug(
         "delayed_workflow.condition_query_groups",
         extra={
@@ -856,13 +982,27 @@ def process_delayed_workflows(
         },
     )
 
-    try:
-        condition_group_results = get_condition_group_results(condition_groups)
-    except SnubaError:
-        # We expect occasional errors, so we report as info and retry.
-        sentry_sdk.capture_exception(level="info")
-        retry_task()
+    return DelayedWorkflowBatch(
+        project=project,
+        batch_key=batch_key,
+        event_data=event_data,
+        workflows_to_envs=workflows_to_envs,
+        data_condition_groups=data_condition_groups,
+        dcg_to_slow_conditions=dcg_to_slow_conditions,
+        condition_groups=condition_groups,
+    )
 
+
+@sentry_sdk.trace
+def fire_delayed_workflows(
+    batch_client: DelayedWorkflowClient,
+    batch: DelayedWorkflowBatch,
+    condition_group_results: dict[UniqueConditionQuery, QueryResult],
+) -> None:
+    """
+    Evaluate the data condition groups of a prepared batch against the query
+    results, fire the actions of the ones that pass and clean up the buffer.
+    """
     logger.debug(
         "delayed_workflow.condition_group_results",
         extra={
@@ -872,11 +1012,11 @@ def process_delayed_workflows(
 
     # Evaluate DCGs
     groups_to_dcgs, trigger_stats = get_groups_to_fire(
-        data_condition_groups,
-        workflows_to_envs,
-        event_data,
+        batch.data_condition_groups,
+        batch.workflows_to_envs,
+        batch.event_data,
         condition_group_results,
-        dcg_to_slow_conditions,
+        batch.dcg_to_slow_conditions,
     )
     metrics.incr(
         "workflow_engine.delayed_workflow.workflow_if_conditions_evaluated",
@@ -901,10 +1041,67 @@ def process_delayed_workflows(
     )
 
     group_to_groupevent = get_group_to_groupevent(
-        event_data,
+        batch.event_data,
         groups_to_dcgs,
-        project,
+        batch.project,
+    )
+
+    fire_actions_for_groups(batch.project.organization, groups_to_dcgs, group_to_groupevent)
+    cleanup_redis_buffer(
+        batch_client.for_project(batch.project.id), batch.event_data.events.keys(), batch.batch_key
     )
 
-    fire_actions_for_groups(project.organization, groups_to_dcgs, group_to_groupevent)
-    cleanup_redis_buffer(batch_client.for_project(project_id), event_data.events.keys(), batch_key)
+
+@sentry_sdk.trace
+def process_delayed_workflows(
+    batch_client: DelayedWorkflowClient, project_id: int, batch_key: str | None = None
+) -> None:
+    """
+    Grab workflows, groups, and data condition groups from the Redis buffer, evaluate the "slow" conditions in a bulk snuba query, and fire them if they pass
+    """
+    batch = prepare_delayed_workflows(batch_client, project_id, batch_key)
+    if batch is None:
+        return
+
+    try:
+        condition_group_results = get_condition_group_results(batch.condition_groups)
+    except SnubaError:
+        # We expect occasional errors, so we report as info and retry.
+        sentry_sdk.capture_exception(level="info")
+        retry_task()
+
+    fire_delayed_workflows(batch_client, batch, condition_group_results)
+
+
+@sentry_sdk.trace
+def process_delayed_workflows_batch(
+    batch_client: DelayedWorkflowClient, project_ids: Sequence[int]
+) -> None:
+    """
+    Process the buffered workflows of several projects, querying Snuba for the
+    slow conditions of all of them at once so that identical queries of projects
+    in the same organization are only made once.
+    """
+    batches: list[DelayedWorkflowBatch] = []
+    for project_id in project_ids:
+        with log_context.new_context(project_id=project_id):
+            batch = prepare_delayed_workflows(batch_client, project_id)
+        if batch is not None:
+            batches.append(batch)
+    if not batches:
+        return
+
+    max_window_skew = timedelta(
+        seconds=options.get("delayed_workflow.cross-project-batching.max-window-skew-seconds")
+    )
+    try:
+        batch_results = get_batched_condition_group_results(batches, max_window_skew)
+    except SnubaError:
+        # We expect occasional errors, so we report as info and retry.
+        sentry_sdk.capture_exception(level="info")
+        retry_task()
+
+    for batch, condition_group_results in zip(batches, batch_results):
+        with log_context.new_context(project_id=batch.project.id):
+            _set_verbose_logging(batch.project)
+            fire_delayed_workflows(batch_client, batch, condition_group_results)
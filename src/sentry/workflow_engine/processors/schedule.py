@@ -2,12 +2,14 @@ import hashlib
 import logging
 import math
 import uuid
+from collections import defaultdict
 from collections.abc import Generator
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from itertools import islice
 
 from sentry import options
+from sentry.models.project import Project
 from sentry.utils import metrics
 from sentry.utils.iterators import chunked
 from sentry.workflow_engine.buffer.batch_client import (
@@ -15,7 +17,10 @@ from sentry.workflow_engine.buffer.batch_client import (
     DelayedWorkflowClient,
     ProjectDelayedWorkflowClient,
 )
-from sentry.workflow_engine.tasks.delayed_workflows import process_delayed_workflows
+from sentry.workflow_engine.tasks.delayed_workflows import (
+    process_delayed_workflows,
+    process_delayed_workflows_batch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +88,43 @@ def process_in_batches(client: ProjectDelayedWorkflowClient) -> None:
             )
 
 
+def process_in_cross_project_batches(
+    buffer_client: DelayedWorkflowClient, project_ids: list[int]
+) -> None:
+    """
+    Schedule the processing of several projects at once, so that identical
+    Snuba queries of projects in the same organization are only made once.
+
+    Projects with more events than fit in a single batch are scheduled on
+    their own by process_in_batches. The others are grouped by organization,
+    and each group is processed by a single task.
+    """
+    batch_size = options.get("delayed_processing.batch_size")
+    max_projects = options.get("delayed_workflow.cross-project-batching.max-projects")
+
+    small_project_ids = []
+    for project_id in project_ids:
+        client = buffer_client.for_project(project_id)
+        if client.get_hash_length() < batch_size:
+            small_project_ids.append(project_id)
+        else:
+            process_in_batches(client)
+
+    project_ids_by_org: dict[int, list[int]] = defaultdict(list)
+    for project_id, organization_id in Project.objects.filter(id__in=small_project_ids).values_list(
+        "id", "organization_id"
+    ):
+        project_ids_by_org[organization_id].append(project_id)
+
+    for org_project_ids in project_ids_by_org.values():
+        for chunk in chunked(sorted(org_project_ids), max_projects):
+            metrics.distribution("workflow_engine.schedule.cross_project_batch_size", len(chunk))
+            process_delayed_workflows_batch.apply_async(
+                kwargs={"project_ids": chunk},
+                headers={"sentry-propagate-traces": False},
+            )
+
+
 class ProjectChooser:
     """
     ProjectChooser assists in determining which projects to process based on the cohort updates.
@@ -238,8 +280,11 @@ def process_buffered_workflows(buffer_client: DelayedWorkflowClient) -> None:
                 extra={"project_ids": sorted(project_ids_to_process)},
             )
 
-            for project_id in project_ids_to_process:
-                process_in_batches(buffer_client.for_project(project_id))
+            if options.get("delayed_workflow.cross-project-batching.enabled"):
+                process_in_cross_project_batches(buffer_client, project_ids_to_process)
+            else:
+                for project_id in project_ids_to_process:
+                    process_in_batches(buffer_client.for_project(project_id))
 
             mark_projects_processed(
                 buffer_client, project_ids_to_process, all_project_ids_and_timestamps
@@ -1,4 +1,5 @@
 from collections.abc import Collection, Sequence
+from contextlib import nullcontext
 from dataclasses import asdict, replace
 from datetime import datetime
 from enum import StrEnum
@@ -8,7 +9,7 @@ import sentry_sdk
 from django.db import router, transaction
 from django.db.models import Q
 
-from sentry import features
+from sentry import features, options
 from sentry.models.activity import Activity
 from sentry.models.environment import Environment
 from sentry.services.eventstore.models import GroupEvent
@@ -29,8 +30,10 @@ from sentry.workflow_engine.processors.contexts.workflow_event_context import (
 from sentry.workflow_engine.processors.data_condition_group import (
     get_data_conditions_for_group,
     process_data_condition_group,
+    shared_condition_results,
 )
 from sentry.workflow_engine.processors.detector import get_detectors_for_event
+from sentry.workflow_engine.processors.workflow_index import WorkflowIndex, get_workflow_index
 from sentry.workflow_engine.processors.workflow_fire_history import create_workflow_fire_histories
 from sentry.workflow_engine.types import (
     WorkflowEvaluation,
@@ -135,6 +138,7 @@ def evaluate_workflow_triggers(
     workflows: set[Workflow],
     event_data: WorkflowEventData,
     event_start_time: datetime,
+    index: WorkflowIndex | None = None,
 ) -> tuple[set[Workflow], dict[Workflow, DelayedWorkflowItem]]:
     """
     Returns a tuple of (triggered_workflows, queue_items_by_workflow)
@@ -146,13 +150,16 @@ def evaluate_workflow_triggers(
     triggered_workflows: set[Workflow] = set()
     queue_items_by_workflow: dict[Workflow, DelayedWorkflowItem] = {}
 
-    dcg_ids = [
-        workflow.when_condition_group_id
-        for workflow in workflows
-        if workflow.when_condition_group_id
-    ]
-    # Retrieve these as a batch to avoid a query/cache-lookup per DCG.
-    data_conditions_by_dcg_id = _get_data_conditions_for_group_by_dcg(dcg_ids)
+    if index is not None:
+        data_conditions_by_dcg_id = index.conditions_by_dcg_id
+    else:
+        dcg_ids = [
+            workflow.when_condition_group_id
+            for workflow in workflows
+            if workflow.when_condition_group_id
+        ]
+        # Retrieve these as a batch to avoid a query/cache-lookup per DCG.
+        data_conditions_by_dcg_id = _get_data_conditions_for_group_by_dcg(dcg_ids)
 
     project = event_data.event.project  # expected to be already cached
     dual_processing_logs_enabled = features.has(
@@ -253,6 +260,7 @@ def evaluate_workflows_action_filters(
     event_data: WorkflowEventData,
     queue_items_by_workflow: dict[Workflow, DelayedWorkflowItem],
     event_start_time: datetime,
+    index: WorkflowIndex | None = None,
 ) -> tuple[set[DataConditionGroup], dict[Workflow, DelayedWorkflowItem]]:
     """
     Evaluate the action filters for the given workflows.
@@ -263,20 +271,28 @@ def evaluate_workflows_action_filters(
     # to evaluate all fast conditions
     all_workflows = workflows.union(set(queue_items_by_workflow.keys()))
 
-    action_conditions_to_workflow = {
-        wdcg.condition_group: wdcg.workflow
-        for wdcg in WorkflowDataConditionGroup.objects.select_related(
-            "workflow", "condition_group"
-        ).filter(workflow__in=all_workflows)
-    }
+    if index is not None:
+        workflows_by_id = {workflow.id: workflow for workflow in all_workflows}
+        action_conditions_to_workflow = {
+            dcg: workflows_by_id[workflow_id]
+            for dcg, workflow_id in index.action_filters
+            if workflow_id in workflows_by_id
+        }
+        data_conditions_by_dcg_id = index.conditions_by_dcg_id
+    else:
+        action_conditions_to_workflow = {
+            wdcg.condition_group: wdcg.workflow
+            for wdcg in WorkflowDataConditionGroup.objects.select_related(
+                "workflow", "condition_group"
+            ).filter(workflow__in=all_workflows)
+        }
+        # Retrieve these as a batch to avoid a query/cache-lookup per DCG.
+        data_conditions_by_dcg_id = _get_data_conditions_for_group_by_dcg(
+            [dcg.id for dcg in action_conditions_to_workflow.keys()]
+        )
 
     filtered_action_groups: set[DataConditionGroup] = set()
 
-    # Retrieve these as a batch to avoid a query/cache-lookup per DCG.
-    data_conditions_by_dcg_id = _get_data_conditions_for_group_by_dcg(
-        [dcg.id for dcg in action_conditions_to_workflow.keys()]
-    )
-
     env_by_id: dict[int, Environment] = {
         env.id: env
         for env in Environment.objects.get_many_from_cache(
@@ -380,26 +396,32 @@ def get_environment_by_event(event_data: WorkflowEventData) -> Environment | Non
 
 @scopedstats.timer()
 def _get_associated_workflows(
-    detectors: Collection[Detector], environment: Environment | None, event_data: WorkflowEventData
+    detectors: Collection[Detector],
+    environment: Environment | None,
+    event_data: WorkflowEventData,
+    index: WorkflowIndex | None = None,
 ) -> set[Workflow]:
     """
     This is a wrapper method to get the workflows associated with a detector and environment.
     Used in process_workflows to wrap the query + logging into a single method
     """
-    environment_filter = (
-        (Q(environment_id=None) | Q(environment_id=environment.id))
-        if environment
-        else Q(environment_id=None)
-    )
-    workflows = set(
-        Workflow.objects.filter(
-            environment_filter,
-            detectorworkflow__detector_id__in=[detector.id for detector in detectors],
-            enabled=True,
+    if index is not None:
+        workflows = set(index.workflows)
+    else:
+        environment_filter = (
+            (Q(environment_id=None) | Q(environment_id=environment.id))
+            if environment
+            else Q(environment_id=None)
+        )
+        workflows = set(
+            Workflow.objects.filter(
+                environment_filter,
+                detectorworkflow__detector_id__in=[detector.id for detector in detectors],
+                enabled=True,
+            )
+            .select_related("environment")
+            .distinct()
         )
-        .select_related("environment")
-        .distinct()
-    )
 
     if workflows:
         metrics_incr(
@@ -500,7 +522,11 @@ def process_workflows(
     if features.has("organizations:workflow-engine-process-workflows-logs", organization):
         log_context.set_verbose(True)
 
-    workflows = _get_associated_workflows(event_detectors.detectors, environment, event_data)
+    index = None
+    if options.get("workflow_engine.compiled-workflow-index.enabled"):
+        index = get_workflow_index(organization.id, event_detectors.detectors, environment)
+
+    workflows = _get_associated_workflows(event_detectors.detectors, environment, event_data, index)
     workflow_evaluation_data.workflows = workflows
 
     if not workflows:
@@ -510,25 +536,29 @@ def process_workflows(
             data=workflow_evaluation_data,
         )
 
-    triggered_workflows, queue_items_by_workflow_id = evaluate_workflow_triggers(
-        workflows, event_data, event_start_time
-    )
+    # With the index, identical conditions of different workflows are only evaluated
+    # once for the event.
+    condition_results_scope = shared_condition_results() if index is not None else nullcontext()
+    with condition_results_scope:
+        triggered_workflows, queue_items_by_workflow_id = evaluate_workflow_triggers(
+            workflows, event_data, event_start_time, index
+        )
 
-    workflow_evaluation_data.triggered_workflows = triggered_workflows
+        workflow_evaluation_data.triggered_workflows = triggered_workflows
 
-    if not triggered_workflows and not queue_items_by_workflow_id:
-        # TODO - re-think tainted once the actions are removed from process_workflows.
-        return WorkflowEvaluation(
-            tainted=True,
-            msg="No items were triggered or queued for slow evaluation",
-            data=workflow_evaluation_data,
-        )
+        if not triggered_workflows and not queue_items_by_workflow_id:
+            # TODO - re-think tainted once the actions are removed from process_workflows.
+            return WorkflowEvaluation(
+                tainted=True,
+                msg="No items were triggered or queued for slow evaluation",
+                data=workflow_evaluation_data,
+            )
 
-    # TODO - we should probably return here and have the rest from here be
-    # `process_actions`, this will take a list of "triggered_workflows"
-    actions_to_trigger, queue_items_by_workflow_id = evaluate_workflows_action_filters(
-        triggered_workflows, event_data, queue_items_by_workflow_id, event_start_time
-    )
+        # TODO - we should probably return here and have the rest from here be
+        # `process_actions`, this will take a list of "triggered_workflows"
+        actions_to_trigger, queue_items_by_workflow_id = evaluate_workflows_action_filters(
+            triggered_workflows, event_data, queue_items_by_workflow_id, event_start_time, index
+        )
 
     enqueue_workflows(batch_client, queue_items_by_workflow_id)
 
@@ -0,0 +1,211 @@
+"""
+A compiled, cached view of the workflows that can fire for a set of detectors.
+
+Processing an event used to query the associated workflows, their action filters
+and the conditions of every condition group on each call. The index bundles all
+of that into a single cached object per organization, detectors and environment,
+with the conditions of every group pre-sorted so the cheapest ones are evaluated
+first. Any change to a workflow, its condition groups or conditions invalidates all
+indexes of the organization by rotating its version token.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import uuid
+from collections import defaultdict
+from collections.abc import Collection
+from datetime import timedelta
+from typing import Any
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+
+from sentry.models.environment import Environment
+from sentry.utils.hashlib import md5_text
+from sentry.workflow_engine.models import (
+    DataCondition,
+    DataConditionGroup,
+    Detector,
+    DetectorWorkflow,
+    Workflow,
+)
+from sentry.workflow_engine.models.data_condition import CONDITION_OPS, Condition
+from sentry.workflow_engine.models.workflow_data_condition_group import WorkflowDataConditionGroup
+from sentry.workflow_engine.utils.metrics import metrics_incr
+
+WORKFLOW_INDEX_TTL = timedelta(minutes=5)
+
+# Relative cost of evaluating a condition. Conditions that only look at the group or
+# the event are cheap, the ones that read from the database, buffers or release
+# caches are more expensive. Unlisted conditions use DEFAULT_CONDITION_COST.
+DEFAULT_CONDITION_COST = 2
+CONDITION_COSTS: dict[Condition, int] = {
+    **{condition: 0 for condition in CONDITION_OPS},
+    Condition.EVERY_EVENT: 0,
+    Condition.FIRST_SEEN_EVENT: 1,
+    Condition.REGRESSION_EVENT: 1,
+    Condition.REAPPEARED_EVENT: 1,
+    Condition.NEW_HIGH_PRIORITY_ISSUE: 1,
+    Condition.EXISTING_HIGH_PRIORITY_ISSUE: 1,
+    Condition.ISSUE_RESOLUTION_CHANGE: 1,
+    Condition.EVENT_CREATED_BY_DETECTOR: 1,
+    Condition.ISSUE_CATEGORY: 1,
+    Condition.ISSUE_PRIORITY_EQUALS: 1,
+    Condition.ISSUE_PRIORITY_GREATER_OR_EQUAL: 1,
+    Condition.ISSUE_PRIORITY_DEESCALATING: 1,
+    Condition.LEVEL: 1,
+    Condition.AGE_COMPARISON: 1,
+    Condition.EVENT_SEEN_COUNT: 1,
+    Condition.EVENT_ATTRIBUTE: 2,
+    Condition.TAGGED_EVENT: 2,
+    Condition.ISSUE_OCCURRENCES: 3,
+    Condition.ASSIGNED_TO: 3,
+    Condition.LATEST_RELEASE: 4,
+    Condition.LATEST_ADOPTED_RELEASE: 4,
+}
+
+
+def get_condition_cost(condition: DataCondition) -> int:
+    try:
+        return CONDITION_COSTS.get(Condition(condition.type), DEFAULT_CONDITION_COST)
+    except ValueError:
+        return DEFAULT_CONDITION_COST
+
+
+def sort_conditions_by_cost(conditions: Collection[DataCondition]) -> list[DataCondition]:
+    return sorted(conditions, key=lambda condition: (get_condition_cost(condition), condition.id))
+
+
+@dataclasses.dataclass(frozen=True)
+class WorkflowIndex:
+    workflows: list[Workflow]
+    # The conditions of all trigger and action filter groups, sorted by cost.
+    conditions_by_dcg_id: dict[int, list[DataCondition]]
+    # The action filter groups with the id of the workflow they belong to.
+    action_filters: list[tuple[DataConditionGroup, int]]
+
+
+def _get_version_cache_key(organization_id: int) -> str:
+    return f"workflow-index-version:{organization_id}"
+
+
+def get_workflow_index_version(organization_id: int) -> str:
+    cache_key = _get_version_cache_key(organization_id)
+    version = cache.get(cache_key)
+    if version is None:
+        # A fresh token rather than a counter, so that an evicted version can never
+        # resurrect indexes built for an older one.
+        cache.add(cache_key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(cache_key)
+    return version
+
+
+def invalidate_workflow_index(organization_id: int) -> None:
+    cache.set(_get_version_cache_key(organization_id), uuid.uuid4().hex, timeout=None)
+
+
+def _get_index_cache_key(
+    organization_id: int, detectors: Collection[Detector], environment: Environment | None
+) -> str:
+    version = get_workflow_index_version(organization_id)
+    detector_ids = ",".join(str(id) for id in sorted(detector.id for detector in detectors))
+    environment_id = environment.id if environment else ""
+    args = md5_text(f"{detector_ids}|{environment_id}").hexdigest()
+    return f"workflow-index:{organization_id}:{version}:{args}"
+
+
+def build_workflow_index(
+    detectors: Collection[Detector], environment: Environment | None
+) -> WorkflowIndex:
+    environment_filter = (
+        (Q(environment_id=None) | Q(environment_id=environment.id))
+        if environment
+        else Q(environment_id=None)
+    )
+    workflows = list(
+        Workflow.objects.filter(
+            environment_filter,
+            detectorworkflow__detector_id__in=[detector.id for detector in detectors],
+            enabled=True,
+        )
+        .select_related("environment")
+        .distinct()
+    )
+
+    action_filters = [
+        (wdcg.condition_group, wdcg.workflow_id)
+        for wdcg in WorkflowDataConditionGroup.objects.select_related("condition_group").filter(
+            workflow__in=workflows
+        )
+    ]
+
+    dcg_ids = {workflow.when_condition_group_id for workflow in workflows} | {
+        dcg.id for dcg, _ in action_filters
+    }
+    dcg_ids.discard(None)
+
+    conditions: dict[int, list[DataCondition]] = defaultdict(list)
+    for condition in DataCondition.objects.filter(condition_group_id__in=dcg_ids):
+        conditions[condition.condition_group_id].append(condition)
+
+    return WorkflowIndex(
+        workflows=workflows,
+        conditions_by_dcg_id={
+            dcg_id: sort_conditions_by_cost(conditions.get(dcg_id, [])) for dcg_id in dcg_ids
+        },
+        action_filters=action_filters,
+    )
+
+
+def get_workflow_index(
+    organization_id: int, detectors: Collection[Detector], environment: Environment | None
+) -> WorkflowIndex:
+    cache_key = _get_index_cache_key(organization_id, detectors, environment)
+    index = cache.get(cache_key)
+    if index is not None:
+        metrics_incr("process_workflows.workflow_index", tags={"result": "hit"})
+        return index
+
+    metrics_incr("process_workflows.workflow_index", tags={"result": "miss"})
+    index = build_workflow_index(detectors, environment)
+    cache.set(cache_key, index, timeout=WORKFLOW_INDEX_TTL.total_seconds())
+    return index
+
+
+def _invalidate_for_organization(instance: Workflow | DataConditionGroup, **kwargs: Any) -> None:
+    invalidate_workflow_index(instance.organization_id)
+
+
+def _invalidate_for_workflow(
+    instance: DetectorWorkflow | WorkflowDataConditionGroup, **kwargs: Any
+) -> None:
+    organization_id = (
+        Workflow.objects.filter(id=instance.workflow_id)
+        .values_list("organization_id", flat=True)
+        .first()
+    )
+    if organization_id is not None:
+        invalidate_workflow_index(organization_id)
+
+
+def _invalidate_for_condition(instance: DataCondition, **kwargs: Any) -> None:
+    organization_id = (
+        DataConditionGroup.objects.filter(id=instance.condition_group_id)
+        .values_list("organization_id", flat=True)
+        .first()
+    )
+    if organization_id is not None:
+        invalidate_workflow_index(organization_id)
+
+
+for _model, _receiver in (
+    (Workflow, _invalidate_for_organization),
+    (DataConditionGroup, _invalidate_for_organization),
+    (DetectorWorkflow, _invalidate_for_workflow),
+    (WorkflowDataConditionGroup, _invalidate_for_workflow),
+    (DataCondition, _invalidate_for_condition),
+):
+    post_save.connect(_receiver, sender=_model, weak=False)
+    post_delete.connect(_receiver, sender=_model, weak=False)
@@ -37,3 +37,27 @@ def process_delayed_workflows(
 
     with quiet_redis_noise():
         _process_delayed_workflows(batch_client, project_id, batch_key)
+
+
+@instrumented_task(
+    name="sentry.workflow_engine.tasks.delayed_workflows_batch",
+    namespace=workflow_engine_tasks,
+    processing_deadline_duration=120,
+    retry=Retry(times=5, delay=5),
+    silo_mode=SiloMode.REGION,
+)
+@retry(timeouts=True)
+@log_context.root()
+def process_delayed_workflows_batch(project_ids: list[int], *args: Any, **kwargs: Any) -> None:
+    """
+    Process the delayed workflows of several projects of an organization, sharing the snuba queries for their "slow" conditions
+    """
+    from sentry.workflow_engine.buffer.batch_client import DelayedWorkflowClient
+    from sentry.workflow_engine.processors.delayed_workflow import (
+        process_delayed_workflows_batch as _process_delayed_workflows_batch,
+    )
+
+    batch_client = DelayedWorkflowClient()
+
+    with quiet_redis_noise():
+        _process_delayed_workflows_batch(batch_client, project_ids)
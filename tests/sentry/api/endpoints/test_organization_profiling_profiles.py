@@ -12,6 +12,7 @@ from sentry.profiles.utils import proxy_profiling_service
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.cases import APITestCase, ProfilesSnubaTestCase, SpanTestCase
 from sentry.testutils.helpers.datetime import before_now, freeze_time
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.samples import load_data
 from sentry.utils.snuba import bulk_snuba_queries, raw_snql_query
 
@@ -797,6 +798,89 @@ class OrganizationProfilingFlamegraphTest(ProfilesSnubaTestCase, SpanTestCase):
             },
         )
 
+    @patch("sentry.profiles.flamegraph.bulk_snuba_queries", wraps=bulk_snuba_queries)
+    @patch("sentry.api.endpoints.organization_profiling_profiles.proxy_profiling_service")
+    def test_queries_profile_candidates_concurrently(
+        self,
+        mock_proxy_profiling_service,
+        mock_bulk_snuba_queries,
+    ):
+        profile_id = uuid4().hex
+        self.store_transaction(transaction="foo", profile_id=profile_id, project=self.project)
+
+        mock_proxy_profiling_service.return_value = HttpResponse(status=200)
+
+        with override_options(
+            {
+                "profiling.flamegraph.query.concurrency": 3,
+                "profiling.flamegraph.profile-set.size": 1,
+            }
+        ):
+            response = self.do_request(
+                {
+                    "project": [self.project.id],
+                    "query": "transaction:foo",
+                    "statsPeriod": "7d",
+                },
+            )
+        assert response.status_code == 200, response.content
+
+        # The newest time ranges are queried at once, and the candidate is found
+        # in them so older ranges aren't queried.
+        mock_bulk_snuba_queries.assert_called_once()
+        requests = mock_bulk_snuba_queries.call_args.args[0]
+        assert len(requests) == 3
+        assert all(request.dataset == Dataset.Discover.value for request in requests)
+
+        mock_proxy_profiling_service.assert_called_once_with(
+            method="POST",
+            path=f"/organizations/{self.project.organization.id}/flamegraph",
+            json_data={
+                "transaction": [{"project_id": self.project.id, "profile_id": profile_id}],
+                "continuous": [],
+            },
+        )
+
+    @patch("sentry.api.endpoints.organization_profiling_profiles.proxy_profiling_service")
+    def test_caches_profile_candidates(self, mock_proxy_profiling_service) -> None:
+        mock_proxy_profiling_service.return_value = HttpResponse(status=200)
+        query = {
+            "project": [self.project.id],
+            "dataSource": "transactions",
+            "query": "transaction:foo",
+            "statsPeriod": "1h",
+        }
+
+        with (
+            override_options({"profiling.flamegraph.candidates-cache.ttl": 60}),
+            patch(
+                "sentry.search.events.builder.base.raw_snql_query",
+                wraps=raw_snql_query,
+            ) as mock_raw_snql_query,
+        ):
+            response = self.do_request(query)
+            assert response.status_code == 200, response.content
+            call_count = mock_raw_snql_query.call_count
+            assert call_count > 0
+
+            # Only whitespace differs, so the candidates come from the cache.
+            response = self.do_request({**query, "query": " transaction:foo  "})
+            assert response.status_code == 200, response.content
+            assert mock_raw_snql_query.call_count == call_count
+
+            response = self.do_request({**query, "query": "transaction:bar"})
+            assert response.status_code == 200, response.content
+            assert mock_raw_snql_query.call_count > call_count
+
+            # Whitespace within quoted values is part of the value.
+            response = self.do_request({**query, "query": 'transaction:"foo bar"'})
+            assert response.status_code == 200, response.content
+            call_count = mock_raw_snql_query.call_count
+
+            response = self.do_request({**query, "query": 'transaction:"foo  bar"'})
+            assert response.status_code == 200, response.content
+            assert mock_raw_snql_query.call_count > call_count
+
 
 class OrganizationProfilingChunksTest(APITestCase):
     endpoint = "sentry-api-0-organization-profiling-chunks"
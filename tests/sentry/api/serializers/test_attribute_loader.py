@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from sentry.api.serializers.attribute_loader import (
+    AttributeLoaderDeadlineExceeded,
+    AttributeProvider,
+    load_attributes,
+)
+
+
+def test_dependencies() -> None:
+    results = load_attributes(
+        [
+            AttributeProvider("b", lambda a: a + 1, depends_on=("a",), concurrent=True),
+            AttributeProvider("c", lambda a, b: a + b, depends_on=("a", "b")),
+            AttributeProvider("a", lambda: 1),
+        ]
+    )
+    assert results == {"a": 1, "b": 2, "c": 3}
+
+
+def test_concurrent_providers_run_alongside_inline() -> None:
+    inline_thread = threading.get_ident()
+    started = threading.Event()
+    threads = {}
+
+    def concurrent():
+        threads["concurrent"] = threading.get_ident()
+        started.set()
+        return "snuba"
+
+    def inline():
+        threads["inline"] = threading.get_ident()
+        # The concurrent provider is already in flight while this one runs
+        assert started.wait(timeout=5)
+        return "postgres"
+
+    results = load_attributes(
+        [
+            AttributeProvider("concurrent", concurrent, concurrent=True),
+            AttributeProvider("inline", inline),
+        ]
+    )
+    assert results == {"concurrent": "snuba", "inline": "postgres"}
+    assert threads["inline"] == inline_thread
+    assert threads["concurrent"] != inline_thread
+
+
+def test_concurrency_disabled() -> None:
+    inline_thread = threading.get_ident()
+    results = load_attributes(
+        [AttributeProvider("a", threading.get_ident, concurrent=True)],
+        allow_concurrency=False,
+    )
+    assert results == {"a": inline_thread}
+
+
+def test_errors_are_raised() -> None:
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        load_attributes([AttributeProvider("a", fail, concurrent=True)])
+
+
+def test_deadline() -> None:
+    release = threading.Event()
+    try:
+        with pytest.raises(AttributeLoaderDeadlineExceeded):
+            load_attributes(
+                [AttributeProvider("slow", lambda: release.wait(5), concurrent=True)],
+                timeout=0.05,
+            )
+    finally:
+        release.set()
+
+    with pytest.raises(AttributeLoaderDeadlineExceeded):
+        load_attributes(
+            [
+                AttributeProvider("slow", lambda: time.sleep(0.1)),
+                AttributeProvider("never", lambda: None),
+            ],
+            timeout=0.05,
+        )
+
+
+def test_invalid_dependencies() -> None:
+    with pytest.raises(ValueError):
+        load_attributes([AttributeProvider("a", lambda b: b, depends_on=("b",))])
+
+    with pytest.raises(ValueError):
+        load_attributes(
+            [
+                AttributeProvider("a", lambda b: b, depends_on=("b",)),
+                AttributeProvider("b", lambda a: a, depends_on=("a",)),
+            ]
+        )
@@ -0,0 +1,61 @@
+from unittest import mock
+
+from sentry.api.serializers import Serializer, serialize
+from sentry.api.serializers.dataloader import DataLoader, get_loader, loader_scope, model_loader
+from sentry.models.project import Project
+from sentry.testutils.cases import TestCase
+
+
+def test_batches_primed_keys() -> None:
+    batch_load = mock.Mock(side_effect=lambda keys: {key: key * 2 for key in keys if key != 3})
+    loader = DataLoader("test", batch_load)
+
+    loader.prime([1, 2, 3])
+    assert loader.load(1) == 2
+    assert loader.load(2) == 4
+    assert loader.load(3) is None
+    assert batch_load.call_count == 1
+
+    assert loader.load_many([1, 4]) == {1: 2, 4: 8}
+    assert batch_load.call_args_list == [mock.call([1, 2, 3]), mock.call([4])]
+
+
+def test_loader_scope() -> None:
+    def batch_load(keys):
+        return {key: key for key in keys}
+
+    assert get_loader("test", "test", batch_load) is not get_loader("test", "test", batch_load)
+
+    with loader_scope():
+        loader = get_loader("test", "test", batch_load)
+        with loader_scope():
+            assert get_loader("test", "test", batch_load) is loader
+        assert get_loader("other", "test", batch_load) is not loader
+
+    assert get_loader("test", "test", batch_load) is not loader
+
+
+class ProjectNameSerializer(Serializer):
+    def get_attrs(self, item_list, user, **kwargs):
+        model_loader(Project).prime(item_list)
+        return {}
+
+    def serialize(self, obj, attrs, user, **kwargs):
+        project = model_loader(Project).load(obj)
+        return project.name if project else None
+
+
+class NestedSerializer(Serializer):
+    def serialize(self, obj, attrs, user, **kwargs):
+        return serialize(obj, serializer=ProjectNameSerializer())
+
+
+class DataLoaderSerializeTest(TestCase):
+    def test_memoized_across_nested_serializers(self) -> None:
+        projects = [self.create_project(name=f"project-{i}") for i in range(3)]
+        project_ids = tuple(project.id for project in projects)
+
+        with self.assertNumQueries(1):
+            result = serialize([project_ids, project_ids], serializer=NestedSerializer())
+
+        assert result == [[project.name for project in projects]] * 2
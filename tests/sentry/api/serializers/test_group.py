@@ -1,9 +1,11 @@
 from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from sentry.api.serializers import serialize
+from sentry.api.serializers import Serializer, serialize
 from sentry.api.serializers.models.group import SimpleGroupSerializer
 from sentry.grouping.grouptype import ErrorGroupType
 from sentry.integrations.types import ExternalProviderEnum
@@ -29,6 +31,11 @@ from sentry.users.models.user_option import UserOption
 pytestmark = [requires_snuba]
 
 
+class NestedGroupsSerializer(Serializer):
+    def serialize(self, obj, attrs, user, **kwargs):
+        return serialize(list(Group.objects.filter(id__in=obj)), user)
+
+
 class GroupSerializerTest(TestCase, PerformanceIssueTestCase):
     def test_project(self) -> None:
         user = self.create_user()
@@ -41,6 +48,29 @@ class GroupSerializerTest(TestCase, PerformanceIssueTestCase):
         assert "slug" in result["project"]
         assert "platform" in result["project"]
 
+    def test_projects_loaded_once_for_nested_serializers(self) -> None:
+        user = self.create_user()
+        group_ids = [self.create_group(project=self.create_project()).id for _ in range(3)]
+
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as queries:
+            result = serialize([group_ids, group_ids], user, NestedGroupsSerializer())
+
+        assert [[group["id"] for group in groups] for groups in result] == [
+            [str(group_id) for group_id in group_ids]
+        ] * 2
+        project_queries = [
+            query
+            for query in queries.captured_queries
+            if '"sentry_project"."id" IN' in query["sql"]
+        ]
+        organization_queries = [
+            query
+            for query in queries.captured_queries
+            if '"sentry_organization"."id" IN' in query["sql"]
+        ]
+        assert len(project_queries) == 1
+        assert len(organization_queries) == 1
+
     def test_is_ignored_with_expired_snooze(self) -> None:
         now = timezone.now()
 
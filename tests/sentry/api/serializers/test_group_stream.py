@@ -1,3 +1,4 @@
+import threading
 from unittest import mock
 
 from sentry import tsdb
@@ -10,6 +11,10 @@ from sentry.issues.grouptype import GroupCategory, ProfileFileIOGroupType
 from sentry.models.environment import Environment
 from sentry.testutils.cases import BaseMetricsTestCase, PerformanceIssueTestCase, TestCase
 from sentry.testutils.helpers.datetime import before_now, freeze_time
+from sentry.testutils.helpers.options import override_options
+from sentry.utils.snuba import prepare_aliased_query as original_prepare_aliased_query
+from sentry.utils.snuba import prepare_raw_queries as original_prepare_raw_queries
+from sentry.utils.snuba import send_prepared_queries as original_send_prepared_queries
 from tests.sentry.issues.test_utils import SearchIssueTestMixin
 
 
@@ -64,6 +69,65 @@ class StreamGroupSerializerTestCase(
         assert [stat[1] for stat in serialized["stats"]["24h"][:-1]] == [0] * 23
         assert serialized["stats"]["24h"][-1][1] == 1
 
+    @freeze_time(before_now(days=1).replace(hour=13, minute=30, second=0, microsecond=0))
+    def test_concurrent_attrs(self) -> None:
+        event = self.create_performance_issue()
+        group = event.group
+
+        def serialize_group(**kwargs):
+            return serialize(
+                group,
+                serializer=StreamGroupSerializerSnuba(
+                    stats_period="24h", organization_id=1, **kwargs
+                ),
+                request=self.make_request(),
+            )
+
+        serialized = serialize_group()
+        with override_options({"api.serializers.group.concurrent-attrs.enabled": True}):
+            prepare_threads = []
+
+            def prepare_raw_queries(*args, **kwargs):
+                prepare_threads.append(threading.get_ident())
+                return original_prepare_raw_queries(*args, **kwargs)
+
+            def prepare_aliased_query(**kwargs):
+                prepare_threads.append(threading.get_ident())
+                return original_prepare_aliased_query(**kwargs)
+
+            send_calls = []
+
+            def send_prepared_queries(snuba_requests, **kwargs):
+                send_calls.append((threading.get_ident(), len(snuba_requests), kwargs["deadline"]))
+                return original_send_prepared_queries(snuba_requests, **kwargs)
+
+            with (
+                mock.patch(
+                    "sentry.api.serializers.models.group.prepare_raw_queries",
+                    side_effect=prepare_raw_queries,
+                ),
+                mock.patch(
+                    "sentry.api.serializers.models.group.prepare_aliased_query",
+                    side_effect=prepare_aliased_query,
+                ),
+                mock.patch(
+                    "sentry.api.serializers.models.group.send_prepared_queries",
+                    side_effect=send_prepared_queries,
+                ),
+            ):
+                assert serialize_group() == serialized
+            # Preparing queries may hit Postgres, so it stays on the request thread.
+            assert prepare_threads == [threading.get_ident()] * 2
+            # The seen stats and then the unhandled flag are sent from the pool,
+            # bounded by the deadline of the lookups.
+            assert [count for _, count, _ in send_calls] == [1, 1]
+            assert all(thread != threading.get_ident() for thread, _, _ in send_calls)
+            assert all(deadline is not None for _, _, deadline in send_calls)
+
+            collapsed = serialize_group(collapse=["unhandled"])
+            assert "isUnhandled" not in collapsed
+            assert collapsed["count"] == "1"
+
     @freeze_time(before_now(days=1).replace(hour=13, minute=30, second=0, microsecond=0))
     def test_profiling_issue(self) -> None:
         proj = self.create_project()
@@ -4,15 +4,18 @@ from functools import cached_property
 from unittest import mock
 
 from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
 from django.db.models import F
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from sentry import features
-from sentry.api.serializers import serialize
+from sentry.api.serializers import Serializer, serialize
 from sentry.api.serializers.models.project import (
     PROJECT_FEATURES_NOT_USED_ON_FRONTEND,
     UNUSED_ON_FRONTEND_FEATURES,
     DetailedProjectSerializer,
+    ProjectSerializer,
     ProjectSummarySerializer,
     ProjectWithOrganizationSerializer,
     ProjectWithTeamSerializer,
@@ -281,6 +284,29 @@ class ProjectSerializerTest(TestCase):
         result = serialize(self.project, self.user)
         assert result["hasTraceMetrics"] is True
 
+    def test_organizations_loaded_once_for_nested_serializers(self) -> None:
+        other_organization = self.create_organization()
+        project_ids = [
+            self.create_project(organization=organization).id
+            for organization in (self.organization, other_organization)
+        ]
+
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as queries:
+            result = serialize([project_ids, project_ids], self.user, NestedProjectsSerializer())
+
+        assert len(result) == 2
+        organization_queries = [
+            query
+            for query in queries.captured_queries
+            if '"sentry_organization"."id" IN' in query["sql"]
+        ]
+        assert len(organization_queries) == 1
+
+
+class NestedProjectsSerializer(Serializer):
+    def serialize(self, obj, attrs, user, **kwargs):
+        return serialize(list(Project.objects.filter(id__in=obj)), user, ProjectSerializer())
+
 
 class ProjectWithTeamSerializerTest(TestCase):
     def test_simple(self) -> None:
@@ -11,6 +11,7 @@ from sentry.api.event_search import (
     AggregateFilter,
     AggregateKey,
     ParenExpression,
+    SearchBoolean,
     SearchConfig,
     SearchFilter,
     SearchKey,
@@ -18,6 +19,7 @@ from sentry.api.event_search import (
     _RecursiveList,
     add_leading_wildcard,
     add_trailing_wildcard,
+    clear_parse_cache,
     default_config,
     flatten,
     gen_wildcard_value,
@@ -29,6 +31,7 @@ from sentry.exceptions import InvalidSearchQuery
 from sentry.search.events.constants import WILDCARD_OPERATOR_MAP, WILDCARD_UNICODE
 from sentry.search.utils import parse_datetime_string, parse_duration, parse_numeric_value
 from sentry.testutils.helpers.datetime import freeze_time
+from sentry.testutils.helpers.options import override_options
 from sentry.utils import json
 
 fixture_path = "fixtures/search-syntax"
@@ -1395,3 +1398,63 @@ def test_handles_ends_with_wildcard_op_translations(query, expected) -> None:
     assert isinstance(filters[0], SearchFilter)
     actual = filters[0].to_query_string()
     assert actual == expected
+
+
+@override_options({"api.event-search.parse-cache.enabled": True})
+class ParseSearchQueryCacheTest(SimpleTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        clear_parse_cache()
+        self.addCleanup(clear_parse_cache)
+
+    @patch("sentry.api.event_search.SearchVisitor")
+    def test_cache_hit_skips_visitor(self, mock_visitor: MagicMock) -> None:
+        mock_visitor.return_value.visit.return_value = [
+            SearchFilter(SearchKey("user.email"), "=", SearchValue("foo@example.com"))
+        ]
+        first = parse_search_query("user.email:foo@example.com")
+        second = parse_search_query("user.email:foo@example.com")
+        assert first == second
+        assert mock_visitor.call_count == 1
+
+    def test_cache_returns_copies(self) -> None:
+        query = "(a:1 OR b:2) c:3"
+        first = parse_search_query(query)
+        first.append(SearchBoolean.BOOLEAN_AND)
+        assert isinstance(first[0], ParenExpression)
+        first[0].children.append(SearchBoolean.BOOLEAN_OR)  # type: ignore[attr-defined]
+
+        second = parse_search_query(query)
+        assert len(second) == 2
+        assert isinstance(second[0], ParenExpression)
+        assert len(second[0].children) == 3
+        assert isinstance(second[0].children, list)
+
+    @patch("sentry.api.event_search.SearchVisitor")
+    def test_cache_keyed_by_config(self, mock_visitor: MagicMock) -> None:
+        mock_visitor.return_value.visit.return_value = []
+        config = SearchConfig.create_from(default_config, allow_boolean=False)
+        parse_search_query("a:1")
+        parse_search_query("a:1", config=config)
+        parse_search_query("a:1", params={"project_id": [1]})
+        parse_search_query("a:1", params={"project_id": [1]})
+        assert mock_visitor.call_count == 3
+
+    @patch("sentry.api.event_search.SearchVisitor")
+    def test_custom_field_type_not_cached(self, mock_visitor: MagicMock) -> None:
+        mock_visitor.return_value.visit.return_value = []
+        parse_search_query("a:1", get_field_type=lambda key: None)
+        parse_search_query("a:1", get_field_type=lambda key: None)
+        assert mock_visitor.call_count == 2
+
+    def test_relative_dates_not_cached(self) -> None:
+        with freeze_time("2024-01-01T00:00:00"):
+            first = parse_search_query("timestamp:-24h")
+        with freeze_time("2024-01-02T00:00:00"):
+            second = parse_search_query("timestamp:-24h")
+        assert first != second
+
+    def test_invalid_query_not_cached(self) -> None:
+        for _ in range(2):
+            with pytest.raises(InvalidSearchQuery):
+                parse_search_query("transaction.duration:>1111111111w")
@@ -41,6 +41,37 @@ class BulkDeleteQueryTest(TestCase):
         assert not Group.objects.filter(id=group1_2.id).exists()
         assert Group.objects.filter(id=group1_3.id).exists()
 
+    def test_execute_range(self) -> None:
+        now = timezone.now()
+        old_groups = [
+            self.create_group(create_open_period=False, last_seen=now - timedelta(days=2))
+            for _ in range(5)
+        ]
+        new_group = self.create_group(create_open_period=False, last_seen=now)
+
+        q = BulkDeleteQuery(model=Group, dtfield="last_seen", days=1)
+        ranges = list(q.get_id_ranges(2))
+        assert ranges[0][0] == old_groups[0].id // 2 * 2
+        assert ranges[-1][1] == new_group.id + 1
+        assert all(lo % 2 == 0 for lo, _ in ranges)
+        assert all(hi == next_lo for (_, hi), (next_lo, _) in zip(ranges, ranges[1:]))
+
+        lo, hi = ranges[0]
+        first_range_ids = {group.id for group in old_groups if lo <= group.id < hi}
+        assert q.execute_range(lo, hi, chunk_size=1) == len(first_range_ids)
+        assert set(Group.objects.values_list("id", flat=True)) == {
+            group.id for group in old_groups if group.id not in first_range_ids
+        } | {new_group.id}
+
+        assert sum(q.execute_range(lo, hi, chunk_size=1) for lo, hi in ranges) == 5 - len(
+            first_range_ids
+        )
+        assert list(Group.objects.values_list("id", flat=True)) == [new_group.id]
+
+    def test_id_ranges_empty(self) -> None:
+        Group.objects.all().delete()
+        assert list(BulkDeleteQuery(model=Group).get_id_ranges(10)) == []
+
 
 class BulkDeleteQueryIteratorTestCase(TestCase):
     def test_iteration(self) -> None:
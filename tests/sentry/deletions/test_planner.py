@@ -0,0 +1,91 @@
+from sentry import deletions
+from sentry.deletions.defaults.project import ProjectDeletionTask
+from sentry.deletions.planner import (
+    MAX_CHUNK_SIZE,
+    MIN_CHUNK_SIZE,
+    AdaptiveChunkSize,
+    get_progress,
+    plan_relations,
+)
+from sentry.integrations.models.repository_project_path_config import RepositoryProjectPathConfig
+from sentry.models.group import Group
+from sentry.models.groupseen import GroupSeen
+from sentry.models.project import Project
+from sentry.models.projectcodeowners import ProjectCodeOwners
+from sentry.models.projectkey import ProjectKey
+from sentry.sentry_apps.models.servicehook import ServiceHook, ServiceHookProject
+from sentry.testutils.cases import TestCase, TransactionTestCase
+
+
+class PlanRelationsTest(TestCase):
+    def get_stages(self, project: Project) -> dict[type, list[int]]:
+        task = deletions.get(model=Project, query={"id": project.id})
+        assert isinstance(task, ProjectDeletionTask)
+        stages: dict[type, list[int]] = {}
+        for stage in plan_relations(
+            task.manager, task.get_child_relations(project), estimate=False
+        ):
+            for p in stage:
+                stages.setdefault(p.relation.params["model"], []).append(p.stage)
+        return stages
+
+    def test_plan_relations(self) -> None:
+        stages = self.get_stages(self.project)
+
+        # Models with foreign keys between them keep their order.
+        assert stages[ProjectCodeOwners][0] < stages[RepositoryProjectPathConfig][0]
+        assert stages[ServiceHookProject][0] < stages[ServiceHook][0]
+
+        # Independent bulk deletions share a stage.
+        assert stages[GroupSeen] == stages[ProjectCodeOwners]
+
+        # Relations which cascade into their own relations run on their own,
+        # after everything listed before them.
+        group_stage = stages[Group][0]
+        assert all(
+            stage != group_stage for model, s in stages.items() if model is not Group for stage in s
+        )
+        assert group_stage > max(stages[ServiceHook])
+
+        # ProjectKey is listed twice, and the bulk deletion runs after the other.
+        assert stages[ProjectKey][0] < stages[ProjectKey][1]
+
+    def test_get_progress(self) -> None:
+        self.create_group(project=self.project)
+        self.create_group(project=self.project)
+
+        task = deletions.get(model=Project, query={"id": self.project.id})
+        progress = {row["model"]: row for row in get_progress(task, [self.project])}
+        assert progress["Group"]["estimated_rows"] == 2
+        assert progress["GroupSeen"]["estimated_rows"] == 0
+
+
+def test_adaptive_chunk_size() -> None:
+    chunk_size = AdaptiveChunkSize(1000, target_duration=1.0)
+    assert chunk_size.observe(0.1) == 1500
+    assert chunk_size.observe(0.75) == 1500
+    assert chunk_size.observe(2.0) == 750
+
+    for _ in range(20):
+        chunk_size.observe(10.0)
+    assert chunk_size.chunk_size == MIN_CHUNK_SIZE
+
+    for _ in range(50):
+        chunk_size.observe(0.0)
+    assert chunk_size.chunk_size == MAX_CHUNK_SIZE
+
+
+class ConcurrentDeletionTest(TransactionTestCase):
+    def test_delete_project(self) -> None:
+        project = self.create_project()
+        group = self.create_group(project=project)
+        GroupSeen.objects.create(group=group, project=project, user_id=self.user.id)
+        self.create_project_key(project=project)
+
+        with self.options({"deletions.planner.concurrency": 4}):
+            deletions.exec_sync(project)
+
+        assert not Project.objects.filter(id=project.id).exists()
+        assert not Group.objects.filter(id=group.id).exists()
+        assert not GroupSeen.objects.filter(project_id=project.id).exists()
+        assert not ProjectKey.objects.filter(project_id=project.id).exists()
@@ -453,6 +453,85 @@ class RegionOutboxTest(TestCase):
 
             assert last_call_count == 2
 
+    def test_bulk_drain(self) -> None:
+        with outbox_context(flush=False):
+            # Two messages coalesced
+            OrganizationMember(organization_id=10001, id=1).outbox_for_update().save()
+            OrganizationMember(organization_id=10001, id=1).outbox_for_update().save()
+
+            OrganizationMember(organization_id=10001, id=2).outbox_for_update().save()
+            Organization(id=10002).outbox_for_update().save()
+
+        with (
+            patch(
+                "sentry.hybridcloud.models.outbox.process_region_outbox.send"
+            ) as mock_process_region_outbox,
+            self.options(
+                {
+                    "hybrid_cloud.outbox.bulk_drain.enabled": True,
+                    "hybrid_cloud.outbox.bulk_drain.batch_size": 2,
+                }
+            ),
+            self.tasks(),
+        ):
+            enqueue_outbox_jobs(concurrency=1, process_outbox_backfills=False)
+
+        assert RegionOutbox.objects.count() == 0
+        assert [
+            c.kwargs["object_identifier"] for c in mock_process_region_outbox.call_args_list
+        ] == [
+            1,
+            2,
+            10002,
+        ]
+
+    def test_bulk_drain_keeps_progress_on_error(self) -> None:
+        with outbox_context(flush=False):
+            OrganizationMember(organization_id=10001, id=1).outbox_for_update().save()
+            OrganizationMember(organization_id=10001, id=1).outbox_for_update().save()
+            OrganizationMember(organization_id=10001, id=2).outbox_for_update().save()
+            OrganizationMember(organization_id=10001, id=3).outbox_for_update().save()
+
+        def send(**kwargs: Any) -> None:
+            if kwargs["object_identifier"] == 2:
+                raise ValueError("This is just a test mock exception")
+
+        with (
+            patch("sentry.hybridcloud.models.outbox.process_region_outbox.send", side_effect=send),
+            self.options({"hybrid_cloud.outbox.bulk_drain.enabled": True}),
+            self.tasks(),
+            raises(OutboxFlushError),
+        ):
+            enqueue_outbox_jobs(concurrency=1, process_outbox_backfills=False)
+
+        # The messages sent before the failure were removed.
+        assert sorted(RegionOutbox.objects.values_list("object_identifier", flat=True)) == [2, 3]
+
+    def test_prepare_next_from_shards(self) -> None:
+        with outbox_context(flush=False):
+            Organization(id=10001).outbox_for_update().save()
+            Organization(id=10001).outbox_for_update().save()
+            Organization(id=10002).outbox_for_update().save()
+
+        start_time = datetime(2022, 10, 1, 0, tzinfo=timezone.utc)
+        with freeze_time(start_time):
+            shards = RegionOutbox.find_scheduled_shards()
+            assert len(shards) == 2
+
+            outboxes = RegionOutbox.prepare_next_from_shards(list(reversed(shards)))
+            assert [outbox.shard_identifier for outbox in outboxes] == [10002, 10001]
+            assert [outbox.id for outbox in outboxes] == [
+                RegionOutbox.objects.filter(shard_identifier=shard_identifier).first().id
+                for shard_identifier in (10002, 10001)
+            ]
+
+            # Every message of the claimed shards was rescheduled.
+            assert RegionOutbox.find_scheduled_shards() == []
+            assert all(
+                outbox.scheduled_for > start_time and outbox.scheduled_from == start_time
+                for outbox in RegionOutbox.objects.all()
+            )
+
     def test_region_sharding_keys(self) -> None:
         org1 = Factories.create_organization()
         org2 = Factories.create_organization()
@@ -10,6 +10,7 @@ from django.utils import timezone
 from sentry.incidents.grouptype import MetricIssue
 from sentry.incidents.subscription_processor import (
     SubscriptionProcessor,
+    get_detector_last_update,
     store_detector_last_update,
 )
 from sentry.incidents.utils.constants import INCIDENTS_SNUBA_SUBSCRIPTION_TYPE
@@ -22,6 +23,7 @@ from sentry.testutils.helpers.datetime import freeze_time
 from sentry.workflow_engine.models import DataSource, DataSourceDetector, DetectorState
 from sentry.workflow_engine.models.data_condition import Condition, DataCondition
 from sentry.workflow_engine.models.detector import Detector
+from sentry.workflow_engine.processors.data_packet import process_data_packet
 from sentry.workflow_engine.types import DetectorPriorityLevel
 
 EMPTY = object()
@@ -259,3 +261,62 @@ class TestSubscriptionProcessorLastUpdate(ProcessUpdateBaseClass):
             result = processor.process_update(message)
 
         assert result is False
+
+
+class TestSubscriptionProcessorProcessUpdates(ProcessUpdateBaseClass):
+    def process_updates(self, updates) -> None:
+        with (
+            self.feature(["organizations:incidents", "organizations:performance-view"]),
+            self.capture_on_commit_callbacks(execute=True),
+        ):
+            SubscriptionProcessor.process_updates(updates)
+
+    def test_processes_updates_in_order(self) -> None:
+        critical = self.build_subscription_update(
+            self.sub, value=self.critical_threshold + 1, time_delta=timedelta(minutes=-2)
+        )
+        resolve = self.build_subscription_update(
+            self.sub, value=self.resolve_threshold - 1, time_delta=timedelta(minutes=-1)
+        )
+
+        with mock.patch(
+            "sentry.incidents.subscription_processor.process_data_packet",
+            wraps=process_data_packet,
+        ) as mock_process_data_packet:
+            self.process_updates([(resolve, self.sub), (critical, self.sub)])
+
+        assert [
+            packet_call.args[0].packet.values["value"]
+            for packet_call in mock_process_data_packet.call_args_list
+        ] == [self.critical_threshold + 1, self.resolve_threshold - 1]
+        assert self.get_detector_state(self.metric_detector) == DetectorPriorityLevel.OK
+        assert (
+            get_detector_last_update(self.metric_detector, self.project.id) == resolve["timestamp"]
+        )
+
+    def test_skips_processed_updates(self) -> None:
+        stored_timestamp = timezone.now() + timedelta(minutes=10)
+        store_detector_last_update(self.metric_detector, self.project.id, stored_timestamp)
+
+        update = self.build_subscription_update(self.sub, value=self.critical_threshold + 1)
+        self.process_updates([(update, self.sub)])
+
+        assert self.get_detector_state(self.metric_detector) == DetectorPriorityLevel.OK
+        assert get_detector_last_update(self.metric_detector, self.project.id) == stored_timestamp
+
+    def test_bulk_loads(self) -> None:
+        other_detector = self.create_detector_data_source_and_data_conditions()
+        other_sub = QuerySubscription.objects.get(
+            id=int(other_detector.data_sources.get().source_id)
+        )
+        updates = [
+            (self.build_subscription_update(sub, value=self.critical_threshold + 1), sub)
+            for sub in (
+                QuerySubscription.objects.get(id=self.sub.id),
+                QuerySubscription.objects.get(id=other_sub.id),
+            )
+        ]
+        self.process_updates(updates)
+
+        assert self.get_detector_state(self.metric_detector) == DetectorPriorityLevel.HIGH
+        assert self.get_detector_state(other_detector) == DetectorPriorityLevel.HIGH
@@ -0,0 +1,123 @@
+from typing import Any
+
+import pytest
+
+from sentry.issues.ownership.grammar import Matcher, Owner, Rule, dump_schema
+from sentry.issues.ownership.rule_index import (
+    RuleIndex,
+    clear_cache,
+    get_pattern_words,
+    get_rule_index,
+)
+
+OWNER = [Owner("team", "team")]
+
+RULES = [
+    Rule(Matcher("path", "*.js"), OWNER),
+    Rule(Matcher("path", "src/sentry/*"), OWNER),
+    Rule(Matcher("url", "http://google.com/*"), OWNER),
+    Rule(Matcher("tags.foo", "bar"), OWNER),
+    Rule(Matcher("module", "foo.bar"), OWNER),
+    Rule(Matcher("module", "foo bar"), OWNER),
+    Rule(Matcher("codeowners", "/src/components/"), OWNER),
+    Rule(Matcher("codeowners", "frontend/*.ts"), OWNER),
+    Rule(Matcher("codeowners", "*"), OWNER),
+    Rule(Matcher("codeowners", "tests/file\\ with\\ spaces/"), OWNER),
+    Rule(Matcher("codeowners", "/usr/local/src/foo/test.py"), OWNER),
+    Rule(Matcher("codeowners", "/libs/web/views/index/**"), OWNER),
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_rule_index_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_get_pattern_words() -> None:
+    assert get_pattern_words("src/sentry/*") == {"src", "sentry"}
+    assert get_pattern_words("/usr/local/src/foo/test.py") == {
+        "usr",
+        "local",
+        "src",
+        "foo",
+        "test",
+        "py",
+    }
+    # Words next to a wildcard can be part of a longer word of the value.
+    assert get_pattern_words("foo*/ba?/baz") == {"baz"}
+    assert get_pattern_words("**") == set()
+    assert get_pattern_words("Frontend/*.TS") == {"frontend", "ts"}
+    # Patterns which may match other characters than their own aren't indexed.
+    assert get_pattern_words("tests/file\\ with\\ spaces/") == set()
+    assert get_pattern_words("src/[ab]/foo") == set()
+    assert get_pattern_words("src/café/foo") == set()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"request": {"url": "http://google.com/foo"}},
+        {"request": {"url": "http://GOOGLE.com/foo"}},
+        {"tags": [["foo", "bar"]]},
+        {"stacktrace": {"frames": [{"filename": "foo/bar.js"}]}},
+        {"stacktrace": {"frames": [{"filename": "src/sentry/models.py"}]}},
+        {"stacktrace": {"frames": [{"filename": "src\\sentry\\models.py"}]}},
+        {"stacktrace": {"frames": [{"abs_path": "/src/components/button.tsx"}]}},
+        {"stacktrace": {"frames": [{"filename": "frontend/app.ts", "in_app": False}]}},
+        {"stacktrace": {"frames": [{"filename": "tests/file with spaces/a.py"}]}},
+        {"stacktrace": {"frames": [{"abs_path": "/usr/local/src/foo/test.py"}]}},
+        {"stacktrace": {"frames": [{"abs_path": "libs/web/views/index/home.tsx"}]}},
+        {"stacktrace": {"frames": [{"abs_path": "/libs/web/views/café/index/home.tsx"}]}},
+        {"stacktrace": {"frames": [{"module": "foo.bar"}, {"module": "foo bar"}]}},
+        {
+            "platform": "java",
+            "stacktrace": {"frames": [{"module": "com.foo.Bar", "filename": "Bar.java"}]},
+        },
+    ],
+)
+def test_matches_every_rule_test(data: dict[str, Any]) -> None:
+    munged_data = Matcher.munge_if_needed(data)
+    candidates = RuleIndex(RULES).get_candidates(data, munged_data)
+
+    assert [rule for rule in candidates if rule.test(data, munged_data)] == [
+        rule for rule in RULES if rule.test(data, munged_data)
+    ]
+
+
+def test_get_candidates() -> None:
+    index = RuleIndex(RULES)
+    data = {"stacktrace": {"frames": [{"filename": "src/sentry/models.py"}]}}
+    candidates = index.get_candidates(data, Matcher.munge_if_needed(data))
+
+    # Rules without a word to look up, and tag rules, are always candidates.
+    assert candidates == [
+        Rule(Matcher("path", "src/sentry/*"), OWNER),
+        Rule(Matcher("tags.foo", "bar"), OWNER),
+        Rule(Matcher("codeowners", "*"), OWNER),
+        Rule(Matcher("codeowners", "tests/file\\ with\\ spaces/"), OWNER),
+    ]
+
+    # Values that aren't ASCII make every rule of their type a candidate.
+    data = {"stacktrace": {"frames": [{"filename": "src/café.py"}]}}
+    candidates = index.get_candidates(data, Matcher.munge_if_needed(data))
+    assert [rule.matcher.type for rule in candidates].count("codeowners") == 6
+
+
+def test_get_rule_index() -> None:
+    schema = dump_schema(RULES)
+    index = get_rule_index(schema)
+    assert index.rules == RULES
+    assert get_rule_index(dump_schema(RULES)) is index
+    assert get_rule_index(dump_schema(RULES[1:])) is not index
+
+
+def test_get_rule_index_by_revision() -> None:
+    index = get_rule_index(dump_schema(RULES), revision=("ProjectOwnership", 1))
+    assert index.rules == RULES
+    # The schema isn't read again while the revision is the same
+    assert get_rule_index({}, revision=("ProjectOwnership", 1)) is index
+    assert get_rule_index(dump_schema(RULES), revision=("ProjectOwnership", 2)) is not index
+    assert get_rule_index(dump_schema(RULES)) is not index
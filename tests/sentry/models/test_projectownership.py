@@ -1,12 +1,14 @@
 from unittest.mock import MagicMock, patch
 
 from sentry.issues.ownership.grammar import Matcher, Owner, Rule, dump_schema, resolve_actors
+from sentry.issues.ownership.rule_index import get_rule_index
 from sentry.models.groupassignee import GroupAssignee
 from sentry.models.groupowner import GroupOwner, GroupOwnerType, OwnerRuleType
 from sentry.models.projectownership import ProjectOwnership
 from sentry.models.repository import Repository
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers.datetime import before_now
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.silo import assume_test_silo_mode_of
 from sentry.testutils.skips import requires_snuba
 from sentry.types.actor import Actor, ActorType
@@ -196,6 +198,30 @@ class ProjectOwnershipTestCase(TestCase):
             ),
         )
 
+    def test_get_owners_rule_index_follows_schema_changes(self) -> None:
+        rule_a = Rule(Matcher("path", "*.py"), [Owner("team", self.team.slug)])
+        rule_b = Rule(Matcher("path", "*.py"), [Owner("team", self.team2.slug)])
+        ownership = ProjectOwnership.objects.create(
+            project_id=self.project2.id, schema=dump_schema([rule_a]), fallthrough=True
+        )
+        data = {"stacktrace": {"frames": [{"filename": "api/foo.py"}]}}
+
+        with (
+            override_options({"ownership.rule-index.enabled": True}),
+            patch(
+                "sentry.models.projectownership.get_rule_index", side_effect=get_rule_index
+            ) as mock_get_rule_index,
+        ):
+            assert ProjectOwnership.get_owners(self.project2.id, data)[1] == [rule_a]
+            # The index is cached by the revision of the schema, not its contents
+            revision = mock_get_rule_index.call_args.kwargs["revision"]
+            assert revision == (("ProjectOwnership", ownership.id, ownership.last_updated),)
+
+            ownership.schema = dump_schema([rule_b])
+            ownership.save()
+            assert ProjectOwnership.get_owners(self.project2.id, data)[1] == [rule_b]
+            assert mock_get_rule_index.call_args.kwargs["revision"] != revision
+
     def test_get_issue_owners_no_codeowners_or_issueowners(self) -> None:
         assert ProjectOwnership.get_issue_owners(self.project.id, {}) == []
 
@@ -1,9 +1,11 @@
-from datetime import UTC, timedelta
+from datetime import UTC, datetime, timedelta
 from unittest import mock
 from zoneinfo import ZoneInfo
 
 import pytest
 from arroyo.backends.kafka import KafkaPayload
+from django.conf import settings
+from django.test import RequestFactory
 from django.utils import timezone
 from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import MarkMissing
 
@@ -13,6 +15,14 @@ from sentry.monitors.clock_tasks.check_missed import (
     mark_environment_missing,
 )
 from sentry.monitors.clock_tasks.producer import MONITORS_CLOCK_TASKS_CODEC
+from sentry.monitors.due_queue import (
+    DUE_LEASE,
+    DUE_QUEUE_KEY,
+    IGNORED_RECHECK_INTERVAL,
+    pop_due_monitor_environments,
+    schedule_monitor_environments,
+)
+from sentry.monitors.logic.monitor_environment import update_monitor_environment
 from sentry.monitors.models import (
     CheckInStatus,
     Monitor,
@@ -21,7 +31,10 @@ from sentry.monitors.models import (
     MonitorStatus,
     ScheduleType,
 )
+from sentry.monitors.validators import MonitorValidator
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
+from sentry.utils import redis
 
 
 class MonitorClockTasksCheckMissingTest(TestCase):
@@ -749,3 +762,119 @@ class MonitorClockTasksCheckMissingTest(TestCase):
         assert not MonitorCheckIn.objects.filter(
             monitor_environment=monitor_environment.id, status=CheckInStatus.MISSED
         ).exists()
+
+
+@override_options({"crons.due_queue.write": True, "crons.due_queue.read": True})
+class MonitorClockTasksCheckMissingDueQueueTest(TestCase):
+    def create_monitor_environment(self, ts, slug, **kwargs):
+        monitor = Monitor.objects.create(
+            organization_id=self.organization.id,
+            project_id=self.project.id,
+            slug=slug,
+            config={
+                "schedule_type": ScheduleType.CRONTAB,
+                "schedule": "* * * * *",
+                "max_runtime": None,
+                "checkin_margin": None,
+            },
+            **kwargs,
+        )
+        monitor_environment = MonitorEnvironment.objects.create(
+            monitor=monitor,
+            environment_id=self.environment.id,
+            last_checkin=ts - timedelta(minutes=2),
+            next_checkin=ts - timedelta(minutes=1),
+            next_checkin_latest=ts,
+            status=MonitorStatus.OK,
+        )
+        schedule_monitor_environments([(monitor_environment.id, ts)])
+        return monitor_environment
+
+    def get_due_ts(self, monitor_environment):
+        score = redis.redis_clusters.get(settings.SENTRY_MONITORS_REDIS_CLUSTER).zscore(
+            DUE_QUEUE_KEY, str(monitor_environment.id)
+        )
+        return None if score is None else datetime.fromtimestamp(score, UTC)
+
+    @mock.patch("sentry.monitors.clock_tasks.check_missed.produce_task")
+    def test_missing_checkin(self, mock_produce_task: mock.MagicMock) -> None:
+        ts = timezone.now().replace(second=0, microsecond=0)
+        monitor_environment = self.create_monitor_environment(ts, "my-monitor")
+
+        dispatch_check_missing(ts - timedelta(minutes=1))
+        assert mock_produce_task.call_count == 0
+
+        dispatch_check_missing(ts)
+        assert mock_produce_task.call_count == 1
+        message = MONITORS_CLOCK_TASKS_CODEC.decode(mock_produce_task.mock_calls[0].args[0].value)
+        assert message["monitor_environment_id"] == monitor_environment.id
+
+        # The monitor environment is leased until the missed check-in is handled
+        assert self.get_due_ts(monitor_environment) == ts + DUE_LEASE
+        dispatch_check_missing(ts + timedelta(minutes=1))
+        assert mock_produce_task.call_count == 1
+
+        with self.capture_on_commit_callbacks(execute=True):
+            mark_environment_missing(monitor_environment.id, ts)
+
+        # And is then due at its next expected check-in
+        monitor_environment.refresh_from_db()
+        assert monitor_environment.status == MonitorStatus.ERROR
+        assert self.get_due_ts(monitor_environment) == monitor_environment.next_checkin_latest
+
+    def test_not_missing_rescheduled(self) -> None:
+        ts = timezone.now().replace(second=0, microsecond=0)
+        monitor_environment = self.create_monitor_environment(ts, "my-monitor")
+        disabled_environment = self.create_monitor_environment(
+            ts, "disabled-monitor", status=ObjectStatus.DISABLED
+        )
+        deleted_environment = self.create_monitor_environment(ts, "deleted-monitor")
+        (due_ids,) = pop_due_monitor_environments(ts, 10)
+        assert sorted(due_ids) == sorted(
+            [monitor_environment.id, disabled_environment.id, deleted_environment.id]
+        )
+
+        # A check-in arrived before the missed check-in was handled
+        with self.capture_on_commit_callbacks(execute=True):
+            update_monitor_environment(monitor_environment, ts, ts + timedelta(minutes=1))
+        deleted_environment_id = deleted_environment.id
+        deleted_environment.delete()
+
+        mark_environment_missing(monitor_environment.id, ts)
+        mark_environment_missing(disabled_environment.id, ts)
+        mark_environment_missing(deleted_environment_id, ts)
+
+        monitor_environment.refresh_from_db()
+        assert monitor_environment.status == MonitorStatus.OK
+        assert self.get_due_ts(monitor_environment) == monitor_environment.next_checkin_latest
+        assert self.get_due_ts(disabled_environment) == ts + IGNORED_RECHECK_INTERVAL
+        assert self.get_due_ts(deleted_environment) is None
+
+    def test_enabled_monitor_rescheduled(self) -> None:
+        ts = timezone.now().replace(second=0, microsecond=0)
+        monitor_environment = self.create_monitor_environment(
+            ts, "disabled-monitor", status=ObjectStatus.DISABLED
+        )
+        assert list(pop_due_monitor_environments(ts, 10)) == [[monitor_environment.id]]
+        mark_environment_missing(monitor_environment.id, ts)
+        assert self.get_due_ts(monitor_environment) == ts + IGNORED_RECHECK_INTERVAL
+
+        request = RequestFactory().get("/")
+        request.user = self.user
+        validator = MonitorValidator(
+            instance=monitor_environment.monitor,
+            data={"status": "active"},
+            partial=True,
+            context={
+                "organization": self.organization,
+                "access": mock.MagicMock(),
+                "request": request,
+            },
+        )
+        assert validator.is_valid()
+        with self.capture_on_commit_callbacks(execute=True):
+            validator.save()
+
+        # Enabling the monitor puts its environments back at their next
+        # expected check-in
+        assert self.get_due_ts(monitor_environment) == ts
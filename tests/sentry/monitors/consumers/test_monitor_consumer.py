@@ -19,7 +19,13 @@ from sentry.constants import DataCategory, ObjectStatus
 from sentry.db.models import BoundedPositiveIntegerField
 from sentry.models.environment import Environment
 from sentry.monitors.constants import TIMEOUT, PermitCheckInStatus
-from sentry.monitors.consumers.monitor_consumer import StoreMonitorCheckInStrategyFactory
+from sentry.monitors.consumers.monitor_consumer import (
+    CheckinGroupContext,
+    StoreMonitorCheckInStrategyFactory,
+    _ensure_monitor_with_config,
+    process_checkin_group,
+)
+from sentry.monitors.logic.mark_ok import mark_ok
 from sentry.monitors.models import (
     CheckInStatus,
     Monitor,
@@ -1439,3 +1445,119 @@ class MonitorConsumerTest(TestCase):
 
         check_accept_monitor_checkin.assert_called_with(self.project.id, monitor.slug)
         assign_seat.assert_called_with(DataCategory.MONITOR_SEAT, monitor)
+
+    def build_checkin_item(self, monitor_slug: str, ts: datetime, **overrides: Any) -> CheckinItem:
+        payload = {
+            "monitor_slug": monitor_slug,
+            "status": "ok",
+            "check_in_id": uuid.uuid4().hex,
+            "environment": "production",
+        }
+        payload.update(overrides)
+        return CheckinItem(
+            ts=ts,
+            partition=0,
+            message={
+                "message_type": "check_in",
+                "start_time": ts.timestamp(),
+                "project_id": self.project.id,
+                "payload": json.dumps(payload).encode(),
+                "sdk": "test/1.0",
+                "retention_days": 90,
+            },
+            payload=payload,
+        )
+
+    @override_options({"crons.bulk_checkin_group_min_size": 2})
+    def test_bulk_checkin_group(self) -> None:
+        monitor = self._create_monitor(slug="my-monitor")
+        guid = uuid.uuid4().hex
+        now = datetime.now().replace(microsecond=0)
+        items = [
+            self.build_checkin_item(
+                monitor.slug, now + timedelta(seconds=i), check_in_id=guid, status="in_progress"
+            )
+            for i in range(3)
+        ]
+        items.append(
+            self.build_checkin_item(monitor.slug, now + timedelta(seconds=3), check_in_id=guid)
+        )
+        items.append(self.build_checkin_item(monitor.slug, now + timedelta(minutes=1)))
+
+        with (
+            mock.patch(
+                "sentry.monitors.consumers.monitor_consumer._ensure_monitor_with_config",
+                wraps=_ensure_monitor_with_config,
+            ) as ensure_monitor,
+            mock.patch(
+                "sentry.monitors.consumers.monitor_consumer.mark_ok",
+                wraps=mark_ok,
+            ) as mock_mark_ok,
+        ):
+            process_checkin_group(items)
+
+        # The monitor is only resolved once for the whole group
+        assert ensure_monitor.call_count == 1
+        # The in-progress updates are superseded by the OK check-in
+        assert [call.args[0].guid.hex for call in mock_mark_ok.call_args_list] == [
+            guid,
+            items[-1].payload["check_in_id"],
+        ]
+
+        checkin = MonitorCheckIn.objects.get(guid=guid)
+        assert checkin.status == CheckInStatus.OK
+        last_checkin = MonitorCheckIn.objects.get(guid=items[-1].payload["check_in_id"])
+        assert last_checkin.status == CheckInStatus.OK
+
+        monitor_environment = MonitorEnvironment.objects.get(id=checkin.monitor_environment_id)
+        assert monitor_environment.status == MonitorStatus.OK
+        assert monitor_environment.last_checkin == last_checkin.date_added
+        assert monitor_environment.next_checkin == monitor.get_next_expected_checkin(
+            last_checkin.date_added
+        )
+
+    @override_options({"crons.bulk_checkin_group_min_size": 2})
+    def test_bulk_checkin_group_in_progress(self) -> None:
+        monitor = self._create_monitor(slug="my-monitor")
+        guid = uuid.uuid4().hex
+        now = datetime.now().replace(microsecond=0)
+        items = [
+            self.build_checkin_item(
+                monitor.slug, now + timedelta(minutes=i), check_in_id=guid, status="in_progress"
+            )
+            for i in range(2)
+        ]
+        process_checkin_group(items)
+
+        checkin = MonitorCheckIn.objects.get(guid=guid)
+        assert checkin.status == CheckInStatus.IN_PROGRESS
+
+        # The last in-progress update is flushed at the end of the group
+        monitor_environment = MonitorEnvironment.objects.get(id=checkin.monitor_environment_id)
+        assert monitor_environment.last_checkin == checkin.date_added
+        assert monitor_environment.next_checkin == monitor.get_next_expected_checkin(
+            checkin.date_updated
+        )
+
+    def test_checkin_group_context_refreshes_environment(self) -> None:
+        monitor = self._create_monitor(slug="my-monitor")
+        group_context = CheckinGroupContext()
+        group_monitor, _ = group_context.ensure_monitor_with_config(
+            self.project, monitor.slug, None
+        )
+        assert group_monitor is not None
+        monitor_environment = group_context.ensure_environment(
+            self.project, group_monitor, "production"
+        )
+
+        # Marked as failed by a clock task and muted by a user in the meantime
+        MonitorEnvironment.objects.filter(id=monitor_environment.id).update(
+            status=MonitorStatus.ERROR, is_muted=True
+        )
+
+        assert (
+            group_context.ensure_environment(self.project, group_monitor, "production")
+            is monitor_environment
+        )
+        assert monitor_environment.status == MonitorStatus.ERROR
+        assert monitor_environment.is_muted
@@ -0,0 +1,72 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from sentry.monitors.due_queue import (
+    DUE_LEASE,
+    backfill_due_queue,
+    pop_due_monitor_environments,
+    schedule_monitor_environments,
+)
+from sentry.monitors.models import Monitor, MonitorEnvironment, ScheduleType
+from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
+
+
+@override_options({"crons.due_queue.write": True})
+class DueQueueTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ts = timezone.now().replace(second=0, microsecond=0)
+
+    def pop(self, ts, page_size=10):
+        return list(pop_due_monitor_environments(ts, page_size))
+
+    def test_pop_due(self) -> None:
+        schedule_monitor_environments(
+            [
+                (1, self.ts - timedelta(minutes=1)),
+                (2, self.ts),
+                (3, self.ts + timedelta(minutes=1)),
+                (4, self.ts - timedelta(minutes=2)),
+            ]
+        )
+
+        assert self.pop(self.ts, page_size=2) == [[4, 1], [2]]
+        # Popped monitor environments are leased
+        assert self.pop(self.ts + timedelta(minutes=1)) == [[3]]
+        assert self.pop(self.ts + DUE_LEASE) == [[1, 2, 4]]
+
+    def test_reschedule(self) -> None:
+        schedule_monitor_environments([(1, self.ts), (2, self.ts)])
+        assert self.pop(self.ts) == [[1, 2]]
+
+        # Handling a missed check-in reschedules the monitor environment
+        schedule_monitor_environments([(1, self.ts + timedelta(minutes=1)), (2, None)])
+        assert self.pop(self.ts + timedelta(minutes=1)) == [[1]]
+        assert self.pop(self.ts + DUE_LEASE * 2) == [[1]]
+
+    def test_writes_disabled(self) -> None:
+        with override_options({"crons.due_queue.write": False}):
+            schedule_monitor_environments([(1, self.ts)])
+        assert self.pop(self.ts) == []
+
+    def test_backfill(self) -> None:
+        monitor = Monitor.objects.create(
+            organization_id=self.organization.id,
+            project_id=self.project.id,
+            config={"schedule": "* * * * *", "schedule_type": ScheduleType.CRONTAB},
+        )
+        monitor_environment = MonitorEnvironment.objects.create(
+            monitor=monitor,
+            environment_id=self.environment.id,
+            next_checkin_latest=self.ts,
+        )
+        MonitorEnvironment.objects.create(
+            monitor=monitor,
+            environment_id=self.create_environment().id,
+            next_checkin_latest=None,
+        )
+
+        backfill_due_queue()
+        assert self.pop(self.ts) == [[monitor_environment.id]]
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from sentry.lang.native.symbolicator import FrameOrder
+from sentry.profiles import symbolication_cache
+from sentry.profiles.symbolication_cache import SymbolicationCacheLookup
+from sentry.profiles.task import run_symbolicate_with_cache
+from sentry.testutils.pytest.fixtures import django_db_all
+
+DEBUG_ID = "f9f85c3c-1a22-374c-b78c-b494f6a8f9f3"
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache():
+    symbolication_cache.clear_local_cache()
+    yield
+    symbolication_cache.clear_local_cache()
+
+
+def make_modules(image_addr: int) -> list[dict[str, Any]]:
+    return [
+        {"type": "macho", "debug_id": DEBUG_ID, "image_addr": hex(image_addr), "image_size": 4096}
+    ]
+
+
+def fake_symbolicate(frames: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    symbolicated = []
+    for i, frame in enumerate(frames):
+        status = "symbolicated" if frame["instruction_addr"] != "0x9999" else "unknown_image"
+        symbolicated.append(
+            {
+                "instruction_addr": frame["instruction_addr"],
+                "function": "function",
+                "status": status,
+                "original_index": i,
+            }
+        )
+    return symbolicated
+
+
+def test_lookup() -> None:
+    stacktraces = [
+        {
+            "frames": [
+                {"instruction_addr": "0x1010"},
+                {"instruction_addr": "0x1020"},
+                {"instruction_addr": "0x1020"},
+                {"instruction_addr": "0x9999"},
+            ]
+        }
+    ]
+    lookup = SymbolicationCacheLookup(1, make_modules(0x1000), stacktraces)
+    assert len(lookup.keys) == 2
+
+    missing_frames = lookup.get_missing_frames({})
+    # Repeated frames are only sent once, and the address adjustment is explicit.
+    assert missing_frames == [
+        {"instruction_addr": "0x1010", "adjust_instruction_addr": False},
+        {"instruction_addr": "0x1020", "adjust_instruction_addr": True},
+        {"instruction_addr": "0x9999", "adjust_instruction_addr": True},
+    ]
+
+    result, to_cache = lookup.merge({}, fake_symbolicate(missing_frames))
+    assert [(f["instruction_addr"], f["original_index"]) for f in result[0]["frames"]] == [
+        ("0x1010", 0),
+        ("0x1020", 1),
+        ("0x1020", 2),
+        ("0x9999", 3),
+    ]
+    # Frames outside any image can't be cached.
+    assert len(to_cache) == 2
+
+    # The cached frames are rebased onto wherever the image was loaded.
+    stacktraces = [{"frames": [{"instruction_addr": "0x5010"}, {"instruction_addr": "0x5030"}]}]
+    lookup = SymbolicationCacheLookup(1, make_modules(0x5000), stacktraces)
+    assert lookup.get_missing_frames(to_cache) == [
+        {"instruction_addr": "0x5030", "adjust_instruction_addr": True}
+    ]
+
+    # Other projects don't share the cache.
+    lookup = SymbolicationCacheLookup(2, make_modules(0x5000), stacktraces)
+    assert not lookup.keys & set(to_cache)
+
+
+@django_db_all
+def test_run_symbolicate_with_cache(default_project) -> None:
+    def run_symbolicate(project, profile, modules, stacktraces, frame_order, platform):
+        return modules, [{"frames": fake_symbolicate(stacktraces[0]["frames"])}], True
+
+    profile: dict[str, Any] = {"event_id": "a" * 32}
+    stacktraces = [{"frames": [{"instruction_addr": "0x1010"}, {"instruction_addr": "0x1020"}]}]
+
+    with mock.patch(
+        "sentry.profiles.task.run_symbolicate", side_effect=run_symbolicate
+    ) as mock_run_symbolicate:
+        _, result, success = run_symbolicate_with_cache(
+            default_project,
+            profile,
+            make_modules(0x1000),
+            stacktraces,
+            FrameOrder.callee_first,
+            "cocoa",
+        )
+        assert success
+        assert mock_run_symbolicate.call_count == 1
+
+        _, cached_result, success = run_symbolicate_with_cache(
+            default_project,
+            profile,
+            make_modules(0x1000),
+            stacktraces,
+            FrameOrder.callee_first,
+            "cocoa",
+        )
+        assert success
+        # Every frame was found in the cache, so symbolicator wasn't called again.
+        assert mock_run_symbolicate.call_count == 1
+        assert cached_result == result
@@ -222,6 +222,15 @@ def sample_v1_profile_without_transaction_timestamps(sample_v1_profile):
     return sample_v1_profile
 
 
+@pytest.fixture
+def sample_v1_profile_with_unsorted_timestamps(sample_v1_profile_without_transaction_timestamps):
+    profile = sample_v1_profile_without_transaction_timestamps
+    # timestamps of different lengths, so they don't sort the same as strings
+    profile["profile"]["samples"][0]["elapsed_since_start_ns"] = "9500500"
+    profile["profile"]["samples"].reverse()
+    return profile
+
+
 def generate_sample_v2_profile():
     return json.loads(
         """{
@@ -540,6 +549,7 @@ def test_decode_signature(project, android_profile) -> None:
         ("sample_v2_profile", 3000),
         ("android_profile", 2020),
         ("sample_v1_profile_without_transaction_timestamps", 25),
+        ("sample_v1_profile_with_unsorted_timestamps", 26),
         ("sample_v2_profile_long", 66000),
         ("sample_v2_profile_samples_not_sorted", 66000),
     ],
@@ -21,7 +21,12 @@ from sentry.models.dynamicsampling import CustomDynamicSamplingRule
 from sentry.models.projectkey import ProjectKey
 from sentry.models.projectteam import ProjectTeam
 from sentry.models.transaction_threshold import TransactionMetric
-from sentry.relay.config import ProjectConfig, TransactionNameRule, get_project_config
+from sentry.relay.config import (
+    ProjectConfig,
+    TransactionNameRule,
+    get_project_config,
+    update_project_config_sections,
+)
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.factories import Factories
 from sentry.testutils.helpers import Feature
@@ -97,6 +102,40 @@ def _validate_project_config(config):
     assert normalize_project_config(config) == config
 
 
+@django_db_all
+@region_silo_test
+def test_project_config_revision_is_content_based(default_project) -> None:
+    keys = ProjectKey.objects.filter(project=default_project)
+    first = get_project_config(default_project, project_keys=keys).to_dict()
+    second = get_project_config(default_project, project_keys=keys).to_dict()
+    assert first["rev"] == second["rev"]
+
+    default_project.update_option("sentry:blacklisted_ips", ["127.0.0.1"])
+    third = get_project_config(default_project, project_keys=keys).to_dict()
+    assert third["rev"] != first["rev"]
+
+
+@django_db_all
+@region_silo_test
+def test_update_project_config_sections(default_project) -> None:
+    keys = ProjectKey.objects.filter(project=default_project)
+    cached = get_project_config(default_project, project_keys=keys).to_dict()
+    assert "filterSettings" in cached["config"]
+
+    default_project.update_option("sentry:blacklisted_ips", ["127.0.0.1"])
+    updated = update_project_config_sections(default_project, cached, ["filters"], keys)
+    assert updated is not None
+    assert updated["config"]["filterSettings"]["clientIps"] == {"blacklistedIps": ["127.0.0.1"]}
+    assert updated["rev"] != cached["rev"]
+    # The cached config is left untouched
+    assert "clientIps" not in cached["config"]["filterSettings"]
+
+    full = get_project_config(default_project, project_keys=keys).to_dict()
+    assert updated["rev"] == full["rev"]
+
+    assert update_project_config_sections(default_project, {"disabled": True}, ["filters"]) is None
+
+
 @django_db_all
 @region_silo_test
 def test_get_project_config_non_visible(default_project) -> None:
@@ -54,3 +54,19 @@ def test_write_delete() -> None:
     cache.delete_many([dsn])
     assert cache.get(dsn) is None
     assert cache.get_rev(dsn) is None
+
+
+@django_db_all
+def test_get_many() -> None:
+    cache = redis.RedisProjectConfigCache()
+
+    value1 = {"my-value": "foo"}
+    value2 = {"my-value": "bar"}
+    cache.set_many({"fake-dsn-1": value1, "fake-dsn-2": value2})
+
+    assert cache.get_many(["fake-dsn-1", "fake-dsn-2", "fake-dsn-3"]) == {
+        "fake-dsn-1": value1,
+        "fake-dsn-2": value2,
+        "fake-dsn-3": None,
+    }
+    assert cache.get_many([]) == {}
@@ -46,6 +46,27 @@ def test_split_debounce_lifecycle() -> None:
     assert not cache.is_debounced(**kwargs)
 
 
+def test_sections() -> None:
+    cache = RedisProjectConfigDebounceCache()
+    kwargs = {
+        "public_key": None,
+        "project_id": 1,
+        "organization_id": None,
+    }
+
+    cache.debounce(**kwargs, sections=("dynamic_sampling",))
+    assert cache.is_debounced(**kwargs, sections=("dynamic_sampling",))
+    assert not cache.is_debounced(**kwargs, sections=("metric_extraction",))
+    assert not cache.is_debounced(**kwargs)
+
+    cache.debounce(**kwargs)
+    assert cache.is_debounced(**kwargs, sections=("metric_extraction",))
+
+    cache.mark_task_done(**kwargs)
+    cache.mark_task_done(**kwargs, sections=("dynamic_sampling",))
+    assert not cache.is_debounced(**kwargs, sections=("dynamic_sampling",))
+
+
 def test_default_prefix() -> None:
     cache = RedisProjectConfigDebounceCache()
     kwargs = {
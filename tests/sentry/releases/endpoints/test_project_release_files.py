@@ -2,6 +2,8 @@ import uuid
 
 from django.core.files.base import ContentFile
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connections, router
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from sentry.models.distribution import Distribution
@@ -42,6 +44,48 @@ class ReleaseFilesListTest(APITestCase):
         assert len(response.data) == 1
         assert response.data[0]["id"] == str(releasefile.id)
 
+    def test_query_count(self) -> None:
+        project = self.project
+        release = Release.objects.create(organization_id=project.organization_id, version="1")
+        release.add_project(project)
+        url = reverse(
+            "sentry-api-0-project-release-files",
+            kwargs={
+                "organization_id_or_slug": project.organization.slug,
+                "project_id_or_slug": project.slug,
+                "version": release.version,
+            },
+        )
+        self.login_as(user=self.user)
+
+        def create_release_files(count):
+            for _ in range(count):
+                name = uuid.uuid4().hex
+                ReleaseFile.objects.create(
+                    organization_id=project.organization_id,
+                    release_id=release.id,
+                    file=File.objects.create(name=name, type="release.file"),
+                    name=name,
+                    dist_id=release.add_dist(uuid.uuid4().hex).id,
+                )
+
+        def count_queries():
+            with CaptureQueriesContext(connections[router.db_for_read(ReleaseFile)]) as queries:
+                response = self.client.get(url)
+            assert response.status_code == 200, response.content
+            return len(response.data), len(queries)
+
+        create_release_files(2)
+        num_files, baseline = count_queries()
+        assert num_files == 2
+
+        # Files and dists are loaded in bulk, the query count does not grow with the
+        # number of release files.
+        create_release_files(8)
+        num_files, num_queries = count_queries()
+        assert num_files == 10
+        assert num_queries == baseline
+
     def test_with_archive(self) -> None:
         project = self.project
         release = self.release
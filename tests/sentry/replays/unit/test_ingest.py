@@ -5,6 +5,7 @@ import pytest
 from sentry.replays.usecases.ingest import (
     Event,
     extract_trace_id,
+    iter_recording_data,
     pack_replay_video,
     parse_replay_events,
     process_recording_event,
@@ -12,6 +13,7 @@ from sentry.replays.usecases.ingest import (
 from sentry.replays.usecases.ingest.event_parser import ParsedEventMeta
 from sentry.replays.usecases.pack import unpack
 from sentry.testutils.pytest.fixtures import django_db_all
+from sentry.utils import json
 
 
 @django_db_all
@@ -137,6 +139,64 @@ def test_parse_replay_events_invalid_json() -> None:
     assert result is None
 
 
+def test_iter_recording_data() -> None:
+    payload = json.dumps(
+        [
+            {"type": 2, "data": {"node": {"id": 1}}, "timestamp": 1},
+            {"type": 3, "data": {"source": 0}, "timestamp": 2},
+            {"type": 5, "data": {"tag": "breadcrumb", "payload": {"category": "ui.click"}}},
+            {"type": 4, "data": {"href": "https://sentry.io"}, "timestamp": 3},
+        ]
+    ).encode()
+
+    assert list(iter_recording_data(payload)) == [
+        {"type": 5, "data": {"tag": "breadcrumb", "payload": {"category": "ui.click"}}}
+    ]
+
+
+def test_iter_recording_data_unknown_event() -> None:
+    """Events the typed decoder does not know are decoded as plain JSON."""
+    payload = b'[{"type": 7, "data": {"tag": "unknown"}}, {"type": 5, "data": null}]'
+    assert list(iter_recording_data(payload)) == [{"type": 7, "data": {"tag": "unknown"}}]
+
+
+def test_parse_replay_events_streaming() -> None:
+    payload = json.dumps(
+        [
+            {"type": 3, "data": {"source": 0}, "timestamp": 1},
+            {
+                "type": 5,
+                "data": {
+                    "tag": "breadcrumb",
+                    "payload": {
+                        "category": "navigation",
+                        "timestamp": 1.0,
+                        "data": {"from": "/", "to": "/issues/"},
+                    },
+                },
+            },
+        ]
+    ).encode()
+    message: Event = {
+        "context": {
+            "key_id": 1,
+            "org_id": 1,
+            "project_id": 1,
+            "received": 1,
+            "replay_id": "1",
+            "retention_days": 1,
+            "segment_id": 1,
+            "should_publish_replay_event": False,
+        },
+        "payload": payload,
+        "payload_compressed": b"",
+        "replay_event": None,
+        "replay_video": None,
+    }
+
+    assert parse_replay_events(message, True, True) == parse_replay_events(message, True)
+
+
 def test_pack_replay_video() -> None:
     result = pack_replay_video(b"hello", b"world")
     video, rrweb = unpack(zlib.decompress(result))
@@ -0,0 +1,56 @@
+import threading
+import time
+from unittest import mock
+
+from sentry.replays.lib.storage import RecordingSegmentStorageMeta
+from sentry.replays.usecases.reader import iter_segment_data
+from sentry.testutils.helpers.options import override_options
+
+
+def make_segments(count: int) -> list[RecordingSegmentStorageMeta]:
+    return [
+        RecordingSegmentStorageMeta(
+            project_id=1,
+            replay_id="b58a67446c914f44a4e329763420047b",
+            segment_id=i,
+            retention_days=30,
+        )
+        for i in range(count)
+    ]
+
+
+def test_iter_segment_data_ordered() -> None:
+    """Segments are yielded in order, even when later segments arrive first."""
+
+    def download(segment):
+        time.sleep((5 - segment.segment_id) * 0.01)
+        if segment.segment_id == 2:
+            return None
+        return None, memoryview(b"[%d]" % segment.segment_id)
+
+    with mock.patch("sentry.replays.usecases.reader._download_segment", side_effect=download):
+        results = [(i, bytes(data)) for i, data in iter_segment_data(make_segments(5))]
+
+    assert results == [(0, b"[0]"), (1, b"[1]"), (2, b"[]"), (3, b"[3]"), (4, b"[4]")]
+
+
+def test_iter_segment_data_bounded() -> None:
+    lock = threading.Lock()
+    downloaded: list[int] = []
+
+    def download(segment):
+        with lock:
+            downloaded.append(segment.segment_id)
+        return None, memoryview(b"[]")
+
+    with (
+        override_options({"replay.storage.download-concurrency": 2}),
+        mock.patch("sentry.replays.usecases.reader._download_segment", side_effect=download),
+    ):
+        segment_data = iter_segment_data(make_segments(10))
+        assert next(segment_data)[0] == 0
+        segment_data.close()
+
+    # Nothing past the in-flight window is downloaded once the consumer stops reading.
+    assert 0 in downloaded
+    assert set(downloaded) <= {0, 1, 2}
@@ -26,3 +26,11 @@ def test_unpack_rrweb_video() -> None:
     x = b"\x00" * 1_000_000
     y = b"\xff" * 1_000_000
     assert unpack(pack(x, y)) == (y, x)
+
+
+def test_unpack_zero_copy() -> None:
+    packed = memoryview(pack(b"hello", b"world"))
+    video, rrweb = unpack(packed)
+    assert video is not None
+    assert video.obj is packed.obj
+    assert rrweb.obj is packed.obj
@@ -0,0 +1,182 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from django.utils import timezone
+
+from sentry.rules.conditions.event_frequency import (
+    EventFrequencyCondition,
+    EventUniqueUserFrequencyCondition,
+)
+from sentry.rules.conditions.frequency_counters import (
+    BUCKET_SIZE,
+    RETENTION,
+    CounterType,
+    get_counts,
+    record_event,
+)
+from sentry.tasks.merge import merge_groups
+from sentry.testutils.cases import RuleTestCase
+from sentry.testutils.helpers.datetime import freeze_time
+from sentry.testutils.helpers.options import override_options
+
+
+@freeze_time()
+class FrequencyCountersTest(RuleTestCase):
+    rule_cls = EventFrequencyCondition
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = timezone.now()
+        self.group_id = self.group.id
+        self.environment_id = self.environment.id
+
+    def record_at(self, offset: timedelta, user: str | None = None) -> None:
+        with freeze_time(self.now + offset):
+            record_event(self.group_id, self.environment_id, timezone.now(), user)
+
+    def test_counts(self) -> None:
+        self.record_at(timedelta(0), "a")
+        self.record_at(timedelta(minutes=1), "b")
+        self.record_at(timedelta(minutes=2), "a")
+
+        with freeze_time(self.now + timedelta(minutes=10)):
+            end = timezone.now()
+            start = end - timedelta(minutes=10)
+            assert get_counts(
+                CounterType.EVENTS, [self.group_id], self.environment_id, start, end
+            ) == {self.group_id: 3}
+            assert get_counts(CounterType.USERS, [self.group_id], None, start, end) == {
+                self.group_id: 2
+            }
+            # Other environments are not counted
+            assert get_counts(
+                CounterType.EVENTS, [self.group_id], self.environment_id + 1, start, end
+            ) == {self.group_id: 0}
+
+            # The counters only cover the time since the first recorded event
+            start = end - timedelta(minutes=15)
+            assert get_counts(CounterType.EVENTS, [self.group_id], None, start, end) == {}
+
+    def test_out_of_range(self) -> None:
+        self.record_at(timedelta(0))
+
+        with freeze_time(self.now + BUCKET_SIZE):
+            start = timezone.now() - RETENTION - BUCKET_SIZE
+            assert (
+                get_counts(CounterType.EVENTS, [self.group_id], None, start, timezone.now()) == {}
+            )
+
+    def test_condition_reads_counters(self) -> None:
+        self.record_at(timedelta(0))
+        self.record_at(timedelta(minutes=8))
+        tsdb = MagicMock()
+        tsdb.get_sums.return_value = {}
+        tsdb.get_distinct_counts_totals.return_value = {}
+        other_group = self.create_group()
+
+        with (
+            freeze_time(self.now + timedelta(minutes=10)),
+            override_options({"rules.frequency-counters.read.enabled": True}),
+        ):
+            condition = EventFrequencyCondition(
+                project=self.project, data={"interval": "5m", "value": 1}, tsdb=tsdb
+            )
+            rates = condition.get_rate_bulk(
+                duration=timedelta(minutes=5),
+                group_ids={self.group_id, other_group.id},
+                environment_id=self.environment_id,
+                current_time=timezone.now(),
+                comparison_interval=None,
+            )
+            assert rates[self.group_id] == 1
+            # Only the group without counters is queried from Snuba
+            assert tsdb.get_sums.call_args.kwargs["keys"] == [other_group.id]
+
+            condition = EventUniqueUserFrequencyCondition(
+                project=self.project, data={"interval": "1h", "value": 1}, tsdb=tsdb
+            )
+            condition.get_rate_bulk(
+                duration=timedelta(days=1),
+                group_ids={self.group_id},
+                environment_id=self.environment_id,
+                current_time=timezone.now(),
+                comparison_interval=None,
+            )
+            # Windows longer than the retention always go to Snuba
+            assert tsdb.get_distinct_counts_totals.call_args.kwargs["keys"] == [self.group_id]
+
+    def test_condition_skips_counters_for_upsampled_projects(self) -> None:
+        self.record_at(timedelta(0))
+        tsdb = MagicMock()
+        tsdb.get_sums.return_value = {self.group_id: 10}
+
+        with (
+            freeze_time(self.now + timedelta(minutes=1)),
+            override_options(
+                {
+                    "rules.frequency-counters.read.enabled": True,
+                    "issues.client_error_sampling.project_allowlist": [self.project.id],
+                }
+            ),
+        ):
+            condition = EventFrequencyCondition(
+                project=self.project, data={"interval": "5m", "value": 1}, tsdb=tsdb
+            )
+            rates = condition.get_rate_bulk(
+                duration=timedelta(minutes=5),
+                group_ids={self.group_id},
+                environment_id=self.environment_id,
+                current_time=timezone.now(),
+                comparison_interval=None,
+            )
+            # The counters count raw events, Snuba counts them by sample weight
+            assert rates[self.group_id] == 10
+            assert tsdb.get_sums.call_args.kwargs["keys"] == [self.group_id]
+
+    def test_merged_groups_fall_back_to_snuba(self) -> None:
+        other_group = self.create_group(self.project)
+        self.record_at(timedelta(0))
+        with freeze_time(self.now):
+            record_event(other_group.id, self.environment_id, timezone.now(), None)
+
+        with (
+            freeze_time(self.now + timedelta(minutes=1)),
+            override_options(
+                {
+                    "rules.frequency-counters.write.enabled": True,
+                    "rules.frequency-counters.read.enabled": True,
+                }
+            ),
+        ):
+            with self.tasks():
+                merge_groups([other_group.id], self.group_id)
+
+            end = timezone.now()
+            start = end - timedelta(minutes=5)
+            # The counters no longer include the events of the merged group,
+            # so neither group is served from them
+            assert (
+                get_counts(CounterType.EVENTS, [self.group_id, other_group.id], None, start, end)
+                == {}
+            )
+
+        # Events recorded after the merge are counted again once the window
+        # starts after it
+        self.record_at(timedelta(minutes=2))
+        with freeze_time(self.now + timedelta(minutes=3)):
+            end = timezone.now()
+            start = end - timedelta(minutes=1, seconds=30)
+            assert get_counts(CounterType.EVENTS, [self.group_id], None, start, end) == {
+                self.group_id: 1
+            }
+
+    def test_unique_users_are_approximate(self) -> None:
+        for i in range(1000):
+            record_event(self.group_id, self.environment_id, self.now, f"user-{i}")
+
+        with freeze_time(self.now + timedelta(minutes=1)):
+            end = timezone.now()
+            start = end - timedelta(minutes=1)
+            count = get_counts(CounterType.USERS, [self.group_id], None, start, end)[self.group_id]
+        # HyperLogLog has a standard error of 0.81%, unlike Snuba's exact ``uniq``
+        assert abs(count - 1000) <= 30
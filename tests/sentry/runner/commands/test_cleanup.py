@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 from unittest.mock import patch
+from uuid import uuid4
 
 from sentry.constants import ObjectStatus
+from sentry.db.deletion import BulkDeleteQuery
 from sentry.models.group import Group
+from sentry.models.userreport import UserReport
 from sentry.runner.commands.cleanup import (
+    BulkDeleteCheckpoint,
     prepare_deletes_by_project,
     run_bulk_deletes_by_project,
+    run_bulk_query_deletes,
+    stream_bulk_query_deletes,
     task_execution,
 )
 from sentry.silo.base import SiloMode
@@ -221,3 +227,60 @@ class RunBulkQueryDeletesByProjectTest(TestCase):
         # Should have seen both projects
         assert project1.id in project_ids_seen
         assert project2.id in project_ids_seen
+
+
+class StreamBulkQueryDeletesTest(TestCase):
+    def create_user_report(self, days: int) -> UserReport:
+        return UserReport.objects.create(
+            project_id=self.project.id,
+            event_id=uuid4().hex,
+            name="name",
+            email="email@example.com",
+            comments="comments",
+            date_added=before_now(days=days),
+        )
+
+    def test_stream_bulk_query_deletes(self) -> None:
+        days = 30
+        old_reports = [self.create_user_report(days + 1) for _ in range(2)]
+        kept_report = self.create_user_report(1)
+        old_reports += [self.create_user_report(days + 1) for _ in range(3)]
+        range_size = kept_report.id + 1
+
+        with patch("sentry.runner.commands.cleanup.BULK_QUERY_DELETES_RANGE_SIZE", range_size):
+            q = BulkDeleteQuery(model=UserReport, dtfield="date_added", days=days)
+            # The first range was deleted before an interruption, so the smallest
+            # id of the table is now in the middle of that range.
+            first_range = next(q.get_id_ranges(range_size))
+            assert first_range == (0, range_size)
+            assert q.execute_range(*first_range) == 2
+            BulkDeleteCheckpoint(q).mark_completed(first_range[0])
+
+            with patch.object(q, "execute_range", wraps=q.execute_range) as execute_range:
+                assert stream_bulk_query_deletes(q, concurrency=1, chunk_size=1) == 3
+            # The ranges still line up with the checkpoint, so only the rest is scanned.
+            assert [call.args for call in execute_range.call_args_list] == [
+                (range_size, old_reports[-1].id + 1)
+            ]
+            assert list(UserReport.objects.values_list("id", flat=True)) == [kept_report.id]
+
+            # Every range is now checkpointed, so a rerun has nothing to do.
+            assert stream_bulk_query_deletes(q, concurrency=1) == 0
+
+    def test_run_bulk_query_deletes_streaming(self) -> None:
+        days = 30
+        self.create_user_report(days + 1)
+        new_report = self.create_user_report(1)
+
+        models_attempted: set[str] = set()
+        with self.options({"cleanup.bulk-query-deletes.streaming": True}):
+            run_bulk_query_deletes(
+                is_filtered=lambda model: model is not UserReport,
+                days=days,
+                project=None,
+                project_id=None,
+                models_attempted=models_attempted,
+            )
+
+        assert models_attempted == {"userreport"}
+        assert list(UserReport.objects.values_list("id", flat=True)) == [new_report.id]
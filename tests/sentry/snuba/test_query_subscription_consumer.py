@@ -16,7 +16,10 @@ from sentry.snuba.dataset import Dataset
 from sentry.snuba.models import SnubaQuery
 from sentry.snuba.query_subscriptions.consumer import (
     InvalidSchemaError,
+    batch_subscriber_registry,
+    handle_messages,
     parse_message_value,
+    register_batch_subscriber,
     register_subscriber,
     subscriber_registry,
 )
@@ -138,6 +141,49 @@ class HandleMessageTest(BaseQuerySubscriptionTest, TestCase):
         )
         mock_callback.assert_called_once_with(data["payload"], sub)
 
+    def test_handle_messages(self) -> None:
+        batched_key = "registered_test_batched"
+        single_key = "registered_test_single"
+        batch_callback = mock.Mock()
+        single_callback = mock.Mock()
+        register_subscriber(batched_key)(mock.Mock())
+        register_batch_subscriber(batched_key)(batch_callback)
+        register_subscriber(single_key)(single_callback)
+        self.addCleanup(subscriber_registry.pop, batched_key)
+        self.addCleanup(subscriber_registry.pop, single_key)
+        self.addCleanup(batch_subscriber_registry.pop, batched_key)
+
+        subscriptions = []
+        with self.tasks():
+            snuba_query = create_snuba_query(
+                SnubaQuery.Type.ERROR,
+                Dataset.Events,
+                "hello",
+                "count()",
+                timedelta(minutes=10),
+                timedelta(minutes=1),
+                None,
+            )
+            for key in (batched_key, batched_key, single_key):
+                subscriptions.append(create_snuba_subscription(self.project, key, snuba_query))
+
+        messages = []
+        for offset, sub in enumerate(subscriptions):
+            sub.refresh_from_db()
+            data = deepcopy(self.valid_wrapper)
+            data["payload"]["subscription_id"] = sub.subscription_id
+            messages.append((json.dumps(data).encode("utf-8"), offset, 0))
+
+        handle_messages(messages, self.topic, self.dataset.value, self.jsoncodec)
+
+        batch_callback.assert_called_once()
+        (updates,) = batch_callback.call_args.args
+        assert [(update["subscription_id"], sub) for update, sub in updates] == [
+            (sub.subscription_id, sub) for sub in subscriptions[:2]
+        ]
+        single_callback.assert_called_once()
+        assert single_callback.call_args.args[1] == subscriptions[2]
+
 
 class ParseMessageValueTest(BaseQuerySubscriptionTest, unittest.TestCase):
     def run_test(self, message):
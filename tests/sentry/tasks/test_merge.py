@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from sentry import buffer, eventstream
 from sentry.models.group import Group
+from sentry.models.groupassignee import GroupAssignee
 from sentry.models.groupenvironment import GroupEnvironment
 from sentry.models.groupmeta import GroupMeta
 from sentry.models.groupredirect import GroupRedirect
@@ -54,6 +55,38 @@ class MergeGroupTest(TestCase, SnubaTestCase):
             .values_list("environment_id", flat=True)
         ) == [1, 2]
 
+    def test_bulk_merge_objects(self) -> None:
+        group1 = self.create_group(self.project)
+        group2 = self.create_group(self.project)
+
+        GroupEnvironment.objects.create(group_id=group1.id, environment_id=1)
+        GroupEnvironment.objects.create(group_id=group1.id, environment_id=2)
+        GroupEnvironment.objects.create(group_id=group2.id, environment_id=1)
+        GroupMeta.objects.create(group=group1, key="github:tid", value="134")
+        GroupMeta.objects.create(group=group1, key="other:tid", value="567")
+        GroupMeta.objects.create(group=group2, key="other:tid", value="abc")
+        GroupAssignee.objects.create(group=group1, project=self.project, user_id=self.user.id)
+        ur = UserReport.objects.create(
+            project_id=self.project.id, group_id=group1.id, event_id="a" * 32
+        )
+
+        with self.options({"merge.bulk-merge-objects.enabled": True}), self.tasks():
+            merge_groups([group1.id], group2.id)
+
+        assert not Group.objects.filter(id=group1.id).exists()
+        assert list(
+            GroupEnvironment.objects.filter(group_id=group2.id)
+            .order_by("environment")
+            .values_list("environment_id", flat=True)
+        ) == [1, 2]
+        # Rows that conflict with the rows of the new group are dropped.
+        assert dict(GroupMeta.objects.filter(group=group2).values_list("key", "value")) == {
+            "github:tid": "134",
+            "other:tid": "abc",
+        }
+        assert GroupAssignee.objects.get(group=group2).user_id == self.user.id
+        assert UserReport.objects.get(id=ur.id).group_id == group2.id
+
     def test_merge_with_event_integrity(self) -> None:
         project = self.create_project()
         event1 = self.store_event(
@@ -12,6 +12,7 @@ from sentry.relay.projectconfig_debounce_cache.redis import RedisProjectConfigDe
 from sentry.tasks.relay import (
     _schedule_invalidate_project_config,
     build_project_config,
+    compute_projectkey_config,
     invalidate_project_config,
     schedule_build_project_config,
     schedule_invalidate_project_config,
@@ -212,6 +213,106 @@ def test_project_update_option(
         }
 
 
+@django_db_all
+@override_options({"relay.project-config.incremental-recompute.enabled": True})
+def test_invalidation_recomputes_only_affected_sections(
+    default_projectkey,
+    default_project,
+    redis_cache,
+):
+    cached = compute_projectkey_config(default_projectkey)
+    cached["config"]["piiConfig"] = {"stale": True}
+    redis_cache.set_many({default_projectkey.public_key: cached})
+
+    with mock.patch(
+        "sentry.relay.config.get_dynamic_sampling_config",
+        return_value={"version": 2, "rules": []},
+    ):
+        invalidate_project_config(
+            project_id=default_project.id, trigger="dynamic_sampling:custom_rule_upsert"
+        )
+
+    config = redis_cache.get(default_projectkey.public_key)
+    assert config["config"]["sampling"] == {"version": 2, "rules": []}
+    # Sections not affected by the trigger are kept from the cached config
+    assert config["config"]["piiConfig"] == {"stale": True}
+    assert config["rev"] != cached["rev"]
+
+
+@django_db_all
+@override_options({"relay.project-config.incremental-recompute.enabled": True})
+def test_invalidation_skips_unchanged_configs(
+    default_projectkey,
+    default_project,
+    redis_cache,
+):
+    redis_cache.set_many(
+        {default_projectkey.public_key: compute_projectkey_config(default_projectkey)}
+    )
+    cached = redis_cache.get(default_projectkey.public_key)
+
+    invalidate_project_config(project_id=default_project.id, trigger="test")
+
+    # The recomputed config has the same revision, so the cached one is not replaced
+    assert redis_cache.get(default_projectkey.public_key) == cached
+
+
+@django_db_all
+@override_options({"relay.project-config.org-batch.enabled": True})
+def test_invalidation_org_batch(
+    default_projectkey,
+    default_project,
+    default_organization,
+    redis_cache,
+):
+    other_project = default_organization.project_set.create(name="other", slug="other")
+    other_key = ProjectKey.objects.get(project=other_project)
+    second_key = ProjectKey.objects.create(project=default_project)
+    uncached_key = ProjectKey.objects.create(project=default_project)
+    cached_keys = [default_projectkey, second_key, other_key]
+    redis_cache.set_many({key.public_key: {"dummy": "dummy"} for key in cached_keys})
+
+    from sentry.relay.config import get_project_config
+
+    with mock.patch("sentry.relay.config.get_project_config", wraps=get_project_config) as compute:
+        invalidate_project_config(organization_id=default_organization.id, trigger="test")
+
+    # One full computation per project, the second key of the project is derived
+    assert compute.call_count == 2
+    for key in cached_keys:
+        config = redis_cache.get(key.public_key)
+        assert config == compute_projectkey_config(key) | {
+            "lastFetch": config["lastFetch"],
+            "lastChange": config["lastChange"],
+        }
+        assert [k["publicKey"] for k in config["publicKeys"]] == [key.public_key]
+    assert redis_cache.get(uncached_key.public_key) is None
+
+
+@django_db_all
+@override_options({"relay.project-config.org-batch.enabled": True})
+def test_invalidation_org_batch_disabled_key(
+    default_projectkey,
+    default_project,
+    default_organization,
+    redis_cache,
+):
+    disabled_key = ProjectKey.objects.create(
+        project=default_project, status=ProjectKeyStatus.INACTIVE
+    )
+    redis_cache.set_many(
+        {
+            disabled_key.public_key: {"dummy": "dummy"},
+            default_projectkey.public_key: {"dummy": "dummy"},
+        }
+    )
+
+    invalidate_project_config(organization_id=default_organization.id, trigger="test")
+
+    assert redis_cache.get(disabled_key.public_key) == {"disabled": True}
+    assert redis_cache.get(default_projectkey.public_key)["disabled"] is False
+
+
 @django_db_all
 def test_project_delete_option(
     default_projectkey,
@@ -408,6 +509,35 @@ class TestInvalidationTask:
             },
         ]
 
+    def test_debounce_sections(
+        self,
+        default_project,
+        invalidation_debounce_cache,
+        django_cache,
+    ):
+        tasks = []
+
+        def apply_async(args=None, kwargs=None, countdown=None):
+            tasks.append(kwargs["trigger"])
+
+        with mock.patch("sentry.tasks.relay.invalidate_project_config.apply_async", apply_async):
+            invalidation_debounce_cache.mark_task_done(
+                public_key=None, project_id=default_project.id, organization_id=None
+            )
+            for trigger in (
+                "releaseproject.post_save",
+                "releaseproject.post_save",
+                # Pending section tasks don't swallow other sections or the whole config
+                "alerts:create-on-demand-metric",
+                "test",
+                # A pending task for the whole config covers every section
+                "dashboards:create-on-demand-metric",
+                "test",
+            ):
+                schedule_invalidate_project_config(project_id=default_project.id, trigger=trigger)
+
+        assert tasks == ["releaseproject.post_save", "alerts:create-on-demand-metric", "test"]
+
     def test_invalidate(
         self,
         default_project,
@@ -26,6 +26,7 @@ from sentry.services.eventstore.processing import event_processing_store
 from sentry.tasks.reprocessing2 import finish_reprocessing, reprocess_group
 from sentry.tasks.store import preprocess_event
 from sentry.testutils.helpers.datetime import before_now
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.helpers.task_runner import BurstTaskRunner
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.testutils.skips import requires_snuba
@@ -49,6 +50,12 @@ def reprocessing_feature(settings):
     yield
 
 
+@pytest.fixture(params=(False, True), ids=("per_event", "batched"))
+def batch_pull_event_data(request):
+    with override_options({"reprocessing2.batch-pull-event-data.enabled": request.param}):
+        yield request.param
+
+
 @pytest.fixture
 def process_and_save(default_project, task_runner):
     def inner(data, seconds_ago=1):
@@ -102,6 +109,7 @@ def test_basic(
     process_and_save,
     register_event_preprocessor,
     django_cache,
+    batch_pull_event_data,
 ):
     from sentry import eventstream
 
@@ -365,6 +373,7 @@ def test_attachments_and_userfeedback(
     reset_snuba,
     register_event_preprocessor,
     process_and_save,
+    batch_pull_event_data,
 ):
     @register_event_preprocessor
     def event_preprocessor(data):
@@ -446,6 +455,7 @@ def test_nodestore_missing(
     reset_snuba,
     process_and_save,
     remaining_events,
+    batch_pull_event_data,
     django_cache,
 ):
 
@@ -1,8 +1,11 @@
+import time
 import unittest
 from datetime import datetime, timedelta
 from unittest import mock
 
 import pytest
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from snuba_sdk import Column, Condition, Entity, Function, Op, Query, Request
 from urllib3 import HTTPConnectionPool
@@ -15,18 +18,31 @@ from sentry.models.project import Project
 from sentry.models.release import Release
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.utils import json
 from sentry.utils.snuba import (
     ROUND_UP,
     RateLimitExceeded,
     RetrySkipTimeout,
     SnubaQueryParams,
+    CacheTTLPolicy,
+    InflightQueries,
+    QueryDeadlineExceeded,
+    SchemaValidationError,
+    SnubaError,
     SnubaRequest,
     UnqualifiedQueryError,
+    _apply_cache_and_build_results,
     _bulk_snuba_query,
+    _inflight_queries,
     _prepare_query_params,
+    _snuba_pool,
+    _urlopen,
+    get_cache_ttl_policy,
     get_json_type,
+    get_snuba_pool,
     get_query_params_to_update_for_projects,
+    get_revalidating_cache_key,
     get_snuba_column_name,
     get_snuba_translators,
     quantize_time,
@@ -628,3 +644,263 @@ class SnubaQueryRateLimitTest(TestCase):
         assert (
             str(exc_info.value) == "Query on could not be run due to allocation policies, info: ..."
         )
+
+
+def _make_snuba_request(project_id: int, referrer: str = "test_referrer") -> SnubaRequest:
+    return SnubaRequest(
+        request=Request(
+            dataset="events",
+            app_id="test",
+            query=Query(
+                match=Entity("events"),
+                select=[Function("count", parameters=[], alias="count")],
+                where=[Condition(Column("project_id"), Op.EQ, project_id)],
+            ),
+        ),
+        referrer=referrer,
+        forward=lambda x: x,
+        reverse=lambda x: x,
+    )
+
+
+@override_options({"snuba.query-cache.stale-while-revalidate.enabled": True})
+class StaleWhileRevalidateCacheTest(TestCase):
+    def setUp(self) -> None:
+        submit_patcher = mock.patch(
+            "sentry.utils.snuba._revalidation_pool.submit",
+            side_effect=lambda fn, *args: fn(*args),
+        )
+        self.mock_submit = submit_patcher.start()
+        self.addCleanup(submit_patcher.stop)
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_fresh_hit(self, mock_query: mock.MagicMock) -> None:
+        mock_query.return_value = [{"data": [{"count": 1}]}]
+        request = _make_snuba_request(self.project.id)
+
+        assert _apply_cache_and_build_results([request], use_cache=True) == [
+            {"data": [{"count": 1}]}
+        ]
+        assert _apply_cache_and_build_results([request], use_cache=True) == [
+            {"data": [{"count": 1}]}
+        ]
+        assert mock_query.call_count == 1
+        assert self.mock_submit.call_count == 0
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_stale_hit_revalidates(self, mock_query: mock.MagicMock) -> None:
+        request = _make_snuba_request(self.project.id)
+
+        with mock.patch("sentry.utils.snuba.time.time", return_value=1000.0):
+            mock_query.return_value = [{"data": [{"count": 1}]}]
+            _apply_cache_and_build_results([request], use_cache=True)
+
+        # Past the fresh TTL, the stale result is served and refreshed once
+        with mock.patch("sentry.utils.snuba.time.time", return_value=1000.0 + 61):
+            mock_query.return_value = [{"data": [{"count": 2}]}]
+            assert _apply_cache_and_build_results([request], use_cache=True) == [
+                {"data": [{"count": 1}]}
+            ]
+        assert mock_query.call_count == 2
+        assert self.mock_submit.call_count == 1
+
+        with mock.patch("sentry.utils.snuba.time.time", return_value=1000.0 + 62):
+            assert _apply_cache_and_build_results([request], use_cache=True) == [
+                {"data": [{"count": 2}]}
+            ]
+        assert mock_query.call_count == 2
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_identical_requests_coalesced(self, mock_query: mock.MagicMock) -> None:
+        mock_query.return_value = [{"data": [{"count": 1}]}]
+        request = _make_snuba_request(self.project.id)
+        other_request = _make_snuba_request(self.project.id)
+
+        assert _apply_cache_and_build_results([request, other_request], use_cache=True) == [
+            {"data": [{"count": 1}]},
+            {"data": [{"count": 1}]},
+        ]
+        mock_query.assert_called_once_with([request])
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_errors_propagate_to_coalesced_requests(self, mock_query: mock.MagicMock) -> None:
+        mock_query.side_effect = UnqualifiedQueryError("invalid")
+        request = _make_snuba_request(self.project.id)
+
+        with pytest.raises(UnqualifiedQueryError):
+            _apply_cache_and_build_results([request, request], use_cache=True)
+
+        mock_query.side_effect = None
+        mock_query.return_value = [{"data": []}]
+        assert _apply_cache_and_build_results([request], use_cache=True) == [{"data": []}]
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_cache_write_failures_resolve_inflight_queries(
+        self, mock_query: mock.MagicMock
+    ) -> None:
+        mock_query.return_value = [{"data": [{"count": 1}]}, {"data": [{"count": 2}]}]
+        request = _make_snuba_request(self.project.id)
+        other_request = _make_snuba_request(self.project.id + 1)
+        cache_keys = [
+            get_revalidating_cache_key(request.request),
+            get_revalidating_cache_key(other_request.request),
+        ]
+
+        with mock.patch("sentry.utils.snuba.cache.set", side_effect=Exception("boom")):
+            assert _apply_cache_and_build_results([request, other_request], use_cache=True) == [
+                {"data": [{"count": 1}]},
+                {"data": [{"count": 2}]},
+            ]
+
+        # Nothing is left in flight for later requests to wait on
+        for cache_key in cache_keys:
+            _, is_owner = _inflight_queries.claim(cache_key)
+            assert is_owner
+            _inflight_queries.resolve(cache_key, result={})
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_errors_before_query_resolve_inflight_queries(self, mock_query: mock.MagicMock) -> None:
+        request = _make_snuba_request(self.project.id)
+        corrupted_request = _make_snuba_request(self.project.id + 1)
+        cache_key = get_revalidating_cache_key(request.request)
+        cache.set(get_revalidating_cache_key(corrupted_request.request), "{}", 60)
+
+        # The first request is claimed before the corrupted entry of the second fails
+        with pytest.raises(KeyError):
+            _apply_cache_and_build_results([request, corrupted_request], use_cache=True)
+        assert mock_query.call_count == 0
+
+        _, is_owner = _inflight_queries.claim(cache_key)
+        assert is_owner
+        _inflight_queries.resolve(cache_key, result={})
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_coalesced_requests_get_copies(self, mock_query: mock.MagicMock) -> None:
+        mock_query.return_value = [{"data": [{"count": 1}]}]
+        request = _make_snuba_request(self.project.id)
+
+        results = _apply_cache_and_build_results([request, request], use_cache=True)
+        assert results == [{"data": [{"count": 1}]}, {"data": [{"count": 1}]}]
+        assert results[0] is not results[1]
+        assert results[0]["data"] is not results[1]["data"]
+
+
+class InflightQueriesTest(unittest.TestCase):
+    def test_claim_and_resolve(self) -> None:
+        inflight = InflightQueries()
+        future, is_owner = inflight.claim("key")
+        assert is_owner
+        same_future, is_owner = inflight.claim("key")
+        assert same_future is future
+        assert not is_owner
+
+        inflight.resolve("key", result={"data": []})
+        assert future.result() == {"data": []}
+
+        _, is_owner = inflight.claim("key")
+        assert is_owner
+
+
+class CacheTTLPolicyTest(unittest.TestCase):
+    @override_options(
+        {
+            "snuba.query-cache.stale-ttl-seconds": 100,
+            "snuba.query-cache.referrer-ttls": {"api.dashboards.widget": {"ttl": 5}},
+        }
+    )
+    def test_referrer_overrides(self) -> None:
+        assert get_cache_ttl_policy(None) == CacheTTLPolicy(ttl=60, stale_ttl=100)
+        assert get_cache_ttl_policy("api.other") == CacheTTLPolicy(ttl=60, stale_ttl=100)
+        assert get_cache_ttl_policy("api.dashboards.widget") == CacheTTLPolicy(ttl=5, stale_ttl=100)
+
+
+class SnubaPoolPartitionTest(unittest.TestCase):
+    @override_options({"snuba.client.pool-partitions": {"api.dashboards.": 3, "api.": 5}})
+    def test_partitioned_pools(self) -> None:
+        assert get_snuba_pool(None) is _snuba_pool
+        assert get_snuba_pool("subscriptions_executor") is _snuba_pool
+
+        dashboards_pool = get_snuba_pool("api.dashboards.widget")
+        assert dashboards_pool is not _snuba_pool
+        assert dashboards_pool.pool.maxsize == 3
+        assert get_snuba_pool("api.dashboards.bignumberchart") is dashboards_pool
+
+        api_pool = get_snuba_pool("api.issues.issue_events")
+        assert api_pool is not dashboards_pool
+        assert api_pool.pool.maxsize == 5
+
+
+class SnubaDeadlineTest(unittest.TestCase):
+    def test_deadline_exceeded_before_send(self) -> None:
+        with mock.patch.object(_snuba_pool, "urlopen") as mock_urlopen:
+            with pytest.raises(QueryDeadlineExceeded):
+                _urlopen("POST", "/events/snql", "{}", {}, deadline=time.monotonic() - 1)
+        assert mock_urlopen.call_count == 0
+
+    def test_remaining_time_used_as_timeout(self) -> None:
+        with mock.patch.object(_snuba_pool, "urlopen") as mock_urlopen:
+            _urlopen("POST", "/events/snql", "{}", {}, deadline=time.monotonic() + 10)
+        timeout = mock_urlopen.call_args.kwargs["timeout"]
+        assert 0 < timeout.total <= 10
+        assert mock_urlopen.return_value.release_conn.call_count == 1
+
+    def test_timeout_capped_by_snuba_timeout(self) -> None:
+        with mock.patch.object(_snuba_pool, "urlopen") as mock_urlopen:
+            _urlopen(
+                "POST",
+                "/events/snql",
+                "{}",
+                {},
+                deadline=time.monotonic() + settings.SENTRY_SNUBA_TIMEOUT * 10,
+            )
+        assert mock_urlopen.call_args.kwargs["timeout"].total == settings.SENTRY_SNUBA_TIMEOUT
+
+    @mock.patch("sentry.utils.snuba._snuba_query")
+    def test_failed_sibling_fails_bulk_query(self, mock_snuba_query: mock.MagicMock) -> None:
+        mock_response = mock.Mock(spec=HTTPResponse)
+        mock_response.status = 200
+        mock_response.data = json.dumps({"data": []}).encode()
+
+        def snuba_query(params):
+            if params[2].referrer == "search":
+                raise SnubaError("connection failed")
+            return ("test_referrer", mock_response, lambda x: x, lambda x: x)
+
+        mock_snuba_query.side_effect = snuba_query
+        requests = [_make_snuba_request(1, referrer="search")] + [
+            _make_snuba_request(i) for i in range(2, 20)
+        ]
+
+        with pytest.raises(SnubaError):
+            _bulk_snuba_query(requests)
+
+    @mock.patch("sentry.utils.snuba._snuba_query")
+    def test_error_response_cancels_bulk_query(self, mock_snuba_query: mock.MagicMock) -> None:
+        error_response = mock.Mock(spec=HTTPResponse)
+        error_response.status = 400
+        error_response.data = json.dumps(
+            {"error": {"type": "schema", "message": "invalid query"}}
+        ).encode()
+        mock_response = mock.Mock(spec=HTTPResponse)
+        mock_response.status = 200
+        mock_response.data = json.dumps({"data": []}).encode()
+
+        def snuba_query(params):
+            if params[2].referrer == "search":
+                return ("search", error_response, lambda x: x, lambda x: x)
+            time.sleep(0.05)
+            return ("test_referrer", mock_response, lambda x: x, lambda x: x)
+
+        mock_snuba_query.side_effect = snuba_query
+        requests = [_make_snuba_request(1, referrer="search")] + [
+            _make_snuba_request(i) for i in range(2, 40)
+        ]
+
+        with pytest.raises(SchemaValidationError):
+            _bulk_snuba_query(requests)
+        # The error is raised by the worker, so requests still waiting for a
+        # thread are never sent, and none are in flight once the query failed.
+        call_count = mock_snuba_query.call_count
+        assert call_count < len(requests)
+        time.sleep(0.1)
+        assert mock_snuba_query.call_count == call_count
@@ -24,6 +24,7 @@ from sentry.workflow_engine.handlers.condition.event_frequency_query_handlers im
     BaseEventFrequencyQueryHandler,
     EventFrequencyQueryHandler,
     EventUniqueUserFrequencyQueryHandler,
+    PercentSessionsQueryHandler,
     QueryResult,
 )
 from sentry.workflow_engine.models import (
@@ -45,6 +46,7 @@ from sentry.workflow_engine.processors.data_condition_group import (
     get_slow_conditions_for_groups,
 )
 from sentry.workflow_engine.processors.delayed_workflow import (
+    DelayedWorkflowBatch,
     EventInstance,
     EventKey,
     EventRedisData,
@@ -56,10 +58,12 @@ from sentry.workflow_engine.processors.delayed_workflow import (
     fetch_workflows_envs,
     fire_actions_for_groups,
     generate_unique_queries,
+    get_batched_condition_group_results,
     get_condition_group_results,
     get_condition_query_groups,
     get_group_to_groupevent,
     get_groups_to_fire,
+    merge_condition_query_groups,
 )
 from tests.sentry.workflow_engine.test_base import BaseWorkflowTest
 from tests.snuba.rules.conditions.test_event_frequency import BaseEventFrequencyPercentTest
@@ -645,6 +649,108 @@ class TestGetSnubaResults(BaseWorkflowTest):
         assert result == {}
 
 
+@freeze_time(FROZEN_TIME)
+class TestBatchedConditionGroupResults(BaseWorkflowTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.project_two = self.create_project(organization=self.organization)
+        self.other_org_project = self.create_project(organization=self.create_organization())
+        self.query = UniqueConditionQuery(
+            handler=EventFrequencyQueryHandler, interval="1h", environment_id=None
+        )
+        self.sessions_query = UniqueConditionQuery(
+            handler=PercentSessionsQueryHandler, interval="1h", environment_id=None
+        )
+
+    def create_batch(
+        self, project: Project, condition_groups: dict[UniqueConditionQuery, GroupQueryParams]
+    ) -> DelayedWorkflowBatch:
+        return DelayedWorkflowBatch(
+            project=project,
+            batch_key=None,
+            event_data=Mock(),
+            workflows_to_envs={},
+            data_condition_groups=[],
+            dcg_to_slow_conditions={},
+            condition_groups=condition_groups,
+        )
+
+    def test_merge_condition_query_groups(self) -> None:
+        now = timezone.now()
+        batches = [
+            self.create_batch(
+                self.project,
+                {
+                    self.query: GroupQueryParams({1}, now),
+                    self.sessions_query: GroupQueryParams({1}, now),
+                },
+            ),
+            self.create_batch(
+                self.project_two,
+                {
+                    self.query: GroupQueryParams({2}, now - timedelta(seconds=10)),
+                    self.sessions_query: GroupQueryParams({2}, now),
+                },
+            ),
+            self.create_batch(self.other_org_project, {self.query: GroupQueryParams({3}, now)}),
+        ]
+
+        merged = merge_condition_query_groups(batches, timedelta(seconds=30))
+        assert {
+            (m.query, frozenset(m.params.group_ids), m.params.timestamp, tuple(m.batch_indexes))
+            for m in merged
+        } == {
+            (self.query, frozenset({1, 2}), now, (1, 0)),
+            (self.query, frozenset({3}), now, (2,)),
+            # Session percentages are relative to a single project
+            (self.sessions_query, frozenset({1}), now, (0,)),
+            (self.sessions_query, frozenset({2}), now, (1,)),
+        }
+
+    def test_merge_condition_query_groups_window_skew(self) -> None:
+        now = timezone.now()
+        batches = [
+            self.create_batch(self.project, {self.query: GroupQueryParams({1}, now)}),
+            self.create_batch(
+                self.project_two,
+                {self.query: GroupQueryParams({2}, now - timedelta(minutes=1))},
+            ),
+        ]
+
+        merged = merge_condition_query_groups(batches, timedelta(seconds=30))
+        assert [(m.params.group_ids, m.params.timestamp) for m in merged] == [
+            ({2}, now - timedelta(minutes=1)),
+            ({1}, now),
+        ]
+
+    def test_get_batched_condition_group_results(self) -> None:
+        event = self.create_event(self.project.id, FROZEN_TIME, "group-1")
+        self.create_event(self.project.id, FROZEN_TIME, "group-1")
+        event_two = self.create_event(self.project_two.id, FROZEN_TIME, "group-2")
+        assert event.group and event_two.group
+
+        batches = [
+            self.create_batch(self.project, {self.query: GroupQueryParams({event.group.id})}),
+            self.create_batch(
+                self.project_two, {self.query: GroupQueryParams({event_two.group.id})}
+            ),
+        ]
+
+        with patch.object(
+            EventFrequencyQueryHandler,
+            "get_rate_bulk",
+            autospec=True,
+            side_effect=EventFrequencyQueryHandler.get_rate_bulk,
+        ) as get_rate_bulk:
+            results = get_batched_condition_group_results(batches, timedelta(seconds=30))
+
+        assert get_rate_bulk.call_count == 1
+        assert results == [
+            {self.query: {event.group.id: 2}},
+            {self.query: {event_two.group.id: 1}},
+        ]
+
+
 class TestGetGroupsToFire(TestDelayedWorkflowBase):
     def setUp(self) -> None:
         super().setUp()
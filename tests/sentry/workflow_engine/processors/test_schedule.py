@@ -18,6 +18,7 @@ from sentry.workflow_engine.processors.schedule import (
     mark_projects_processed,
     process_buffered_workflows,
     process_in_batches,
+    process_in_cross_project_batches,
 )
 
 FROZEN_TIME = before_now(days=1).replace(hour=1, minute=30, second=0, microsecond=0)
@@ -156,6 +157,50 @@ class ProcessInBatchesTest(CreateEventTestCase):
         assert not original_data
 
 
+class ProcessInCrossProjectBatchesTest(CreateEventTestCase):
+    @override_options({"delayed_processing.batch_size": 2})
+    @patch("sentry.workflow_engine.processors.schedule.process_in_batches")
+    @patch(
+        "sentry.workflow_engine.tasks.delayed_workflows.process_delayed_workflows_batch.apply_async"
+    )
+    def test_groups_by_organization(
+        self, mock_apply_batch: MagicMock, mock_process_in_batches: MagicMock
+    ) -> None:
+        project = self.create_project()
+        project_two = self.create_project()
+        large_project = self.create_project()
+        other_org_project = self.create_project(organization=self.create_organization())
+        for p in (project, project_two, other_org_project):
+            self.push_to_hash(p.id, 1, 1)
+        self.push_to_hash(large_project.id, 1, 1)
+        self.push_to_hash(large_project.id, 1, 2)
+
+        process_in_cross_project_batches(
+            self.batch_client,
+            [project.id, project_two.id, large_project.id, other_org_project.id],
+        )
+
+        # The large project needs batches of its own
+        mock_process_in_batches.assert_called_once()
+        assert mock_process_in_batches.call_args[0][0].project_id == large_project.id
+
+        assert sorted(
+            call.kwargs["kwargs"]["project_ids"] for call in mock_apply_batch.call_args_list
+        ) == sorted([sorted([project.id, project_two.id]), [other_org_project.id]])
+
+    @override_options({"delayed_workflow.cross-project-batching.max-projects": 1})
+    @patch(
+        "sentry.workflow_engine.tasks.delayed_workflows.process_delayed_workflows_batch.apply_async"
+    )
+    def test_max_projects(self, mock_apply_batch: MagicMock) -> None:
+        project = self.create_project()
+        project_two = self.create_project()
+
+        process_in_cross_project_batches(self.batch_client, [project.id, project_two.id])
+
+        assert mock_apply_batch.call_count == 2
+
+
 class FetchGroupToEventDataTest(CreateEventTestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -0,0 +1,132 @@
+from unittest.mock import patch
+
+from sentry.eventstream.base import GroupState
+from sentry.grouping.grouptype import ErrorGroupType
+from sentry.models.environment import Environment
+from sentry.testutils.helpers.datetime import before_now
+from sentry.testutils.helpers.options import override_options
+from sentry.workflow_engine.buffer.batch_client import DelayedWorkflowClient
+from sentry.workflow_engine.models import DataCondition, Detector
+from sentry.workflow_engine.models.data_condition import Condition
+from sentry.workflow_engine.processors.workflow import process_workflows
+from sentry.workflow_engine.processors.workflow_index import (
+    _get_index_cache_key,
+    get_workflow_index,
+    sort_conditions_by_cost,
+)
+from sentry.workflow_engine.types import WorkflowEventData
+from tests.sentry.workflow_engine.test_base import BaseWorkflowTest
+
+FROZEN_TIME = before_now(days=1).replace(hour=1, minute=30, second=0, microsecond=0)
+
+
+class TestWorkflowIndex(BaseWorkflowTest):
+    def setUp(self) -> None:
+        self.workflow, self.detector, _, self.workflow_triggers = self.create_detector_and_workflow(
+            detector_type=ErrorGroupType.slug
+        )
+        self.latest_release = self.create_data_condition(
+            condition_group=self.workflow_triggers,
+            type=Condition.LATEST_RELEASE,
+            comparison=True,
+            condition_result=True,
+        )
+        self.action_filter = self.create_data_condition_group()
+        self.create_workflow_data_condition_group(
+            workflow=self.workflow, condition_group=self.action_filter
+        )
+
+    def get_index(self):
+        return get_workflow_index(self.organization.id, [self.detector], None)
+
+    def test_build(self) -> None:
+        disabled_workflow = self.create_workflow(enabled=False)
+        self.create_detector_workflow(detector=self.detector, workflow=disabled_workflow)
+
+        index = self.get_index()
+        assert index.workflows == [self.workflow]
+        assert index.action_filters == [(self.action_filter, self.workflow.id)]
+        assert index.conditions_by_dcg_id[self.action_filter.id] == []
+
+        trigger_conditions = index.conditions_by_dcg_id[self.workflow_triggers.id]
+        # The release lookup is more expensive than the seen count, so it goes last
+        assert [condition.type for condition in trigger_conditions] == [
+            Condition.EVENT_SEEN_COUNT,
+            Condition.LATEST_RELEASE,
+        ]
+
+    def test_cached(self) -> None:
+        index = self.get_index()
+        with self.assertNumQueries(0):
+            assert self.get_index() == index
+
+    def test_cache_key(self) -> None:
+        def get_key(detector_ids: list[int], environment_id: int | None) -> str:
+            return _get_index_cache_key(
+                self.organization.id,
+                [Detector(id=id) for id in detector_ids],
+                Environment(id=environment_id) if environment_id else None,
+            )
+
+        assert get_key([1, 2], None) == get_key([2, 1], None)
+        assert get_key([1, 2], None) != get_key([12], None)
+        assert get_key([1], 23) != get_key([12], 3)
+        assert get_key([1], None) != get_key([1], 1)
+
+    def test_invalidated_on_changes(self) -> None:
+        self.get_index()
+
+        self.latest_release.delete()
+        assert [
+            condition.type
+            for condition in self.get_index().conditions_by_dcg_id[self.workflow_triggers.id]
+        ] == [Condition.EVENT_SEEN_COUNT]
+
+        self.workflow.update(enabled=False)
+        assert self.get_index().workflows == []
+
+    def test_sort_conditions_by_cost(self) -> None:
+        conditions = [
+            DataCondition(id=1, type=Condition.ASSIGNED_TO),
+            DataCondition(id=2, type=Condition.TAGGED_EVENT),
+            DataCondition(id=3, type=Condition.EQUAL),
+            DataCondition(id=4, type=Condition.LEVEL),
+        ]
+        assert [condition.id for condition in sort_conditions_by_cost(conditions)] == [3, 4, 2, 1]
+
+
+@override_options({"workflow_engine.compiled-workflow-index.enabled": True})
+class TestProcessWorkflowsWithIndex(BaseWorkflowTest):
+    def setUp(self) -> None:
+        self.workflow, self.detector, _, _ = self.create_detector_and_workflow(
+            detector_type=ErrorGroupType.slug
+        )
+        self.group, self.event, self.group_event = self.create_group_event()
+        self.event_data = WorkflowEventData(
+            event=self.group_event,
+            group=self.group,
+            group_state=GroupState(
+                id=1, is_new=False, is_regression=True, is_new_group_environment=False
+            ),
+        )
+        self.batch_client = DelayedWorkflowClient()
+
+    def test_triggered_workflows(self) -> None:
+        disabled_workflow = self.create_workflow(enabled=False)
+        self.create_detector_workflow(detector=self.detector, workflow=disabled_workflow)
+
+        result = process_workflows(self.batch_client, self.event_data, FROZEN_TIME)
+        assert result.data.triggered_workflows == {self.workflow}
+
+    def test_shared_conditions_evaluated_once(self) -> None:
+        other_workflow, _, _, _ = self.create_detector_and_workflow(name_prefix="other")
+        self.create_detector_workflow(detector=self.detector, workflow=other_workflow)
+
+        with patch.object(
+            DataCondition, "evaluate_value", autospec=True, side_effect=DataCondition.evaluate_value
+        ) as evaluate_value:
+            result = process_workflows(self.batch_client, self.event_data, FROZEN_TIME)
+
+        assert result.data.triggered_workflows == {self.workflow, other_workflow}
+        # Both workflows are triggered by an identical seen count condition
+        assert evaluate_value.call_count == 1
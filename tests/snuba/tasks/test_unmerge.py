@@ -5,7 +5,7 @@ import hashlib
 import itertools
 import logging
 import uuid
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 from unittest import mock
 from unittest.mock import patch
 
@@ -28,6 +28,8 @@ from sentry.tasks.unmerge import (
     get_fingerprint,
     get_group_backfill_attributes,
     get_group_creation_attributes,
+    get_tsdb_bucket,
+    get_tsdb_bucket_size,
     unmerge,
 )
 from sentry.testutils.cases import SnubaTestCase, TestCase
@@ -61,6 +63,24 @@ class UnmergeTestCase(TestCase, SnubaTestCase):
             == hashlib.md5(b"Not hello world").hexdigest()
         )
 
+    def test_get_tsdb_bucket(self) -> None:
+        bucket_size = get_tsdb_bucket_size()
+        assert bucket_size is not None
+        # Every rollup is a multiple of the bucket size, so bucketing an event
+        # never moves it into another interval of any rollup.
+        for rollup in tsdb.backend.get_rollups():
+            assert rollup % bucket_size == 0
+
+        timestamp = datetime(2024, 1, 1, 12, 0, 7, 500, tzinfo=UTC)
+        bucket = get_tsdb_bucket(timestamp, bucket_size)
+        assert bucket <= timestamp < bucket + timedelta(seconds=bucket_size)
+        for rollup in tsdb.backend.get_rollups():
+            assert tsdb.backend.normalize_to_epoch(
+                bucket, rollup
+            ) == tsdb.backend.normalize_to_epoch(timestamp, rollup)
+
+        assert get_tsdb_bucket(timestamp, None) == timestamp
+
     def test_get_group_creation_attributes(self) -> None:
         now = timezone.now().replace(microsecond=0)
         e1 = self.store_event(